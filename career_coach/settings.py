@@ -49,6 +49,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'chatbot.tracing.TracingMiddleware',
+    'chatbot.metrics.MetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -75,6 +77,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'career_coach.wsgi.application'
+ASGI_APPLICATION = 'career_coach.asgi.application'
 
 
 # Database
@@ -88,6 +91,181 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# - llm: LLM 응답 캐시 2차 저장소 (DB 테이블, gunicorn 워커 간 공유)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'llm': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'llm_cache',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+LLM_CACHE_ALIAS = 'llm'
+LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', str(7 * 24 * 3600)))
+LLM_CACHE_MEMORY_SIZE = int(os.getenv('LLM_CACHE_MEMORY_SIZE', '512'))
+
+# 동일 LLM 요청 병합 (single-flight) - 워커 간 잠금은 llm 캐시 사용
+SINGLE_FLIGHT_LOCK_TTL_SECONDS = 90
+SINGLE_FLIGHT_RESULT_TTL_SECONDS = 30
+SINGLE_FLIGHT_POLL_INTERVAL_SECONDS = 0.25
+
+# LLM 백엔드 - LLM_BACKEND=fake 이면 로컬 스탠드인 서버로 전체 요청 경로를 오프라인 실행
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'openai')
+LLM_BACKENDS = {
+    'openai': {
+        'BACKEND': 'chatbot.llm_backends.OpenAIBackend',
+    },
+    'fake': {
+        'BACKEND': 'chatbot.llm_backends.FakeServerBackend',
+        'OPTIONS': {
+            # 비어 있으면 프로세스 안에서 서버 기동 (여러 워커가 공유하려면 run_fake_openai 주소 지정)
+            'url': os.getenv('FAKE_OPENAI_URL', ''),
+            'latency_ms': float(os.getenv('FAKE_OPENAI_LATENCY_MS', '0')),
+            'ms_per_token': float(os.getenv('FAKE_OPENAI_MS_PER_TOKEN', '0')),
+            'error_rate': float(os.getenv('FAKE_OPENAI_ERROR_RATE', '0')),
+            'seed': int(os.getenv('FAKE_OPENAI_SEED', '0')),
+        },
+    },
+}
+
+# 모델 라우팅 - 저렴한 티어부터 순서대로 (tier, model)
+# 짧은 주니어 입력은 light, 그 외 standard로 시작 → 스키마/품질 검사 실패 시에만 상위 티어로 캐스케이드
+LLM_MODEL_TIERS = [
+    ('light', os.getenv('LLM_MODEL_LIGHT', 'gpt-4.1-nano')),
+    ('standard', os.getenv('LLM_MODEL_STANDARD', 'gpt-4o-mini')),
+    ('strong', os.getenv('LLM_MODEL_STRONG', 'gpt-4o')),
+]
+# light 티어로 보낼 최대 입력 토큰 (스테이지별, 공통 system 프롬프트 제외한 요청별 입력)
+LLM_ROUTING_LIGHT_MAX_INPUT_TOKENS = {
+    'resume_analysis': 250,
+    'interview_questions': 350,
+    'learning_path': 300,
+}
+# 이력서 분석 단계에서 주니어로 보는 경력 (년)
+LLM_ROUTING_JUNIOR_MAX_YEARS = 2
+# light 티어로 보낼 최대 정규화 스킬 수 (기술 스택이 넓으면 standard)
+LLM_ROUTING_LIGHT_MAX_SKILLS = 6
+
+# 모델별 단가 (USD / 1M 토큰) - 비용 = 캐시 미적중 입력 + 캐시 적중 입력 + 출력
+# 날짜가 붙은 스냅샷 이름(gpt-4o-mini-2024-07-18)은 가장 긴 접두사로 매칭, 목록에 없으면 비용 미집계
+LLM_MODEL_PRICES = {
+    'gpt-4.1-nano': {'input': 0.10, 'cached_input': 0.025, 'output': 0.40},
+    'gpt-4.1-mini': {'input': 0.40, 'cached_input': 0.10, 'output': 1.60},
+    'gpt-4.1': {'input': 2.00, 'cached_input': 0.50, 'output': 8.00},
+    'gpt-4o-mini': {'input': 0.15, 'cached_input': 0.075, 'output': 0.60},
+    'gpt-4o': {'input': 2.50, 'cached_input': 1.25, 'output': 10.00},
+}
+LLM_BATCH_PRICE_RATIO = 0.5                 # Batch API 요청은 동기 호출 단가의 50%
+
+# LLM 호출 복원력 - 호출 1건(재시도 포함) 마감 시간은 gunicorn --timeout(60s)보다 충분히 짧게
+LLM_CALL_DEADLINE_SECONDS = float(os.getenv('LLM_CALL_DEADLINE_SECONDS', '25'))
+LLM_ATTEMPT_TIMEOUT_SECONDS = float(os.getenv('LLM_ATTEMPT_TIMEOUT_SECONDS', '15'))
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '2'))
+LLM_RETRY_BASE_DELAY_SECONDS = 0.5
+LLM_RETRY_MAX_DELAY_SECONDS = 4.0
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv('LLM_CIRCUIT_FAILURE_THRESHOLD', '5'))
+LLM_CIRCUIT_RESET_SECONDS = float(os.getenv('LLM_CIRCUIT_RESET_SECONDS', '30'))
+
+# 요청 마감 시간 - X-Request-Timeout 헤더(초) 또는 엔드포인트별 기본값, gunicorn --timeout(60s) 미만
+REQUEST_DEADLINE_HEADER = 'X-Request-Timeout'
+REQUEST_DEADLINE_DEFAULTS = {
+    'profile': 30,
+    'interview_session': 30,
+    'learning_path': 40,
+    'coaching_bundle': 50,
+}
+REQUEST_DEADLINE_MIN_SECONDS = 1
+REQUEST_DEADLINE_MAX_SECONDS = 55
+# LLM 이후 DB 저장/응답에 남겨 둘 시간
+REQUEST_DEADLINE_RESERVE_SECONDS = 2
+# 남은 시간 → max_tokens 환산 (첫 토큰 지연 + 초당 출력 토큰)
+LLM_FIRST_TOKEN_SECONDS = 1.5
+LLM_OUTPUT_TOKENS_PER_SECOND = int(os.getenv('LLM_OUTPUT_TOKENS_PER_SECOND', '60'))
+
+# 대량 이력서 분석 (OpenAI Batch API)
+ANALYSIS_BATCH_MAX_RECORDS = 50000          # Batch API 입력 파일당 요청 상한
+ANALYSIS_BATCH_DB_CHUNK = 500               # bulk_create/bulk_update 청크 크기
+ANALYSIS_BATCH_MAX_ERRORS = 200             # 배치별 보관할 실패 상세 건수
+ANALYSIS_BATCH_COMPLETION_WINDOW = '24h'
+ANALYSIS_BATCH_POLL_INTERVAL_SECONDS = int(os.getenv('ANALYSIS_BATCH_POLL_INTERVAL_SECONDS', '60'))
+ANALYSIS_BATCH_INGEST_LEASE_SECONDS = 900   # 결과 수집 중 폴러가 비정상 종료하면 이 시간 후 다른 폴러가 재점유
+
+# 스킬 인덱스 (resume_profile_skills) / 목록 조회 키셋 페이지네이션
+SKILL_LINK_DB_CHUNK = 1000                  # 연결 행 bulk_create / backfill 청크 크기
+LIST_PAGE_SIZE = 20                         # 목록 API 기본 페이지 크기
+LIST_MAX_PAGE_SIZE = 100
+
+# 전문 검색 (SQLite FTS5, GET /api/search)
+SEARCH_MAX_RESULTS = 50
+SEARCH_SNIPPET_CHARS = 120                  # 스니펫 길이 (일치 위치 기준 앞뒤)
+SEARCH_INDEX_DB_CHUNK = 1000                # rebuild_search_index 청크 크기
+
+
+# 비동기 작업 모드 (DB 작업 큐 + run_generation_workers 워커 풀)
+GENERATION_WORKER_CONCURRENCY = int(os.getenv('GENERATION_WORKER_CONCURRENCY', '4'))
+GENERATION_JOB_POLL_INTERVAL_SECONDS = 1.0
+GENERATION_JOB_LEASE_SECONDS = 300           # 워커가 이 시간 안에 끝내지 못하면 다른 워커가 재점유
+GENERATION_JOB_MAX_ATTEMPTS = 3
+GENERATION_JOB_RETRY_DELAY_SECONDS = 5       # 재시도/선행 작업 대기 간격 (재시도는 지수 증가)
+GENERATION_JOB_CLAIM_CANDIDATES = 10         # 점유 경합 시 시도할 후보 작업 수
+
+# 메트릭 (GET /api/metrics, Prometheus 텍스트 형식)
+# 여러 프로세스(gunicorn 워커, 생성 작업 워커)의 값을 합산하려면 공유 디렉터리 지정 (기동 시 비우기)
+METRICS_MULTIPROC_DIR = os.getenv('METRICS_MULTIPROC_DIR', '')
+METRICS_FLUSH_INTERVAL_SECONDS = float(os.getenv('METRICS_FLUSH_INTERVAL_SECONDS', '1'))
+
+# 요청 트레이싱 - 요청별 span 트리를 파일(JSON Lines) 또는 OTLP/HTTP 수집기로 내보냄 (빈 값이면 비활성)
+TRACING_EXPORTER = os.getenv('TRACING_EXPORTER', '')
+TRACING_EXPORTERS = {
+    'file': {
+        'BACKEND': 'chatbot.tracing.FileSpanExporter',
+        'OPTIONS': {'path': os.getenv('TRACING_FILE_PATH', str(BASE_DIR / 'db' / 'traces.jsonl'))},
+    },
+    'otlp': {
+        'BACKEND': 'chatbot.tracing.OTLPHttpExporter',
+        'OPTIONS': {'endpoint': os.getenv('TRACING_OTLP_ENDPOINT', 'http://localhost:4318/v1/traces')},
+    },
+}
+TRACING_SAMPLE_RATE = float(os.getenv('TRACING_SAMPLE_RATE', '1.0'))
+TRACING_SERVICE_NAME = 'career-coach'
+TRACING_RESPONSE_HEADER = 'X-Trace-Id'
+
+# 구조화 로깅 - JSON 1줄/레코드, 큐 핸들러가 별도 스레드에서 stdout에 기록
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+# LLM 원시 응답 기록 비율 (파싱 실패는 항상 기록)
+LOG_COMPLETION_SAMPLE_RATE = float(os.getenv('LOG_COMPLETION_SAMPLE_RATE', '0.01'))
+# 로그에서 길이/해시로만 남길 이력서 원문 필드
+LOG_REDACT_FIELDS = ('career_summary', 'technical_skills', 'resume_text')
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'trace_context': {'()': 'chatbot.structured_logging.TraceContextFilter'},
+    },
+    'formatters': {
+        'json': {'()': 'chatbot.structured_logging.JsonFormatter'},
+    },
+    'handlers': {
+        'queue_json': {
+            '()': 'chatbot.structured_logging.QueueJsonHandler',
+            'formatter': 'json',
+            'filters': ['trace_context'],
+            'maxsize': int(os.getenv('LOG_QUEUE_SIZE', '10000')),
+        },
+    },
+    'root': {'handlers': ['queue_json'], 'level': 'WARNING'},
+    'loggers': {
+        'chatbot': {'level': LOG_LEVEL},
+        'django': {'level': 'INFO'},
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -14,13 +14,144 @@
 
 import os
 import json
+import logging
 import time
-from typing import List, Dict, Any, Tuple
-from dataclasses import dataclass
-from openai import OpenAI
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import List, Dict, Any, Tuple, AsyncIterator, Callable, Optional, Type
+from dataclasses import dataclass, asdict
+from functools import partial
+from django.conf import settings
+from pydantic import BaseModel, ValidationError
+
+from .llm_cache import LLMResponseCache, normalize_text
+from .single_flight import SingleFlight, request_fingerprint
+from .resilience import CircuitBreaker, CircuitOpenError, DeadlineExceededError, ResilientCaller
+from .deadline import Deadline
+from .llm_backends import load_backend
+from .model_router import model_router, is_junior_level, RouteDecision
+from .usage import add_usage, empty_usage, usage_cost, usage_tokens
+from .metrics import cache_requests, llm_fallbacks, llm_inflight, llm_tokens, observe_llm_call, stage_timer
+from .tracing import current_trace_id, tracer
+from .structured_logging import log_raw_completion
+from .json_stream import IncrementalArrayParser, parse_array
+from .token_budget import FieldBudget, fit_fields, completion_budget, budget_report, count_message_tokens
+from .schemas import (
+    ResumeAnalysisResult, InterviewQuestion, InterviewQuestionSet, LearningPhasePersonalization,
+    LearningPersonalization, openai_response_format
+)
+from .roadmaps import roadmap_library, merge_personalization, outline
+from .skills import skill_normalizer
+from .prompts import (
+    prompt_registry, PromptTemplate, ANALYSIS_PROMPT, INTERVIEW_PROMPT, LEARNING_PROMPT,
+    COMPANY_STYLES, GOAL_DESCRIPTIONS
+)
+
+# 설정(LLM_BACKEND)으로 선택한 백엔드의 클라이언트 사용 (openai / 로컬 스탠드인 서버)
+# 재시도/타임아웃은 resilience 계층이 담당 (SDK 자체 재시도 비활성화)
+logger = logging.getLogger(__name__)
+
+llm_backend = load_backend()
+client = llm_backend.client
+# ASGI 경로용 비동기 클라이언트 (한 프로세스에서 다수의 LLM 호출을 동시에 대기)
+async_client = llm_backend.async_client
+
+# 호출별 마감 시간 + 재시도 + 서킷 브레이커 (연속 실패 시 즉시 기본값으로 대체)
+llm_breaker = CircuitBreaker(
+    llm_backend.name, settings.LLM_CIRCUIT_FAILURE_THRESHOLD, settings.LLM_CIRCUIT_RESET_SECONDS
+)
+llm_caller = ResilientCaller(llm_breaker)
+
+# === 토큰 예산 (입력 필드 상한 + 출력 크기 기반 max_tokens) ===
+# 입력 필드별 상한 - priority가 낮은 필드부터 추가로 줄임
+ANALYSIS_FIELD_BUDGETS = [
+    FieldBudget("career_summary", max_tokens=600, priority=1),
+    FieldBudget("technical_skills", max_tokens=200, priority=2),
+    FieldBudget("job_role", max_tokens=80, priority=3),
+]
+INTERVIEW_FIELD_BUDGETS = [
+    FieldBudget("personality_traits", max_tokens=120, priority=1),
+    FieldBudget("improvement_areas", max_tokens=150, priority=2),
+    FieldBudget("career_summary", max_tokens=500, priority=3),
+    FieldBudget("strength_areas", max_tokens=150, priority=4),
+    FieldBudget("technical_skills", max_tokens=200, priority=5),
+]
+LEARNING_FIELD_BUDGETS = [
+    FieldBudget("growth_trajectory", max_tokens=250, priority=1),
+    FieldBudget("improvement_areas", max_tokens=150, priority=2),
+    FieldBudget("strength_areas", max_tokens=150, priority=3),
+    FieldBudget("technical_skills", max_tokens=200, priority=4),
+]
+ANALYSIS_INPUT_TOKENS = 800
+INTERVIEW_INPUT_TOKENS = 1000
+LEARNING_INPUT_TOKENS = 700
+
+# 출력 항목당 토큰 (한국어 응답 기준) - 요청 출력량에 맞춰 max_tokens 산정
+INTERVIEW_QUESTION_COUNT = 5
+INTERVIEW_TOKENS_PER_QUESTION = 280
+LEARNING_PHASE_COUNT = 3
+# 골격은 사전 구성 - 단계별 projects/personal_advice만 생성
+LEARNING_TOKENS_PER_PHASE = 320
+ANALYSIS_OUTPUT_TOKENS = 1000
+
+# 요청 마감 시간이 부족할 때 LLM 호출을 시도할 최소 출력 토큰 (미만이면 스테이지 생략 → 기본값)
+MIN_OUTPUT_TOKENS = {
+    "resume_analysis": 600,  # 단일 객체라 잘리면 복구 불가
+    "interview_questions": INTERVIEW_TOKENS_PER_QUESTION * 2,
+    "learning_path": LEARNING_TOKENS_PER_PHASE,
+}
+
+# 구조화 출력 스키마 (import 시점에 한 번만 생성)
+ANALYSIS_RESPONSE_FORMAT = openai_response_format(ResumeAnalysisResult, "resume_analysis")
+INTERVIEW_RESPONSE_FORMAT = openai_response_format(InterviewQuestionSet, "interview_questions")
+LEARNING_RESPONSE_FORMAT = openai_response_format(LearningPersonalization, "learning_path")
+
+# 분석 실패 시 기본값의 커리어 레벨
+PLACEHOLDER_CAREER_LEVEL = "분석 중"
+
+# 이력서 분석 응답 캐시 (temperature 0.3 → 동일 입력이면 사실상 동일 결과)
+analysis_cache = LLMResponseCache("resume_analysis")
+
+# 동일 LLM 요청 동시 실행 병합 (재시도/더블클릭 대응)
+llm_flight = SingleFlight("llm")
+
+class OutputStats:
+    """스테이지별 구조화 출력 검증 결과 집계 (파싱 실패/잘림 복구/기본값 대체 추적)"""
+
+    OUTCOMES = ("validated", "repaired", "invalid", "refused", "fallback")
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(self.OUTCOMES, 0))
+        self._lock = threading.Lock()
+
+    def incr(self, stage: str, outcome: str) -> None:
+        with self._lock:
+            self._counts[stage][outcome] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {stage: dict(counts) for stage, counts in self._counts.items()}
+
+
+output_stats = OutputStats()
+
+# 요청 단위 생성 정보 (캐시 상태 등) - 비동기 태스크/스레드별로 분리
+_generation_info: ContextVar[Optional[Dict[str, Any]]] = ContextVar("generation_info", default=None)
 
-# 환경 변수에서 API 키 가져오기
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+def begin_generation() -> Dict[str, Any]:
+    """요청 시작 시 호출 - AI 엔진이 이번 요청에서 기록하는 생성 정보를 담을 dict 반환"""
+    info: Dict[str, Any] = {}
+    _generation_info.set(info)
+    return info
+
+
+def _record_generation(**info: Any) -> None:
+    """현재 요청의 생성 정보에 항목 기록 (begin_generation 이전이면 무시)"""
+    current = _generation_info.get()
+    if current is not None:
+        current.update(info)
 
 
 @dataclass
@@ -37,565 +168,795 @@ class CareerAnalysis:
 
 class CareerCoachAI:
     """커리어 코치 AI 엔진"""
+
+    # 배열 응답 스테이지의 구조화 출력 컨테이너 모델
+    _ITEM_CONTAINERS = {
+        "interview_questions": InterviewQuestionSet,
+        "learning_path": LearningPersonalization,
+    }
     
     def __init__(self):
-        self.model = "gpt-4o-mini"  # 비용 효율적이면서 성능 좋은 모델
+        # 기본 모델 - 캐시 키/토큰 계산/Batch API 기준 (실제 호출 모델은 model_router가 선택)
+        self.model = "gpt-4o-mini"
+
+    # === 프롬프트/파싱 헬퍼 (동기·비동기 엔진 공용) ===
+
+    def _bounded(self, template: PromptTemplate, request: Dict[str, Any],
+                 deadline: Optional[Deadline]) -> Tuple[Dict[str, Any], Optional[float]]:
+        """
+        요청 마감 시간 반영 - 남은 시간에 맞춰 max_tokens 축소 후 (요청, LLM 마감 시각) 반환
+        - 최소 출력량도 생성할 수 없으면 호출하지 않고 DeadlineExceededError
+        """
+        if deadline is None:
+            return request, None
+        max_tokens = deadline.output_tokens(ceiling=request["max_tokens"])
+        _record_generation(deadline={"max_tokens": max_tokens})
+        if max_tokens < MIN_OUTPUT_TOKENS[template.name]:
+            raise DeadlineExceededError(f"{template.name}: 남은 시간 부족 - LLM 호출 생략")
+        return {**request, "max_tokens": max_tokens}, deadline.llm_deadline()
+
+    def _complete(self, template: PromptTemplate, request: Dict[str, Any],
+                  deadline: Optional[Deadline] = None, model: Optional[str] = None) -> Any:
+        """복원력 계층(마감 시간/재시도/서킷 브레이커)을 거친 동기 LLM 호출"""
+        request, llm_deadline = self._bounded(template, request, deadline)
+        model = model or self.model
+
+        def attempt(timeout: float) -> Any:
+            with observe_llm_call(model):
+                return client.chat.completions.create(model=model, timeout=timeout, **request)
+
+        with stage_timer("upstream"):
+            return llm_caller.call(attempt, deadline=llm_deadline)
+
+    # === 모델 라우팅/캐스케이드 ===
+
+    def _route(self, template: PromptTemplate, request: Dict[str, Any], junior: bool,
+               technical_skills: str) -> RouteDecision:
+        """요청별 입력(공통 system 프롬프트 제외) 토큰 수 + 주니어 여부 + 정규화 스킬 수로 첫 시도 모델 선택"""
+        user_messages = [message for message in request["messages"] if message["role"] != "system"]
+        input_tokens = count_message_tokens(user_messages, self.model)
+        skill_count = len(skill_normalizer.normalize(technical_skills))
+        return model_router.route(template.name, input_tokens, junior, skill_count)
+
+    def _quality_issue(self, stage: str, result: Any, response: Any) -> Optional[str]:
+        """
+        스키마 검증은 통과했지만 상위 모델로 다시 생성할 결과인지 (사유 반환)
+        - max_tokens로 잘린 응답은 제외 (모델을 바꿔도 해결되지 않음)
+        """
+        if getattr(response.choices[0], "finish_reason", None) == "length":
+            return None
+        if stage == "resume_analysis":
+            return None if result.strength_areas and result.improvement_areas else "empty_areas"
+        expected = INTERVIEW_QUESTION_COUNT if stage == "interview_questions" else LEARNING_PHASE_COUNT
+        return "too_few_items" if len(result) < expected else None
+
+    def _record_route(self, decision: RouteDecision, outcome: str, started: float,
+                      response: Any = None) -> None:
+        """시도별 라우팅 결정/결과/지연/토큰 기록 (generation_metadata.routing)"""
+        usage = getattr(response, "usage", None)
+        tokens = usage_tokens(usage) if usage is not None else None
+        cost = usage_cost(decision.model, tokens) if tokens else None
+        info = _generation_info.get() or {}
+        routing = list(info.get("routing", []))
+        routing.append({
+            "stage": decision.stage,
+            "tier": decision.tier,
+            "model": decision.model,
+            "reason": decision.reason,
+            "outcome": outcome,
+            "latency_seconds": round(time.monotonic() - started, 3),
+            "prompt_tokens": tokens["prompt_tokens"] if tokens else None,
+            "completion_tokens": tokens["completion_tokens"] if tokens else None,
+            "cached_tokens": tokens["cached_tokens"] if tokens else None,
+            "cost_usd": cost,
+        })
+        _record_generation(routing=routing)
+        if tokens:
+            for kind, count in tokens.items():
+                llm_tokens.inc(count, model=decision.model, kind=kind.removesuffix("_tokens"))
+            # 실패한 캐스케이드 시도도 과금되므로 요청 사용량에 포함
+            _record_generation(usage=add_usage(info.get("usage"), decision.stage, decision.model, tokens, cost))
+
+    def _record_model_used(self, stage: str, model: Optional[str]) -> None:
+        models = dict((_generation_info.get() or {}).get("models_used", {}))
+        models[stage] = model
+        _record_generation(models_used=models)
+
+    def _cascade_step(self, decision: RouteDecision, started: float, response: Any,
+                      result: Any, error: Optional[Exception]) -> Optional[RouteDecision]:
+        """시도 결과 기록 후 다음 시도 모델 반환 (캐스케이드 종료면 None)"""
+        if error is None:
+            outcome = self._quality_issue(decision.stage, result, response) or "ok"
+        elif isinstance(error, ValueError):  # 스키마 불일치/응답 거부 (ValidationError 포함)
+            outcome = "invalid_output"
+        else:  # 업스트림 오류/마감 시간/서킷 오픈 - 상위 모델로 해결되지 않음
+            outcome = "error"
+        self._record_route(decision, outcome, started, response)
+        if outcome in ("ok", "error"):
+            return None
+        return model_router.escalate(decision, outcome)
+
+    def _generate(self, template: PromptTemplate, request: Dict[str, Any],
+                  parse: Callable[[Any], Any], decision: RouteDecision,
+                  deadline: Optional[Deadline] = None) -> Any:
+        """
+        라우팅된 모델로 생성 → 스키마/품질 검사 실패 시 상위 티어로 재시도 (캐스케이드)
+        - 상위 티어 시도가 실패하면 앞서 검증을 통과한 결과 사용
+        - 검증을 통과한 결과가 없으면 마지막 예외 전파 (호출부에서 기본값 대체)
+        """
+        best: Optional[Tuple[RouteDecision, Any]] = None
+        error: Optional[Exception] = None
+        while decision is not None:
+            started = time.monotonic()
+            response = result = error = None
+            try:
+                response = self._complete(template, request, deadline, decision.model)
+                self._record_prompt_usage(template, response)
+                with stage_timer("parse"):
+                    result = parse(response)
+                best = (decision, result)
+            except Exception as e:
+                error = e
+            decision = self._cascade_step(decision, started, response, result, error)
+        if best is None:
+            raise error
+        self._record_model_used(template.name, best[0].model)
+        return best[1]
+
+    def _coalesced(self, request: Dict[str, Any], fn, fallback, deadline: Optional[Deadline] = None) -> Any:
+        """
+        동일 요청(모델 + 파라미터)의 동시 실행을 하나의 LLM 호출로 병합 (작업 워커 스레드/배치 등 동기 경로)
+        - 다른 워커의 결과를 마감 시간까지 받지 못하면 fallback(error)로 대체
+        """
+        try:
+            result, role = llm_flight.do_sync(request_fingerprint(self.model, request), fn,
+                                              deadline.llm_deadline() if deadline else None)
+        except DeadlineExceededError as e:
+            result, role = fallback(e), "deadline_exceeded"
+        cache_requests.inc(cache="single_flight", result=role)
+        _record_generation(single_flight=role)
+        return result
+
+    def _mark_degraded(self, stage: str, error: Optional[Exception]) -> None:
+        """기본값으로 대체된 스테이지와 사유 기록 (generation_metadata.degraded)"""
+        if isinstance(error, CircuitOpenError):
+            reason = "circuit_open"
+        elif isinstance(error, TimeoutError):
+            reason = "deadline_exceeded"
+        elif isinstance(error, ValidationError):
+            reason = "invalid_output"
+        elif error is None:
+            reason = "empty_response"
+        else:
+            reason = "upstream_error"
+        llm_fallbacks.inc(stage=stage, reason=reason)
+        stages = dict((_generation_info.get() or {}).get("degraded_stages", {}))
+        stages[stage] = reason
+        _record_generation(degraded=True, degraded_stages=stages)
+        self._record_model_used(stage, None)
+
+    def _record_prompt_usage(self, template: PromptTemplate, response: Any) -> None:
+        """response.usage 기반 prefix 캐시 적중 토큰 기록"""
+        _record_generation(prompt=prompt_registry.record_usage(template.name, getattr(response, "usage", None)))
+
+    def _analysis_cache_key(self, career_summary: str, job_role: str,
+                            technical_skills: str, experience_years: int) -> str:
+        """정규화된 입력 + 모델 + 프롬프트 버전 기반 분석 캐시 키"""
+        return analysis_cache.make_key(
+            self.model, ANALYSIS_PROMPT.key,
+            career_summary=normalize_text(career_summary),
+            job_role=normalize_text(job_role),
+            technical_skills=skill_normalizer.fingerprint(technical_skills),
+            experience_years=experience_years
+        )
+
+    def _analysis_cache_entry(self, analysis: CareerAnalysis, model: Optional[str]) -> Dict[str, Any]:
+        """분석 캐시 값 - 분석 결과 + 그 결과를 만든 모델 (캐스케이드/배치 모델은 캐시 키의 기본 모델과 다를 수 있음)"""
+        return {"analysis": asdict(analysis), "model": model}
+
+    def _cached_analysis(self, entry: Dict[str, Any]) -> CareerAnalysis:
+        """캐시 적중 - 저장된 생성 모델을 이번 요청의 model_used로 기록"""
+        if "analysis" not in entry:
+            # 이전 형식(분석 결과만 저장)의 항목은 생성 모델을 알 수 없어 기본 모델로 보고 (TTL 후 사라짐)
+            entry = {"analysis": entry, "model": self.model}
+        self._record_model_used("resume_analysis", entry["model"])
+        return CareerAnalysis(**entry["analysis"])
+
+    def _record_analysis_cache(self, status: str) -> None:
+        """이번 요청의 캐시 결과와 누적 통계 기록"""
+        cache_requests.inc(cache="analysis", result=status)
+        _record_generation(cache={"status": status, **analysis_cache.stats()})
+
+    @stage_timer("prompt_render")
+    def _analysis_request(self, career_summary: str, job_role: str,
+                          technical_skills: str, experience_years: int) -> Dict[str, Any]:
+        """1단계 이력서 분석 요청 파라미터 구성 (입력 토큰 예산 적용)"""
+        fields, truncated = fit_fields(
+            {"career_summary": career_summary, "job_role": job_role, "technical_skills": technical_skills},
+            ANALYSIS_FIELD_BUDGETS, ANALYSIS_INPUT_TOKENS, self.model
+        )
+        messages = ANALYSIS_PROMPT.render(experience_years=experience_years, **fields)
+        max_tokens = completion_budget(1, ANALYSIS_OUTPUT_TOKENS)
+        _record_generation(token_budget=budget_report(messages, max_tokens, self.model, truncated))
+        return {
+            "messages": messages,
+            "temperature": 0.3,  # 일관성 있는 분석을 위해 낮은 temperature
+            "max_tokens": max_tokens,
+            "response_format": ANALYSIS_RESPONSE_FORMAT
+        }
+
+    def _validate_output(self, stage: str, output_model: Type[BaseModel], message: Any) -> BaseModel:
+        """
+        구조화 출력(json_schema) 1회 검증
+        - 모델 거부/스키마 불일치 시 예외 → 호출부에서 기본값으로 대체
+        """
+        refusal = getattr(message, "refusal", None)
+        if refusal:
+            output_stats.incr(stage, "refused")
+            log_raw_completion(stage, message.content, failed=True, refusal=refusal)
+            raise ValueError(f"모델이 응답을 거부했습니다: {refusal}")
+        try:
+            result = output_model.model_validate_json(message.content or "")
+        except ValidationError as e:
+            output_stats.incr(stage, "invalid")
+            log_raw_completion(stage, message.content, failed=True, validation_errors=e.error_count())
+            raise
+        output_stats.incr(stage, "validated")
+        log_raw_completion(stage, message.content, failed=False)
+        return result
+
+    def _validate_items(self, stage: str, key: str, item_model: Type[BaseModel],
+                        choice: Any) -> List[BaseModel]:
+        """
+        배열 응답 검증 - max_tokens로 잘린 응답(finish_reason == "length")은
+        완성된 원소만 살리고 미완성 원소만 버림
+        """
+        if getattr(choice, "finish_reason", None) != "length":
+            container = self._validate_output(stage, self._ITEM_CONTAINERS[stage], choice.message)
+            return getattr(container, key)
+
+        logger.warning("✂️ %s 응답이 max_tokens에서 잘림 - 완성된 원소만 복구", stage, extra={"stage": stage})
+        items, _ = parse_array(choice.message.content or "", key)
+        recovered = []
+        for item in items:
+            try:
+                recovered.append(item_model.model_validate(item))
+            except ValidationError:
+                continue
+        if not recovered:
+            output_stats.incr(stage, "invalid")
+            log_raw_completion(stage, choice.message.content, failed=True, finish_reason="length")
+            raise ValueError(f"{stage} 응답이 잘려 복구할 원소가 없습니다")
+        output_stats.incr(stage, "repaired")
+        _record_generation(truncation={"stage": stage, "recovered_items": len(recovered)})
+        return recovered
+
+    def _parse_analysis_response(self, message: Any) -> CareerAnalysis:
+        """이력서 분석 응답 검증"""
+        result = self._validate_output("resume_analysis", ResumeAnalysisResult, message)
+        return CareerAnalysis(**result.model_dump())
+
+    def _parse_analysis_completion(self, response: Any) -> CareerAnalysis:
+        return self._parse_analysis_response(response.choices[0].message)
+
+    def _analysis_fallback(self, error: Exception) -> CareerAnalysis:
+        """API 호출/검증 실패 시 기본 분석 결과"""
+        output_stats.incr("resume_analysis", "fallback")
+        self._mark_degraded("resume_analysis", error)
+        logger.error("❌ 이력서 분석 오류: %s", error, extra={
+            "stage": "resume_analysis", "error_type": type(error).__name__,
+            "api_key_configured": bool(os.getenv("OPENAI_API_KEY")),
+        })
+        
+        # 기본값 반환 (에러 핸들링)
+        return CareerAnalysis(
+            career_level=PLACEHOLDER_CAREER_LEVEL,
+            strength_areas=["기술적 역량"],
+            improvement_areas=["추가 분석 필요"],
+            career_pattern="분석 진행 중",
+            market_competitiveness=5,
+            personality_traits=["분석 중"],
+            growth_trajectory="추가 분석 필요"
+        )
+
+    @stage_timer("prompt_render")
+    def _interview_request(self, analysis: CareerAnalysis, company_type: str,
+                           position_level: str, career_summary: str,
+                           technical_skills: str) -> Dict[str, Any]:
+        """2단계 면접 질문 요청 파라미터 구성 (입력 토큰 예산 적용)"""
+        fields, truncated = fit_fields(
+            {
+                "strength_areas": ', '.join(analysis.strength_areas),
+                "improvement_areas": ', '.join(analysis.improvement_areas),
+                "personality_traits": ', '.join(analysis.personality_traits),
+                "career_summary": career_summary,
+                "technical_skills": technical_skills
+            },
+            INTERVIEW_FIELD_BUDGETS, INTERVIEW_INPUT_TOKENS, self.model
+        )
+        messages = INTERVIEW_PROMPT.render(
+            company_style=COMPANY_STYLES.get(company_type, "일반 기업"),
+            company_type=company_type,
+            position_level=position_level,
+            career_level=analysis.career_level,
+            **fields
+        )
+        max_tokens = completion_budget(INTERVIEW_QUESTION_COUNT, INTERVIEW_TOKENS_PER_QUESTION)
+        _record_generation(token_budget=budget_report(messages, max_tokens, self.model, truncated))
+        return {
+            "messages": messages,
+            "temperature": 0.7,  # 창의적 질문 생성을 위해 높은 temperature
+            "max_tokens": max_tokens,
+            "response_format": INTERVIEW_RESPONSE_FORMAT
+        }
+
+    def _parse_interview_response(self, choice: Any) -> List[Dict[str, str]]:
+        """면접 질문 응답 검증"""
+        questions = self._validate_items("interview_questions", "questions", InterviewQuestion, choice)
+        return [question.model_dump() for question in questions[:INTERVIEW_QUESTION_COUNT]]
+
+    def _parse_interview_completion(self, response: Any) -> List[Dict[str, str]]:
+        return self._parse_interview_response(response.choices[0])
+
+    def _interview_fallback(self, error: Optional[Exception] = None) -> List[Dict[str, str]]:
+        """기본 질문 반환 (에러 핸들링)"""
+        output_stats.incr("interview_questions", "fallback")
+        self._mark_degraded("interview_questions", error)
+        return [
+            {
+                "question": "본인의 주요 프로젝트 경험에 대해 설명해주세요.",
+                "category": "경험",
+                "difficulty_level": "기본",
+                "suggested_answer_approach": "구체적인 성과와 학습 포인트 중심으로 답변"
+            }
+        ] * 5
+
+    def _roadmap_phases(self, analysis: CareerAnalysis, target_goal: str,
+                        technical_skills: str, duration_months: int) -> List[Dict[str, Any]]:
+        """(목표, 레벨, 기간 구간, 스킬 계열)에 맞는 사전 구성 로드맵 골격 사본"""
+        template = roadmap_library.select(target_goal, analysis.career_level, duration_months, technical_skills)
+        _record_generation(roadmap_template=template.template_id)
+        return roadmap_library.phases(template, duration_months)
+
+    @stage_timer("prompt_render")
+    def _learning_request(self, analysis: CareerAnalysis, target_goal: str,
+                          technical_skills: str, duration_months: int,
+                          phases: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """3단계 학습 경로 개인화 요청 파라미터 구성 (입력 토큰 예산 적용)"""
+        fields, truncated = fit_fields(
+            {
+                "strength_areas": ', '.join(analysis.strength_areas),
+                "improvement_areas": ', '.join(analysis.improvement_areas),
+                "growth_trajectory": analysis.growth_trajectory,
+                "technical_skills": technical_skills
+            },
+            LEARNING_FIELD_BUDGETS, LEARNING_INPUT_TOKENS, self.model
+        )
+        messages = LEARNING_PROMPT.render(
+            career_level=analysis.career_level,
+            goal_description=GOAL_DESCRIPTIONS.get(target_goal, target_goal),
+            duration_months=duration_months,
+            roadmap_outline=outline(phases),
+            **fields
+        )
+        max_tokens = completion_budget(len(phases), LEARNING_TOKENS_PER_PHASE)
+        _record_generation(token_budget=budget_report(messages, max_tokens, self.model, truncated))
+        return {
+            "messages": messages,
+            "temperature": 0.4,  # 실용적이면서 창의적인 계획
+            "max_tokens": max_tokens,
+            "response_format": LEARNING_RESPONSE_FORMAT
+        }
+
+    def _parse_learning_response(self, phases: List[Dict[str, Any]], choice: Any) -> List[Dict[str, Any]]:
+        """학습 경로 개인화 응답 검증 후 골격 단계와 병합 (응답이 모자라면 나머지 단계는 골격 기본값)"""
+        items = self._validate_items("learning_path", "phases", LearningPhasePersonalization, choice)
+        return merge_personalization(phases, [item.model_dump() for item in items])
+
+    def _parse_learning_completion(self, phases: List[Dict[str, Any]], response: Any) -> List[Dict[str, Any]]:
+        return self._parse_learning_response(phases, response.choices[0])
+
+    def _learning_fallback(self, phases: List[Dict[str, Any]],
+                           error: Optional[Exception] = None) -> List[Dict[str, Any]]:
+        """기본 학습 경로 반환 (에러 핸들링) - 골격의 기본 projects/personal_advice 사용"""
+        output_stats.incr("learning_path", "fallback")
+        self._mark_degraded("learning_path", error)
+        return phases
+
+    # === 생성 API (동기) ===
         
     def analyze_resume_profile(self, career_summary: str, job_role: str, 
-                             technical_skills: str, experience_years: int) -> CareerAnalysis:
+                             technical_skills: str, experience_years: int,
+                             deadline: Optional[Deadline] = None) -> CareerAnalysis:
         """
         🔍 1단계: 이력서 심층 분석
         - 단순 정보 추출이 아닌 패턴 분석
         - 숨겨진 강점/약점 발견
         """
+        cache_key = self._analysis_cache_key(career_summary, job_role, technical_skills, experience_years)
+        cached, status = analysis_cache.get(cache_key)
+        self._record_analysis_cache(status)
+        if cached is not None:
+            return self._cached_analysis(cached)
         
-        analysis_prompt = f"""
-당신은 20년 경력의 글로벌 헤드헌팅 회사 시니어 파트너입니다. 
-구글, 메타, 네이버, 카카오 등 수천 명의 개발자 채용을 성공시키며, 개발자 커리어 패턴과 시장 트렌드를 정확히 파악하는 전문가입니다.
-
-**지원자 정보:**
-📋 **경력 요약**: {career_summary}
-💼 **수행 직무**: {job_role}
-🛠️ **기술 스킬**: {technical_skills}
-📅 **경력 연수**: {experience_years}년
-
-**미션**: 이 개발자의 현재 위치와 잠재력을 정밀 분석하여, 향후 커리어 전략 수립의 기초 데이터를 제공하세요.
-
-**심층 분석 요구사항:**
-
-1. **커리어 레벨 정밀 진단**
-   - 경력 연수 대비 실제 성숙도 평가
-   - 업계 표준과 비교한 기술 수준
-   - 리더십/책임감 발전 정도
-
-2. **시장 차별화 강점 분석** (구체적 증거 기반)
-   - 타 개발자 대비 독특한 경험이나 역량
-   - 기술적 깊이와 넓이의 균형
-   - 비즈니스 임팩트 창출 능력
-
-3. **전략적 개선 영역** (채용 관점)
-   - 현재 시장에서 요구되지만 부족한 스킬
-   - 다음 레벨로 승진하기 위한 필수 역량
-   - 장기적 경쟁력 확보를 위한 투자 영역
-
-4. **커리어 패턴 심화 분석** (존댓말로 작성 필수)
-   - 학습 동기와 성장 의지에 대한 구체적 평가
-   - 현재 상황(나이, 경력 전환 등)의 강점과 약점 분석
-   - 실무 경험 부족 시 이를 극복할 수 있는 방안과 잠재력
-   - 향후 커리어 발전 가능성과 제약 요인
-   - 시장에서의 포지셔닝과 차별화 전략
-
-5. **현재 시장 가치** (정량적 평가)
-   - 현재 기술 스택의 시장 수요도
-   - 경력 대비 연봉 협상력
-   - 이직 시 선택권의 폭
-
-**출력 형식 (JSON):**
-{{
-    "career_level": "주니어/중급/시니어/리드/아키텍트 중 정확한 위치",
-    "strength_areas": [
-        "구체적이고 차별화된 강점 1 (시장 관점에서 평가)",
-        "경쟁사 대비 우위를 가질 수 있는 강점 2", 
-        "장기적 성장 잠재력을 보여주는 강점 3"
-    ],
-    "improvement_areas": [
-        "즉시 개선이 필요한 핵심 약점 1 (구체적 이유 포함)",
-        "시장 요구사항 대비 부족한 영역 2 (트렌드 반영)",
-        "커리어 도약을 위한 필수 투자 영역 3"
-    ],
-    "career_pattern": "이 개발자님의 현재 상황과 성장 패턴에 대한 심화 분석입니다. 학습 동기, 경력 전환 의지, 실무 경험 부족 극복 방안, 나이와 상황을 고려한 현실적 전망을 포함하여 5-6문장으로 존댓말로 상세히 작성하세요.",
-    "market_competitiveness": "현재 시장에서의 경쟁력 점수 (1-10점, 동일 경력 대비)",
-    "personality_traits": [
-        "이력서에서 드러나는 학습 성향과 적응력 평가",
-        "업무 접근 방식과 문제 해결 스타일",
-        "팀워크와 리더십 발현 가능성"
-    ],
-    "growth_trajectory": "현재 궤적을 유지할 경우와 적극적인 성장 전략을 수립할 경우의 5년 후 전망을 구체적으로 비교 분석 (존댓말 4-5문장)"
-}}
-
-**필수 작성 규칙:**
-- career_pattern과 growth_trajectory는 반드시 존댓말로 작성
-- 구체적 근거와 실용적 인사이트 중심
-- 나이, 실무 경험, 학습 기간 등 개인 상황을 세밀히 고려
-- 일반론이 아닌 이 개발자만의 상황에 맞춘 분석
-- 부정적 요소도 건설적 관점에서 개선 방향 제시
-"""
-
-        try:
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": analysis_prompt}],
-                temperature=0.3,  # 일관성 있는 분석을 위해 낮은 temperature
-                max_tokens=1500
-            )
-            
-            # 디버깅: 원시 응답 확인
-            raw_content = response.choices[0].message.content
-            print(f"🔍 OpenAI 원시 응답: {raw_content}")
-            
-            # JSON 파싱 전 정리
-            if raw_content:
-                # 코드 블록 마커 제거
-                if raw_content.startswith("```json"):
-                    raw_content = raw_content[7:]
-                if raw_content.endswith("```"):
-                    raw_content = raw_content[:-3]
-                raw_content = raw_content.strip()
-                
-                result = json.loads(raw_content)
-            else:
-                raise ValueError("Empty response from OpenAI")
-            
-            return CareerAnalysis(
-                career_level=result['career_level'],
-                strength_areas=result['strength_areas'],
-                improvement_areas=result['improvement_areas'],
-                career_pattern=result['career_pattern'],
-                market_competitiveness=result['market_competitiveness'],
-                personality_traits=result['personality_traits'],
-                growth_trajectory=result['growth_trajectory']
-            )
-            
-        except json.JSONDecodeError as e:
-            # JSON 파싱 오류 상세 로깅
-            print(f"❌ JSON 파싱 오류: {e}")
-            print(f"🔍 문제가 된 응답 내용: {raw_content}")
-            
-            # JSON 복구 시도
+        request = self._analysis_request(career_summary, job_role, technical_skills, experience_years)
+        route = self._route(ANALYSIS_PROMPT, request, experience_years <= settings.LLM_ROUTING_JUNIOR_MAX_YEARS,
+                            technical_skills)
+        
+        def run() -> Dict[str, Any]:
             try:
-                # 불완전한 JSON을 완성하려고 시도
-                if "{" in raw_content:
-                    start_idx = raw_content.find("{")
-                    json_part = raw_content[start_idx:]
-                    # 중괄호 균형 맞추기
-                    open_count = json_part.count("{")
-                    close_count = json_part.count("}")
-                    if open_count > close_count:
-                        json_part += "}" * (open_count - close_count)
-                    result = json.loads(json_part)
-                else:
-                    raise ValueError("No JSON structure found")
-            except:
-                # 완전히 실패한 경우 기본값 사용
-                result = {
-                    "career_level": "분석 중",
-                    "strength_areas": ["기술적 역량", "실무 경험"],
-                    "improvement_areas": ["추가 분석 필요"],
-                    "career_pattern": "분석 진행 중",
-                    "market_competitiveness": 5,
-                    "personality_traits": ["분석 중"],
-                    "growth_trajectory": "추가 분석 필요"
-                }
-            
-            return CareerAnalysis(
-                career_level=result['career_level'],
-                strength_areas=result['strength_areas'],
-                improvement_areas=result['improvement_areas'],
-                career_pattern=result['career_pattern'],
-                market_competitiveness=result['market_competitiveness'],
-                personality_traits=result['personality_traits'],
-                growth_trajectory=result['growth_trajectory']
-            )
+                analysis = self._generate(ANALYSIS_PROMPT, request, self._parse_analysis_completion, route, deadline)
+            except Exception as e:
+                return asdict(self._analysis_fallback(e))
             
-        except Exception as e:
-            # 완전한 API 호출 실패
-            print(f"❌ OpenAI API 호출 오류: {e}")
-            print(f"API 키 설정 여부: {'설정됨' if os.getenv('OPENAI_API_KEY') else '미설정'}")
-            
-            # 기본값 반환 (에러 핸들링)
-            return CareerAnalysis(
-                career_level="분석 중",
-                strength_areas=["기술적 역량"],
-                improvement_areas=["추가 분석 필요"],
-                career_pattern="분석 진행 중",
-                market_competitiveness=5,
-                personality_traits=["분석 중"],
-                growth_trajectory="추가 분석 필요"
-            )
+            analysis_cache.set(cache_key, self._analysis_cache_entry(analysis, self.model_used("resume_analysis")))
+            return asdict(analysis)
+        
+        result = self._coalesced(request, run, lambda e: asdict(self._analysis_fallback(e)), deadline)
+        return CareerAnalysis(**result)
 
     def generate_interview_questions(self, analysis: CareerAnalysis, 
                                    company_type: str, position_level: str,
-                                   career_summary: str, technical_skills: str) -> List[Dict[str, str]]:
+                                   career_summary: str, technical_skills: str,
+                                   deadline: Optional[Deadline] = None) -> List[Dict[str, str]]:
         """
         🎯 2단계: 맞춤형 면접 질문 생성
         - 분석 결과 기반 개인화
         - 회사 유형별 차별화
         - 실제 면접에서 나올 법한 질문
         """
+        request = self._interview_request(analysis, company_type, position_level,
+                                          career_summary, technical_skills)
+        route = self._route(INTERVIEW_PROMPT, request, is_junior_level(analysis.career_level), technical_skills)
         
-        # 회사 유형별 면접 스타일 정의
-        company_styles = {
-            "startup": "빠른 성장, 다양한 역할, 문제해결 능력 중시",
-            "midsize": "안정성과 성장의 균형, 체계적 프로세스",
-            "large": "전문성, 체계적 업무, 협업 능력",
-            "foreign": "글로벌 마인드, 커뮤니케이션, 다양성"
-        }
-        
-        interview_prompt = f"""
-당신은 {company_styles.get(company_type, "일반 기업")} 특성을 가진 회사의 시니어 기술 면접관입니다. 
-10년 이상 {position_level} 레벨 개발자를 채용해온 전문가로, 실제 업무 역량을 정확히 파악하는 날카로운 질문으로 유명합니다.
-
-**지원자 상세 프로필:**
-- 커리어 레벨: {analysis.career_level}
-- 핵심 강점: {', '.join(analysis.strength_areas)}
-- 개선 필요 영역: {', '.join(analysis.improvement_areas)}
-- 성격 특성: {', '.join(analysis.personality_traits)}
-- 구체적 경력: {career_summary}
-- 기술 스택: {technical_skills}
-
-**면접 목표**: 이 지원자가 우리 회사 {position_level} 포지션에서 **실제로 성과를 낼 수 있는지** 검증하는 심층 질문을 만드세요.
-
-**필수 질문 설계 원칙:**
-1. **경험 기반 구체성**: 지원자의 실제 프로젝트/기술을 언급한 세부 질문
-2. **실무 시나리오**: 가상이 아닌 실제 일어날 수 있는 업무 상황
-3. **기술적 깊이**: 단순 지식이 아닌 문제 해결 과정과 트레이드오프 이해도 평가
-4. **협업 검증**: 실제 팀워크와 커뮤니케이션 역량 확인
-5. **회사 핏**: {company_type} 환경에서의 적응력과 가치 부합성
-
-**필수 질문 카테고리 (각 1개씩, 총 5개):**
-
-1. **기술 전문성 & 실무 경험** (고급 난이도)
-   - 지원자의 주요 기술 스택을 깊이 있게 탐구
-   - 실제 겪었을 법한 기술적 도전과 해결 과정
-   - 아키텍처/설계 관련 의사결정 경험
-
-2. **문제 해결 & 트러블슈팅** (중급-고급 난이도)
-   - 구체적인 문제 상황과 해결 과정
-   - 다양한 접근법의 장단점 분석
-   - 제약 조건 하에서의 최적해 도출
-
-3. **학습 능력 & 적응력** (중급 난이도)
-   - 새로운 기술 습득 경험과 방법론
-   - 실패나 어려움 극복 사례
-   - 변화하는 요구사항에 대한 대응
-
-4. **팀워크 & 커뮤니케이션** (중급 난이도)
-   - 실제 협업 경험과 갈등 해결
-   - 기술적 내용의 비기술자 설명 능력
-   - 코드 리뷰, 멘토링 등 지식 공유 경험
-
-5. **회사 적합성 & 비전** (기본-중급 난이도)
-   - {company_type} 환경에서의 목표와 기여 방향
-   - 장기적 성장 계획과 회사 발전 방향의 일치성
-   - 업무 우선순위와 가치관
-
-**출력 형식 (JSON):**
-[
-    {{
-        "question": "지원자의 구체적 경험을 언급한 상세하고 날카로운 질문 (2-3문장)",
-        "category": "기술 전문성 & 실무 경험",
-        "difficulty_level": "고급",
-        "suggested_answer_approach": "효과적인 답변을 위한 구체적 가이드 (구조화 방법, 포함할 내용 등)"
-    }},
-    {{
-        "question": "실제 상황 기반의 문제 해결 시나리오 질문",
-        "category": "문제 해결 & 트러블슈팅", 
-        "difficulty_level": "중급",
-        "suggested_answer_approach": "문제 분석 -> 해결 과정 -> 결과 -> 학습 순서로 답변"
-    }}
-    // ... 총 5개 질문
-]
-
-**주의사항:**
-- 각 질문은 지원자의 실제 경험과 기술을 구체적으로 언급해야 함
-- "일반적으로 어떻게 하나요?" 같은 추상적 질문 금지
-- 실제 면접에서 30분 이상 토론할 수 있을 정도의 깊이 있는 질문
-- {company_type} 회사의 특성과 {position_level} 레벨에 적합한 난이도
-"""
-
-        try:
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": interview_prompt}],
-                temperature=0.7,  # 창의적 질문 생성을 위해 높은 temperature
-                max_tokens=2000
-            )
-            
-            # JSON 파싱 개선
-            raw_content = response.choices[0].message.content
-            print(f"🔍 면접 질문 원시 응답: {raw_content}")
-            
-            # JSON 정리
-            if raw_content.startswith("```json"):
-                raw_content = raw_content[7:]
-            if raw_content.endswith("```"):
-                raw_content = raw_content[:-3]
-            raw_content = raw_content.strip()
-            
-            questions = json.loads(raw_content)
-            return questions[:5]  # 정확히 5개만 반환
+        def run() -> List[Dict[str, str]]:
+            try:
+                return self._generate(INTERVIEW_PROMPT, request, self._parse_interview_completion, route, deadline)
+            except ValidationError as e:
+                logger.error("❌ 면접 질문 스키마 검증 오류: %s", e, extra={"stage": "interview_questions", "error_type": type(e).__name__})
+                error = e
+            except Exception as e:
+                logger.error("❌ 면접 질문 생성 오류: %s", e, extra={"stage": "interview_questions", "error_type": type(e).__name__})
+                error = e
             
-        except json.JSONDecodeError as e:
-            print(f"❌ 면접 질문 JSON 파싱 오류: {e}")
-            print(f"🔍 문제가 된 응답: {raw_content}")
-            # 기본 질문 반환
-        except Exception as e:
-            print(f"❌ 면접 질문 생성 오류: {e}")
-            # 기본 질문 반환
-            # 기본 질문 반환 (에러 핸들링)
-            return [
-                {
-                    "question": "본인의 주요 프로젝트 경험에 대해 설명해주세요.",
-                    "category": "경험",
-                    "difficulty_level": "기본",
-                    "suggested_answer_approach": "구체적인 성과와 학습 포인트 중심으로 답변"
-                }
-            ] * 5
+            return self._interview_fallback(error)
+        
+        return self._coalesced(request, run, self._interview_fallback, deadline)
 
     def generate_learning_path(self, analysis: CareerAnalysis, target_goal: str,
                              career_summary: str, technical_skills: str,
-                             duration_months: int = 3) -> List[Dict[str, Any]]:
+                             duration_months: int = 3,
+                             deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
         """
         📚 3단계: 개인 맞춤형 학습 경로 생성
         - 현재 수준에서 목표까지의 구체적 로드맵
         - 실현 가능한 단계별 계획
         """
+        phases = self._roadmap_phases(analysis, target_goal, technical_skills, duration_months)
+        request = self._learning_request(analysis, target_goal, technical_skills, duration_months, phases)
+        route = self._route(LEARNING_PROMPT, request, is_junior_level(analysis.career_level), technical_skills)
         
-        goal_descriptions = {
-            "skill_enhancement": "현재 기술 스킬 심화 및 확장",
-            "career_change": "새로운 분야로의 커리어 전환",
-            "promotion": "현재 직무에서의 승진 및 성장",
-            "interview_prep": "면접 준비 및 취업 성공",
-            "freelance_prep": "프리랜서/창업 준비"
-        }
+        def run() -> List[Dict[str, Any]]:
+            try:
+                steps = self._generate(LEARNING_PROMPT, request, partial(self._parse_learning_completion, phases),
+                                       route, deadline)
+                return steps + phases[len(steps):]
+            except ValidationError as e:
+                logger.error("❌ 학습 경로 스키마 검증 오류: %s", e, extra={"stage": "learning_path", "error_type": type(e).__name__})
+                error = e
+            except Exception as e:
+                logger.error("❌ 학습 경로 생성 오류: %s", e, extra={"stage": "learning_path", "error_type": type(e).__name__})
+                error = e
+            
+            return self._learning_fallback(phases, error)
         
-        learning_prompt = f"""
-당신은 10년 이상 개발자 커리어 코칭을 해온 시니어 멘토입니다. 실리콘밸리와 국내 대기업에서 수백 명의 개발자 성장을 도왔습니다.
-
-**지원자 심층 분석:**
-- 커리어 레벨: {analysis.career_level}
-- 핵심 강점: {', '.join(analysis.strength_areas)}
-- 개선 필요 영역: {', '.join(analysis.improvement_areas)}
-- 성장 궤적: {analysis.growth_trajectory}
-- 현재 기술 스택: {technical_skills}
-- 커리어 목표: {goal_descriptions.get(target_goal, target_goal)}
-- 학습 기간: {duration_months}개월
-
-**미션**: 이 개발자가 시장에서 경쟁력을 갖추고 커리어 목표를 달성할 수 있는 **실전 중심의 학습 로드맵**을 설계하세요.
-
-**필수 포함 요소:**
-1. **특정 기술 스택 심화**: 현재 기술을 전문가 수준으로 발전
-2. **구체적인 프로젝트 제안**: 실제 포트폴리오가 될 수 있는 프로젝트 (기술 스택 명시)
-3. **커뮤니케이션 스킬**: 기술 발표, 코드 리뷰, 팀 협업 역량
-4. **한국 취업 시장 맞춤**: 국내 기업 채용 트렌드와 요구사항 반영
-5. **개인화된 실행 가이드**: 이 개발자만을 위한 구체적 실행 방법론
-
-**로드맵 설계 원칙:**
-- **실무 연결성**: 실제 업무에서 바로 써먹을 수 있는 내용
-- **프로젝트 기반**: 각 단계마다 구체적인 산출물 생성
-- **네트워킹 포함**: 한국 개발 커뮤니티 참여와 지식 공유 (OKKY, 카카오톡 오픈채팅, 원티드)
-
-**단계별 로드맵 (JSON):**
-[
-    {{
-        "phase": "1단계: 기술 전문성 심화",
-        "duration_weeks": {duration_months * 4 // 3},
-        "objectives": [
-            "현재 주력 기술 스택의 고급 기능 마스터",
-            "성능 최적화 및 아키텍처 설계 능력 향상",
-            "실전 프로젝트 1개 완성 (포트폴리오용)"
-        ],
-        "resources": [
-            "기술별 공식 문서 심화 학습 (Spring Boot/Django 공식 문서)",
-            "실무 아키텍처 패턴 서적 (클린 아키텍처, 마이크로서비스 패턴)",
-            "GitHub 오픈소스 프로젝트 분석 (Spring Boot/Django 베스트 프랙티스)"
-        ],
-        "milestones": [
-            "복잡한 비즈니스 로직을 포함한 개인 프로젝트 완성",
-            "기술 블로그 포스팅 3회 이상",
-            "코드 품질 측정 도구로 80% 이상 달성"
-        ],
-        "projects": [
-            "E-commerce API 서버 구축 (Spring Boot + JPA + Redis 캐싱)",
-            "실시간 채팅 시스템 구현 (WebSocket + JWT 인증 + MongoDB)",
-            "개인 포트폴리오 사이트 + 관리자 대시보드 (REST API + 프론트엔드 연동)"
-        ],
-        "personal_advice": "이 단계를 성공적으로 완료하시려면 다음과 같은 구체적인 실행 계획을 권장드립니다. 학습과 실습의 균형을 맞추시되, 평일에는 이론 학습(Django 공식 문서)에, 주말에는 집중적으로 실습 프로젝트에 시간을 할애하세요. IDE는 파이참이나 VS Code를 사용하시고, 버전 관리는 GitHub으로 진행하시기 바랍니다. 학습 순서는 Django ORM 심화 → REST API 설계 → 성능 최적화 → 배포 자동화 순으로 진행하시면 됩니다. 특히 E-commerce 프로젝트는 2주차부터 시작하여 점진적으로 기능을 추가해 나가시고, 진행상황을 벨로그나 브런치, GitHub README에 정리하여 포트폴리오로 활용하시길 바랍니다."
-    }},
-    {{
-        "phase": "2단계: 확장 기술 습득 및 실전 경험",
-        "duration_weeks": {duration_months * 4 // 2},
-        "objectives": [
-            "인접 기술 스택 습득 (풀스택/클라우드/데브옵스)",
-            "팀 프로젝트 또는 오픈소스 기여 경험",
-            "기술 발표 및 지식 공유 활동"
-        ],
-        "resources": [
-            "클라우드 플랫폼 실습 과정 (AWS Skill Builder, 네이버 클라우드 플랫폼 아카데미)",
-            "오픈소스 프로젝트 참여 (GitHub에서 한국어 프로젝트 또는 'good first issue' 찾기)",
-            "개발자 커뮤니티 참여 (OKKY, 원티드 개발자 모임, 카카오톡 개발자 오픈채팅)"
-        ],
-        "milestones": [
-            "오픈소스 프로젝트에 의미있는 기여 (PR 머지)",
-            "개발자 커뮤니티에서 기술 발표 1회",
-            "클라우드 기반 배포 환경 구축 완료"
-        ],
-        "projects": [
-            "마이크로서비스 아키텍처 기반 TODO 서비스 (Docker + Kubernetes)",
-            "실시간 주식 가격 모니터링 시스템 (WebSocket + 외부 API 연동)",
-            "개발팀용 코드 리뷰 봇 개발 (GitHub API + Slack 연동)"
-        ],
-        "personal_advice": "2단계 실행을 위해서는 체계적인 접근이 필요합니다. AWS 학습은 AWS Skill Builder에서 단계별로 진행하시고, 실습은 AWS 프리티어를 활용하세요. 오픈소스 기여는 'good first issue' 라벨이 있는 Django 관련 프로젝트를 GitHub에서 찾아 시작하시되, 코드 분석부터 차근차근 시작하세요. 기술 발표 준비는 8주차부터 시작하여 발표 자료는 브런치나 벨로그에 올리고, 데모는 Netlify나 GitHub Pages로 배포하시면 됩니다. 마이크로서비스 프로젝트는 Docker Desktop에서 로컬 개발하시고, Kubernetes는 Minikube로 학습하신 후 네이버 클라우드나 AWS에 배포해보세요. 특히 학습한 내용을 정기적으로 벨로그나 티스토리에 포스팅하여 지식을 정리하시길 권합니다."
-    }},
-    {{
-        "phase": "3단계: 리더십 및 영향력 확장",
-        "duration_weeks": {duration_months * 4 - (duration_months * 4 // 3) - (duration_months * 4 // 2)},
-        "objectives": [
-            "주니어 개발자 멘토링 경험",
-            "기술적 의사결정 및 코드 리뷰 리더십",
-            "개발 프로세스 개선 제안 및 실행"
-        ],
-        "resources": [
-            "리더십 및 커뮤니케이션 스킬 도서 (크루셜 대화, 피드백의 기술)",
-            "코드 리뷰 베스트 프랙티스 학습 (Google의 엔지니어링 문화)",
-            "애자일/스크럼 방법론 실습 (Scrum.org 인증 과정)"
-        ],
-        "milestones": [
-            "1명 이상 주니어 개발자 멘토링",
-            "팀/회사 내 기술 세미나 진행",
-            "개발 프로세스 개선 사례 1건 이상"
-        ],
-        "projects": [
-            "팀 개발 생산성 향상 도구 개발 (CI/CD 파이프라인 + 모니터링)",
-            "사내 기술 블로그 플랫폼 구축 (CMS + 검색 + 댓글 시스템)",
-            "주니어 개발자를 위한 코딩 테스트 문제 플랫폼 개발"
-        ],
-        "personal_advice": "리더십 단계의 핵심은 체계적인 멘토링과 프로세스 개선입니다. 주니어 멘토링은 정기적으로 카카오톡 화상통화나 구글 미트로 진행하시고, 멘토링 내용은 노션 템플릿을 만들어 체계적으로 관리하세요. 기술 세미나는 4주 전부터 준비를 시작하여 주제 선정 → 자료 조사 → 발표 자료 작성 → 리허설 순으로 진행하시되, 발표 자료는 파워포인트나 구글 슬라이드로 제작하고 데모는 실제 작동하는 코드로 준비하세요. CI/CD 파이프라인 구축은 젠킨스나 GitHub Actions을 사용하여 실제 프로젝트에 적용해보시고, 모니터링은 엘라스틱서치와 키바나를 활용하시길 바랍니다. 특히 프로세스 개선 제안서는 현재 문제점 분석 → 해결 방안 → 기대 효과를 명확히 정리하여 상급자에게 제시하시면 됩니다."
-    }}
-]
+        return self._coalesced(request, run, partial(self._learning_fallback, phases), deadline)
 
-**중요 출력 규칙:**
-- projects와 personal_advice 필드 반드시 포함
-- resources는 반드시 문자열 배열로만 출력 (객체 형태 금지)
-- personal_advice는 해당 단계의 objectives, resources, milestones, projects를 구체적으로 어떻게 실행할지 상세한 방법론을 존댓말로 제시
-- 어떤 도구로, 어떤 순서로, 어떤 플랫폼에서 학습할지 구체적인 실행 계획 포함 (시간 투자량은 언급하지 않음)
-- 한국 개발자가 실제로 사용하는 플랫폼과 서비스 위주로 구성
-- 구체적이고 실행 가능한 내용으로 작성
-"""
+    def model_used(self, stage: str) -> Optional[str]:
+        """
+        이번 요청에서 stage 결과를 만든 모델
+        (기본값 대체면 None, LLM 호출 기록이 없으면(캐시 적중 등) 기본 모델)
+        """
+        return (_generation_info.get() or {}).get("models_used", {}).get(stage, self.model)
+
+    def get_analysis_metadata(self, start_time: float, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """프로필 analysis_result에 함께 저장하는 분석 메타데이터"""
+        info = _generation_info.get() or {}
+        metadata = {
+            "generation_time": time.time() - start_time,
+            "model_used": self.model_used("resume_analysis"),
+            "routing": info.get("routing", []),
+            "cache": info.get("cache"),
+            "degraded": info.get("degraded", False),
+            "usage": info.get("usage") or empty_usage(),
+            "trace_id": current_trace_id(),
+        }
+        if deadline is not None:
+            metadata["deadline"] = {**info.get("deadline", {}), **deadline.report()}
+        return metadata
 
+    def get_generation_metadata(self, process_type: str, start_time: float,
+                                deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """생성 메타데이터 (성능 모니터링용)"""
+        metadata = {
+            "process_type": process_type,
+            "model_used": self.model_used(process_type),
+            "backend": llm_backend.name,
+            "degraded": False,
+            "generation_time_seconds": round(time.time() - start_time, 2),
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "trace_id": current_trace_id(),
+            "usage": empty_usage(),
+            **(_generation_info.get() or {})
+        }
+        if deadline is not None:
+            metadata["deadline"] = {**metadata.get("deadline", {}), **deadline.report()}
+        return metadata
+
+
+class AsyncCareerCoachAI(CareerCoachAI):
+    """
+    ⚡ 비동기 커리어 코치 AI 엔진 (ASGI 경로)
+    - AsyncOpenAI 클라이언트로 LLM 응답 대기 중 이벤트 루프 반환
+    - 프롬프트/파싱/기본값 로직은 CareerCoachAI와 공유
+    """
+
+    async def _acomplete(self, template: PromptTemplate, request: Dict[str, Any],
+                         deadline: Optional[Deadline] = None, model: Optional[str] = None,
+                         **options: Any) -> Any:
+        """복원력 계층(마감 시간/재시도/서킷 브레이커)을 거친 비동기 LLM 호출"""
+        request, llm_deadline = self._bounded(template, request, deadline)
+        model = model or self.model
+
+        async def attempt(timeout: float) -> Any:
+            with observe_llm_call(model):
+                return await async_client.chat.completions.create(
+                    model=model, timeout=timeout, **options, **request
+                )
+
+        with stage_timer("upstream"):
+            return await llm_caller.acall(attempt, deadline=llm_deadline)
+
+    async def _agenerate(self, template: PromptTemplate, request: Dict[str, Any],
+                         parse: Callable[[Any], Any], decision: RouteDecision,
+                         deadline: Optional[Deadline] = None) -> Any:
+        """라우팅 + 캐스케이드 생성 (비동기) - 동작은 _generate와 동일"""
+        best: Optional[Tuple[RouteDecision, Any]] = None
+        error: Optional[Exception] = None
+        while decision is not None:
+            started = time.monotonic()
+            response = result = error = None
+            try:
+                response = await self._acomplete(template, request, deadline, decision.model)
+                self._record_prompt_usage(template, response)
+                with stage_timer("parse"):
+                    result = parse(response)
+                best = (decision, result)
+            except Exception as e:
+                error = e
+            decision = self._cascade_step(decision, started, response, result, error)
+        if best is None:
+            raise error
+        self._record_model_used(template.name, best[0].model)
+        return best[1]
+
+    async def _coalesced(self, request: Dict[str, Any], fn, fallback, deadline: Optional[Deadline] = None) -> Any:
+        """
+        동일 요청(모델 + 파라미터)의 동시 실행을 하나의 LLM 호출로 병합
+        - 다른 워커의 결과를 마감 시간까지 받지 못하면 fallback(error)로 대체
+        """
         try:
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": learning_prompt}],
-                temperature=0.4,  # 실용적이면서 창의적인 계획
-                max_tokens=2500
-            )
-            
-            # JSON 파싱 개선
-            raw_content = response.choices[0].message.content
-            print(f"🔍 학습 경로 원시 응답: {raw_content}")
-            
-            # JSON 부분만 추출
-            if "```json" in raw_content:
-                start_idx = raw_content.find("```json") + 7
-                end_idx = raw_content.find("```", start_idx)
-                if end_idx != -1:
-                    raw_content = raw_content[start_idx:end_idx]
-            elif "[" in raw_content:
-                # JSON 배열 부분만 추출
-                start_idx = raw_content.find("[")
-                end_idx = raw_content.rfind("]") + 1
-                raw_content = raw_content[start_idx:end_idx]
+            result, role = await llm_flight.do(request_fingerprint(self.model, request), fn,
+                                               deadline.llm_deadline() if deadline else None)
+        except DeadlineExceededError as e:
+            result, role = fallback(e), "deadline_exceeded"
+        cache_requests.inc(cache="single_flight", result=role)
+        _record_generation(single_flight=role)
+        return result
+
+    async def analyze_resume_profile(self, career_summary: str, job_role: str,
+                                     technical_skills: str, experience_years: int,
+                                     deadline: Optional[Deadline] = None) -> CareerAnalysis:
+        """🔍 1단계: 이력서 심층 분석 (비동기)"""
+        cache_key = self._analysis_cache_key(career_summary, job_role, technical_skills, experience_years)
+        cached, status = await analysis_cache.aget(cache_key)
+        self._record_analysis_cache(status)
+        if cached is not None:
+            return self._cached_analysis(cached)
+        
+        request = self._analysis_request(career_summary, job_role, technical_skills, experience_years)
+        route = self._route(ANALYSIS_PROMPT, request, experience_years <= settings.LLM_ROUTING_JUNIOR_MAX_YEARS,
+                            technical_skills)
+        
+        async def run() -> Dict[str, Any]:
+            try:
+                analysis = await self._agenerate(ANALYSIS_PROMPT, request, self._parse_analysis_completion,
+                                                 route, deadline)
+            except Exception as e:
+                return asdict(self._analysis_fallback(e))
             
-            raw_content = raw_content.strip()
-            learning_steps = json.loads(raw_content)
-            return learning_steps
+            await analysis_cache.aset(cache_key,
+                                      self._analysis_cache_entry(analysis, self.model_used("resume_analysis")))
+            return asdict(analysis)
+        
+        result = await self._coalesced(request, run, lambda e: asdict(self._analysis_fallback(e)), deadline)
+        return CareerAnalysis(**result)
+
+    async def generate_interview_questions(self, analysis: CareerAnalysis,
+                                           company_type: str, position_level: str,
+                                           career_summary: str, technical_skills: str,
+                                           deadline: Optional[Deadline] = None) -> List[Dict[str, str]]:
+        """🎯 2단계: 맞춤형 면접 질문 생성 (비동기)"""
+        request = self._interview_request(analysis, company_type, position_level,
+                                          career_summary, technical_skills)
+        route = self._route(INTERVIEW_PROMPT, request, is_junior_level(analysis.career_level), technical_skills)
+        
+        async def run() -> List[Dict[str, str]]:
+            try:
+                return await self._agenerate(INTERVIEW_PROMPT, request, self._parse_interview_completion,
+                                             route, deadline)
+            except ValidationError as e:
+                logger.error("❌ 면접 질문 스키마 검증 오류: %s", e, extra={"stage": "interview_questions", "error_type": type(e).__name__})
+                error = e
+            except Exception as e:
+                logger.error("❌ 면접 질문 생성 오류: %s", e, extra={"stage": "interview_questions", "error_type": type(e).__name__})
+                error = e
             
-        except json.JSONDecodeError as e:
-            print(f"❌ 학습 경로 JSON 파싱 오류: {e}")
-            print(f"🔍 문제가 된 응답: {raw_content}")
-            # 기본 학습 경로 반환
-        except Exception as e:
-            print(f"❌ 학습 경로 생성 오류: {e}")
+            return self._interview_fallback(error)
+        
+        return await self._coalesced(request, run, self._interview_fallback, deadline)
+
+    async def generate_learning_path(self, analysis: CareerAnalysis, target_goal: str,
+                                     career_summary: str, technical_skills: str,
+                                     duration_months: int = 3,
+                                     deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """📚 3단계: 개인 맞춤형 학습 경로 생성 (비동기)"""
+        phases = self._roadmap_phases(analysis, target_goal, technical_skills, duration_months)
+        request = self._learning_request(analysis, target_goal, technical_skills, duration_months, phases)
+        route = self._route(LEARNING_PROMPT, request, is_junior_level(analysis.career_level), technical_skills)
+        
+        async def run() -> List[Dict[str, Any]]:
+            try:
+                steps = await self._agenerate(LEARNING_PROMPT, request,
+                                              partial(self._parse_learning_completion, phases), route, deadline)
+                return steps + phases[len(steps):]
+            except ValidationError as e:
+                logger.error("❌ 학습 경로 스키마 검증 오류: %s", e, extra={"stage": "learning_path", "error_type": type(e).__name__})
+                error = e
+            except Exception as e:
+                logger.error("❌ 학습 경로 생성 오류: %s", e, extra={"stage": "learning_path", "error_type": type(e).__name__})
+                error = e
             
-        # 기본 학습 경로 반환 (에러 핸들링)
-        return [
-            {
-                "phase": "1단계: 현재 스킬 강화",
-                "duration_weeks": duration_months * 4 // 3,
-                "objectives": [
-                    "기존 기술 스택 심화 학습",
-                    "실전 프로젝트 경험 쌓기",
-                    "코드 품질 향상 집중"
-                ],
-                "resources": [
-                    "온라인 강의 플랫폼 (인프런, 패스트캠퍼스, 유데미)",
-                    "기술 공식 문서 및 한국어 튜토리얼 (벨로그, 브런치 기술 포스팅)",
-                    "국내 오픈소스 프로젝트 분석 (네이버, 카카오, 우아한형제들 GitHub)"
-                ],
-                "milestones": [
-                    "개인 프로젝트 1개 완성 (GitHub 포트폴리오)",
-                    "기술 블로그 포스팅 2회 (벨로그/티스토리)",
-                    "포트폴리오 업데이트 및 이력서 개선"
-                ],
-                "projects": [
-                    f"{technical_skills} 기반 웹 애플리케이션 개발",
-                    "개인 포트폴리오 사이트 구축",
-                    "오픈소스 라이브러리 활용 프로젝트"
-                ],
-                "personal_advice": f"1단계 실행 방법론입니다. objectives 달성을 위해서는 평일 저녁(2시간)은 {technical_skills} 공식 문서 학습에, 주말(4-6시간)은 실습 프로젝트에 집중하세요. resources 활용은 인프런/패스트캠퍼스에서 기초 강의 수강 → 벨로그/브런치에서 실무 사례 분석 → GitHub에서 우아한형제들/네이버 오픈소스 코드 리뷰 순으로 진행하시기 바랍니다. milestones 달성을 위한 구체적 계획은 1-2주차에 개인 프로젝트 기획 및 개발환경 설정(VS Code/인텔리제이 + GitHub), 3-4주차에 핵심 기능 개발, 5-6주차에 포트폴리오 정리 및 벨로그 포스팅으로 스케줄을 잡으세요. projects 구현 시에는 웹 애플리케이션은 MVC 패턴으로, 포트폴리오 사이트는 반응형 디자인으로, 오픈소스 프로젝트는 기존 이슈 해결부터 시작하여 단계적으로 접근하시길 권합니다."
-            },
-            {
-                "phase": "2단계: 역량 확장",
-                "duration_weeks": duration_months * 4 // 2,
-                "objectives": [
-                    "새로운 기술 스택 학습",
-                    "팀 프로젝트 경험",
-                    "커뮤니케이션 스킬 향상"
-                ],
-                "resources": [
-                    "개발자 커뮤니티 참여 (OKKY, 원티드 개발자 모임)",
-                    "온라인 멘토링 프로그램 (프로그래머스 멘토링, 코드스테이츠)",
-                    "기술 컨퍼런스 참석 (DEVIEW, 우아한테크세미나, 파이콘 코리아)"
-                ],
-                "milestones": [
-                    "협업 프로젝트 참여 (오픈소스 또는 팀 프로젝트)",
-                    "기술 발표 경험 (사내 세미나 또는 커뮤니티)",
-                    "네트워킹 확대 (OKKY, 원티드 등 커뮤니티 활동)"
-                ],
-                "projects": [
-                    "팀 협업 기반 프로젝트",
-                    "오픈소스 기여 활동",
-                    "스터디 그룹 프로젝트"
-                ],
-                "personal_advice": "2단계 실행 방법론을 안내드립니다. objectives 달성을 위해서는 새로운 기술 학습(주중 1시간)과 팀 프로젝트 참여(주말 중심)를 병행하세요. resources 활용은 OKKY 커뮤니티 가입 → 원티드 개발자 모임 참석 → 온라인 멘토링 신청 → 기술 컨퍼런스 참석 순으로 네트워킹을 확장하시기 바랍니다. milestones 달성 계획은 1-3주차에 협업 프로젝트 팀원 모집(OKKY/카카오톡 오픈채팅), 4-6주차에 프로젝트 개발 및 코드 리뷰 경험, 7-8주차에 기술 발표 자료 준비 및 발표로 진행하세요. projects 실행은 팀 협업 프로젝트에서 지라/노션으로 업무 관리, 슬랙/카카오톡으로 커뮤니케이션, GitHub로 코드 협업을 진행하시고, 오픈소스 기여는 'good first issue' 검색 → 이슈 분석 → 코드 수정 → PR 제출 순으로 체계적으로 접근하시길 권합니다."
-            },
-            {
-                "phase": "3단계: 리더십 및 전문성 발전",
-                "duration_weeks": duration_months * 4 - (duration_months * 4 // 3) - (duration_months * 4 // 2),
-                "objectives": [
-                    "리더십 및 멘토링 역량 개발",
-                    "기술적 의사결정 능력 향상",
-                    "업계 영향력 확장 및 전문성 인정"
-                ],
-                "resources": [
-                    "리더십 도서 및 온라인 과정 (크루셜 대화, 피드백의 기술)",
-                    "기술 컨퍼런스 발표 기회 (DEVIEW, 우아한테크세미나)",
-                    "멘토링 플랫폼 참여 (프로그래머스 멘토, F-Lab 멘토)"
-                ],
-                "milestones": [
-                    "주니어 개발자 1명 이상 멘토링 완료",
-                    "기술 컨퍼런스 또는 사내 세미나 발표 1회",
-                    "개발 프로세스 개선 제안 및 실행 1건"
-                ],
-                "projects": [
-                    "팀 생산성 향상 도구 개발 (CI/CD 파이프라인)",
-                    "기술 블로그 플랫폼 구축 및 운영",
-                    "오픈소스 프로젝트 메인테이너 활동"
-                ],
-                "personal_advice": "3단계 실행 방법론을 제시드립니다. objectives 달성을 위해서는 리더십 개발(주중 30분 독서)과 실무 리더십 실습(프로젝트 리드 경험)을 병행하세요. resources 활용은 리더십 도서 학습 → 멘토링 스킬 온라인 과정 수강 → 컨퍼런스 발표 기회 신청 → 멘토링 플랫폼 멘토 등록 순으로 단계적으로 진행하시기 바랍니다. milestones 달성 계획은 1-4주차에 멘토링 대상자 모집 및 멘토링 계획 수립(노션 템플릿 활용), 5-8주차에 정기 멘토링 진행 및 발표 자료 준비, 9-12주차에 컨퍼런스 발표 및 프로세스 개선 제안서 작성으로 스케줄을 구성하세요. projects 실행은 CI/CD 도구는 젠킨스나 GitHub Actions로 구축하고, 기술 블로그는 Jekyll/Gatsby로 개발하여 GitHub Pages에 배포하며, 오픈소스 활동은 기존 기여 프로젝트에서 메인테이너 권한 요청부터 시작하시길 권합니다."
-            }
-        ]
+            return self._learning_fallback(phases, error)
+        
+        return await self._coalesced(request, run, partial(self._learning_fallback, phases), deadline)
 
-    def get_generation_metadata(self, process_type: str, start_time: float) -> Dict[str, Any]:
-        """생성 메타데이터 (성능 모니터링용)"""
-        return {
-            "process_type": process_type,
-            "model_used": self.model,
-            "generation_time_seconds": round(time.time() - start_time, 2),
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+    async def _stream_array_elements(self, template: PromptTemplate, request: Dict[str, Any],
+                                     key: str, limit: int, decision: RouteDecision,
+                                     deadline: Optional[Deadline] = None) -> AsyncIterator[Any]:
+        """
+        stream=True 완성 응답에서 배열 원소를 닫히는 즉시 하나씩 반환
+        (이미 보낸 원소는 되돌릴 수 없으므로 캐스케이드 없이 라우팅된 모델 1회)
+        """
+        # 스트림 연결까지만 재시도 (원소를 내보내기 시작한 뒤에는 재시도하지 않음)
+        started = time.monotonic()
+        try:
+            stream = await self._acomplete(template, request, deadline, decision.model,
+                                           stream=True, stream_options={"include_usage": True})
+        except Exception:
+            self._record_route(decision, "error", started)
+            raise
+        usage_chunk = None
+        parser = IncrementalArrayParser(key)
+        llm_inflight.inc(model=decision.model)
+        # 스트림 소비 구간 (원소를 yield하는 동안 활성 span을 바꾸지 않도록 직접 종료)
+        stream_span = tracer.start_span("upstream_stream", **{"llm.model": decision.model})
+        first_token = True
+        limit_reached = False
+        try:
+            async for chunk in stream:
+                if deadline is not None and time.monotonic() >= deadline.llm_deadline():
+                    # 요청 마감 - 이미 보낸 원소까지만 반환 (부분 응답)
+                    logger.warning("⏱️ %s 스트림 마감 시간 도달 - 완성 원소 %d개로 종료", template.name, parser.emitted,
+                                   extra={"stage": template.name, "emitted_items": parser.emitted})
+                    _record_generation(truncation={"stage": template.name, "recovered_items": parser.emitted})
+                    break
+                if getattr(chunk, "usage", None):
+                    self._record_prompt_usage(template, chunk)
+                    usage_chunk = chunk
+                # 개수 제한에 도달한 뒤에는 배열이 닫히고 오는 마지막 사용량 청크까지만 읽음 (토큰/비용 집계)
+                if limit_reached or not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if first_token and choice.delta.content:
+                    first_token = False
+                    stream_span.add_event("first_token")
+                    stream_span.set_attribute("llm.time_to_first_token_ms",
+                                              round((time.monotonic() - started) * 1000, 1))
+                for element in parser.feed(choice.delta.content or ""):
+                    yield element
+                    if parser.emitted >= limit:
+                        limit_reached = True
+                        break
+                if not limit_reached and getattr(choice, "finish_reason", None) == "length":
+                    # 잘린 응답 - 미완성 원소는 버리고 이미 보낸 원소까지만 유지
+                    logger.warning("✂️ %s 스트림이 max_tokens에서 잘림 - 완성 원소 %d개 유지", template.name, parser.emitted,
+                                   extra={"stage": template.name, "emitted_items": parser.emitted})
+                    _record_generation(truncation={"stage": template.name, "recovered_items": parser.emitted})
+                    if parser.emitted:
+                        output_stats.incr(template.name, "repaired")
+        finally:
+            # 조기 종료(개수 제한/마감 시간) 시 업스트림 연결 반환
+            close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+            if close is not None:
+                await close()
+            llm_inflight.dec(model=decision.model)
+            stream_span.set_attribute("llm.emitted_items", parser.emitted)
+            stream_span.end()
+            self._record_route(decision, "streamed", started, usage_chunk)
+            if parser.emitted:
+                self._record_model_used(template.name, decision.model)
+        if parser.errors:
+            logger.error("❌ 스트리밍 원소 JSON 파싱 오류 %d건", parser.errors,
+                         extra={"stage": template.name, "parse_errors": parser.errors})
+
+    async def stream_interview_questions(self, analysis: CareerAnalysis,
+                                         company_type: str, position_level: str,
+                                         career_summary: str, technical_skills: str,
+                                         deadline: Optional[Deadline] = None) -> AsyncIterator[Dict[str, str]]:
+        """🎯 2단계 스트리밍: 면접 질문을 하나씩 검증해 생성 즉시 반환 (SSE용, 스키마 불일치 원소는 건너뜀)"""
+        request = self._interview_request(analysis, company_type, position_level,
+                                          career_summary, technical_skills)
+        route = self._route(INTERVIEW_PROMPT, request, is_junior_level(analysis.career_level), technical_skills)
+        emitted = 0
+        error = None
+        
+        try:
+            async for item in self._stream_array_elements(INTERVIEW_PROMPT, request, "questions",
+                                                          INTERVIEW_QUESTION_COUNT, route, deadline):
+                try:
+                    question = InterviewQuestion.model_validate(item)
+                except ValidationError as e:
+                    output_stats.incr("interview_questions", "invalid")
+                    logger.warning("⚠️ 스키마에 맞지 않는 면접 질문 건너뜀: %s", e, extra={"stage": "interview_questions"})
+                    continue
+                emitted += 1
+                yield question.model_dump()
+        except Exception as e:
+            logger.error("❌ 면접 질문 스트리밍 오류: %s", e, extra={"stage": "interview_questions", "error_type": type(e).__name__})
+            error = e
+        
+        if emitted == 0:
+            for question in self._interview_fallback(error):
+                yield question
+
+    async def stream_learning_path(self, analysis: CareerAnalysis, target_goal: str,
+                                   career_summary: str, technical_skills: str,
+                                   duration_months: int = 3,
+                                   deadline: Optional[Deadline] = None) -> AsyncIterator[Dict[str, Any]]:
+        """📚 3단계 스트리밍: 골격 단계에 개인화 항목을 병합해 하나씩 반환 (SSE용)"""
+        phases = self._roadmap_phases(analysis, target_goal, technical_skills, duration_months)
+        request = self._learning_request(analysis, target_goal, technical_skills, duration_months, phases)
+        route = self._route(LEARNING_PROMPT, request, is_junior_level(analysis.career_level), technical_skills)
+        emitted = 0
+        error = None
+        
+        try:
+            async for item in self._stream_array_elements(LEARNING_PROMPT, request, "phases", len(phases),
+                                                          route, deadline):
+                step = {**phases[emitted], **LearningPhasePersonalization.model_validate(item).model_dump()}
+                emitted += 1
+                yield step
+        except Exception as e:
+            logger.error("❌ 학습 경로 스트리밍 오류: %s", e, extra={"stage": "learning_path", "error_type": type(e).__name__})
+            error = e
+        
+        # 개인화되지 못한 나머지 단계는 골격 기본값으로 채움
+        remaining = phases[emitted:] if emitted else self._learning_fallback(phases, error)
+        for step in remaining:
+            yield step
 
 
 # AI 서비스 인스턴스 (싱글톤)
 career_coach_ai = CareerCoachAI()
+async_career_coach_ai = AsyncCareerCoachAI()
@@ -14,21 +14,45 @@
 
 import time
 import json
+import asyncio
+from datetime import date, timedelta
 from typing import List
-from django.http import JsonResponse
-from django.shortcuts import get_object_or_404
-from ninja import NinjaAPI, Schema
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Func, IntegerField
+from django.db.models.fields.json import KT
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404, aget_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from ninja import NinjaAPI, Schema, File, Query
+from ninja.files import UploadedFile
 from ninja.responses import Response
 
-from .models import ResumeProfile, InterviewSession, LearningPath
+from .models import ResumeProfile, InterviewSession, LearningPath, AnalysisBatch, GenerationJob
 from .schemas import (
-    ResumeProfileCreateRequest, ResumeProfileResponse,
-    InterviewSessionCreateRequest, InterviewSessionResponse,
-    LearningPathCreateRequest, LearningPathResponse,
-    ErrorResponse, SuccessResponse,
+    ResumeProfileCreateRequest, ResumeProfileResponse, ResumeProfileListResponse,
+    InterviewSessionCreateRequest, InterviewSessionResponse, InterviewSessionListItem, InterviewSessionListResponse,
+    LearningPathCreateRequest, LearningPathResponse, LearningPathListItem, LearningPathListResponse,
+    CoachingBundleCreateRequest, CoachingBundleResponse, AnalysisBatchResponse, GenerationJobResponse,
+    UsageReportResponse, SearchResponse, ErrorResponse, SuccessResponse,
     ResumeAnalysisResult, InterviewQuestion, LearningStep
 )
-from .ai_service import career_coach_ai
+from .ai_service import (
+    async_career_coach_ai, begin_generation, analysis_cache, llm_backend, llm_flight, llm_caller, output_stats,
+    CareerAnalysis
+)
+from .deadline import Deadline
+from .model_router import model_router
+from .batch_service import submit_analysis_batch, poll_analysis_batch, batch_progress
+from .jobs import aenqueue_job
+from .skills import skill_normalizer, alink_profile_skills
+from .pagination import InvalidCursor, keyset_page
+from .search import DOCUMENT_TYPES, match_query, search_available, search_documents
+from .prompts import prompt_registry
+from .metrics import registry as metrics_registry, stage_timer
+from .usage import arecord_usage_rollup, record_usage_rollup, usage_report, USAGE_GROUP_FIELDS
 
 # API 인스턴스 생성
 api = NinjaAPI(
@@ -57,6 +81,7 @@ api = NinjaAPI(
     1. /profiles 로 이력서 정보 입력 및 AI 분석
     2. /interview-sessions 로 맞춤형 면접 질문 생성
     3. /learning-paths 로 개인화된 학습 경로 추천
+    (2+3 한 번에: /profiles/{id}/coaching-bundle - 병렬 생성)
     """,
     version="1.0.0",
     docs_url="/docs"
@@ -72,10 +97,128 @@ def global_exception_handler(request, exc):
     }, status=500)
 
 
+@stage_timer("restore_analysis")
+def _restore_analysis(analysis_data: dict) -> CareerAnalysis:
+    """저장된 analysis_result(JSON)에서 CareerAnalysis 객체 복원"""
+    return CareerAnalysis(
+        career_level=analysis_data['career_level'],
+        strength_areas=analysis_data['strength_areas'],
+        improvement_areas=analysis_data['improvement_areas'],
+        career_pattern=analysis_data['career_pattern'],
+        market_competitiveness=analysis_data['market_competitiveness'],
+        personality_traits=analysis_data['personality_traits'],
+        growth_trajectory=analysis_data['growth_trajectory']
+    )
+
+
+# === SSE 스트리밍 헬퍼 ===
+
+def _wants_stream(request) -> bool:
+    """스트리밍 모드 요청 여부 (?stream=1 또는 Accept: text/event-stream)"""
+    if request.GET.get("stream") in ("1", "true"):
+        return True
+    return "text/event-stream" in request.headers.get("Accept", "")
+
+
+def _sse_event(event: str, data) -> str:
+    """Server-Sent Events 포맷으로 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _sse_response(events) -> StreamingHttpResponse:
+    """프록시 버퍼링 없이 즉시 전달되는 SSE 응답"""
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+# === 비동기 작업 모드 헬퍼 ===
+
+def _wants_async(request) -> bool:
+    """비동기 작업 모드 요청 여부 (?async=1 또는 Prefer: respond-async)"""
+    if request.GET.get("async") in ("1", "true"):
+        return True
+    return "respond-async" in request.headers.get("Prefer", "")
+
+
+@stage_timer("serialize")
+def _profile_response(profile: ResumeProfile) -> ResumeProfileResponse:
+    analysis_result = None
+    if profile.analysis_result:
+        analysis_result = ResumeAnalysisResult(**{
+            k: v for k, v in profile.analysis_result.items() 
+            if k != "analysis_metadata"
+        })
+    return ResumeProfileResponse(
+        id=str(profile.id),
+        career_summary=profile.career_summary,
+        job_role=profile.job_role,
+        technical_skills=profile.technical_skills,
+        skill_ids=profile.skill_ids,
+        experience_years=profile.experience_years,
+        created_at=profile.created_at,
+        analysis_status=profile.analysis_status,
+        analysis_result=analysis_result
+    )
+
+
+@stage_timer("serialize")
+def _session_response(session: InterviewSession) -> InterviewSessionResponse:
+    return InterviewSessionResponse(
+        id=str(session.id),
+        profile_id=str(session.profile_id),
+        target_company_type=session.target_company_type,
+        target_position_level=session.target_position_level,
+        questions=[InterviewQuestion(**q) for q in session.questions],
+        created_at=session.created_at,
+        generation_metadata=session.generation_metadata
+    )
+
+
+@stage_timer("serialize")
+def _learning_path_response(learning_path: LearningPath) -> LearningPathResponse:
+    return LearningPathResponse(
+        id=str(learning_path.id),
+        profile_id=str(learning_path.profile_id),
+        target_goal=learning_path.target_goal,
+        learning_roadmap=[LearningStep(**step) for step in learning_path.learning_roadmap],
+        estimated_duration_months=learning_path.estimated_duration_months,
+        created_at=learning_path.created_at,
+        generation_metadata=learning_path.generation_metadata
+    )
+
+
+def _job_result(job: GenerationJob):
+    """완료된 작업의 결과 (각 생성 API의 201 응답과 같은 형태)"""
+    if job.status != "completed":
+        return None
+    if job.kind == "profile_analysis":
+        return _profile_response(ResumeProfile.objects.get(id=job.profile_id))
+    if job.kind == "interview_session":
+        return _session_response(InterviewSession.objects.get(id=job.result_id))
+    return _learning_path_response(LearningPath.objects.get(id=job.result_id))
+
+
+def _job_response(job: GenerationJob, result=None) -> GenerationJobResponse:
+    return GenerationJobResponse(
+        id=str(job.id),
+        kind=job.kind,
+        status=job.status,
+        profile_id=str(job.profile_id),
+        status_url=reverse(f"{api.urls_namespace}:generation_job", kwargs={"job_id": job.id}),
+        attempts=job.attempts,
+        error=job.error,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+        result=result.model_dump(mode="json") if result is not None else None
+    )
+
+
 # === 1. 이력서 프로필 관리 ===
 
 @api.post("/profiles", 
-          response={201: ResumeProfileResponse, 400: ErrorResponse},
+          response={201: ResumeProfileResponse, 202: GenerationJobResponse, 400: ErrorResponse},
           summary="📝 이력서 프로필 생성 및 AI 분석",
           description="""
           구직자의 이력서 정보를 입력받아 AI가 심층 분석하고 프로필을 생성합니다.
@@ -106,9 +249,16 @@ def global_exception_handler(request, exc):
           - market_competitiveness: 1-10점 경쟁력 점수
           
           ⚡ 처리 시간: 약 5-10초 (OpenAI API 호출 포함)
+          
+          ⏱️ 시간 예산: `X-Request-Timeout` 헤더(초, 기본 30초) - 예산 안에 분석을 마칠 수 없으면
+          기본 분석 결과를 반환하고 analysis_metadata.degraded = true
+          
+          🧵 비동기 작업 모드: `?async=1` 또는 `Prefer: respond-async`
+          - 프로필을 analysis_status = pending으로 저장하고 분석을 작업 큐에 등록한 뒤 즉시 202 + 작업 정보 반환
+          - 진행 상황: status_url(GET /jobs/{job_id}) 또는 GET /profiles/{id}의 analysis_status
           """,
           tags=["이력서 분석"])
-def create_profile(request, data: ResumeProfileCreateRequest):
+async def create_profile(request, data: ResumeProfileCreateRequest):
     """
     📝 이력서 핵심 정보 입력 API
     
@@ -116,22 +266,34 @@ def create_profile(request, data: ResumeProfileCreateRequest):
     """
     try:
         start_time = time.time()
+        deadline = Deadline.from_request(request, "profile")
+        begin_generation()
         
         # 1. 프로필 생성
-        profile = ResumeProfile.objects.create(
-            career_summary=data.career_summary,
-            job_role=data.job_role,
-            technical_skills=data.technical_skills,
-            experience_years=data.experience_years
-        )
+        with stage_timer("db", operation="create_profile"):
+            profile = await ResumeProfile.objects.acreate(
+                career_summary=data.career_summary,
+                job_role=data.job_role,
+                technical_skills=data.technical_skills,
+                skill_ids=skill_normalizer.normalize(data.technical_skills),
+                experience_years=data.experience_years
+            )
+            await alink_profile_skills([profile])
+        
+        # 1-a. 비동기 작업 모드: 분석은 워커 풀에서 처리
+        if _wants_async(request):
+            job = await aenqueue_job("profile_analysis", profile)
+            return 202, _job_response(job)
         
         # 2. AI 분석 실행 (차별화 포인트!)
-        analysis = career_coach_ai.analyze_resume_profile(
-            career_summary=data.career_summary,
-            job_role=data.job_role,
-            technical_skills=data.technical_skills,
-            experience_years=data.experience_years
-        )
+        with stage_timer("llm"):
+            analysis = await async_career_coach_ai.analyze_resume_profile(
+                career_summary=data.career_summary,
+                job_role=data.job_role,
+                technical_skills=data.technical_skills,
+                experience_years=data.experience_years,
+                deadline=deadline
+            )
         
         # 3. 분석 결과 저장 (캐싱)
         analysis_data = {
@@ -142,30 +304,17 @@ def create_profile(request, data: ResumeProfileCreateRequest):
             "market_competitiveness": analysis.market_competitiveness,
             "personality_traits": analysis.personality_traits,
             "growth_trajectory": analysis.growth_trajectory,
-            "analysis_metadata": {
-                "generation_time": time.time() - start_time,
-                "model_used": "gpt-4o-mini"
-            }
+            "analysis_metadata": async_career_coach_ai.get_analysis_metadata(start_time, deadline)
         }
         
         profile.analysis_result = analysis_data
-        profile.save()
+        profile.analysis_status = "completed"
+        with stage_timer("db", operation="save_analysis"):
+            await profile.asave(update_fields=["analysis_result", "analysis_status", "updated_at"])
+            await arecord_usage_rollup("resume_analysis", [analysis_data["analysis_metadata"]])
         
         # 4. 응답 반환
-        response_data = ResumeProfileResponse(
-            id=str(profile.id),
-            career_summary=profile.career_summary,
-            job_role=profile.job_role,
-            technical_skills=profile.technical_skills,
-            experience_years=profile.experience_years,
-            created_at=profile.created_at,
-            analysis_result=ResumeAnalysisResult(**{
-                k: v for k, v in analysis_data.items() 
-                if k != "analysis_metadata"
-            })
-        )
-        
-        return 201, response_data
+        return 201, _profile_response(profile)
         
     except Exception as e:
         return 400, ErrorResponse(
@@ -187,6 +336,7 @@ def create_profile(request, data: ResumeProfileCreateRequest):
          📊 응답 내용:
          - 입력한 이력서 정보 (career_summary, job_role 등)
          - AI 분석 결과 (강점, 개선점, 시장 경쟁력 등)
+         - analysis_status: pending / processing / completed / failed (비동기 작업 모드 진행 상황)
          - 생성 일시 및 메타데이터
          """,
          tags=["이력서 분석"])
@@ -194,34 +344,213 @@ def get_profile(request, profile_id: str):
     """프로필 조회 API"""
     try:
         profile = get_object_or_404(ResumeProfile, id=profile_id)
-        
-        analysis_result = None
-        if profile.analysis_result:
-            analysis_result = ResumeAnalysisResult(**{
-                k: v for k, v in profile.analysis_result.items() 
-                if k != "analysis_metadata"
-            })
-        
-        response_data = ResumeProfileResponse(
-            id=str(profile.id),
-            career_summary=profile.career_summary,
-            job_role=profile.job_role,
-            technical_skills=profile.technical_skills,
-            experience_years=profile.experience_years,
-            created_at=profile.created_at,
-            analysis_result=analysis_result
-        )
-        
-        return response_data
+        return _profile_response(profile)
         
     except Exception as e:
         return 404, ErrorResponse(error="프로필을 찾을 수 없습니다.")
 
 
+def _resolve_skill_ids(values: List[str]):
+    """스킬 필터 값(canonical ID 또는 별칭) → (스킬 ID, 사전에 없는 값)"""
+    skill_ids, unknown = [], []
+    for value in values:
+        ids = [value] if value in skill_normalizer.entries else skill_normalizer.normalize(value)
+        if ids:
+            skill_ids.extend(ids)
+        else:
+            unknown.append(value)
+    return sorted(set(skill_ids)), unknown
+
+
+@api.get("/profiles",
+         response={200: ResumeProfileListResponse, 400: ErrorResponse},
+         summary="🔎 프로필 목록 (스킬/직무 필터)",
+         description="""
+         조건(지정한 스킬 모두 보유, 직무 일치)에 맞는 프로필을 최신순으로 조회합니다.
+         
+         📋 쿼리 파라미터:
+         - skill (선택, 반복 가능): canonical 스킬 ID 또는 별칭 (예: ?skill=kubernetes&skill=go, ?skill=쿠버네티스)
+           - 여러 개면 교집합, 없으면 전체 프로필
+         - job_role (선택): 수행 직무 (정확히 일치)
+         - cursor (선택): 이전 응답의 next_cursor
+         - limit (선택): 페이지 크기 (기본 20, 최대 100)
+         
+         ⚡ 스킬 연결 테이블(resume_profile_skills) 인덱스로 교집합을 구하고 (created_at, id) 키셋으로
+         페이지를 나누므로, technical_skills 문자열 스캔이나 OFFSET 없이 페이지 깊이와 무관하게 일정한 비용
+         """,
+         tags=["이력서 분석"])
+def list_profiles(request, skill: List[str] = Query([]), job_role: str = None, cursor: str = None, limit: int = None):
+    """🔎 프로필 목록 API"""
+    skill_ids, unknown = _resolve_skill_ids(skill)
+    if unknown:
+        return 400, ErrorResponse(error="알 수 없는 스킬입니다.", details={"skill": unknown})
+    
+    profiles = ResumeProfile.objects.all()
+    if job_role:
+        profiles = profiles.filter(job_role=job_role)
+    for skill_id in skill_ids:
+        # 스킬마다 연결 테이블 조인 1개 (프로필별 (profile, skill) 유니크 인덱스 조회)
+        profiles = profiles.filter(skill_links__skill_id=skill_id)
+    try:
+        with stage_timer("db", operation="list_profiles"):
+            items, next_cursor = keyset_page(profiles, cursor, limit)
+    except InvalidCursor as e:
+        return 400, ErrorResponse(error=str(e))
+    return 200, ResumeProfileListResponse(
+        items=[_profile_response(profile) for profile in items],
+        skill_ids=skill_ids,
+        next_cursor=next_cursor
+    )
+
+
+class _JSONArrayLength(Func):
+    """JSON 배열 길이를 DB에서 계산 (배열 본문을 애플리케이션으로 가져오지 않음)"""
+    function = "JSON_ARRAY_LENGTH"
+    output_field = IntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="JSONB_ARRAY_LENGTH", **extra_context)
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="JSON_LENGTH", **extra_context)
+
+
+# 목록에서 기본 제외(defer)하는 대용량 JSON 필드 - ?expand=로 포함
+SESSION_EXPANDABLE_FIELDS = ("questions", "generation_metadata")
+LEARNING_PATH_EXPANDABLE_FIELDS = ("learning_roadmap", "generation_metadata")
+
+
+def _expand_fields(expand: str, allowed):
+    fields = {field.strip() for field in (expand or "").split(",") if field.strip()}
+    return fields, sorted(fields - set(allowed))
+
+
+def _profile_children_page(profile_id, related_name, expand, allowed, summary_annotations, cursor, limit):
+    """
+    프로필 하위 목록 공통 처리 → (상태 코드, 오류 또는 (항목, 다음 커서, 포함 필드))
+    - expand에 없는 대용량 JSON 필드는 defer, summary 요청 시 개수/미리보기만 SQL로 계산
+    """
+    try:
+        profile = get_object_or_404(ResumeProfile.objects.only("id"), id=profile_id)
+    except Exception:
+        return 404, ErrorResponse(error="프로필을 찾을 수 없습니다.")
+    expanded, invalid = _expand_fields(expand, allowed)
+    if invalid:
+        return 400, ErrorResponse(error="잘못된 expand 필드입니다.", details={"expand": invalid, "allowed": list(allowed)})
+    
+    queryset = getattr(profile, related_name).defer(*[field for field in allowed if field not in expanded])
+    if summary_annotations:
+        queryset = queryset.annotate(**summary_annotations)
+    try:
+        with stage_timer("db", operation=f"list_{related_name}"):
+            items, next_cursor = keyset_page(queryset, cursor, limit)
+    except InvalidCursor as e:
+        return 400, ErrorResponse(error=str(e))
+    return 200, (items, next_cursor, expanded)
+
+
+@stage_timer("serialize")
+def _session_list_item(session: InterviewSession, expanded) -> InterviewSessionListItem:
+    return InterviewSessionListItem(
+        id=str(session.id),
+        profile_id=str(session.profile_id),
+        target_company_type=session.target_company_type,
+        target_position_level=session.target_position_level,
+        created_at=session.created_at,
+        question_count=getattr(session, "question_count", None),
+        first_question=getattr(session, "first_question", None),
+        questions=[InterviewQuestion(**q) for q in session.questions] if "questions" in expanded else None,
+        generation_metadata=session.generation_metadata if "generation_metadata" in expanded else None
+    )
+
+
+@stage_timer("serialize")
+def _learning_path_list_item(learning_path: LearningPath, expanded) -> LearningPathListItem:
+    return LearningPathListItem(
+        id=str(learning_path.id),
+        profile_id=str(learning_path.profile_id),
+        target_goal=learning_path.target_goal,
+        estimated_duration_months=learning_path.estimated_duration_months,
+        created_at=learning_path.created_at,
+        phase_count=getattr(learning_path, "phase_count", None),
+        first_phase=getattr(learning_path, "first_phase", None),
+        learning_roadmap=([LearningStep(**step) for step in learning_path.learning_roadmap]
+                          if "learning_roadmap" in expanded else None),
+        generation_metadata=learning_path.generation_metadata if "generation_metadata" in expanded else None
+    )
+
+
+@api.get("/profiles/{profile_id}/interview-sessions",
+         response={200: InterviewSessionListResponse, 400: ErrorResponse, 404: ErrorResponse},
+         summary="🗂️ 프로필의 면접 세션 목록",
+         description="""
+         프로필에서 생성한 면접 세션을 최신순으로 조회합니다.
+         
+         📋 쿼리 파라미터:
+         - cursor (선택): 이전 응답의 next_cursor
+         - limit (선택): 페이지 크기 (기본 20, 최대 100)
+         - expand (선택): 포함할 대용량 필드 (questions, generation_metadata 중 쉼표로 조합, 기본 제외)
+         - summary (선택): true면 질문 수(question_count)와 첫 질문(first_question)을 함께 반환
+         
+         ⚡ (created_at, id) 키셋 페이지네이션 + 질문 JSON은 요청할 때만 조회하므로
+         세션이 아무리 많아도 목록 페이지 비용이 일정합니다.
+         """,
+         tags=["면접 질문"])
+def list_interview_sessions(request, profile_id: str, cursor: str = None, limit: int = None,
+                            expand: str = "", summary: bool = False):
+    """🗂️ 면접 세션 목록 API"""
+    status, result = _profile_children_page(
+        profile_id, "interview_sessions", expand, SESSION_EXPANDABLE_FIELDS,
+        {"question_count": _JSONArrayLength("questions"), "first_question": KT("questions__0__question")}
+        if summary else None,
+        cursor, limit
+    )
+    if status != 200:
+        return status, result
+    items, next_cursor, expanded = result
+    return 200, InterviewSessionListResponse(
+        items=[_session_list_item(session, expanded) for session in items],
+        next_cursor=next_cursor
+    )
+
+
+@api.get("/profiles/{profile_id}/learning-paths",
+         response={200: LearningPathListResponse, 400: ErrorResponse, 404: ErrorResponse},
+         summary="🗂️ 프로필의 학습 경로 목록",
+         description="""
+         프로필에서 생성한 학습 경로를 최신순으로 조회합니다.
+         
+         📋 쿼리 파라미터:
+         - cursor (선택): 이전 응답의 next_cursor
+         - limit (선택): 페이지 크기 (기본 20, 최대 100)
+         - expand (선택): 포함할 대용량 필드 (learning_roadmap, generation_metadata 중 쉼표로 조합, 기본 제외)
+         - summary (선택): true면 단계 수(phase_count)와 첫 단계 이름(first_phase)을 함께 반환
+         
+         ⚡ (created_at, id) 키셋 페이지네이션 + 로드맵 JSON은 요청할 때만 조회
+         """,
+         tags=["학습 경로"])
+def list_learning_paths(request, profile_id: str, cursor: str = None, limit: int = None,
+                        expand: str = "", summary: bool = False):
+    """🗂️ 학습 경로 목록 API"""
+    status, result = _profile_children_page(
+        profile_id, "learning_paths", expand, LEARNING_PATH_EXPANDABLE_FIELDS,
+        {"phase_count": _JSONArrayLength("learning_roadmap"), "first_phase": KT("learning_roadmap__0__phase")}
+        if summary else None,
+        cursor, limit
+    )
+    if status != 200:
+        return status, result
+    items, next_cursor, expanded = result
+    return 200, LearningPathListResponse(
+        items=[_learning_path_list_item(learning_path, expanded) for learning_path in items],
+        next_cursor=next_cursor
+    )
+
+
 # === 2. 면접 질문 생성 ===
 
 @api.post("/interview-sessions", 
-          response={201: InterviewSessionResponse, 400: ErrorResponse},
+          response={201: InterviewSessionResponse, 202: GenerationJobResponse, 400: ErrorResponse},
           summary="🎯 맞춤형 면접 질문 5개 생성",
           description="""
           이력서 분석 결과를 바탕으로 회사 유형과 포지션 레벨에 맞는 개인화된 면접 질문 5개를 생성합니다.
@@ -254,9 +583,18 @@ def get_profile(request, profile_id: str):
           - suggested_answer_approach: 효과적인 답변 구조 가이드
           
           ✨ 차별화: "자신의 강점은?"이 아닌 실제 경험 기반 구체적 질문
+          
+          📡 스트리밍 모드: `?stream=1` 또는 `Accept: text/event-stream`
+          - 질문이 완성될 때마다 `question` 이벤트 전송, 저장 후 `session` 이벤트로 종료
+          
+          ⏱️ 시간 예산: `X-Request-Timeout` 헤더(초, 기본 30초) - 남은 시간에 맞춰 생성량을 줄이고,
+          부족하면 부분/기본 질문 + generation_metadata.degraded = true
+          
+          🧵 비동기 작업 모드: `?async=1` 또는 `Prefer: respond-async` - 202 + 작업 정보 반환,
+          완료 후 GET /jobs/{job_id}의 result에 세션 포함 (프로필 분석이 진행 중이면 끝난 뒤 실행)
           """,
           tags=["면접 질문"])
-def create_interview_session(request, data: InterviewSessionCreateRequest):
+async def create_interview_session(request, data: InterviewSessionCreateRequest):
     """
     🎯 맞춤 면접 모의 질문 생성 API
     
@@ -267,9 +605,18 @@ def create_interview_session(request, data: InterviewSessionCreateRequest):
     """
     try:
         start_time = time.time()
+        deadline = Deadline.from_request(request, "interview_session")
+        begin_generation()
         
         # 1. 프로필 조회
-        profile = get_object_or_404(ResumeProfile, id=data.profile_id)
+        with stage_timer("db", operation="get_profile"):
+            profile = await aget_object_or_404(ResumeProfile, id=data.profile_id)
+        
+        # 1-a. 비동기 작업 모드: 프로필 분석이 진행 중이어도 등록 (워커가 분석 완료 후 실행)
+        if _wants_async(request) and (profile.analysis_result or
+                                      profile.analysis_status in ResumeProfile.IN_PROGRESS_STATUSES):
+            job = await aenqueue_job("interview_session", profile, data.model_dump(exclude={"profile_id"}))
+            return 202, _job_response(job)
         
         # 2. 분석 결과 확인
         if not profile.analysis_result:
@@ -278,64 +625,95 @@ def create_interview_session(request, data: InterviewSessionCreateRequest):
             )
         
         # 3. AI 분석 객체 복원
-        from .ai_service import CareerAnalysis
-        analysis_data = profile.analysis_result
-        analysis = CareerAnalysis(
-            career_level=analysis_data['career_level'],
-            strength_areas=analysis_data['strength_areas'],
-            improvement_areas=analysis_data['improvement_areas'],
-            career_pattern=analysis_data['career_pattern'],
-            market_competitiveness=analysis_data['market_competitiveness'],
-            personality_traits=analysis_data['personality_traits'],
-            growth_trajectory=analysis_data['growth_trajectory']
-        )
+        analysis = _restore_analysis(profile.analysis_result)
+        
+        # 4-a. 스트리밍 모드: 질문이 완성되는 즉시 SSE 이벤트로 전송
+        if _wants_stream(request):
+            return _sse_response(_interview_session_events(profile, data, analysis, start_time, deadline))
         
         # 4. 맞춤형 면접 질문 생성 (핵심!)
-        questions_data = career_coach_ai.generate_interview_questions(
+        with stage_timer("llm"):
+            questions_data = await async_career_coach_ai.generate_interview_questions(
+                analysis=analysis,
+                company_type=data.target_company_type,
+                position_level=data.target_position_level,
+                career_summary=profile.career_summary,
+                technical_skills=profile.technical_skills,
+                deadline=deadline
+            )
+        
+        # 5. 면접 세션 저장
+        with stage_timer("db", operation="create_interview_session"):
+            session = await InterviewSession.objects.acreate(
+                profile=profile,
+                target_company_type=data.target_company_type,
+                target_position_level=data.target_position_level,
+                questions=questions_data,
+                generation_metadata=async_career_coach_ai.get_generation_metadata(
+                    "interview_questions", start_time, deadline
+                )
+            )
+            await arecord_usage_rollup("interview_questions", [session.generation_metadata])
+        
+        # 6. 응답 반환
+        return 201, _session_response(session)
+        
+    except Exception as e:
+        return 400, ErrorResponse(
+            error="면접 질문 생성 중 오류가 발생했습니다.",
+            details={"message": str(e)}
+        )
+
+
+async def _interview_session_events(profile, data, analysis, start_time, deadline):
+    """면접 질문 SSE 이벤트 스트림 (question × N → session, 완료 후 세션 저장)"""
+    begin_generation()
+    try:
+        questions = []
+        async for question in async_career_coach_ai.stream_interview_questions(
             analysis=analysis,
             company_type=data.target_company_type,
             position_level=data.target_position_level,
             career_summary=profile.career_summary,
-            technical_skills=profile.technical_skills
-        )
+            technical_skills=profile.technical_skills,
+            deadline=deadline
+        ):
+            questions.append(question)
+            yield _sse_event("question", question)
         
-        # 5. 면접 세션 저장
-        session = InterviewSession.objects.create(
+        session = await InterviewSession.objects.acreate(
             profile=profile,
             target_company_type=data.target_company_type,
             target_position_level=data.target_position_level,
-            questions=questions_data,
-            generation_metadata=career_coach_ai.get_generation_metadata(
-                "interview_questions", start_time
+            questions=questions,
+            generation_metadata=async_career_coach_ai.get_generation_metadata(
+                "interview_questions", start_time, deadline
             )
         )
-        
-        # 6. 응답 반환
-        questions = [InterviewQuestion(**q) for q in questions_data]
+        await arecord_usage_rollup("interview_questions", [session.generation_metadata])
         
         response_data = InterviewSessionResponse(
             id=str(session.id),
             profile_id=str(profile.id),
             target_company_type=session.target_company_type,
             target_position_level=session.target_position_level,
-            questions=questions,
+            questions=[InterviewQuestion(**q) for q in questions],
             created_at=session.created_at,
             generation_metadata=session.generation_metadata
         )
-        
-        return 201, response_data
+        yield _sse_event("session", response_data.model_dump(mode="json"))
         
     except Exception as e:
-        return 400, ErrorResponse(
+        yield _sse_event("error", ErrorResponse(
             error="면접 질문 생성 중 오류가 발생했습니다.",
             details={"message": str(e)}
-        )
+        ).model_dump())
 
 
 # === 3. 학습 경로 생성 ===
 
 @api.post("/learning-paths", 
-          response={201: LearningPathResponse, 400: ErrorResponse},
+          response={201: LearningPathResponse, 202: GenerationJobResponse, 400: ErrorResponse},
           summary="📚 개인화된 학습 경로 추천",
           description="""
           현재 수준 분석을 바탕으로 실전 중심의 3단계 학습 로드맵을 설계합니다.
@@ -377,9 +755,18 @@ def create_interview_session(request, data: InterviewSessionCreateRequest):
           - 🎯 개인화 조언: 현재 수준과 목표에 맞는 구체적 실행 방안
           
           🎯 결과: 한국 개발자 맞춤 학습 자료 + 측정 가능한 마일스톤 + 실행 가능한 프로젝트 + 구체적 방법론
+          
+          📡 스트리밍 모드: `?stream=1` 또는 `Accept: text/event-stream`
+          - 단계가 완성될 때마다 `step` 이벤트 전송, 저장 후 `learning_path` 이벤트로 종료
+          
+          ⏱️ 시간 예산: `X-Request-Timeout` 헤더(초, 기본 40초) - 남은 시간에 맞춰 생성량을 줄이고,
+          부족하면 부분/기본 로드맵 + generation_metadata.degraded = true
+          
+          🧵 비동기 작업 모드: `?async=1` 또는 `Prefer: respond-async` - 202 + 작업 정보 반환,
+          완료 후 GET /jobs/{job_id}의 result에 학습 경로 포함 (프로필 분석이 진행 중이면 끝난 뒤 실행)
           """,
           tags=["학습 경로"])
-def create_learning_path(request, data: LearningPathCreateRequest):
+async def create_learning_path(request, data: LearningPathCreateRequest):
     """
     📚 자기 개발 학습 경로 추천 API
     
@@ -390,9 +777,18 @@ def create_learning_path(request, data: LearningPathCreateRequest):
     """
     try:
         start_time = time.time()
+        deadline = Deadline.from_request(request, "learning_path")
+        begin_generation()
         
         # 1. 프로필 조회
-        profile = get_object_or_404(ResumeProfile, id=data.profile_id)
+        with stage_timer("db", operation="get_profile"):
+            profile = await aget_object_or_404(ResumeProfile, id=data.profile_id)
+        
+        # 1-a. 비동기 작업 모드: 프로필 분석이 진행 중이어도 등록 (워커가 분석 완료 후 실행)
+        if _wants_async(request) and (profile.analysis_result or
+                                      profile.analysis_status in ResumeProfile.IN_PROGRESS_STATUSES):
+            job = await aenqueue_job("learning_path", profile, data.model_dump(exclude={"profile_id"}))
+            return 202, _job_response(job)
         
         # 2. 분석 결과 확인
         if not profile.analysis_result:
@@ -401,61 +797,369 @@ def create_learning_path(request, data: LearningPathCreateRequest):
             )
         
         # 3. AI 분석 객체 복원
-        from .ai_service import CareerAnalysis
-        analysis_data = profile.analysis_result
-        analysis = CareerAnalysis(
-            career_level=analysis_data['career_level'],
-            strength_areas=analysis_data['strength_areas'],
-            improvement_areas=analysis_data['improvement_areas'],
-            career_pattern=analysis_data['career_pattern'],
-            market_competitiveness=analysis_data['market_competitiveness'],
-            personality_traits=analysis_data['personality_traits'],
-            growth_trajectory=analysis_data['growth_trajectory']
-        )
+        analysis = _restore_analysis(profile.analysis_result)
+        
+        # 4-a. 스트리밍 모드: 학습 단계가 완성되는 즉시 SSE 이벤트로 전송
+        if _wants_stream(request):
+            return _sse_response(_learning_path_events(profile, data, analysis, start_time, deadline))
         
         # 4. 개인 맞춤형 학습 경로 생성 (핵심!)
-        learning_data = career_coach_ai.generate_learning_path(
+        with stage_timer("llm"):
+            learning_data = await async_career_coach_ai.generate_learning_path(
+                analysis=analysis,
+                target_goal=data.target_goal,
+                career_summary=profile.career_summary,
+                technical_skills=profile.technical_skills,
+                duration_months=data.preferred_duration_months or 3,
+                deadline=deadline
+            )
+        
+        # 5. 학습 경로 저장
+        with stage_timer("db", operation="create_learning_path"):
+            learning_path = await LearningPath.objects.acreate(
+                profile=profile,
+                target_goal=data.target_goal,
+                learning_roadmap=learning_data,
+                estimated_duration_months=data.preferred_duration_months or 3,
+                generation_metadata=async_career_coach_ai.get_generation_metadata(
+                    "learning_path", start_time, deadline
+                )
+            )
+            await arecord_usage_rollup("learning_path", [learning_path.generation_metadata])
+        
+        # 6. 응답 반환
+        return 201, _learning_path_response(learning_path)
+        
+    except Exception as e:
+        return 400, ErrorResponse(
+            error="학습 경로 생성 중 오류가 발생했습니다.",
+            details={"message": str(e)}
+        )
+
+
+async def _learning_path_events(profile, data, analysis, start_time, deadline):
+    """학습 경로 SSE 이벤트 스트림 (step × N → learning_path, 완료 후 경로 저장)"""
+    duration_months = data.preferred_duration_months or 3
+    begin_generation()
+    try:
+        steps = []
+        async for step in async_career_coach_ai.stream_learning_path(
             analysis=analysis,
             target_goal=data.target_goal,
             career_summary=profile.career_summary,
             technical_skills=profile.technical_skills,
-            duration_months=data.preferred_duration_months or 3
-        )
+            duration_months=duration_months,
+            deadline=deadline
+        ):
+            steps.append(LearningStep(**step))
+            yield _sse_event("step", steps[-1].model_dump())
         
-        # 5. 학습 경로 저장
-        learning_path = LearningPath.objects.create(
+        learning_path = await LearningPath.objects.acreate(
             profile=profile,
             target_goal=data.target_goal,
-            learning_roadmap=learning_data,
-            estimated_duration_months=data.preferred_duration_months or 3,
-            generation_metadata=career_coach_ai.get_generation_metadata(
-                "learning_path", start_time
+            learning_roadmap=[step.model_dump() for step in steps],
+            estimated_duration_months=duration_months,
+            generation_metadata=async_career_coach_ai.get_generation_metadata(
+                "learning_path", start_time, deadline
             )
         )
-        
-        # 6. 응답 반환
-        learning_steps = [LearningStep(**step) for step in learning_data]
+        await arecord_usage_rollup("learning_path", [learning_path.generation_metadata])
         
         response_data = LearningPathResponse(
             id=str(learning_path.id),
             profile_id=str(profile.id),
             target_goal=learning_path.target_goal,
-            learning_roadmap=learning_steps,
+            learning_roadmap=steps,
             estimated_duration_months=learning_path.estimated_duration_months,
             created_at=learning_path.created_at,
             generation_metadata=learning_path.generation_metadata
         )
+        yield _sse_event("learning_path", response_data.model_dump(mode="json"))
+        
+    except Exception as e:
+        yield _sse_event("error", ErrorResponse(
+            error="학습 경로 생성 중 오류가 발생했습니다.",
+            details={"message": str(e)}
+        ).model_dump())
+
+
+# === 4. 코칭 번들 (면접 질문 + 학습 경로 병렬 생성) ===
+
+async def _with_generation_metadata(process_type: str, start_time: float, deadline: Deadline, generate):
+    """생성 작업을 독립 컨텍스트에서 실행하고 (결과, 메타데이터) 반환"""
+    begin_generation()
+    result = await generate()
+    return result, async_career_coach_ai.get_generation_metadata(process_type, start_time, deadline)
+
+
+@sync_to_async
+def _save_coaching_bundle(profile, data, questions_data, interview_metadata,
+                          learning_data, learning_metadata, duration_months):
+    """면접 세션 + 학습 경로를 하나의 트랜잭션으로 저장"""
+    with transaction.atomic():
+        session = InterviewSession.objects.create(
+            profile=profile,
+            target_company_type=data.target_company_type,
+            target_position_level=data.target_position_level,
+            questions=questions_data,
+            generation_metadata=interview_metadata
+        )
+        learning_path = LearningPath.objects.create(
+            profile=profile,
+            target_goal=data.target_goal,
+            learning_roadmap=learning_data,
+            estimated_duration_months=duration_months,
+            generation_metadata=learning_metadata
+        )
+        record_usage_rollup("interview_questions", [interview_metadata])
+        record_usage_rollup("learning_path", [learning_metadata])
+    return session, learning_path
+
+
+@api.post("/profiles/{profile_id}/coaching-bundle",
+          response={201: CoachingBundleResponse, 400: ErrorResponse},
+          summary="🎁 면접 질문 + 학습 경로 한 번에 생성",
+          description="""
+          하나의 프로필에 대해 맞춤형 면접 질문 5개와 학습 경로를 **동시에** 생성합니다.
+          
+          📋 입력 필드:
+          - target_company_type / target_position_level: /interview-sessions 와 동일
+          - target_goal / preferred_duration_months: /learning-paths 와 동일
+          
+          ⚡ 두 LLM 호출을 병렬로 실행하므로 전체 소요 시간은 두 호출의 합이 아닌
+          더 느린 쪽 수준입니다. 두 결과는 하나의 트랜잭션으로 저장됩니다.
+          
+          ⏱️ 시간 예산: `X-Request-Timeout` 헤더(초, 기본 50초) - 시간이 부족한 생성 작업은
+          건너뛰고 기본값으로 대체 (해당 generation_metadata.degraded = true)
+          """,
+          tags=["코칭 번들"])
+async def create_coaching_bundle(request, profile_id: str, data: CoachingBundleCreateRequest):
+    """
+    🎁 코칭 번들 생성 API
+    
+    **기능**: 프로필 1회 조회 → 면접 질문/학습 경로 병렬 생성 → 단일 트랜잭션 저장
+    """
+    try:
+        start_time = time.time()
+        deadline = Deadline.from_request(request, "coaching_bundle")
+        duration_months = data.preferred_duration_months or 3
+        
+        # 1. 프로필 조회 (1회)
+        with stage_timer("db", operation="get_profile"):
+            profile = await aget_object_or_404(ResumeProfile, id=profile_id)
+        
+        # 2. 분석 결과 확인
+        if not profile.analysis_result:
+            return 400, ErrorResponse(
+                error="프로필 분석이 완료되지 않았습니다. 먼저 프로필을 생성해주세요."
+            )
+        
+        # 3. AI 분석 객체 복원 (1회)
+        analysis = _restore_analysis(profile.analysis_result)
+        
+        # 4. 면접 질문 + 학습 경로 병렬 생성
+        with stage_timer("llm"):
+            (questions_data, interview_metadata), (learning_data, learning_metadata) = await asyncio.gather(
+                _with_generation_metadata("interview_questions", start_time, deadline, lambda: async_career_coach_ai.generate_interview_questions(
+                    analysis=analysis,
+                    company_type=data.target_company_type,
+                    position_level=data.target_position_level,
+                    career_summary=profile.career_summary,
+                    technical_skills=profile.technical_skills,
+                    deadline=deadline
+                )),
+                _with_generation_metadata("learning_path", start_time, deadline, lambda: async_career_coach_ai.generate_learning_path(
+                    analysis=analysis,
+                    target_goal=data.target_goal,
+                    career_summary=profile.career_summary,
+                    technical_skills=profile.technical_skills,
+                    duration_months=duration_months,
+                    deadline=deadline
+                ))
+            )
+        
+        # 5. 단일 트랜잭션 저장
+        with stage_timer("db", operation="save_coaching_bundle"):
+            session, learning_path = await _save_coaching_bundle(
+                profile, data, questions_data, interview_metadata,
+                learning_data, learning_metadata, duration_months
+            )
+        
+        # 6. 응답 반환
+        response_data = CoachingBundleResponse(
+            profile_id=str(profile.id),
+            interview_session=_session_response(session),
+            learning_path=_learning_path_response(learning_path),
+            generation_time_seconds=round(time.time() - start_time, 2)
+        )
         
         return 201, response_data
         
     except Exception as e:
         return 400, ErrorResponse(
-            error="학습 경로 생성 중 오류가 발생했습니다.",
+            error="코칭 번들 생성 중 오류가 발생했습니다.",
             details={"message": str(e)}
         )
 
 
-# === 4. 헬스체크 ===
+# === 5. 대량 이력서 분석 (Batch API) ===
+
+def _batch_response(batch: AnalysisBatch) -> AnalysisBatchResponse:
+    return AnalysisBatchResponse(
+        id=str(batch.id),
+        status=batch.status,
+        source_name=batch.source_name,
+        openai_batch_id=batch.openai_batch_id,
+        progress=batch_progress(batch),
+        errors=batch.errors,
+        created_at=batch.created_at,
+        completed_at=batch.completed_at
+    )
+
+
+@api.post("/profile-batches",
+          response={202: AnalysisBatchResponse, 400: ErrorResponse},
+          summary="📦 이력서 대량 등록 (Batch API)",
+          description="""
+          JSONL 파일(한 줄에 /profiles 요청 본문 1개)로 여러 이력서를 한 번에 등록하고
+          OpenAI Batch API로 분석을 제출합니다. 코호트(부트캠프 수료생 등) 온보딩용입니다.
+          
+          📋 입력: multipart `file` - 각 줄은 career_summary / job_role / technical_skills / experience_years
+          
+          ⚙️ 처리 방식:
+          - 유효한 줄은 프로필로 즉시 생성 (analysis_result는 배치 완료 시 채워짐)
+          - 검증에 실패한 줄은 줄 번호와 함께 errors에 기록
+          - 동기 분석 대비 50% 비용, 최대 24시간 내 완료
+          
+          📊 진행 상황: GET /profile-batches/{batch_id}
+          """,
+          tags=["대량 등록"])
+def create_profile_batch(request, file: UploadedFile = File(...)):
+    """📦 이력서 대량 등록 API"""
+    try:
+        lines = file.read().decode("utf-8-sig").splitlines()
+        batch = submit_analysis_batch(lines, source_name=file.name or "")
+        return 202, _batch_response(batch)
+        
+    except ValueError as e:
+        return 400, ErrorResponse(error=str(e))
+    except Exception as e:
+        return 400, ErrorResponse(
+            error="배치 제출 중 오류가 발생했습니다.",
+            details={"message": str(e)}
+        )
+
+
+@api.get("/profile-batches/{batch_id}",
+         response={200: AnalysisBatchResponse, 404: ErrorResponse},
+         summary="📦 대량 등록 진행 상황",
+         description="""
+         배치의 상태, 진행률, 실패 상세를 조회합니다.
+         
+         - `refresh=true`: OpenAI 배치 상태를 지금 조회하고, 완료되었으면 결과를 저장한 뒤 응답
+           (기본은 `python manage.py poll_analysis_batches`가 주기적으로 갱신한 값)
+         """,
+         tags=["대량 등록"])
+def get_profile_batch(request, batch_id: str, refresh: bool = False):
+    """📦 대량 등록 진행 상황 API"""
+    try:
+        batch = get_object_or_404(AnalysisBatch, id=batch_id)
+    except Exception:
+        return 404, ErrorResponse(error="배치를 찾을 수 없습니다.")
+    
+    if refresh:
+        batch = poll_analysis_batch(batch)
+    return 200, _batch_response(batch)
+
+
+# === 6. 비동기 생성 작업 ===
+
+@api.get("/jobs/{job_id}",
+         response={200: GenerationJobResponse, 404: ErrorResponse},
+         url_name="generation_job",
+         summary="🧵 비동기 생성 작업 상태",
+         description="""
+         `?async=1`로 등록한 생성 작업의 상태를 조회합니다.
+         
+         - status: pending → running → completed / failed (실패 시 최대 3회까지 자동 재시도)
+         - result: 완료 시 프로필 / 면접 세션 / 학습 경로 (각 생성 API의 201 응답과 동일)
+         """,
+         tags=["비동기 작업"])
+def get_generation_job(request, job_id: str):
+    """🧵 비동기 생성 작업 상태 API"""
+    try:
+        job = get_object_or_404(GenerationJob, id=job_id)
+    except Exception:
+        return 404, ErrorResponse(error="작업을 찾을 수 없습니다.")
+    return 200, _job_response(job, _job_result(job))
+
+
+# === 7. 사용량/비용 집계 ===
+
+@api.get("/usage",
+         response={200: UsageReportResponse, 400: ErrorResponse},
+         summary="💰 LLM 사용량/비용 집계",
+         description="""
+         생성 결과 저장 시 증분 갱신되는 집계 행(일자 × 스테이지 × 모델)을 합산합니다.
+         면접 세션/학습 경로의 메타데이터를 스캔하지 않으므로 부하 중에도 가볍게 조회할 수 있습니다.
+         
+         📋 쿼리 파라미터:
+         - start / end (선택): 기간 (YYYY-MM-DD, 기본 최근 7일)
+         - group_by (선택): day, stage, model 중 쉼표로 조합 (기본 day,stage,model / 빈 값이면 합계만)
+         
+         📊 응답: 요청 수, LLM 호출 수, 입력/출력/캐시 적중 토큰, 비용(USD), 요청당 평균 비용
+         - 요청 수는 최종 결과를 낸 모델 기준, 호출/토큰/비용은 캐스케이드 시도 포함
+         - 요청별 상세는 각 결과의 generation_metadata.usage / analysis_metadata.usage
+         """,
+         tags=["시스템"])
+def get_usage_report(request, start: date = None, end: date = None, group_by: str = ",".join(USAGE_GROUP_FIELDS)):
+    """💰 사용량/비용 집계 API"""
+    end = end or timezone.localdate()
+    start = start or end - timedelta(days=6)
+    fields = [field.strip() for field in group_by.split(",") if field.strip()]
+    invalid = [field for field in fields if field not in USAGE_GROUP_FIELDS]
+    if invalid or start > end:
+        return 400, ErrorResponse(
+            error="잘못된 집계 조건입니다.",
+            details={"group_by": invalid, "allowed": list(USAGE_GROUP_FIELDS), "start": str(start), "end": str(end)}
+        )
+    return 200, usage_report(start, end, list(dict.fromkeys(fields)))
+
+
+# === 8. 전문 검색 ===
+
+@api.get("/search",
+         response={200: SearchResponse, 400: ErrorResponse, 501: ErrorResponse},
+         summary="🔍 전문 검색 (프로필 / 면접 질문 / 학습 경로)",
+         description="""
+         경력 요약, 생성된 면접 질문, 학습 로드맵 본문을 검색합니다. (예: "MSA 전환"을 물어본 면접 세션)
+         
+         📋 쿼리 파라미터:
+         - q (필수): 검색어 - 모든 단어를 포함하는 문서만 (한글은 부분 문자열 일치, 조사가 붙은 형태는 원형으로 검색)
+         - type (선택): profile / interview_session / learning_path
+         - profile_id (선택): 특정 프로필의 문서만
+         - limit (선택): 최대 결과 수 (기본 20, 최대 50)
+         
+         📊 응답: BM25 관련도 순 결과 + 일치 구간을 <mark>로 표시한 스니펫
+         
+         ⚡ SQLite FTS5 바이그램 색인 조회 (JSON 필드 icontains 스캔 없음), 저장 시 자동 색인
+         """,
+         tags=["검색"])
+def search(request, q: str, type: str = None, profile_id: str = None, limit: int = 20):
+    """🔍 전문 검색 API"""
+    if not search_available():
+        return 501, ErrorResponse(error="전문 검색은 SQLite 데이터베이스에서만 지원합니다.")
+    if type and type not in DOCUMENT_TYPES:
+        return 400, ErrorResponse(error="잘못된 문서 종류입니다.", details={"allowed": list(DOCUMENT_TYPES)})
+    if not match_query(q):
+        return 400, ErrorResponse(error="검색어를 입력해 주세요.")
+    
+    with stage_timer("db", operation="search"):
+        hits = search_documents(q, type, profile_id, min(max(limit, 1), settings.SEARCH_MAX_RESULTS))
+    return 200, SearchResponse(query=q, hits=hits)
+
+
+# === 9. 헬스체크 ===
 
 @api.get("/health", 
          response=SuccessResponse,
@@ -467,6 +1171,8 @@ def create_learning_path(request, data: LearningPathCreateRequest):
          - 서버 상태 (healthy/unhealthy)
          - API 버전 정보
          - 사용 가능한 주요 기능 목록
+         - LLM 캐시 히트율, 동일 요청 병합(single-flight), 프롬프트 prefix 캐시 적중률,
+           구조화 출력 검증/기본값 대체 횟수, 재시도/서킷 브레이커 상태 (워커 단위)
          
          💡 용도: 서버 연결 테스트, 기능 확인
          """,
@@ -482,9 +1188,38 @@ def health_check(request):
                 "이력서 분석 및 프로필 생성",
                 "맞춤형 면접 질문 생성 (5개)",
                 "개인화된 학습 경로 추천"
-            ]
+            ],
+            "llm": {
+                "backend": llm_backend.describe(),
+                "analysis_cache": analysis_cache.stats(),
+                "single_flight": llm_flight.stats(),
+                "prompt_prefix_cache": prompt_registry.stats(),
+                "structured_output": output_stats.stats(),
+                "resilience": llm_caller.stats(),
+                "model_routing": model_router.stats()
+            }
         }
     )
 
 
+# === 10. 메트릭 ===
 
+@api.get("/metrics",
+         summary="📈 Prometheus 메트릭",
+         description="""
+         Prometheus 텍스트 형식(text/plain; version=0.0.4) 메트릭을 반환합니다.
+         
+         📊 주요 메트릭 (접두사 career_coach_):
+         - http_requests_total / http_request_duration_seconds: 엔드포인트(URL 패턴)별 요청 수/처리 시간
+         - stage_duration_seconds: 엔드포인트 × 처리 단계 히스토그램
+           (db, restore_analysis, prompt_render, upstream, parse, llm, serialize)
+         - llm_requests_total: 모델 × 업스트림 상태 코드(200/429/5xx/timeout/connection_error)
+         - llm_inflight_requests: 진행 중인 업스트림 호출 수 (스트리밍 포함)
+         - llm_tokens_total, llm_fallbacks_total, cache_requests_total
+         
+         🧮 METRICS_MULTIPROC_DIR 지정 시 모든 gunicorn/생성 작업 워커의 값을 합산
+         """,
+         tags=["시스템"])
+def metrics(request):
+    """📈 메트릭 수집 API"""
+    return HttpResponse(metrics_registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class ChatbotConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chatbot'
+
+    def ready(self):
+        # 스킬 사전 오토마톤/학습 로드맵 골격은 기동 시 한 번 구성 (요청 경로에서는 조회만)
+        from .roadmaps import roadmap_library
+        from .skills import skill_normalizer
+        skill_normalizer.load()
+        roadmap_library.load()
+        # 전문 검색 색인 동기화 시그널 등록
+        from . import search  # noqa: F401
@@ -0,0 +1,280 @@
+"""
+📦 대량 이력서 분석 - OpenAI Batch API (코호트 단위 온보딩)
+
+- JSONL(ResumeProfileCreateRequest 레코드) → 프로필 일괄 생성 + Batch API 1회 제출
+  (동기 호출 대비 50% 비용, 24시간 완료 창)
+- 폴링으로 상태 갱신, 결과 파일을 청크 단위로 읽으며 analysis_result 일괄 저장(bulk_update)
+- 배치별 진행/실패 집계: 입력 검증 실패, 요청 실패, 응답 스키마 불일치, 만료/취소로 미처리
+- 같은 배치를 여러 폴러(관리 명령/API refresh)가 동시에 갱신해도 결과는 한 번만 반영
+  · 종료된 배치의 결과 수집은 상태 비교 후 갱신(compare-and-swap)으로 폴러 하나만 점유 (임대 만료 시 재점유)
+  · 파일 다운로드는 트랜잭션 밖, 결과는 청크마다 커밋 → 수집 중에도 진행률이 보이고 다른 쓰기를 막지 않음
+"""
+
+import json
+import logging
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from openai.types.chat import ChatCompletion
+from pydantic import ValidationError
+
+from .ai_service import analysis_cache, career_coach_ai, llm_backend, CareerAnalysis
+from .models import AnalysisBatch, ResumeProfile
+from .schemas import ResumeProfileCreateRequest
+from .search import index_documents
+from .skills import link_profile_skills, skill_normalizer
+from .usage import add_usage, empty_usage, record_usage_rollup, usage_cost, usage_tokens
+
+logger = logging.getLogger(__name__)
+
+# 오프라인 작업이므로 SDK 기본 재시도 사용 (요청 경로의 복원력 계층과 별개)
+# 백엔드 설정(LLM_BACKEND)을 따르므로 fake 백엔드면 스탠드인 서버로 제출
+batch_client = llm_backend.batch_client
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'record'}: {e['msg']}" for e in error.errors())
+
+
+def read_batch_records(lines: Iterable[str]) -> Tuple[List[ResumeProfileCreateRequest], List[Dict[str, Any]]]:
+    """JSONL 줄 단위 검증 - (유효 레코드, 실패 목록[line, error]) 반환"""
+    records, errors = [], []
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            records.append(ResumeProfileCreateRequest.model_validate_json(line))
+        except ValidationError as e:
+            errors.append({"line": line_no, "error": _validation_message(e)})
+    return records, errors
+
+
+def _record_failure(batch: AnalysisBatch, error: Dict[str, Any]) -> None:
+    """실패 집계 (상세는 최대 ANALYSIS_BATCH_MAX_ERRORS건만 보관)"""
+    batch.failed_count += 1
+    if len(batch.errors) < settings.ANALYSIS_BATCH_MAX_ERRORS:
+        batch.errors.append(error)
+
+
+def _batch_request_line(profile: ResumeProfile) -> str:
+    """Batch API 입력 1줄 - 동기 경로와 같은 프롬프트/스키마/토큰 예산 사용"""
+    request = career_coach_ai._analysis_request(
+        profile.career_summary, profile.job_role, profile.technical_skills, profile.experience_years
+    )
+    return json.dumps({
+        "custom_id": str(profile.id),
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {"model": career_coach_ai.model, **request},
+    }, ensure_ascii=False)
+
+
+def submit_analysis_batch(lines: Iterable[str], source_name: str = "") -> AnalysisBatch:
+    """
+    JSONL 레코드로 프로필 일괄 생성 후 Batch API 제출
+    - 유효 레코드가 없거나 상한 초과 시 ValueError
+    - 업로드/제출 실패 시 배치를 failed로 기록하고 예외 전파
+    """
+    records, errors = read_batch_records(lines)
+    if not records:
+        raise ValueError("유효한 레코드가 없습니다.")
+    if len(records) > settings.ANALYSIS_BATCH_MAX_RECORDS:
+        raise ValueError(f"배치당 최대 {settings.ANALYSIS_BATCH_MAX_RECORDS}건까지 제출할 수 있습니다.")
+
+    with transaction.atomic():
+        batch = AnalysisBatch.objects.create(source_name=source_name[:255], total_count=len(records) + len(errors))
+        for error in errors:
+            _record_failure(batch, error)
+        batch.save(update_fields=["failed_count", "errors"])
+        profiles = ResumeProfile.objects.bulk_create(
+            [ResumeProfile(batch=batch, skill_ids=skill_normalizer.normalize(record.technical_skills),
+                           **record.model_dump()) for record in records],
+            batch_size=settings.ANALYSIS_BATCH_DB_CHUNK
+        )
+        link_profile_skills(profiles)
+        index_documents(profiles)
+
+    payload = "\n".join(_batch_request_line(profile) for profile in profiles).encode("utf-8")
+    try:
+        input_file = batch_client.files.create(file=(f"analysis_{batch.id}.jsonl", payload), purpose="batch")
+        remote = batch_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=settings.ANALYSIS_BATCH_COMPLETION_WINDOW,
+            metadata={"analysis_batch_id": str(batch.id)}
+        )
+    except Exception as e:
+        batch.status = "failed"
+        batch.completed_at = timezone.now()
+        batch.errors.append({"stage": "submit", "error": str(e)})
+        batch.failed_count = batch.total_count
+        with transaction.atomic():
+            batch.save(update_fields=["status", "completed_at", "errors", "failed_count", "updated_at"])
+            batch.profiles.filter(analysis_status="pending").update(analysis_status="failed")
+        raise
+
+    batch.input_file_id = input_file.id
+    batch.openai_batch_id = remote.id
+    batch.status = remote.status
+    batch.save(update_fields=["input_file_id", "openai_batch_id", "status", "updated_at"])
+    logger.info("📦 분석 배치 제출: %s → %s (%d건, 입력 오류 %d건)", batch.id, remote.id, len(profiles), len(errors),
+                extra={"batch_id": str(batch.id), "remote_batch_id": remote.id})
+    return batch
+
+
+def _analysis_data(analysis: CareerAnalysis, completion: ChatCompletion, batch: AnalysisBatch) -> Dict[str, Any]:
+    """create_profile과 같은 형태의 analysis_result"""
+    usage = empty_usage()
+    if completion.usage is not None:
+        tokens = usage_tokens(completion.usage)
+        usage = add_usage(usage, "resume_analysis", completion.model, tokens,
+                          usage_cost(completion.model, tokens, batch=True))
+    return {
+        **asdict(analysis),
+        "analysis_metadata": {
+            "model_used": completion.model,
+            "source": "batch_api",
+            "batch_id": str(batch.id),
+            "usage": usage,
+        },
+    }
+
+
+def _flush_results(batch: AnalysisBatch, results: Dict[str, Dict[str, Any]]) -> None:
+    """결과 청크 일괄 저장 + 진행률 갱신 (이미 저장된 프로필은 건너뜀)"""
+    if not results:
+        return
+    now = timezone.now()
+    profiles = list(ResumeProfile.objects.filter(id__in=results.keys(), batch=batch, analysis_result__isnull=True))
+    for profile in profiles:
+        profile.analysis_result = results[str(profile.id)]
+        profile.analysis_status = "completed"
+        profile.updated_at = now
+    # 청크마다 커밋 (실패 집계는 재점유 시 중복되지 않도록 수집을 마칠 때 한 번에 기록)
+    with transaction.atomic():
+        ResumeProfile.objects.bulk_update(profiles, ["analysis_result", "analysis_status", "updated_at"])
+        AnalysisBatch.objects.filter(id=batch.id).update(
+            completed_count=F("completed_count") + len(profiles), updated_at=now
+        )
+    batch.completed_count += len(profiles)
+    record_usage_rollup("resume_analysis", [p.analysis_result["analysis_metadata"] for p in profiles])
+    results.clear()
+
+
+def _ingest_output(batch: AnalysisBatch, file_id: str) -> None:
+    """출력 파일을 읽으며 검증된 분석 결과를 청크 단위로 저장"""
+    content = batch_client.files.content(file_id)
+    profiles = {str(p.id): p for p in batch.profiles.filter(analysis_result__isnull=True)}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        profile_id = item.get("custom_id")
+        response = item.get("response") or {}
+        if profile_id not in profiles:
+            continue
+        if response.get("status_code") != 200:
+            _record_failure(batch, {"profile_id": profile_id, "error": f"HTTP {response.get('status_code')}"})
+            continue
+        try:
+            completion = ChatCompletion.model_validate(response["body"])
+            analysis = career_coach_ai._parse_analysis_response(completion.choices[0].message)
+        except (ValidationError, ValueError, KeyError, IndexError) as e:
+            _record_failure(batch, {"profile_id": profile_id, "error": f"응답 검증 실패: {e}"})
+            continue
+
+        profile = profiles[profile_id]
+        results[profile_id] = _analysis_data(analysis, completion, batch)
+        # 동일 입력의 이후 동기 요청은 캐시에서 응답
+        analysis_cache.set(career_coach_ai._analysis_cache_key(
+            profile.career_summary, profile.job_role, profile.technical_skills, profile.experience_years
+        ), career_coach_ai._analysis_cache_entry(analysis, completion.model))
+        if len(results) >= settings.ANALYSIS_BATCH_DB_CHUNK:
+            _flush_results(batch, results)
+
+    _flush_results(batch, results)
+
+
+def _ingest_errors(batch: AnalysisBatch, file_id: str) -> None:
+    """오류 파일의 요청별 실패 집계"""
+    content = batch_client.files.content(file_id)
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        error = item.get("error") or ((item.get("response") or {}).get("body") or {}).get("error") or {}
+        _record_failure(batch, {"profile_id": item.get("custom_id"), "error": error.get("message", "unknown error")})
+
+
+def poll_analysis_batch(batch: AnalysisBatch) -> AnalysisBatch:
+    """
+    원격 배치 상태 1회 조회 - 종료 상태가 되면 결과/오류 파일 반영 후 다시 읽은 배치 반환
+    (이미 종료된 배치는 그대로 반환)
+    - 진행 중: 상태만 갱신 (이미 종료 처리된 행은 건드리지 않음)
+    - 종료: 결과 수집을 점유한 폴러만 반영, 다른 폴러가 수집 중이면 현재 행을 그대로 반환
+    """
+    if batch.is_terminal or not batch.openai_batch_id:
+        return batch
+
+    remote = batch_client.batches.retrieve(batch.openai_batch_id)
+    rows = AnalysisBatch.objects.filter(id=batch.id).exclude(status__in=AnalysisBatch.TERMINAL_STATUSES)
+    now = timezone.now()
+    if remote.status not in AnalysisBatch.TERMINAL_STATUSES:
+        rows.update(status=remote.status, updated_at=now)
+        return AnalysisBatch.objects.get(id=batch.id)
+
+    stale = now - timedelta(seconds=settings.ANALYSIS_BATCH_INGEST_LEASE_SECONDS)
+    claimed = rows.filter(Q(ingest_locked_at__isnull=True) | Q(ingest_locked_at__lt=stale)).update(
+        ingest_locked_at=now, output_file_id=remote.output_file_id or "",
+        error_file_id=remote.error_file_id or "", updated_at=now
+    )
+    batch = AnalysisBatch.objects.get(id=batch.id)
+    if claimed:
+        _finalize_batch(batch, remote)
+    return batch
+
+
+def _finalize_batch(batch: AnalysisBatch, remote) -> None:
+    """점유한 종료 배치의 결과/오류 파일 수집 후 종료 상태 기록"""
+    if batch.output_file_id:
+        _ingest_output(batch, batch.output_file_id)
+    if batch.error_file_id:
+        _ingest_errors(batch, batch.error_file_id)
+    # 배치 수준 오류 (입력 파일 검증 실패 등) - 레코드 수와 별개로 기록
+    for error in getattr(getattr(remote, "errors", None), "data", None) or []:
+        batch.errors.append({"stage": "batch", "error": error.message})
+
+    batch.status = remote.status
+    batch.completed_at = timezone.now()
+    with transaction.atomic():
+        # 청크마다 F()로 증가시킨 완료 수 기준으로 만료/취소/실패로 결과가 없는 레코드 집계
+        batch.completed_count = AnalysisBatch.objects.values_list("completed_count", flat=True).get(id=batch.id)
+        unresolved = batch.total_count - batch.completed_count - batch.failed_count
+        if unresolved > 0:
+            batch.failed_count += unresolved
+            batch.errors.append({"stage": "batch", "error": f"배치 {batch.status}: {unresolved}건 미처리"})
+        batch.profiles.filter(analysis_status="pending").update(analysis_status="failed")
+        batch.save(update_fields=["status", "failed_count", "errors", "completed_at", "updated_at"])
+    logger.info("📦 분석 배치 종료: %s (%s, 완료 %d / 실패 %d)", batch.id, batch.status,
+                batch.completed_count, batch.failed_count, extra={"batch_id": str(batch.id)})
+
+
+def batch_progress(batch: AnalysisBatch) -> Dict[str, Any]:
+    """배치 진행/실패 요약"""
+    resolved = batch.completed_count + batch.failed_count
+    return {
+        "total": batch.total_count,
+        "completed": batch.completed_count,
+        "failed": batch.failed_count,
+        "pending": max(batch.total_count - resolved, 0),
+        "progress": round(resolved / batch.total_count, 3) if batch.total_count else 0.0,
+    }
@@ -0,0 +1,63 @@
+"""
+⏱️ 요청 마감 시간 (deadline) - HTTP 요청의 시간 예산을 LLM 호출까지 전달
+
+- 요청마다 Deadline 생성: X-Request-Timeout 헤더(초) 또는 엔드포인트별 기본값
+- api.py → CareerCoachAI → 복원력 계층으로 전달되어 업스트림 timeout/max_tokens 결정
+- 남은 시간으로 생성할 수 없는 스테이지는 LLM 호출 없이 기본값으로 대체
+- DB 저장/응답 직렬화 시간은 미리 떼어 둠 (LLM이 예산을 전부 쓰지 않도록)
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+
+class Deadline:
+    """단조 시계 기준 요청 마감 시각"""
+
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self.started = time.monotonic()
+        self.at = self.started + seconds
+
+    @classmethod
+    def from_request(cls, request: Any, endpoint: str) -> "Deadline":
+        """헤더 값(초)이 있으면 사용, 없거나 잘못되면 엔드포인트 기본값 (최대값으로 제한)"""
+        seconds = settings.REQUEST_DEADLINE_DEFAULTS.get(endpoint, settings.REQUEST_DEADLINE_MAX_SECONDS)
+        header = request.headers.get(settings.REQUEST_DEADLINE_HEADER)
+        if header:
+            try:
+                seconds = float(header)
+            except ValueError:
+                pass
+        seconds = max(settings.REQUEST_DEADLINE_MIN_SECONDS, min(seconds, settings.REQUEST_DEADLINE_MAX_SECONDS))
+        return cls(seconds)
+
+    def remaining(self) -> float:
+        return max(self.at - time.monotonic(), 0.0)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def llm_deadline(self) -> float:
+        """LLM 호출이 끝나야 하는 시각 (저장/응답 시간 제외)"""
+        return self.at - settings.REQUEST_DEADLINE_RESERVE_SECONDS
+
+    def output_tokens(self, ceiling: Optional[int] = None) -> int:
+        """LLM 마감까지 생성 가능한 출력 토큰 추정치"""
+        available = self.llm_deadline() - time.monotonic() - settings.LLM_FIRST_TOKEN_SECONDS
+        tokens = max(int(available * settings.LLM_OUTPUT_TOKENS_PER_SECOND), 0)
+        return min(tokens, ceiling) if ceiling else tokens
+
+    def report(self) -> Dict[str, Any]:
+        """generation_metadata용 요약"""
+        return {
+            "budget_seconds": round(self.budget, 2),
+            "elapsed_seconds": round(self.elapsed(), 2),
+            "remaining_seconds": round(self.remaining(), 2),
+        }
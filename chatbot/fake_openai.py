@@ -0,0 +1,384 @@
+"""
+🧪 로컬 OpenAI 호환 스탠드인 서버 - 네트워크/비용 없이 전체 요청 경로 검증·부하 테스트
+
+- POST /v1/chat/completions: 스키마(response_format)별 한국어 응답 (stream=True면 SSE)
+  · 입력 메시지 해시로 변형을 고르므로 같은 입력 → 같은 출력 (결정적)
+  · max_tokens보다 길면 잘라서 finish_reason="length" (잘림 복구 경로 검증)
+- 지연(첫 토큰 + 토큰당), 오류율(500/429), 토큰 수(prompt/completion/cached) 설정 가능
+- POST /v1/files, GET /v1/files/{id}/content, POST /v1/batches, GET /v1/batches/{id}
+  (배치는 조회할 때마다 validating → in_progress → completed 로 진행)
+- 사용자 메시지에 FAIL_MARKER가 있는 배치 요청은 오류 파일로 보냄 (실패 집계 검증용)
+
+단독 실행: python manage.py run_fake_openai --port 8765 --latency-ms 300
+"""
+
+import email.parser
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+FAIL_MARKER = "[[FAIL]]"
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """스탠드인 서버 동작 설정"""
+    latency_ms: float = 0.0            # 응답(첫 토큰) 전 고정 지연
+    ms_per_token: float = 0.0          # 출력 토큰당 추가 지연
+    error_rate: float = 0.0            # chat.completions 오류 응답 비율 (0~1)
+    prompt_tokens: Optional[int] = None       # None이면 입력 길이로 추정
+    completion_tokens: Optional[int] = None   # None이면 출력 길이로 추정
+    cached_tokens: int = 0             # prompt_tokens_details.cached_tokens
+    seed: int = 0                      # 오류 주입 난수 시드
+    stream_chunk_chars: int = 16       # 스트리밍 델타 크기
+
+
+# === 스키마별 한국어 응답 (입력 해시로 변형 선택) ===
+
+_CAREER_LEVELS = ["주니어", "중급", "시니어"]
+_STRENGTHS = ["백엔드 API 설계", "데이터베이스 모델링", "클라우드 인프라 운영", "테스트 자동화", "성능 최적화"]
+_IMPROVEMENTS = ["대규모 트래픽 경험", "시스템 설계 역량", "기술 리더십", "모니터링/관측성"]
+_QUESTIONS = [
+    ("가장 어려웠던 장애 대응 경험과 재발 방지를 위해 무엇을 바꿨는지 설명해주세요.", "문제해결"),
+    ("트래픽이 10배로 늘어난다면 현재 서비스에서 가장 먼저 병목이 될 지점은 어디인가요?", "기술"),
+    ("코드 리뷰에서 의견이 충돌했을 때 어떻게 합의에 이르렀나요?", "팀워크"),
+    ("최근에 도입한 기술 중 도입을 후회하거나 되돌린 사례가 있나요?", "경험"),
+    ("3년 뒤 어떤 엔지니어가 되고 싶고, 지금 무엇을 준비하고 있나요?", "비전"),
+    ("데이터 정합성이 깨졌던 경험과 복구 과정을 설명해주세요.", "기술"),
+    ("요구사항이 자주 바뀌는 프로젝트에서 일정을 어떻게 관리했나요?", "경험"),
+]
+_PHASES = ["현재 스킬 심화", "실전 프로젝트 확장", "전문성 및 리더십"]
+
+
+def _variant(body: Dict[str, Any]) -> int:
+    messages = json.dumps(body.get("messages", []), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(messages.encode("utf-8")).digest()[0]
+
+
+def _schema_name(body: Dict[str, Any]) -> str:
+    response_format = body.get("response_format") or {}
+    return (response_format.get("json_schema") or {}).get("name", "resume_analysis")
+
+
+def canned_content(body: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 스키마에 맞는 결정적 응답 객체"""
+    v = _variant(body)
+    schema = _schema_name(body)
+    if schema == "interview_questions":
+        return {"questions": [{
+            "question": question,
+            "category": category,
+            "difficulty_level": ["기본", "중급", "고급"][(v + i) % 3],
+            "suggested_answer_approach": "상황-행동-결과 순서로, 수치와 본인의 역할을 중심으로 답변",
+        } for i, (question, category) in enumerate(_QUESTIONS[(v + k) % len(_QUESTIONS)] for k in range(5))]}
+    if schema == "learning_path":
+        return {"phases": [{
+            "projects": [f"{_IMPROVEMENTS[(v + i) % len(_IMPROVEMENTS)]} 보완 프로젝트",
+                         f"{_STRENGTHS[(v + i) % len(_STRENGTHS)]} {name} 사례 정리"],
+            "personal_advice": "공식 문서로 개념을 정리한 뒤 같은 주에 실습 프로젝트에 바로 적용해 보세요.",
+        } for i, name in enumerate(_PHASES)]}
+    return {
+        "career_level": _CAREER_LEVELS[v % 3],
+        "strength_areas": [_STRENGTHS[v % len(_STRENGTHS)], _STRENGTHS[(v + 1) % len(_STRENGTHS)]],
+        "improvement_areas": [_IMPROVEMENTS[v % len(_IMPROVEMENTS)]],
+        "career_pattern": "꾸준히 기술 범위를 넓혀 온 안정적 성장형입니다.",
+        "market_competitiveness": 5 + v % 5,
+        "personality_traits": ["꼼꼼함", "협업 지향"],
+        "growth_trajectory": "핵심 도메인 경험을 살려 시니어 엔지니어로 성장할 수 있습니다.",
+    }
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(len(text) // 2, 1)
+
+
+class FakeOpenAIState:
+    """서버 메모리 상태 (설정, 파일, 배치, 요청 통계)"""
+
+    def __init__(self, config: Optional[FakeOpenAIConfig] = None):
+        self.config = config or FakeOpenAIConfig()
+        self.files: Dict[str, Tuple[str, bytes]] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.requests = 0
+        self.errors = 0
+        self.lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+
+    # --- chat.completions ---
+
+    def should_fail(self) -> bool:
+        with self.lock:
+            self.requests += 1
+            failed = self._rng.random() < self.config.error_rate
+            self.errors += failed
+            return failed
+
+    def completion_parts(self, body: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+        """(content, finish_reason, usage) - max_tokens 초과 시 잘라서 length"""
+        content = json.dumps(canned_content(body), ensure_ascii=False)
+        finish_reason = "stop"
+        completion_tokens = self.config.completion_tokens or _estimate_tokens(content)
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens")
+        if max_tokens and completion_tokens > max_tokens:
+            content = content[:int(len(content) * max_tokens / completion_tokens)]
+            completion_tokens, finish_reason = max_tokens, "length"
+
+        prompt_tokens = self.config.prompt_tokens or _estimate_tokens(
+            "".join(message.get("content", "") for message in body.get("messages", []))
+        )
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": min(self.config.cached_tokens, prompt_tokens)},
+        }
+        return content, finish_reason, usage
+
+    def generation_delay(self, completion_tokens: int) -> float:
+        return (self.config.latency_ms + self.config.ms_per_token * completion_tokens) / 1000
+
+    # --- files / batches ---
+
+    def add_file(self, filename: str, content: bytes, purpose: str) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:16]}"
+        with self.lock:
+            self.files[file_id] = (filename, content)
+        return {
+            "id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+            "filename": filename, "purpose": purpose, "status": "processed",
+        }
+
+    def create_batch(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex[:16]}",
+            "object": "batch",
+            "endpoint": body["endpoint"],
+            "input_file_id": body["input_file_id"],
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "validating",
+            "created_at": int(time.time()),
+            "metadata": body.get("metadata"),
+            "output_file_id": None,
+            "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        with self.lock:
+            self.batches[batch["id"]] = batch
+        return batch
+
+    def advance_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """조회마다 한 단계씩 진행 - 폴링 루프 검증용"""
+        with self.lock:
+            batch = self.batches.get(batch_id)
+        if batch is None:
+            return None
+        if batch["status"] == "validating":
+            batch["status"] = "in_progress"
+            batch["request_counts"]["total"] = len(self._input_lines(batch))
+        elif batch["status"] == "in_progress":
+            self._complete_batch(batch)
+        return batch
+
+    def _input_lines(self, batch: Dict[str, Any]) -> List[Dict[str, Any]]:
+        _, content = self.files[batch["input_file_id"]]
+        return [json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip()]
+
+    def _complete_batch(self, batch: Dict[str, Any]) -> None:
+        outputs, errors = [], []
+        for line in self._input_lines(batch):
+            body = line["body"]
+            if any(FAIL_MARKER in message.get("content", "") for message in body.get("messages", [])):
+                errors.append({
+                    "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                    "custom_id": line["custom_id"],
+                    "response": {"status_code": 400, "body": {"error": {"message": "invalid request"}}},
+                    "error": None,
+                })
+                continue
+            outputs.append({
+                "id": f"batch_req_{uuid.uuid4().hex[:12]}",
+                "custom_id": line["custom_id"],
+                "response": {"status_code": 200, "request_id": uuid.uuid4().hex, "body": chat_completion(self, body)},
+                "error": None,
+            })
+
+        def to_file(records: List[Dict[str, Any]], suffix: str) -> Optional[str]:
+            if not records:
+                return None
+            content = "\n".join(json.dumps(r, ensure_ascii=False) for r in records).encode("utf-8")
+            return self.add_file(f"{batch['id']}_{suffix}.jsonl", content, "batch_output")["id"]
+
+        batch["output_file_id"] = to_file(outputs, "output")
+        batch["error_file_id"] = to_file(errors, "error")
+        batch["request_counts"] = {"total": len(outputs) + len(errors),
+                                   "completed": len(outputs), "failed": len(errors)}
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+
+
+def chat_completion(state: FakeOpenAIState, body: Dict[str, Any]) -> Dict[str, Any]:
+    """chat.completion 응답 본문"""
+    content, finish_reason, usage = state.completion_parts(body)
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o-mini"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content, "refusal": None},
+            "finish_reason": finish_reason,
+        }],
+        "usage": usage,
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeOpenAI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> FakeOpenAIState:
+        return self.server.state
+
+    def log_message(self, format, *args):  # 테스트 출력 오염 방지
+        pass
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str, error_type: str) -> None:
+        self._send_json({"error": {"message": message, "type": error_type, "code": None}}, status)
+
+    def _not_found(self) -> None:
+        self._send_error(404, f"unknown path {self.path}", "invalid_request_error")
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _chat_completions(self, body: Dict[str, Any]) -> None:
+        if self.state.should_fail():
+            # 429와 500을 번갈아 - 재시도/서킷 브레이커 경로 모두 검증
+            if self.state.errors % 2:
+                return self._send_error(500, "fake upstream error", "server_error")
+            return self._send_error(429, "fake rate limit", "rate_limit_error")
+
+        if not body.get("stream"):
+            completion = chat_completion(self.state, body)
+            time.sleep(self.state.generation_delay(completion["usage"]["completion_tokens"]))
+            return self._send_json(completion)
+        self._stream_completion(body)
+
+    def _stream_completion(self, body: Dict[str, Any]) -> None:
+        """SSE 스트리밍 (chat.completion.chunk) - 첫 토큰 지연 후 델타를 토큰 속도로 전송"""
+        content, finish_reason, usage = self.state.completion_parts(body)
+        config = self.state.config
+        base = {"id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "object": "chat.completion.chunk",
+                "created": int(time.time()), "model": body.get("model", "gpt-4o-mini")}
+        size = max(config.stream_chunk_chars, 1)
+        pieces = [content[i:i + size] for i in range(0, len(content), size)]
+        per_piece = config.ms_per_token * usage["completion_tokens"] / max(len(pieces), 1) / 1000
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def send(chunk: Dict[str, Any]) -> None:
+            self.wfile.write(f"data: {json.dumps({**base, **chunk}, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        time.sleep(config.latency_ms / 1000)
+        try:
+            for i, piece in enumerate(pieces):
+                last = i == len(pieces) - 1
+                send({"choices": [{"index": 0, "delta": {"content": piece},
+                                   "finish_reason": finish_reason if last else None}]})
+                time.sleep(per_piece)
+            if (body.get("stream_options") or {}).get("include_usage"):
+                send({"choices": [], "usage": usage})
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 조기 종료 (개수 제한/마감 시간)
+        self.close_connection = True
+
+    def do_POST(self):
+        body = self._read_body()
+        if self.path == "/v1/chat/completions":
+            return self._chat_completions(json.loads(body))
+        if self.path == "/v1/batches":
+            return self._send_json(self.state.create_batch(json.loads(body)))
+        if self.path == "/v1/files":
+            message = email.parser.BytesParser().parsebytes(
+                b"Content-Type: " + self.headers["Content-Type"].encode() + b"\r\n\r\n" + body
+            )
+            fields = {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+            upload = fields["file"]
+            return self._send_json(self.state.add_file(
+                upload.get_filename() or "upload.jsonl",
+                upload.get_payload(decode=True),
+                fields["purpose"].get_payload(decode=True).decode()
+            ))
+        self._not_found()
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts[:2] == ["v1", "batches"] and len(parts) == 3:
+            batch = self.state.advance_batch(parts[2])
+            return self._send_json(batch) if batch else self._not_found()
+        if parts[:2] == ["v1", "files"] and len(parts) == 4 and parts[3] == "content":
+            stored = self.state.files.get(parts[2])
+            if stored is None:
+                return self._not_found()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(stored[1])))
+            self.end_headers()
+            self.wfile.write(stored[1])
+            return
+        self._not_found()
+
+
+class FakeOpenAIServer:
+    """백그라운드 스레드에서 도는 스탠드인 서버 (with 문 지원)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[FakeOpenAIConfig] = None):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = FakeOpenAIState(config)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def state(self) -> FakeOpenAIState:
+        return self.httpd.state
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,256 @@
+"""
+🧵 비동기 작업 모드 - DB 테이블 기반 작업 큐 + 워커 풀
+
+- 웹 요청(?async=1 또는 Prefer: respond-async)은 작업만 등록하고 202 + 작업 URL 반환
+  → 웹 계층은 LLM 응답을 기다리지 않음
+- 워커(python manage.py run_generation_workers)가 작업을 점유해 동기 AI 엔진으로 처리
+  · 점유: pending 작업을 상태/임대 시각 비교 후 갱신 (compare-and-swap, 브로커/행 잠금 불필요)
+  · 임대(lease) 만료된 running 작업은 워커 비정상 종료로 보고 다시 점유
+  · 예외 시 지수 백오프로 재시도, 최대 횟수 초과 시 failed
+- 면접 질문/학습 경로 작업은 프로필 분석이 끝날 때까지 시도 횟수 소모 없이 대기
+  (분석을 진행할 작업/배치가 없으면 대기하지 않고 실패 처리 - 요청 경로 분석 실패로 pending에 남은 프로필 등)
+"""
+
+import logging
+import threading
+import time
+import uuid
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .ai_service import begin_generation, career_coach_ai
+from .models import AnalysisBatch, GenerationJob, InterviewSession, LearningPath, ResumeProfile
+from .tracing import trace
+from .usage import record_usage_rollup
+
+logger = logging.getLogger(__name__)
+
+
+class JobNotReady(Exception):
+    """선행 작업(프로필 분석)이 끝나지 않아 나중에 다시 실행"""
+
+
+def enqueue_job(kind: str, profile: ResumeProfile, payload: Optional[Dict[str, Any]] = None) -> GenerationJob:
+    return GenerationJob.objects.create(kind=kind, profile=profile, payload=payload or {}, run_after=timezone.now())
+
+
+async def aenqueue_job(kind: str, profile: ResumeProfile,
+                       payload: Optional[Dict[str, Any]] = None) -> GenerationJob:
+    return await GenerationJob.objects.acreate(
+        kind=kind, profile=profile, payload=payload or {}, run_after=timezone.now()
+    )
+
+
+# === 작업 점유 ===
+
+def claim_job(worker: str) -> Optional[GenerationJob]:
+    """실행 가능한 작업 1건 점유 (다른 워커와 경합 시 다음 후보로)"""
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.GENERATION_JOB_LEASE_SECONDS)
+    candidates = GenerationJob.objects.filter(
+        Q(status='pending', run_after__lte=now) | Q(status='running', locked_at__lt=stale)
+    ).order_by('run_after').values_list('id', 'status', 'locked_at')[:settings.GENERATION_JOB_CLAIM_CANDIDATES]
+
+    for job_id, status, locked_at in candidates:
+        claimed = GenerationJob.objects.filter(id=job_id, status=status, locked_at=locked_at).update(
+            status='running', locked_by=worker, locked_at=now, attempts=F('attempts') + 1, updated_at=now
+        )
+        if claimed:
+            job = GenerationJob.objects.select_related('profile').get(id=job_id)
+            if job.started_at is None:
+                job.started_at = now
+                job.save(update_fields=['started_at'])
+            return job
+    return None
+
+
+def _finish(job: GenerationJob, worker: str, **fields: Any) -> bool:
+    """점유 중인 워커만 결과 기록 (임대 만료로 다른 워커가 가져갔으면 무시)"""
+    return bool(GenerationJob.objects.filter(id=job.id, locked_by=worker, status='running').update(
+        updated_at=timezone.now(), **fields
+    ))
+
+
+# === 작업 종류별 처리 (동기 AI 엔진) ===
+
+def _job_metadata(job: GenerationJob) -> Dict[str, Any]:
+    return {
+        "id": str(job.id),
+        "attempt": job.attempts,
+        "queue_wait_seconds": round((job.started_at - job.created_at).total_seconds(), 2),
+    }
+
+
+def _analysis_in_flight(profile: ResumeProfile) -> bool:
+    """프로필 분석을 끝낼 주체(대기/실행 중 분석 작업 또는 종료되지 않은 배치)가 있는지"""
+    if GenerationJob.objects.filter(
+        profile_id=profile.id, kind='profile_analysis', status__in=('pending', 'running')
+    ).exists():
+        return True
+    return bool(profile.batch_id) and AnalysisBatch.objects.filter(id=profile.batch_id).exclude(
+        status__in=AnalysisBatch.TERMINAL_STATUSES
+    ).exists()
+
+
+def _analysed_profile(job: GenerationJob) -> ResumeProfile:
+    profile = ResumeProfile.objects.get(id=job.profile_id)
+    if profile.analysis_status in ResumeProfile.IN_PROGRESS_STATUSES:
+        if not _analysis_in_flight(profile):
+            raise ValueError("진행 중인 프로필 분석이 없습니다. 프로필을 다시 등록해 주세요.")
+        raise JobNotReady("프로필 분석 대기 중")
+    if not profile.analysis_result:
+        raise ValueError("프로필 분석이 완료되지 않았습니다.")
+    return profile
+
+
+def run_profile_analysis(job: GenerationJob) -> Optional[uuid.UUID]:
+    profile = job.profile
+    ResumeProfile.objects.filter(id=profile.id).update(analysis_status='processing')
+    start_time = time.time()
+    begin_generation()
+    analysis = career_coach_ai.analyze_resume_profile(
+        profile.career_summary, profile.job_role, profile.technical_skills, profile.experience_years
+    )
+    profile.analysis_result = {
+        **asdict(analysis),
+        "analysis_metadata": {**career_coach_ai.get_analysis_metadata(start_time), "job": _job_metadata(job)},
+    }
+    profile.analysis_status = 'completed'
+    profile.save(update_fields=['analysis_result', 'analysis_status', 'updated_at'])
+    record_usage_rollup("resume_analysis", [profile.analysis_result["analysis_metadata"]])
+    return None
+
+
+def run_interview_session(job: GenerationJob) -> uuid.UUID:
+    from .api import _restore_analysis  # api 모듈이 이 모듈을 import하므로 실행 시점에 가져옴
+    profile = _analysed_profile(job)
+    start_time = time.time()
+    begin_generation()
+    questions = career_coach_ai.generate_interview_questions(
+        _restore_analysis(profile.analysis_result), job.payload['target_company_type'], job.payload['target_position_level'],
+        profile.career_summary, profile.technical_skills
+    )
+    session = InterviewSession.objects.create(
+        profile=profile,
+        target_company_type=job.payload['target_company_type'],
+        target_position_level=job.payload['target_position_level'],
+        questions=questions,
+        generation_metadata={
+            **career_coach_ai.get_generation_metadata("interview_questions", start_time),
+            "job": _job_metadata(job),
+        }
+    )
+    record_usage_rollup("interview_questions", [session.generation_metadata])
+    return session.id
+
+
+def run_learning_path(job: GenerationJob) -> uuid.UUID:
+    from .api import _restore_analysis  # api 모듈이 이 모듈을 import하므로 실행 시점에 가져옴
+    profile = _analysed_profile(job)
+    duration_months = job.payload.get('preferred_duration_months') or 3
+    start_time = time.time()
+    begin_generation()
+    steps = career_coach_ai.generate_learning_path(
+        _restore_analysis(profile.analysis_result), job.payload['target_goal'],
+        profile.career_summary, profile.technical_skills, duration_months
+    )
+    learning_path = LearningPath.objects.create(
+        profile=profile,
+        target_goal=job.payload['target_goal'],
+        learning_roadmap=steps,
+        estimated_duration_months=duration_months,
+        generation_metadata={
+            **career_coach_ai.get_generation_metadata("learning_path", start_time),
+            "job": _job_metadata(job),
+        }
+    )
+    record_usage_rollup("learning_path", [learning_path.generation_metadata])
+    return learning_path.id
+
+
+JOB_HANDLERS: Dict[str, Callable[[GenerationJob], Optional[uuid.UUID]]] = {
+    'profile_analysis': run_profile_analysis,
+    'interview_session': run_interview_session,
+    'learning_path': run_learning_path,
+}
+
+
+def run_job(job: GenerationJob, worker: str) -> None:
+    """점유한 작업 실행 후 결과/재시도/실패 기록"""
+    now = timezone.now()
+    try:
+        with trace(f"job {job.kind}", **{"job.id": str(job.id), "job.attempt": job.attempts, "job.worker": worker}):
+            result_id = JOB_HANDLERS[job.kind](job)
+    except JobNotReady:
+        # 대기는 시도 횟수에 포함하지 않음
+        _finish(job, worker, status='pending', locked_by='', locked_at=None, attempts=F('attempts') - 1,
+                run_after=now + timedelta(seconds=settings.GENERATION_JOB_RETRY_DELAY_SECONDS))
+        return
+    except Exception as e:
+        logger.error("❌ 생성 작업 실패: %s %s (%d회차) - %s", job.kind, job.id, job.attempts, e,
+                     extra={"job_id": str(job.id), "job_kind": job.kind, "attempt": job.attempts})
+        if job.attempts >= settings.GENERATION_JOB_MAX_ATTEMPTS:
+            _finish(job, worker, status='failed', error=str(e), completed_at=now)
+            if job.kind == 'profile_analysis':
+                ResumeProfile.objects.filter(id=job.profile_id).update(analysis_status='failed')
+        else:
+            delay = settings.GENERATION_JOB_RETRY_DELAY_SECONDS * 2 ** (job.attempts - 1)
+            _finish(job, worker, status='pending', error=str(e), locked_by='', locked_at=None,
+                    run_after=now + timedelta(seconds=delay))
+        return
+    _finish(job, worker, status='completed', result_id=result_id, error='', completed_at=timezone.now())
+
+
+def run_pending_jobs(worker: str = "inline", limit: Optional[int] = None) -> int:
+    """실행 가능한 작업이 없을 때까지 현재 스레드에서 처리 - 처리한 작업 수 반환"""
+    processed = 0
+    while limit is None or processed < limit:
+        job = claim_job(worker)
+        if job is None:
+            break
+        run_job(job, worker)
+        processed += 1
+    return processed
+
+
+# === 워커 풀 ===
+
+class WorkerPool:
+    """작업 큐를 폴링하는 워커 스레드 묶음 (각 스레드가 작업 1건씩 처리)"""
+
+    def __init__(self, concurrency: int, name: str = "worker"):
+        self.concurrency = concurrency
+        self.name = f"{name}-{uuid.uuid4().hex[:6]}"
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def _loop(self, worker: str) -> None:
+        while not self._stop.is_set():
+            close_old_connections()
+            try:
+                job = claim_job(worker)
+                if job is not None:
+                    run_job(job, worker)
+                    continue
+            except Exception as e:  # DB 일시 오류 등 - 워커는 계속 동작
+                logger.exception("❌ 작업 워커 오류 (%s): %s", worker, e, extra={"worker": worker})
+            self._stop.wait(settings.GENERATION_JOB_POLL_INTERVAL_SECONDS)
+        close_old_connections()
+
+    def start(self) -> "WorkerPool":
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._loop, args=(f"{self.name}-{i}",), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
@@ -0,0 +1,141 @@
+"""
+🌊 증분 JSON 파서 - LLM 스트리밍 응답에서 배열 원소를 완성 즉시 추출
+
+- 완성 응답 델타를 그대로 입력 → 최상위 배열 원소(면접 질문, 학습 단계)가 닫히는 즉시 반환
+- key 지정 시 해당 키의 배열 ({"questions": [...]}) 또는 객체 없이 바로 시작하는 배열,
+  미지정 시 첫 번째 배열
+- 배열 앞의 코드 블록 마커/설명, 배열 뒤의 후행 텍스트 무시
+- finish_reason == "length"로 잘린 응답은 미완성 원소만 버리고 완성된 원소는 유지
+- 문자열 내부 괄호/이스케이프 처리, 정규식으로 관심 문자 사이를 건너뛰어 스캔
+"""
+
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+# 문자열 밖에서 의미 있는 문자 / 문자열 안에서 의미 있는 문자
+_STRUCTURAL = re.compile(r'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class IncrementalArrayParser:
+    """델타 단위로 입력받아 배열 원소(객체/배열/문자열)를 완성되는 즉시 반환"""
+
+    def __init__(self, key: Optional[str] = None):
+        # 구조화 출력({"key": [...]})과 배열만 반환하는 응답(```json [...] ```) 모두 지원
+        self._start_pattern = re.compile(
+            r'"%s"\s*:\s*\[|\A[^{"]*\[' % re.escape(key) if key else r"\["
+        )
+        self._prefix = ""
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._element_start = -1
+        self.started = False
+        self.done = False
+        self.emitted = 0
+        self.errors = 0
+
+    @property
+    def truncated(self) -> bool:
+        """배열이 닫히기 전에 입력이 끝났는지 (입력 종료 후 확인)"""
+        return not self.done
+
+    def feed(self, delta: str) -> List[Any]:
+        """델타 텍스트를 입력받아 이번에 완성된 원소 목록 반환"""
+        if self.done or not delta:
+            return []
+
+        if not self.started:
+            self._prefix += delta
+            match = self._start_pattern.search(self._prefix)
+            if match is None:
+                return []
+            self.started = True
+            self._buf = self._prefix[match.end():]
+            self._prefix = ""
+        else:
+            self._buf += delta
+
+        return self._scan()
+
+    def _scan(self) -> List[Any]:
+        items: List[Any] = []
+        buf, pos = self._buf, self._pos
+
+        while pos < len(buf):
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                if match.group() == "\\":
+                    # 이스케이프된 다음 문자 건너뛰기 (아직 도착 전이면 다음 feed에서 건너뜀)
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 0:
+                    self._emit(buf[self._element_start:pos], items)
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            ch, index = match.group(), match.start()
+            pos = match.end()
+
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 0:
+                    self._element_start = index
+            elif ch in "{[":
+                if self._depth == 0:
+                    self._element_start = index
+                self._depth += 1
+            elif self._depth == 0:
+                if ch == "]":
+                    # 대상 배열 종료 - 이후 텍스트는 무시
+                    self.done = True
+                    self._buf, self._pos = "", 0
+                    return items
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buf[self._element_start:pos], items)
+
+        # 소비한 텍스트 정리 (미완성 원소 시작점부터만 보관)
+        if self._depth > 0 or self._in_string:
+            keep_from = self._element_start
+        else:
+            keep_from = min(pos, len(buf))
+        self._buf = buf[keep_from:]
+        self._pos = pos - keep_from
+        if self._element_start >= 0:
+            self._element_start -= keep_from
+        return items
+
+    def _emit(self, text: str, items: List[Any]) -> None:
+        try:
+            items.append(json.loads(text))
+            self.emitted += 1
+        except json.JSONDecodeError:
+            self.errors += 1
+
+    def pending_text(self) -> str:
+        """아직 닫히지 않은 원소 텍스트 (디버깅용)"""
+        if self._depth > 0 or self._in_string:
+            return self._buf
+        return ""
+
+
+def parse_array(text: str, key: Optional[str] = None) -> Tuple[List[Any], bool]:
+    """
+    완성된(또는 잘린) 응답 전체에서 배열 원소 추출
+    반환: (원소 목록, 배열이 정상적으로 닫혔는지)
+    """
+    parser = IncrementalArrayParser(key)
+    items = parser.feed(text)
+    return items, parser.done
@@ -0,0 +1,87 @@
+"""
+🔌 LLM 백엔드 - 설정으로 선택하는 OpenAI 호환 클라이언트 묶음
+
+- settings.LLM_BACKENDS[별칭] = {'BACKEND': 클래스 경로, 'OPTIONS': {...}} (CACHES와 같은 형태)
+- settings.LLM_BACKEND (환경 변수 LLM_BACKEND)로 사용할 별칭 선택
+  · openai: 실제 OpenAI API
+  · fake: 로컬 스탠드인 서버 (지연/오류율/토큰 수 설정) - 오프라인 부하 테스트·벤치마크
+- 모든 백엔드가 같은 SDK 클라이언트를 제공하므로 프롬프트/복원력/파싱 경로는 그대로 검증됨
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from openai import OpenAI, AsyncOpenAI
+
+from .fake_openai import FakeOpenAIConfig, FakeOpenAIServer
+
+
+class LLMBackend:
+    """
+    OpenAI 호환 엔드포인트 하나에 대한 클라이언트 묶음
+    - client / async_client: 요청 경로용 (재시도는 resilience 계층 담당 → SDK 재시도 비활성화)
+    - batch_client: 오프라인 작업용 (SDK 기본 재시도 사용)
+    """
+
+    name = "base"
+
+    def __init__(self, **options: Any):
+        self.options = options
+        kwargs = self.client_kwargs()
+        self.client = OpenAI(max_retries=0, **kwargs)
+        self.async_client = AsyncOpenAI(max_retries=0, **kwargs)
+        self.batch_client = OpenAI(**kwargs)
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        """OpenAI 클라이언트 생성 인자 (api_key, base_url)"""
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        """헬스체크용 요약"""
+        return {"name": self.name, "base_url": str(self.client.base_url)}
+
+
+class OpenAIBackend(LLMBackend):
+    """실제 OpenAI API (OPENAI_BASE_URL 환경 변수 또는 base_url 옵션으로 프록시 지정 가능)"""
+
+    name = "openai"
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        kwargs = {"api_key": self.options.get("api_key") or os.getenv('OPENAI_API_KEY')}
+        if self.options.get("base_url"):
+            kwargs["base_url"] = self.options["base_url"]
+        return kwargs
+
+
+class FakeServerBackend(LLMBackend):
+    """
+    로컬 스탠드인 서버 백엔드
+    - url 옵션이 있으면 이미 떠 있는 서버 사용 (manage.py run_fake_openai, 워커 간 공유)
+    - 없으면 프로세스 안에서 서버를 띄움 (나머지 옵션은 FakeOpenAIConfig 필드)
+    """
+
+    name = "fake"
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        self.server: Optional[FakeOpenAIServer] = None
+        base_url = self.options.get("url")
+        if not base_url:
+            config = FakeOpenAIConfig(**{k: v for k, v in self.options.items() if k != "url"})
+            self.server = FakeOpenAIServer(config=config).start()
+            base_url = self.server.base_url
+        return {"api_key": "sk-fake", "base_url": base_url}
+
+    def describe(self) -> Dict[str, Any]:
+        info = super().describe()
+        if self.server is not None:
+            state = self.server.state
+            info.update(requests=state.requests, injected_errors=state.errors)
+        return info
+
+
+def load_backend(alias: Optional[str] = None) -> LLMBackend:
+    """설정된 백엔드 생성 (별칭 미지정 시 settings.LLM_BACKEND)"""
+    config = settings.LLM_BACKENDS[alias or settings.LLM_BACKEND]
+    return import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
@@ -0,0 +1,166 @@
+"""
+💾 LLM 응답 캐시 - 내용 주소 기반 (content-addressed)
+
+동일 입력 → 동일 응답:
+- 키: 정규화된 입력 + 모델명 + 프롬프트 버전의 SHA-256 해시
+- 1차 캐시: 프로세스 내 LRU (크기 제한, TTL)
+- 2차 캐시: Django 캐시 프레임워크 (settings.CACHES['llm'], 워커 간 공유 및 영속)
+- 히트/미스/축출 통계 제공 (analysis_metadata에 기록)
+- 2차 캐시 오류(캐시 테이블 미생성, 백엔드 장애 등)는 미스로 처리 - 캐시 때문에 요청이 실패하지 않도록
+  (DB 캐시 테이블은 python manage.py createcachetable로 생성)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(value: str) -> str:
+    """유니코드 정규화 + 공백 정리 (의미 없는 차이로 캐시가 갈라지지 않도록)"""
+    value = unicodedata.normalize("NFKC", value or "")
+    return re.sub(r"\s+", " ", value).strip()
+
+
+class LRUCache:
+    """크기 제한 + TTL을 가진 스레드 안전 LRU 캐시 (1차 캐시)"""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LLMResponseCache:
+    """2단계 LLM 응답 캐시 (프로세스 LRU → Django 캐시)"""
+
+    def __init__(self, namespace: str, maxsize: Optional[int] = None, ttl: Optional[int] = None):
+        self.namespace = namespace
+        self.ttl = ttl or settings.LLM_CACHE_TTL_SECONDS
+        self.memory = LRUCache(maxsize or settings.LLM_CACHE_MEMORY_SIZE, self.ttl)
+        self.hits = 0
+        self.misses = 0
+        self.persistent_hits = 0
+        self.persistent_errors = 0
+
+    @property
+    def persistent(self):
+        return caches[settings.LLM_CACHE_ALIAS]
+
+    def make_key(self, model: str, prompt_version: str, **inputs: Any) -> str:
+        """입력 + 모델 + 프롬프트 버전으로 캐시 키 생성"""
+        payload = json.dumps(
+            {"model": model, "prompt_version": prompt_version, "inputs": inputs},
+            ensure_ascii=False, sort_keys=True
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"llm:{self.namespace}:{digest}"
+
+    def _lookup_memory(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits += 1
+        return value
+
+    def _record_persistent(self, key: str, value: Optional[Any]) -> Tuple[Optional[Any], str]:
+        if value is None:
+            self.misses += 1
+            return None, "miss"
+        self.hits += 1
+        self.persistent_hits += 1
+        self.memory.set(key, value)
+        return value, "persistent"
+
+    def _persistent_failed(self, operation: str, error: Exception) -> None:
+        self.persistent_errors += 1
+        logger.warning("⚠️ LLM 2차 캐시 %s 실패 - 캐시 없이 진행: %s", operation, error,
+                       extra={"cache": self.namespace, "error_type": type(error).__name__})
+
+    def get(self, key: str) -> Tuple[Optional[Any], str]:
+        """(값, 출처) 반환 - 출처는 memory/persistent/miss"""
+        value = self._lookup_memory(key)
+        if value is not None:
+            return value, "memory"
+        try:
+            value = self.persistent.get(key)
+        except Exception as e:
+            self._persistent_failed("조회", e)
+            value = None
+        return self._record_persistent(key, value)
+
+    async def aget(self, key: str) -> Tuple[Optional[Any], str]:
+        value = self._lookup_memory(key)
+        if value is not None:
+            return value, "memory"
+        try:
+            value = await self.persistent.aget(key)
+        except Exception as e:
+            self._persistent_failed("조회", e)
+            value = None
+        return self._record_persistent(key, value)
+
+    def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        try:
+            self.persistent.set(key, value, timeout=self.ttl)
+        except Exception as e:
+            self._persistent_failed("저장", e)
+
+    async def aset(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        try:
+            await self.persistent.aset(key, value, timeout=self.ttl)
+        except Exception as e:
+            self._persistent_failed("저장", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (프로세스 단위)"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "persistent_hits": self.persistent_hits,
+            "persistent_errors": self.persistent_errors,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "memory_entries": len(self.memory),
+            "memory_evictions": self.memory.evictions,
+        }
@@ -0,0 +1,55 @@
+"""
+🧩 기존 프로필 → 스킬 연결 테이블(resume_profile_skills) 채우기
+
+사용법: python manage.py backfill_profile_skills [--chunk-size 1000] [--renormalize]
+
+- 프로필을 PK 키셋 순서로 청크 단위로 읽어 연결 (전체를 메모리에 올리지 않음, 중단 후 재실행해도 안전)
+- --renormalize: 현재 스킬 사전으로 technical_skills를 다시 정규화해 skill_ids가 바뀐 프로필의 연결을 교체
+  (사전에 별칭/스킬을 추가한 뒤 실행)
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from chatbot.models import ProfileSkill, ResumeProfile
+from chatbot.skills import link_profile_skills, skill_normalizer
+
+
+class Command(BaseCommand):
+    help = "기존 프로필의 정규화 스킬을 스킬 연결 테이블에 채움"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=settings.SKILL_LINK_DB_CHUNK)
+        parser.add_argument("--renormalize", action="store_true", help="현재 스킬 사전으로 skill_ids 재계산")
+
+    def handle(self, *args, **options):
+        chunk_size, renormalize = options["chunk_size"], options["renormalize"]
+        profiles = ResumeProfile.objects.only("id", "technical_skills", "skill_ids").order_by("pk")
+        last_pk, scanned, renormalized, linked = None, 0, 0, 0
+
+        while True:
+            chunk = list((profiles.filter(pk__gt=last_pk) if last_pk else profiles)[:chunk_size])
+            if not chunk:
+                break
+            last_pk = chunk[-1].pk
+            scanned += len(chunk)
+
+            with transaction.atomic():
+                if renormalize:
+                    changed = []
+                    for profile in chunk:
+                        skill_ids = skill_normalizer.normalize(profile.technical_skills)
+                        if skill_ids != profile.skill_ids:
+                            profile.skill_ids = skill_ids
+                            changed.append(profile)
+                    if changed:
+                        ResumeProfile.objects.bulk_update(changed, ["skill_ids"])
+                        ProfileSkill.objects.filter(profile__in=changed).delete()
+                        renormalized += len(changed)
+                linked += link_profile_skills(chunk)
+            self.stdout.write(f"{scanned} profiles scanned ({renormalized} renormalized, {linked} skill links)")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 프로필 {scanned}건, 재정규화 {renormalized}건, 스킬 연결 {linked}건 (기존 연결 포함)"
+        ))
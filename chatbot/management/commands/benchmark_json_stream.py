@@ -0,0 +1,74 @@
+"""
+📊 증분 JSON 파서 벤치마크 - 녹화된 LLM 완성 응답 기준
+
+사용법: python manage.py benchmark_json_stream [--chunk-size 8] [--iterations 200]
+
+- 전체 수신 후 파싱(기존 방식) vs 증분 파싱(IncrementalArrayParser) 처리 시간
+- 첫 원소를 얻기까지 소비한 응답 비율 (스트리밍 체감 지연)
+"""
+
+import json
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from chatbot.json_stream import IncrementalArrayParser
+
+RECORDED_COMPLETIONS = Path(__file__).resolve().parents[2] / "testdata" / "recorded_completions.jsonl"
+
+
+def load_recorded_completions(path: Path = RECORDED_COMPLETIONS):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _parse_buffered(content: str, key: str):
+    """기존 방식: 전체 응답 수신 후 첫 JSON 값부터 한 번에 디코딩"""
+    start = min(index for index in (content.find("{"), content.find("[")) if index >= 0)
+    data, _ = json.JSONDecoder().raw_decode(content, start)
+    return data[key] if isinstance(data, dict) else data
+
+
+class Command(BaseCommand):
+    help = "녹화된 LLM 완성 응답으로 증분 JSON 파서 성능 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=8, help="스트림 델타 크기 (문자)")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def handle(self, *args, **options):
+        chunk_size, iterations = options["chunk_size"], options["iterations"]
+        records = load_recorded_completions()
+
+        self.stdout.write(f"{'completion':<32}{'chars':>7}{'buffered ms':>13}{'incremental ms':>16}"
+                          f"{'items':>7}{'1st item @':>12}")
+        for record in records:
+            content, key = record["content"], record["key"]
+            chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+            buffered = None
+            if record["finish_reason"] != "length":
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    "".join(chunks)
+                    _parse_buffered(content, key)
+                buffered = (time.perf_counter() - started) / iterations * 1000
+
+            first_at, items = None, 0
+            started = time.perf_counter()
+            for _ in range(iterations):
+                parser, consumed, items = IncrementalArrayParser(key), 0, 0
+                for chunk in chunks:
+                    consumed += len(chunk)
+                    found = parser.feed(chunk)
+                    if found and first_at is None:
+                        first_at = consumed / len(content)
+                    items += len(found)
+            incremental = (time.perf_counter() - started) / iterations * 1000
+
+            self.stdout.write(
+                f"{record['name']:<32}{len(content):>7}"
+                f"{(f'{buffered:.3f}' if buffered is not None else 'n/a'):>13}{incremental:>16.3f}"
+                f"{items:>7}{(f'{first_at:.0%}' if first_at is not None else '-'):>12}"
+            )
@@ -0,0 +1,121 @@
+"""
+📊 전문 검색 벤치마크 - 합성 문서 N건 (기본 100만) 기준
+
+사용법: python manage.py benchmark_search [--rows 1000000] [--iterations 50] [--seed 42]
+
+- 임시 SQLite 파일에 앱과 같은 FTS5 테이블/바이그램 토큰으로 합성 문서 적재 (앱 DB는 건드리지 않음)
+- 색인 구축 처리량, 파일 크기
+- 검색어별 상위 20건 BM25 조회 p50/p99 vs 일반 테이블 LIKE '%검색어%' 전체 스캔
+"""
+
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from chatbot.search import CREATE_TABLE_SQL, SEARCH_TABLE, match_query, ngram_tokens
+
+PHRASES = (
+    "MSA 전환", "모놀리식 아키텍처 분리", "레거시 마이그레이션", "쿠버네티스 클러스터 운영", "대용량 트래픽 처리",
+    "결제 시스템 설계", "캐시 전략 수립", "CI/CD 파이프라인 구축", "장애 대응 회고", "데이터 파이프라인 최적화",
+    "React 상태 관리", "모바일 앱 성능 개선", "검색 엔진 도입", "이벤트 기반 아키텍처", "팀 온보딩 문서화",
+    "코드 리뷰 문화", "API 게이트웨이 설계", "배치 작업 안정화", "Kafka 메시지 처리", "테스트 자동화",
+)
+CONNECTORS = ("경험을", "과정에서", "관련하여", "주도하며", "담당하면서", "기반으로")
+ENDINGS = ("설명해 주세요.", "어떻게 해결하셨나요?", "개선했습니다.", "학습합니다.", "진행했습니다.")
+QUERIES = ("MSA 전환", "마이그레이션", "쿠버네티스", "결제 시스템", "Kafka", "장애 대응 회고")
+DOC_TYPES = ("profile", "interview_session", "learning_path")
+
+
+def synthetic_documents(rows: int, seed: int):
+    """
+    일반 어휘(임의 음절 조합 수천 개) 문장 사이에 주제 구문이 드물게 섞인 문서
+    (주제 구문은 뒤로 갈수록 드물게 - 검색어마다 일치 문서 수가 수십 배씩 차이)
+    """
+    rng = random.Random(seed)
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(400)]
+    vocabulary = ["".join(rng.choices(syllables, k=rng.randint(2, 4))) for _ in range(5000)]
+    weights = [1 / (rank + 1) for rank in range(len(PHRASES))]
+    for index in range(rows):
+        sentences = []
+        for _ in range(rng.randint(2, 6)):
+            words = rng.choices(vocabulary, k=rng.randint(4, 9))
+            if rng.random() < 0.1:
+                words.insert(rng.randrange(len(words)), rng.choices(PHRASES, weights)[0])
+            sentences.append(f"{' '.join(words)} {rng.choice(CONNECTORS)} {rng.choice(ENDINGS)}")
+        yield index + 1, DOC_TYPES[index % 3], "\n".join(sentences)
+
+
+def _percentiles(latencies):
+    if len(latencies) < 2:
+        return latencies[0], latencies[0]
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49], cuts[98]
+
+
+class Command(BaseCommand):
+    help = "합성 문서로 FTS5 바이그램 검색 성능 측정 (LIKE 스캔 대비)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--iterations", type=int, default=50, help="검색어별 FTS 조회 반복 수")
+        parser.add_argument("--baseline-iterations", type=int, default=3, help="검색어별 LIKE 스캔 반복 수")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "search_benchmark.sqlite3")
+            db = sqlite3.connect(path)
+            db.execute(CREATE_TABLE_SQL)
+            db.execute("CREATE TABLE plain_documents (id INTEGER PRIMARY KEY, doc_type TEXT, body TEXT)")
+
+            started, batch = time.perf_counter(), []
+            for rowid, doc_type, body in synthetic_documents(rows, options["seed"]):
+                batch.append((rowid, doc_type, str(rowid), str(rowid), body, ngram_tokens(body)))
+                if len(batch) >= 10_000:
+                    self._load(db, batch)
+                    batch = []
+            self._load(db, batch)
+            db.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+            db.commit()
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"색인 구축: {rows:,}건 {elapsed:.1f}s ({rows / elapsed:,.0f} docs/s), "
+                              f"파일 {os.path.getsize(path) / 1024 / 1024:,.0f} MiB (LIKE 비교용 원문 테이블 포함)")
+
+            self.stdout.write(f"{'query':<16}{'hits':>9}{'fts p50 ms':>12}{'fts p99 ms':>12}{'like p50 ms':>13}")
+            for query in QUERIES:
+                expression = match_query(query)
+                hits = db.execute(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH ?",
+                                  (expression,)).fetchone()[0]
+                fts = self._time(db, options["iterations"],
+                                 f"SELECT doc_type, doc_id, body FROM {SEARCH_TABLE} "
+                                 f"WHERE {SEARCH_TABLE} MATCH ? ORDER BY rank LIMIT 20", (expression,))
+                # LIKE는 순위를 매길 수 없으므로 일치 행을 모두 읽는 비용으로 비교
+                like = self._time(db, options["baseline_iterations"],
+                                  "SELECT id FROM plain_documents WHERE body LIKE ?", (f"%{query}%",))
+                fts_p50, fts_p99 = _percentiles(fts)
+                self.stdout.write(f"{query:<16}{hits:>9,}{fts_p50:>12.1f}{fts_p99:>12.1f}"
+                                  f"{statistics.median(like):>13.1f}")
+            db.close()
+
+    @staticmethod
+    def _load(db, batch):
+        db.executemany(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, doc_type, doc_id, profile_id, body, tokens) VALUES (?, ?, ?, ?, ?, ?)",
+            batch
+        )
+        db.executemany("INSERT INTO plain_documents VALUES (?, ?, ?)", [(row[0], row[1], row[4]) for row in batch])
+
+    @staticmethod
+    def _time(db, iterations, sql, params):
+        latencies = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            db.execute(sql, params).fetchall()
+            latencies.append((time.perf_counter() - started) * 1000)
+        return latencies
@@ -0,0 +1,76 @@
+"""
+📊 스킬 정규화 벤치마크 - 합성 기술 스택 문자열 기준
+
+사용법: python manage.py benchmark_skill_normalizer [--count 100000] [--seed 42]
+
+- Aho-Corasick 매처(SkillNormalizer) vs 별칭마다 정규식을 도는 단순 방식
+- 처리량 (문자열/초)과 문자열당 지연 p50/p99 (µs)
+- 두 방식의 결과가 다른 입력 수 (경계/최장 일치 처리 차이)
+"""
+
+import random
+import re
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from chatbot.skills import SKILL_DICTIONARY, normalize_skill_text, skill_normalizer
+
+SEPARATORS = (", ", ",", " / ", " | ", "·", " 및 ", "\n", " ")
+NOISE = ("경험 3년", "사내 프로젝트", "협업", "toy project", "운영 경험", "기초", "etc", "자격증 보유")
+
+
+def synthetic_inputs(count: int, seed: int):
+    """별칭 + 잡음 토큰을 임의 구분자로 섞은 문자열 (대소문자 변형 포함)"""
+    rng = random.Random(seed)
+    aliases = [alias for _, name, _, entry_aliases in SKILL_DICTIONARY for alias in (*entry_aliases, name)]
+    inputs = []
+    for _ in range(count):
+        tokens = rng.sample(aliases, rng.randint(2, 10)) + rng.sample(NOISE, rng.randint(0, 2))
+        rng.shuffle(tokens)
+        tokens = [token.upper() if rng.random() < 0.1 else token for token in tokens]
+        inputs.append(rng.choice(SEPARATORS).join(tokens))
+    return inputs
+
+
+def naive_normalizer():
+    """기준선: 별칭마다 단어 경계 정규식을 하나씩 검사 (별칭 수만큼 입력을 다시 훑음)"""
+    patterns = [
+        (re.compile(rf"(?<![a-z0-9]){re.escape(normalize_skill_text(alias))}(?![a-z0-9])"), skill_id)
+        for skill_id, name, _, aliases in SKILL_DICTIONARY for alias in (*aliases, name)
+    ]
+
+    def normalize(text: str):
+        text = normalize_skill_text(text)
+        return sorted({skill_id for pattern, skill_id in patterns if pattern.search(text)})
+
+    return normalize
+
+
+class Command(BaseCommand):
+    help = "합성 입력으로 스킬 정규화 매처 성능 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=100_000, help="합성 문자열 수")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        inputs = synthetic_inputs(options["count"], options["seed"])
+        skill_normalizer.load()
+
+        results = {}
+        self.stdout.write(f"{'matcher':<16}{'strings/s':>12}{'p50 µs':>10}{'p99 µs':>10}")
+        for name, normalize in (("aho-corasick", skill_normalizer.normalize), ("naive-regex", naive_normalizer())):
+            latencies, outputs = [], []
+            for text in inputs:
+                started = time.perf_counter()
+                outputs.append(normalize(text))
+                latencies.append((time.perf_counter() - started) * 1_000_000)
+            results[name] = outputs
+            cuts = statistics.quantiles(latencies, n=100)
+            throughput = len(inputs) / (sum(latencies) / 1_000_000)
+            self.stdout.write(f"{name:<16}{throughput:>12,.0f}{cuts[49]:>10.1f}{cuts[98]:>10.1f}")
+
+        differing = sum(a != b for a, b in zip(results["aho-corasick"], results["naive-regex"]))
+        self.stdout.write(f"결과가 다른 입력: {differing}/{len(inputs)} (naive는 최장 일치/겹침을 처리하지 않음)")
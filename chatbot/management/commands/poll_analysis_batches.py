@@ -0,0 +1,41 @@
+"""
+📦 진행 중인 분석 배치 폴링 - 종료된 배치의 결과를 프로필에 저장
+
+사용법: python manage.py poll_analysis_batches [batch_id ...] [--wait] [--poll-interval 60]
+(인자 없이 실행하면 진행 중인 모든 배치 1회 갱신 - cron 용)
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from chatbot.batch_service import batch_progress, poll_analysis_batch
+from chatbot.models import AnalysisBatch
+
+
+class Command(BaseCommand):
+    help = "진행 중인 Batch API 분석 배치 상태 갱신 및 결과 저장"
+
+    def add_arguments(self, parser):
+        parser.add_argument("batch_ids", nargs="*", help="대상 배치 ID (생략 시 진행 중인 전체)")
+        parser.add_argument("--wait", action="store_true", help="모든 대상 배치가 종료될 때까지 반복")
+        parser.add_argument("--poll-interval", type=int, default=settings.ANALYSIS_BATCH_POLL_INTERVAL_SECONDS)
+
+    def handle(self, *args, **options):
+        batches = AnalysisBatch.objects.exclude(status__in=AnalysisBatch.TERMINAL_STATUSES)
+        if options["batch_ids"]:
+            batches = batches.filter(id__in=options["batch_ids"])
+        pending = list(batches)
+
+        while pending:
+            # poll_analysis_batch는 다시 읽은 배치를 반환 (넘긴 인스턴스는 갱신되지 않음)
+            polled = []
+            for batch in pending:
+                batch = poll_analysis_batch(batch)
+                self.stdout.write(f"{batch.id} {batch.status}: {batch_progress(batch)}")
+                polled.append(batch)
+            pending = [batch for batch in polled if not batch.is_terminal]
+            if not options["wait"] or not pending:
+                break
+            time.sleep(options["poll_interval"])
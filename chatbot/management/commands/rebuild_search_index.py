@@ -0,0 +1,45 @@
+"""
+🔍 전문 검색 색인 재구성 - 모든 프로필/면접 세션/학습 경로를 다시 색인
+
+사용법: python manage.py rebuild_search_index [--chunk-size 1000]
+
+- 색인 테이블을 비우고 문서 종류별로 청크 단위 스트리밍 색인 (한 트랜잭션 → 도중 실패 시 기존 색인 유지)
+- 끝나면 FTS5 optimize로 세그먼트 병합
+- 토크나이저 변경, 시그널을 거치지 않은 일괄 수정(QuerySet.update 등) 후 실행
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from chatbot.search import DOCUMENT_TYPES, SEARCH_TABLE, index_documents, search_available
+
+
+class Command(BaseCommand):
+    help = "전문 검색 색인(FTS5) 재구성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=settings.SEARCH_INDEX_DB_CHUNK)
+
+    def handle(self, *args, **options):
+        if not search_available():
+            raise CommandError("전문 검색은 SQLite 데이터베이스에서만 지원합니다.")
+        chunk_size = options["chunk_size"]
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+            for doc_type, (model, field) in DOCUMENT_TYPES.items():
+                fields = ["id", field] if doc_type == "profile" else ["id", "profile_id", field]
+                chunk, indexed = [], 0
+                for instance in model.objects.only(*fields).order_by().iterator(chunk_size=chunk_size):
+                    chunk.append(instance)
+                    if len(chunk) >= chunk_size:
+                        indexed += index_documents(chunk, replace=False)
+                        chunk = []
+                indexed += index_documents(chunk, replace=False)
+                self.stdout.write(f"{doc_type}: {indexed}건 색인")
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+        self.stdout.write(self.style.SUCCESS("전문 검색 색인 재구성 완료"))
@@ -0,0 +1,49 @@
+"""
+🧪 로컬 OpenAI 호환 스탠드인 서버 실행 - 여러 gunicorn 워커/부하 테스트 도구가 공유
+
+사용법:
+  python manage.py run_fake_openai --port 8765 --latency-ms 300 --ms-per-token 15 --error-rate 0.05
+  LLM_BACKEND=fake FAKE_OPENAI_URL=http://127.0.0.1:8765/v1 gunicorn ...
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from chatbot.fake_openai import FakeOpenAIConfig, FakeOpenAIServer
+
+
+class Command(BaseCommand):
+    help = "로컬 OpenAI 호환 스탠드인 서버 실행 (지연/오류율/토큰 수 설정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency-ms", type=float, default=0.0, help="첫 토큰 전 고정 지연")
+        parser.add_argument("--ms-per-token", type=float, default=0.0, help="출력 토큰당 추가 지연")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="429/500 응답 비율 (0~1)")
+        parser.add_argument("--prompt-tokens", type=int, default=None, help="usage.prompt_tokens 고정값")
+        parser.add_argument("--completion-tokens", type=int, default=None, help="usage.completion_tokens 고정값")
+        parser.add_argument("--cached-tokens", type=int, default=0)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        config = FakeOpenAIConfig(
+            latency_ms=options["latency_ms"],
+            ms_per_token=options["ms_per_token"],
+            error_rate=options["error_rate"],
+            prompt_tokens=options["prompt_tokens"],
+            completion_tokens=options["completion_tokens"],
+            cached_tokens=options["cached_tokens"],
+            seed=options["seed"],
+        )
+        server = FakeOpenAIServer(options["host"], options["port"], config).start()
+        self.stdout.write(f"🧪 스탠드인 서버 실행 중: {server.base_url} ({config})")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            state = server.state
+            self.stdout.write(f"종료 - 요청 {state.requests}건, 주입 오류 {state.errors}건")
+        finally:
+            server.stop()
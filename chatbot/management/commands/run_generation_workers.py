@@ -0,0 +1,39 @@
+"""
+🧵 비동기 생성 작업 워커 풀 - ?async=1로 등록된 분석/면접 질문/학습 경로 작업 처리
+
+사용법:
+  python manage.py run_generation_workers [--concurrency 4]   # 상시 실행 (웹 서버와 별도 프로세스)
+  python manage.py run_generation_workers --drain             # 대기 작업을 모두 처리하고 종료 (cron/테스트용)
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from chatbot.jobs import WorkerPool, run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = "DB 작업 큐의 LLM 생성 작업을 처리하는 워커 풀 실행"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=settings.GENERATION_WORKER_CONCURRENCY,
+                            help="동시 처리 작업 수 (워커 스레드 수)")
+        parser.add_argument("--drain", action="store_true", help="실행 가능한 작업을 모두 처리한 뒤 종료")
+
+    def handle(self, *args, **options):
+        if options["drain"]:
+            processed = run_pending_jobs(worker="drain")
+            self.stdout.write(f"처리한 작업: {processed}건")
+            return
+
+        pool = WorkerPool(options["concurrency"]).start()
+        self.stdout.write(f"🧵 생성 작업 워커 {options['concurrency']}개 실행 중 ({pool.name})")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            self.stdout.write("종료 중 - 실행 중인 작업이 끝나기를 기다립니다")
+        finally:
+            pool.stop()
@@ -0,0 +1,43 @@
+"""
+📦 이력서 JSONL 대량 등록 → OpenAI Batch API 제출
+
+사용법: python manage.py submit_analysis_batch cohort.jsonl [--wait] [--poll-interval 60]
+"""
+
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from chatbot.batch_service import batch_progress, poll_analysis_batch, submit_analysis_batch
+
+
+class Command(BaseCommand):
+    help = "JSONL 이력서 파일로 프로필을 일괄 생성하고 Batch API로 분석 제출"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="ResumeProfileCreateRequest JSONL 파일")
+        parser.add_argument("--wait", action="store_true", help="배치 종료까지 폴링하며 결과 저장")
+        parser.add_argument("--poll-interval", type=int, default=settings.ANALYSIS_BATCH_POLL_INTERVAL_SECONDS)
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"파일이 없습니다: {path}")
+
+        with open(path, encoding="utf-8-sig") as f:
+            try:
+                batch = submit_analysis_batch(f, source_name=path.name)
+            except ValueError as e:
+                raise CommandError(str(e))
+
+        self.stdout.write(f"배치 {batch.id} 제출 ({batch.openai_batch_id}) - {batch_progress(batch)}")
+        if not options["wait"]:
+            return
+
+        while not batch.is_terminal:
+            time.sleep(options["poll_interval"])
+            batch = poll_analysis_batch(batch)
+            self.stdout.write(f"  {batch.status}: {batch_progress(batch)}")
+        self.stdout.write(self.style.SUCCESS(f"배치 {batch.id} {batch.status} - {batch_progress(batch)}"))
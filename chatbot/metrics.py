@@ -0,0 +1,402 @@
+"""
+📈 Prometheus 텍스트 형식 메트릭 - GET /api/metrics
+
+- 카운터/게이지/히스토그램을 프로세스 메모리에 기록 (요청 경로에서는 잠금 + dict 갱신만)
+- 멀티 프로세스(gunicorn 워커 N개, run_generation_workers): METRICS_MULTIPROC_DIR 지정 시
+  백그라운드 스레드가 프로세스별 스냅샷(<pid>.json)을 주기적으로 기록하고, 수집 시 모든 스냅샷을 합산
+  · 카운터/히스토그램: 종료된 프로세스 값도 유지 (재시작 시 디렉터리 비우기)
+  · 게이지(진행 중 호출 수): 살아 있는 프로세스 값만 합산
+- 엔드포인트 라벨은 MetricsMiddleware가 URL 패턴(api/profiles/<profile_id>)으로 설정
+"""
+
+import copy
+import json
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import openai
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .tracing import endpoint_route, span
+
+logger = logging.getLogger(__name__)
+
+# 요청 단위 엔드포인트 라벨 (미들웨어 밖 - 워커/관리 명령 - 에서는 "background")
+_current_endpoint: ContextVar[str] = ContextVar("metrics_endpoint", default="background")
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Metric:
+    """라벨 조합별 값 보관 (값 형태는 종류별로 다름)"""
+
+    kind = ""
+
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str, labelnames: Sequence[str]):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[LabelValues, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _empty(self) -> Any:
+        return 0.0
+
+    def merge(self, target: Dict[LabelValues, Any], key: LabelValues, value: Any) -> None:
+        target[key] = target.get(key, 0.0) + value
+
+    def samples(self, values: Dict[LabelValues, Any]) -> Iterator[str]:
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    """프로세스별 현재 값 - 수집 시 살아 있는 프로세스 값만 합산"""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track_inprogress(self, **labels: Any) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(Metric):
+    """버킷별(비누적) 관측 수 + 합계 - 출력 시 누적 버킷으로 변환"""
+
+    kind = "histogram"
+
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str,
+                 labelnames: Sequence[str], buckets: Sequence[float] = DURATION_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def _empty(self) -> Any:
+        return {"buckets": [0] * len(self.buckets), "sum": 0.0}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = next(i for i, bound in enumerate(self.buckets) if value <= bound)
+        with self.registry.lock:
+            entry = self.values.setdefault(key, self._empty())
+            entry["buckets"][index] += 1
+            entry["sum"] += value
+
+    def merge(self, target: Dict[LabelValues, Any], key: LabelValues, value: Any) -> None:
+        entry = target.setdefault(key, self._empty())
+        entry["buckets"] = [a + b for a, b in zip(entry["buckets"], value["buckets"])]
+        entry["sum"] += value["sum"]
+
+    def samples(self, values: Dict[LabelValues, Any]) -> Iterator[str]:
+        for key, entry in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry["buckets"]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(entry['sum'])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(cumulative)}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """메트릭 정의 + 프로세스별 스냅샷 기록/합산"""
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.lock = threading.Lock()
+        self._flusher_pid: Optional[int] = None
+        self._flusher_lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Any:
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DURATION_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    # === 멀티 프로세스 스냅샷 ===
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return Path(settings.METRICS_MULTIPROC_DIR) if settings.METRICS_MULTIPROC_DIR else None
+
+    def snapshot(self) -> Dict[str, List[List[Any]]]:
+        with self.lock:
+            return {
+                name: [[list(key), copy.deepcopy(value)] for key, value in metric.values.items()]
+                for name, metric in self.metrics.items() if metric.values
+            }
+
+    def flush(self) -> None:
+        """현재 프로세스 스냅샷 기록 (임시 파일 → rename으로 원자적 교체)"""
+        directory = self.directory
+        if directory is None:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{os.getpid()}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"pid": os.getpid(), "metrics": self.snapshot()}))
+        os.replace(tmp, path)
+
+    def ensure_flusher(self) -> None:
+        """프로세스마다(fork 이후 포함) 스냅샷 기록 스레드 1개 기동"""
+        if self.directory is None or self._flusher_pid == os.getpid():
+            return
+        with self._flusher_lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            threading.Thread(target=self._flush_loop, name="metrics-flusher", daemon=True).start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(settings.METRICS_FLUSH_INTERVAL_SECONDS)
+            try:
+                self.flush()
+            except OSError as e:
+                logger.warning("⚠️ 메트릭 스냅샷 기록 실패: %s", e)
+
+    def _other_snapshots(self) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+        directory = self.directory
+        if directory is None or not directory.exists():
+            return
+        for path in directory.glob("*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):  # 기록 중인 파일 등
+                continue
+            if data.get("pid") == os.getpid():
+                continue
+            yield _pid_alive(data["pid"]), data["metrics"]
+
+    def collect(self) -> Dict[str, Dict[LabelValues, Any]]:
+        """현재 프로세스 값 + 다른 프로세스 스냅샷 합산"""
+        merged: Dict[str, Dict[LabelValues, Any]] = {name: {} for name in self.metrics}
+        sources = [(True, self.snapshot()), *self._other_snapshots()]
+        for alive, metrics in sources:
+            for name, samples in metrics.items():
+                metric = self.metrics.get(name)
+                if metric is None or (metric.kind == "gauge" and not alive):
+                    continue
+                for key, value in samples:
+                    metric.merge(merged[name], tuple(key), value)
+        return merged
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)"""
+        lines = []
+        for name, values in self.collect().items():
+            metric = self.metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.samples(values))
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# === 메트릭 정의 ===
+
+http_requests = registry.counter(
+    "career_coach_http_requests_total", "HTTP 요청 수", ("endpoint", "method", "status"))
+http_request_duration = registry.histogram(
+    "career_coach_http_request_duration_seconds", "HTTP 요청 처리 시간", ("endpoint", "method"))
+stage_duration = registry.histogram(
+    "career_coach_stage_duration_seconds",
+    "엔드포인트별 처리 단계 시간 (db, restore_analysis, prompt_render, upstream, parse, llm, serialize)",
+    ("endpoint", "stage"))
+llm_requests = registry.counter(
+    "career_coach_llm_requests_total", "LLM 업스트림 호출 시도 수 (HTTP 상태 코드/오류 종류별)", ("model", "status"))
+llm_inflight = registry.gauge(
+    "career_coach_llm_inflight_requests", "진행 중인 LLM 업스트림 호출 수 (스트리밍 포함)", ("model",))
+llm_tokens = registry.counter(
+    "career_coach_llm_tokens_total", "LLM 토큰 사용량 (prompt/completion/cached)", ("model", "kind"))
+llm_fallbacks = registry.counter(
+    "career_coach_llm_fallbacks_total", "기본값으로 대체된 생성 수", ("stage", "reason"))
+cache_requests = registry.counter(
+    "career_coach_cache_requests_total",
+    "캐시 조회 결과 (analysis: memory/persistent/miss, single_flight: leader/coalesced_*/deadline_exceeded)", ("cache", "result"))
+
+
+# === 계측 헬퍼 ===
+
+@contextmanager
+def stage_timer(stage: str, **attributes: Any) -> Iterator[None]:
+    """현재 엔드포인트의 처리 단계 시간 기록 + 같은 이름의 트레이싱 span (with 문/동기 함수 데코레이터)"""
+    started = time.perf_counter()
+    try:
+        with span(stage, **attributes):
+            yield
+    finally:
+        stage_duration.observe(time.perf_counter() - started, endpoint=_current_endpoint.get(), stage=stage)
+        registry.ensure_flusher()
+
+
+def _llm_status(error: BaseException) -> str:
+    if isinstance(error, openai.APIStatusError):
+        return str(error.status_code)
+    if isinstance(error, (openai.APITimeoutError, TimeoutError)):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection_error"
+    return type(error).__name__
+
+
+@contextmanager
+def observe_llm_call(model: str) -> Iterator[None]:
+    """업스트림 호출 1회 - 진행 중 게이지 + 결과 상태 코드 (llm_attempt span)"""
+    llm_inflight.inc(model=model)
+    with span("llm_attempt", **{"llm.model": model}) as attempt:
+        try:
+            yield
+        except BaseException as e:
+            status = _llm_status(e)
+            raise
+        else:
+            status = "200"
+        finally:
+            attempt.set_attribute("llm.status", status)
+            llm_requests.inc(model=model, status=status)
+            llm_inflight.dec(model=model)
+            registry.ensure_flusher()
+
+
+class MetricsMiddleware:
+    """
+    요청 수/처리 시간 + 단계별 메트릭에 쓸 엔드포인트 라벨 설정 (동기/비동기 겸용)
+    (SSE 응답은 스트림을 소비하는 동안에도 라벨 유지 - TracingMiddleware와 같은 방식)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        endpoint = endpoint_route(request.path_info)
+        token, started = _current_endpoint.set(endpoint), time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_endpoint.reset(token)
+        return self._finish(request, endpoint, started, response)
+
+    async def __acall__(self, request):
+        endpoint = endpoint_route(request.path_info)
+        token, started = _current_endpoint.set(endpoint), time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_endpoint.reset(token)
+        return self._finish(request, endpoint, started, response)
+
+    def _finish(self, request, endpoint: str, started: float, response):
+        # 스트리밍(SSE) 응답은 첫 바이트 전까지의 시간
+        http_request_duration.observe(time.perf_counter() - started, endpoint=endpoint, method=request.method)
+        http_requests.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+        registry.ensure_flusher()
+        if not response.streaming:
+            return response
+        # SSE: 스트림을 소비하는 쪽 컨텍스트에서 엔드포인트 라벨을 다시 설정
+        if response.is_async:
+            response.streaming_content = self._aiter_with_endpoint(endpoint, response.streaming_content)
+        else:
+            response.streaming_content = self._iter_with_endpoint(endpoint, response.streaming_content)
+        return response
+
+    @staticmethod
+    async def _aiter_with_endpoint(endpoint: str, content):
+        token = _current_endpoint.set(endpoint)
+        try:
+            async for chunk in content:
+                yield chunk
+        finally:
+            _reset_endpoint(token)
+
+    @staticmethod
+    def _iter_with_endpoint(endpoint: str, content):
+        token = _current_endpoint.set(endpoint)
+        try:
+            yield from content
+        finally:
+            _reset_endpoint(token)
+
+
+def _reset_endpoint(token) -> None:
+    """스트림을 다른 컨텍스트에서 닫는 경우(GC 등)에는 되돌릴 값이 없으므로 무시"""
+    try:
+        _current_endpoint.reset(token)
+    except ValueError:
+        pass
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:31
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisBatch',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('source_name', models.CharField(blank=True, max_length=255, verbose_name='입력 파일명')),
+                ('status', models.CharField(choices=[('validating', '검증 중'), ('in_progress', '진행 중'), ('finalizing', '마무리 중'), ('completed', '완료'), ('failed', '실패'), ('expired', '만료'), ('cancelling', '취소 중'), ('cancelled', '취소됨')], default='validating', max_length=20)),
+                ('openai_batch_id', models.CharField(blank=True, max_length=100)),
+                ('input_file_id', models.CharField(blank=True, max_length=100)),
+                ('output_file_id', models.CharField(blank=True, max_length=100)),
+                ('error_file_id', models.CharField(blank=True, max_length=100)),
+                ('total_count', models.PositiveIntegerField(default=0, verbose_name='전체 레코드 수')),
+                ('completed_count', models.PositiveIntegerField(default=0, verbose_name='분석 저장 완료 수')),
+                ('failed_count', models.PositiveIntegerField(default=0, verbose_name='실패 수')),
+                ('errors', models.JSONField(default=list, verbose_name='실패 상세 (최대 N건)')),
+            ],
+            options={
+                'verbose_name': '분석 배치',
+                'verbose_name_plural': '분석 배치들',
+                'db_table': 'analysis_batches',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='resumeprofile',
+            name='batch',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='profiles', to='chatbot.analysisbatch', verbose_name='분석 배치'),
+        ),
+    ]
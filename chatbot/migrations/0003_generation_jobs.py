@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:42
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def mark_analysed_profiles(apps, schema_editor):
+    """기존 프로필: 분석 결과가 있으면 completed"""
+    ResumeProfile = apps.get_model('chatbot', 'ResumeProfile')
+    ResumeProfile.objects.filter(analysis_result__isnull=False).update(analysis_status='completed')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0002_analysis_batch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeprofile',
+            name='analysis_status',
+            field=models.CharField(choices=[('pending', '분석 대기'), ('processing', '분석 중'), ('completed', '분석 완료'), ('failed', '분석 실패')], default='pending', max_length=20, verbose_name='분석 상태'),
+        ),
+        migrations.RunPython(mark_analysed_profiles, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='GenerationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(choices=[('profile_analysis', '이력서 분석'), ('interview_session', '면접 질문 생성'), ('learning_path', '학습 경로 생성')], max_length=30)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=20)),
+                ('payload', models.JSONField(default=dict, verbose_name='요청 본문')),
+                ('result_id', models.UUIDField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('run_after', models.DateTimeField(verbose_name='실행 가능 시각')),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='generation_jobs', to='chatbot.resumeprofile')),
+            ],
+            options={
+                'verbose_name': '생성 작업',
+                'verbose_name_plural': '생성 작업들',
+                'db_table': 'generation_jobs',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='generation_job_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0003_generation_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsageRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='집계 일자')),
+                ('stage', models.CharField(max_length=50, verbose_name='생성 단계')),
+                ('model', models.CharField(max_length=100, verbose_name='모델')),
+                ('requests', models.PositiveIntegerField(default=0)),
+                ('calls', models.PositiveIntegerField(default=0)),
+                ('prompt_tokens', models.PositiveBigIntegerField(default=0)),
+                ('completion_tokens', models.PositiveBigIntegerField(default=0)),
+                ('cached_tokens', models.PositiveBigIntegerField(default=0)),
+                ('cost_usd', models.DecimalField(decimal_places=8, default=0, max_digits=16)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '사용량 집계',
+                'verbose_name_plural': '사용량 집계들',
+                'db_table': 'usage_rollups',
+                'ordering': ['day', 'stage', 'model'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'stage', 'model'), name='usage_rollup_unique')],
+            },
+        ),
+    ]
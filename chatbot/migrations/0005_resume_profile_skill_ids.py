@@ -0,0 +1,149 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:05
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+# 이 시점의 스킬 사전 (canonical ID, 별칭) - 앱 코드(chatbot.skills)와 분리해 고정
+# 이후 사전 변경은 python manage.py backfill_profile_skills --renormalize로 반영
+SKILL_ALIASES = (
+    ('python', ('python', 'python3', '파이썬')),
+    ('java', ('java', '자바')),
+    ('kotlin', ('kotlin', '코틀린')),
+    ('javascript', ('javascript', 'js', 'ecmascript', 'es6', '자바스크립트')),
+    ('typescript', ('typescript', 'ts', '타입스크립트')),
+    ('go', ('go', 'golang', '고랭')),
+    ('rust', ('rust',)),
+    ('c', ('c', 'c언어')),
+    ('cpp', ('c++', 'cpp', '씨플플')),
+    ('csharp', ('c#', 'csharp', 'c샵')),
+    ('php', ('php',)),
+    ('ruby', ('ruby', '루비')),
+    ('scala', ('scala', '스칼라')),
+    ('swift', ('swift', '스위프트')),
+    ('dart', ('dart', '다트')),
+    ('sql', ('sql',)),
+    ('spring', ('spring', 'spring framework', '스프링')),
+    ('spring-boot', ('spring boot', 'springboot', '스프링 부트', '스프링부트')),
+    ('jpa', ('jpa', 'hibernate', 'spring data jpa', '하이버네이트')),
+    ('django', ('django', '장고', 'drf', 'django rest framework')),
+    ('fastapi', ('fastapi', 'fast api')),
+    ('flask', ('flask', '플라스크')),
+    ('nodejs', ('node.js', 'nodejs', 'node', '노드')),
+    ('nestjs', ('nestjs', 'nest.js', '네스트')),
+    ('express', ('express', 'express.js')),
+    ('rails', ('rails', 'ruby on rails', '레일즈')),
+    ('graphql', ('graphql',)),
+    ('grpc', ('grpc',)),
+    ('msa', ('msa', 'microservices', 'microservice', '마이크로서비스')),
+    ('mysql', ('mysql', '마이에스큐엘')),
+    ('postgresql', ('postgresql', 'postgres', '포스트그레스')),
+    ('oracle', ('oracle', '오라클')),
+    ('mongodb', ('mongodb', 'mongo', '몽고디비')),
+    ('redis', ('redis', '레디스')),
+    ('elasticsearch', ('elasticsearch', 'elastic search', '엘라스틱서치', '엘라스틱 서치')),
+    ('kafka', ('kafka', '카프카')),
+    ('rabbitmq', ('rabbitmq', '래빗mq')),
+    ('react', ('react', 'react.js', 'reactjs', '리액트')),
+    ('nextjs', ('next.js', 'nextjs', '넥스트')),
+    ('vue', ('vue', 'vue.js', 'vuejs')),
+    ('angular', ('angular', '앵귤러')),
+    ('svelte', ('svelte',)),
+    ('html', ('html', 'html5')),
+    ('css', ('css', 'css3', 'scss', 'sass', 'tailwind', 'tailwindcss')),
+    ('redux', ('redux', '리덕스')),
+    ('webpack', ('webpack', '웹팩')),
+    ('android', ('android', '안드로이드')),
+    ('ios', ('ios',)),
+    ('jetpack-compose', ('jetpack compose', '컴포즈')),
+    ('swiftui', ('swiftui',)),
+    ('flutter', ('flutter', '플러터')),
+    ('react-native', ('react native', 'react-native', '리액트 네이티브', '리액트네이티브')),
+    ('spark', ('spark', 'pyspark', '스파크', 'Apache Spark')),
+    ('airflow', ('airflow', '에어플로우', 'Apache Airflow')),
+    ('hadoop', ('hadoop', '하둡')),
+    ('pandas', ('pandas', '판다스')),
+    ('numpy', ('numpy', '넘파이')),
+    ('tensorflow', ('tensorflow', '텐서플로우', '텐서플로')),
+    ('pytorch', ('pytorch', 'torch', '파이토치')),
+    ('scikit-learn', ('scikit-learn', 'sklearn', '사이킷런')),
+    ('machine-learning', ('machine learning', 'ml', '머신러닝', '기계학습')),
+    ('deep-learning', ('deep learning', 'dl', '딥러닝')),
+    ('llm', ('llm', 'openai', 'langchain', '랭체인')),
+    ('bigquery', ('bigquery', '빅쿼리')),
+    ('aws', ('aws', 'amazon web services', 'ec2', 'aws ec2', 's3', 'lambda', '아마존 웹 서비스')),
+    ('gcp', ('gcp', 'google cloud', '구글 클라우드')),
+    ('azure', ('azure', '애저')),
+    ('docker', ('docker', '도커')),
+    ('kubernetes', ('kubernetes', 'k8s', '쿠버네티스', 'eks', 'gke')),
+    ('terraform', ('terraform', '테라폼')),
+    ('jenkins', ('jenkins', '젠킨스')),
+    ('github-actions', ('github actions', 'github action', '깃허브 액션')),
+    ('ci-cd', ('ci/cd', 'cicd', 'ci cd')),
+    ('linux', ('linux', '리눅스', 'ubuntu', '우분투')),
+    ('nginx', ('nginx', '엔진엑스')),
+    ('prometheus', ('prometheus', '프로메테우스', 'grafana', '그라파나')),
+    ('git', ('git', '깃', 'github', '깃허브', 'gitlab')),
+    ('jira', ('jira', '지라')),
+    ('figma', ('figma', '피그마')),
+)
+
+
+def _normalize(value):
+    value = unicodedata.normalize('NFKC', value or '').lower()
+    return re.sub(r'\s+', ' ', value).strip()
+
+
+def _skill_pattern():
+    """
+    별칭 전체를 긴 것부터 나열한 정규식 (왼쪽 우선, 같은 시작점이면 가장 긴 별칭)
+    - 띄어쓰기/구두점 변형 포함 (spring boot ↔ springboot)
+    - 영문/숫자로 시작·끝나는 별칭은 단어 경계에서만 매칭
+    """
+    variants = {}
+    for skill_id, aliases in SKILL_ALIASES:
+        for alias in {_normalize(alias) for alias in aliases}:
+            for variant in {alias, re.sub(r'[\s.\-]', '', alias)}:
+                if variant:
+                    variants.setdefault(variant, skill_id)
+    alternatives = []
+    for variant in sorted(variants, key=len, reverse=True):
+        pattern = re.escape(variant)
+        if variant[0].isascii() and variant[0].isalnum():
+            pattern = r'(?<![a-z0-9])' + pattern
+        if variant[-1].isascii() and variant[-1].isalnum():
+            pattern += r'(?![a-z0-9])'
+        alternatives.append(pattern)
+    return re.compile('|'.join(alternatives)), variants
+
+
+def backfill_skill_ids(apps, schema_editor):
+    """기존 프로필의 기술 스킬 문자열 정규화"""
+    pattern, variants = _skill_pattern()
+    ResumeProfile = apps.get_model('chatbot', 'ResumeProfile')
+    profiles = []
+    for profile in ResumeProfile.objects.only('id', 'technical_skills').iterator(chunk_size=1000):
+        text = _normalize(profile.technical_skills)
+        profile.skill_ids = sorted({variants[match.group()] for match in pattern.finditer(text)})
+        profiles.append(profile)
+        if len(profiles) >= 1000:
+            ResumeProfile.objects.bulk_update(profiles, ['skill_ids'])
+            profiles = []
+    ResumeProfile.objects.bulk_update(profiles, ['skill_ids'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0004_usage_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeprofile',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list, help_text='예: ["aws", "docker", "mysql", "python"]', verbose_name='정규화 스킬 ID'),
+        ),
+        migrations.RunPython(backfill_skill_ids, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,148 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 이 시점의 스킬 사전 (canonical ID, 표시 이름, 로드맵 계열) - 앱 코드(chatbot.skills)와 분리해 고정
+# 이후 사전에 추가된 스킬 행은 link_profile_skills가 연결 시 생성
+SKILLS = (
+    ('python', 'Python', ''),
+    ('java', 'Java', 'backend'),
+    ('kotlin', 'Kotlin', ''),
+    ('javascript', 'JavaScript', 'frontend'),
+    ('typescript', 'TypeScript', 'frontend'),
+    ('go', 'Go', 'backend'),
+    ('rust', 'Rust', 'backend'),
+    ('c', 'C', ''),
+    ('cpp', 'C++', ''),
+    ('csharp', 'C#', 'backend'),
+    ('php', 'PHP', 'backend'),
+    ('ruby', 'Ruby', 'backend'),
+    ('scala', 'Scala', 'data'),
+    ('swift', 'Swift', 'mobile'),
+    ('dart', 'Dart', 'mobile'),
+    ('sql', 'SQL', 'data'),
+    ('spring', 'Spring', 'backend'),
+    ('spring-boot', 'Spring Boot', 'backend'),
+    ('jpa', 'JPA', 'backend'),
+    ('django', 'Django', 'backend'),
+    ('fastapi', 'FastAPI', 'backend'),
+    ('flask', 'Flask', 'backend'),
+    ('nodejs', 'Node.js', 'backend'),
+    ('nestjs', 'NestJS', 'backend'),
+    ('express', 'Express', 'backend'),
+    ('rails', 'Ruby on Rails', 'backend'),
+    ('graphql', 'GraphQL', 'backend'),
+    ('grpc', 'gRPC', 'backend'),
+    ('msa', 'MSA', 'backend'),
+    ('mysql', 'MySQL', 'backend'),
+    ('postgresql', 'PostgreSQL', 'backend'),
+    ('oracle', 'Oracle', 'backend'),
+    ('mongodb', 'MongoDB', 'backend'),
+    ('redis', 'Redis', 'backend'),
+    ('elasticsearch', 'Elasticsearch', 'backend'),
+    ('kafka', 'Kafka', 'data'),
+    ('rabbitmq', 'RabbitMQ', 'backend'),
+    ('react', 'React', 'frontend'),
+    ('nextjs', 'Next.js', 'frontend'),
+    ('vue', 'Vue.js', 'frontend'),
+    ('angular', 'Angular', 'frontend'),
+    ('svelte', 'Svelte', 'frontend'),
+    ('html', 'HTML', 'frontend'),
+    ('css', 'CSS', 'frontend'),
+    ('redux', 'Redux', 'frontend'),
+    ('webpack', 'Webpack', 'frontend'),
+    ('android', 'Android', 'mobile'),
+    ('ios', 'iOS', 'mobile'),
+    ('jetpack-compose', 'Jetpack Compose', 'mobile'),
+    ('swiftui', 'SwiftUI', 'mobile'),
+    ('flutter', 'Flutter', 'mobile'),
+    ('react-native', 'React Native', 'mobile'),
+    ('spark', 'Apache Spark', 'data'),
+    ('airflow', 'Apache Airflow', 'data'),
+    ('hadoop', 'Hadoop', 'data'),
+    ('pandas', 'pandas', 'data'),
+    ('numpy', 'NumPy', 'data'),
+    ('tensorflow', 'TensorFlow', 'data'),
+    ('pytorch', 'PyTorch', 'data'),
+    ('scikit-learn', 'scikit-learn', 'data'),
+    ('machine-learning', 'Machine Learning', 'data'),
+    ('deep-learning', 'Deep Learning', 'data'),
+    ('llm', 'LLM', 'data'),
+    ('bigquery', 'BigQuery', 'data'),
+    ('aws', 'AWS', 'devops'),
+    ('gcp', 'Google Cloud', 'devops'),
+    ('azure', 'Azure', 'devops'),
+    ('docker', 'Docker', 'devops'),
+    ('kubernetes', 'Kubernetes', 'devops'),
+    ('terraform', 'Terraform', 'devops'),
+    ('jenkins', 'Jenkins', 'devops'),
+    ('github-actions', 'GitHub Actions', 'devops'),
+    ('ci-cd', 'CI/CD', 'devops'),
+    ('linux', 'Linux', 'devops'),
+    ('nginx', 'Nginx', 'devops'),
+    ('prometheus', 'Prometheus', 'devops'),
+    ('git', 'Git', ''),
+    ('jira', 'Jira', ''),
+    ('figma', 'Figma', 'frontend'),
+)
+
+
+def seed_skills(apps, schema_editor):
+    """스킬 사전 → skills 테이블 (기존 프로필 연결은 backfill_profile_skills 명령으로)"""
+    Skill = apps.get_model('chatbot', 'Skill')
+    Skill.objects.bulk_create(
+        [Skill(id=skill_id, name=name, family=family) for skill_id, name, family in SKILLS],
+        ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0005_resume_profile_skill_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, verbose_name='표시 이름')),
+                ('family', models.CharField(blank=True, max_length=20, verbose_name='로드맵 계열')),
+            ],
+            options={
+                'verbose_name': '스킬',
+                'verbose_name_plural': '스킬들',
+                'db_table': 'skills',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfileSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('profile', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='chatbot.resumeprofile')),
+                ('skill', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='profile_links', to='chatbot.skill')),
+            ],
+            options={
+                'verbose_name': '프로필 스킬',
+                'verbose_name_plural': '프로필 스킬들',
+                'db_table': 'resume_profile_skills',
+            },
+        ),
+        migrations.AddField(
+            model_name='resumeprofile',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='profiles', through='chatbot.ProfileSkill', to='chatbot.skill', verbose_name='보유 스킬'),
+        ),
+        migrations.AddIndex(
+            model_name='profileskill',
+            index=models.Index(fields=['skill', 'profile'], name='skill_profile_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='profileskill',
+            constraint=models.UniqueConstraint(fields=('profile', 'skill'), name='profile_skill_unique'),
+        ),
+        migrations.RunPython(seed_skills, migrations.RunPython.noop),
+    ]
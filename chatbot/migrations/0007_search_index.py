@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:40
+
+from django.db import migrations
+
+# 이 시점의 색인 테이블 DDL - 앱 코드(chatbot.search)와 분리해 고정
+CREATE_SEARCH_TABLE_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_documents USING fts5(
+    doc_type UNINDEXED,
+    doc_id UNINDEXED,
+    profile_id UNINDEXED,
+    body UNINDEXED,
+    tokens,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+DROP_SEARCH_TABLE_SQL = "DROP TABLE IF EXISTS search_documents"
+
+
+def create_search_table(apps, schema_editor):
+    """FTS5 색인 테이블 (SQLite 전용, 기존 데이터 색인은 rebuild_search_index 명령으로)"""
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(CREATE_SEARCH_TABLE_SQL)
+
+
+def drop_search_table(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(DROP_SEARCH_TABLE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0006_skill_table'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_table, drop_search_table),
+    ]
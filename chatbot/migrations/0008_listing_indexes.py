@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0007_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(fields=['profile', 'created_at', 'id'], name='session_profile_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='learningpath',
+            index=models.Index(fields=['profile', 'created_at', 'id'], name='path_profile_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumeprofile',
+            index=models.Index(fields=['created_at', 'id'], name='profile_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumeprofile',
+            index=models.Index(fields=['job_role', 'created_at', 'id'], name='profile_job_role_created_idx'),
+        ),
+        # 복합 인덱스를 먼저 만든 뒤 FK 단일 인덱스 제거 (프로필별 조회가 인덱스 없이 도는 구간이 없도록)
+        migrations.AlterField(
+            model_name='interviewsession',
+            name='profile',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='interview_sessions', to='chatbot.resumeprofile'),
+        ),
+        migrations.AlterField(
+            model_name='learningpath',
+            name='profile',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='learning_paths', to='chatbot.resumeprofile'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0008_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisbatch',
+            name='ingest_locked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='결과 수집 점유 시각'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+"""
+🧭 모델 라우팅 + 캐스케이드 - 스테이지/입력 크기별 모델 선택
+
+- 짧은 입력의 주니어 프로필 → light 티어 (가장 싸고 빠른 모델)
+- 그 외 → standard 티어
+- 스키마 검증 실패/품질 검사 미달 시에만 한 단계 위 티어로 재시도 (최대 strong)
+- 시도별 결정(티어, 모델, 사유, 결과, 지연, 토큰)은 generation_metadata.routing에 기록
+"""
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+# career_level 텍스트에서 주니어로 보는 표현
+JUNIOR_LEVEL_KEYWORDS = ("주니어", "신입", "초급", "입문")
+
+
+def is_junior_level(career_level: str) -> bool:
+    return any(keyword in (career_level or "") for keyword in JUNIOR_LEVEL_KEYWORDS)
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """스테이지 1회 시도에 사용할 모델"""
+    stage: str
+    tier: str
+    model: str
+    reason: str
+
+
+class ModelRouter:
+    """설정(LLM_MODEL_TIERS, LLM_ROUTING_*) 기반 라우터 - 스테이지/티어별 결정 횟수 집계"""
+
+    def __init__(self):
+        self._decisions: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._escalations: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @property
+    def tiers(self) -> List[Tuple[str, str]]:
+        return list(settings.LLM_MODEL_TIERS)
+
+    def _decide(self, stage: str, index: int, reason: str) -> RouteDecision:
+        tier, model = self.tiers[index]
+        with self._lock:
+            self._decisions[stage][tier] += 1
+        return RouteDecision(stage, tier, model, reason)
+
+    def route(self, stage: str, input_tokens: int, junior: bool, skill_count: int = 0) -> RouteDecision:
+        """첫 시도 모델 - 짧고 기술 스택이 좁은 주니어 입력만 light, 나머지는 standard"""
+        light_limit = settings.LLM_ROUTING_LIGHT_MAX_INPUT_TOKENS.get(stage, 0)
+        if junior and input_tokens <= light_limit and skill_count <= settings.LLM_ROUTING_LIGHT_MAX_SKILLS:
+            return self._decide(stage, 0, "short_junior_input")
+        return self._decide(stage, min(1, len(self.tiers) - 1), "default")
+
+    def escalate(self, decision: RouteDecision, reason: str) -> Optional[RouteDecision]:
+        """캐스케이드 - 한 단계 위 티어 (이미 최상위면 None)"""
+        names = [tier for tier, _ in self.tiers]
+        index = names.index(decision.tier) + 1 if decision.tier in names else len(names)
+        if index >= len(names):
+            return None
+        with self._lock:
+            self._escalations[decision.stage] += 1
+        return self._decide(decision.stage, index, f"cascade:{reason}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "decisions": {stage: dict(tiers) for stage, tiers in self._decisions.items()},
+                "escalations": dict(self._escalations),
+            }
+
+
+model_router = ModelRouter()
@@ -47,6 +47,39 @@ class ResumeProfile(models.Model):
         default=0
     )
     
+    # 스킬 사전 기준 정규화 결과 (정렬된 canonical ID) - 캐시 키/라우팅/집계용
+    skill_ids = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="정규화 스킬 ID",
+        help_text="예: [\"aws\", \"docker\", \"mysql\", \"python\"]"
+    )
+    
+    # 스킬별 프로필 조회용 정규화 테이블 (skill_ids와 같은 내용, 인덱스로 교집합 조회)
+    skills = models.ManyToManyField(
+        'Skill',
+        through='ProfileSkill',
+        related_name='profiles',
+        blank=True,
+        verbose_name="보유 스킬"
+    )
+    
+    # 분석 진행 상태 (비동기 작업 모드/대량 등록에서는 pending으로 생성 후 워커가 갱신)
+    ANALYSIS_STATUS_CHOICES = [
+        ('pending', '분석 대기'),
+        ('processing', '분석 중'),
+        ('completed', '분석 완료'),
+        ('failed', '분석 실패'),
+    ]
+    IN_PROGRESS_STATUSES = ('pending', 'processing')
+    
+    analysis_status = models.CharField(
+        max_length=20,
+        choices=ANALYSIS_STATUS_CHOICES,
+        default='pending',
+        verbose_name="분석 상태"
+    )
+    
     # 분석 결과 저장 (캐싱용)
     analysis_result = models.JSONField(
         null=True, 
@@ -54,20 +87,224 @@ class ResumeProfile(models.Model):
         verbose_name="AI 분석 결과"
     )
     
+    # 대량 등록(Batch API)으로 생성된 경우 소속 배치
+    batch = models.ForeignKey(
+        'AnalysisBatch',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='profiles',
+        verbose_name="분석 배치"
+    )
+    
     class Meta:
         db_table = 'resume_profiles'
         verbose_name = '이력서 프로필'
         verbose_name_plural = '이력서 프로필들'
+        # 목록은 모두 (created_at, id) 키셋 순서 - id까지 포함해야 동률 정렬도 인덱스로 처리
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='profile_created_idx'),
+            models.Index(fields=['job_role', 'created_at', 'id'], name='profile_job_role_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.career_summary[:50]}..."
 
 
+class Skill(models.Model):
+    """스킬 사전 항목 (ID = skills.SKILL_DICTIONARY의 canonical ID)"""
+    
+    id = models.CharField(primary_key=True, max_length=50)
+    name = models.CharField(max_length=100, verbose_name="표시 이름")
+    family = models.CharField(max_length=20, blank=True, verbose_name="로드맵 계열")
+    
+    class Meta:
+        db_table = 'skills'
+        verbose_name = '스킬'
+        verbose_name_plural = '스킬들'
+        ordering = ['id']
+    
+    def __str__(self):
+        return self.name
+
+
+class ProfileSkill(models.Model):
+    """
+    프로필 ↔ 스킬 연결
+    - (profile, skill) 유니크 인덱스: 프로필의 스킬 확인 (교집합의 두 번째 스킬부터)
+    - (skill, profile) 인덱스: 스킬로 프로필 찾기 (교집합의 첫 스킬)
+    FK 단일 컬럼 인덱스는 위 두 복합 인덱스의 접두사와 겹치므로 만들지 않음
+    """
+    
+    profile = models.ForeignKey(ResumeProfile, on_delete=models.CASCADE, related_name='skill_links', db_index=False)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='profile_links', db_index=False)
+    
+    class Meta:
+        db_table = 'resume_profile_skills'
+        verbose_name = '프로필 스킬'
+        verbose_name_plural = '프로필 스킬들'
+        constraints = [
+            models.UniqueConstraint(fields=['profile', 'skill'], name='profile_skill_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['skill', 'profile'], name='skill_profile_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.profile_id} - {self.skill_id}"
+
+
+class AnalysisBatch(models.Model):
+    """OpenAI Batch API 기반 대량 이력서 분석 작업 (코호트 단위 온보딩)"""
+    
+    STATUS_CHOICES = [
+        ('validating', '검증 중'),
+        ('in_progress', '진행 중'),
+        ('finalizing', '마무리 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+        ('expired', '만료'),
+        ('cancelling', '취소 중'),
+        ('cancelled', '취소됨'),
+    ]
+    TERMINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    source_name = models.CharField(max_length=255, blank=True, verbose_name="입력 파일명")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='validating')
+    
+    # OpenAI 측 식별자
+    openai_batch_id = models.CharField(max_length=100, blank=True)
+    input_file_id = models.CharField(max_length=100, blank=True)
+    output_file_id = models.CharField(max_length=100, blank=True)
+    error_file_id = models.CharField(max_length=100, blank=True)
+    
+    # 결과 수집 점유 시각 (폴러 하나만 결과 파일 반영, 임대 만료 시 다른 폴러가 이어서 처리)
+    ingest_locked_at = models.DateTimeField(null=True, blank=True, verbose_name="결과 수집 점유 시각")
+    
+    # 진행/실패 집계 (입력 검증 실패 포함)
+    total_count = models.PositiveIntegerField(default=0, verbose_name="전체 레코드 수")
+    completed_count = models.PositiveIntegerField(default=0, verbose_name="분석 저장 완료 수")
+    failed_count = models.PositiveIntegerField(default=0, verbose_name="실패 수")
+    errors = models.JSONField(default=list, verbose_name="실패 상세 (최대 N건)")
+    
+    class Meta:
+        db_table = 'analysis_batches'
+        verbose_name = '분석 배치'
+        verbose_name_plural = '분석 배치들'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"{self.source_name or self.id} ({self.status})"
+    
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in self.TERMINAL_STATUSES
+
+
+class GenerationJob(models.Model):
+    """
+    LLM 생성 작업 큐 (DB 테이블 기반, 외부 브로커 없음)
+    - 웹 요청은 작업만 등록하고 202 반환, run_generation_workers 워커 풀이 처리
+    - 워커는 상태 비교 후 갱신(compare-and-swap)으로 작업 점유, 임대(lease) 만료 시 다른 워커가 재점유
+    """
+    
+    KIND_CHOICES = [
+        ('profile_analysis', '이력서 분석'),
+        ('interview_session', '면접 질문 생성'),
+        ('learning_path', '학습 경로 생성'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('running', '실행 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    TERMINAL_STATUSES = ('completed', 'failed')
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    profile = models.ForeignKey(ResumeProfile, on_delete=models.CASCADE, related_name='generation_jobs')
+    payload = models.JSONField(default=dict, verbose_name="요청 본문")
+    
+    # 생성된 결과 (InterviewSession / LearningPath ID, 프로필 분석은 profile 자체)
+    result_id = models.UUIDField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    
+    # 스케줄링/점유
+    attempts = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField(verbose_name="실행 가능 시각")
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'generation_jobs'
+        verbose_name = '생성 작업'
+        verbose_name_plural = '생성 작업들'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='generation_job_queue_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} {self.id} ({self.status})"
+    
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in self.TERMINAL_STATUSES
+
+
+class UsageRollup(models.Model):
+    """
+    LLM 사용량/비용 집계 (일자 × 스테이지 × 모델)
+    - 생성 결과 저장 시점에 F() 증분으로 갱신 → 집계 조회가 세션/학습 경로 JSON 스캔 없이 행 몇 개만 읽음
+    - requests: 해당 모델로 최종 결과를 낸 생성 요청 수 (캐시/단일 실행 공유로 호출 없이 끝난 요청 포함)
+    - calls/토큰/비용: 캐스케이드 하위 시도까지 포함한 실제 호출 합계
+    """
+    
+    day = models.DateField(verbose_name="집계 일자")
+    stage = models.CharField(max_length=50, verbose_name="생성 단계")
+    model = models.CharField(max_length=100, verbose_name="모델")
+    
+    requests = models.PositiveIntegerField(default=0)
+    calls = models.PositiveIntegerField(default=0)
+    prompt_tokens = models.PositiveBigIntegerField(default=0)
+    completion_tokens = models.PositiveBigIntegerField(default=0)
+    cached_tokens = models.PositiveBigIntegerField(default=0)
+    cost_usd = models.DecimalField(max_digits=16, decimal_places=8, default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'usage_rollups'
+        verbose_name = '사용량 집계'
+        verbose_name_plural = '사용량 집계들'
+        ordering = ['day', 'stage', 'model']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'stage', 'model'], name='usage_rollup_unique'),
+        ]
+    
+    def __str__(self):
+        return f"{self.day} {self.stage} {self.model}"
+
+
 class InterviewSession(models.Model):
     """면접 질문 생성 세션"""
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    profile = models.ForeignKey(ResumeProfile, on_delete=models.CASCADE, related_name='interview_sessions')
+    # 프로필별 조회는 (profile, created_at, id) 복합 인덱스가 담당 (FK 단일 인덱스는 그 접두사라 생략)
+    profile = models.ForeignKey(ResumeProfile, on_delete=models.CASCADE, related_name='interview_sessions',
+                                db_index=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
     # 면접 설정
@@ -110,13 +347,17 @@ class InterviewSession(models.Model):
         verbose_name = '면접 세션'
         verbose_name_plural = '면접 세션들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['profile', 'created_at', 'id'], name='session_profile_created_idx'),
+        ]
 
 
 class LearningPath(models.Model):
     """개인 맞춤형 학습 경로"""
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    profile = models.ForeignKey(ResumeProfile, on_delete=models.CASCADE, related_name='learning_paths')
+    profile = models.ForeignKey(ResumeProfile, on_delete=models.CASCADE, related_name='learning_paths',
+                                db_index=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
     # 학습 목표
@@ -152,6 +393,9 @@ class LearningPath(models.Model):
         verbose_name = '학습 경로'
         verbose_name_plural = '학습 경로들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['profile', 'created_at', 'id'], name='path_profile_created_idx'),
+        ]
 
 
 class UserFeedback(models.Model):
@@ -0,0 +1,59 @@
+"""
+📑 키셋(커서) 페이지네이션 - (created_at, id) 내림차순 목록
+
+- OFFSET 대신 직전 페이지 마지막 행의 (created_at, id) 다음부터 조회
+  → 페이지가 깊어져도 앞 행을 건너뛰며 읽지 않고, 사이에 행이 추가돼도 중복/누락 없음
+- 커서는 불투명 문자열 (base64url JSON) - 손상/조작된 값은 InvalidCursor
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+
+KEYSET_ORDERING = ("-created_at", "-id")
+
+
+class InvalidCursor(ValueError):
+    """디코딩할 수 없는 커서"""
+
+
+def encode_cursor(created_at: datetime, pk) -> str:
+    raw = json.dumps([created_at.isoformat(), str(pk)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, pk = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(pk)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursor("잘못된 커서입니다.") from e
+
+
+def page_size(limit: Optional[int]) -> int:
+    """요청 페이지 크기 → 1 ~ LIST_MAX_PAGE_SIZE"""
+    return min(max(limit or settings.LIST_PAGE_SIZE, 1), settings.LIST_MAX_PAGE_SIZE)
+
+
+def keyset_page(queryset: QuerySet, cursor: Optional[str], limit: Optional[int]) -> Tuple[List, Optional[str]]:
+    """
+    (created_at, id) 내림차순 한 페이지 + 다음 커서 (마지막 페이지면 None)
+    - limit + 1건을 읽어 다음 페이지 존재 여부를 COUNT 없이 판단
+    """
+    size = page_size(limit)
+    queryset = queryset.order_by(*KEYSET_ORDERING)
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+    rows = list(queryset[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+    last = rows[size - 1]
+    return rows[:size], encode_cursor(last.created_at, last.pk)
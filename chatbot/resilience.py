@@ -0,0 +1,219 @@
+"""
+🛡️ LLM 호출 복원력 - 호출별 마감 시간 + 지수 백오프 재시도 + 서킷 브레이커
+
+- 호출 하나(재시도 포함)가 쓸 수 있는 총 시간을 제한 → gunicorn --timeout 이전에 종료
+- 429/5xx/연결 오류/타임아웃만 재시도 (지터 포함 지수 백오프, Retry-After 존중)
+- 연속 실패가 임계치를 넘으면 서킷 오픈 → 일정 시간 LLM 호출 없이 즉시 실패
+  (호출부는 곧바로 기본값으로 대체하고 generation_metadata에 degraded 표시)
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import openai
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 LLM 호출을 건너뜀"""
+
+
+class DeadlineExceededError(TimeoutError):
+    """호출 마감 시간 초과 (재시도 포함)"""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """일시적 업스트림 오류인지 (429, 5xx, 연결 오류, 타임아웃)"""
+    if isinstance(error, (openai.APIConnectionError, asyncio.TimeoutError, TimeoutError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 (초)"""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커 (프로세스 단위)
+    - closed: 정상 호출
+    - open: reset_seconds 동안 즉시 실패
+    - half_open: 시험 호출 1건만 허용 → 성공 시 closed, 실패 시 다시 open
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_count = 0
+        self.short_circuited = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> None:
+        """호출 가능 여부 확인 - 불가하면 CircuitOpenError"""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self.short_circuited += 1
+        raise CircuitOpenError(f"{self.name} 서킷 오픈 - LLM 호출 생략")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or (self._opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_count += 1
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """시험 호출 슬롯만 반납 (성공/실패로 세지 않음 - 상태는 그대로, 다음 호출이 다시 시험)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "opened": self.opened_count,
+            "short_circuited": self.short_circuited,
+        }
+
+
+class ResilientCaller:
+    """LLM 호출 래퍼 - fn(timeout)을 마감 시간 안에서 재시도"""
+
+    def __init__(self, breaker: CircuitBreaker):
+        self.breaker = breaker
+        self.retries = 0
+        self.deadline_exceeded = 0
+
+    def _deadline(self, deadline: Optional[float]) -> float:
+        default = time.monotonic() + settings.LLM_CALL_DEADLINE_SECONDS
+        return min(default, deadline) if deadline else default
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """지터 포함 지수 백오프 (full jitter), Retry-After가 있으면 우선"""
+        ceiling = settings.LLM_RETRY_MAX_DELAY_SECONDS
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, ceiling)
+        return random.uniform(0, min(ceiling, settings.LLM_RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
+
+    def _next_delay(self, attempt: int, error: BaseException, deadline: float) -> Optional[float]:
+        """재시도 대기 시간 - 재시도하지 않을 경우 None"""
+        if not is_retryable(error) or attempt >= settings.LLM_MAX_RETRIES:
+            return None
+        delay = self._backoff(attempt, error)
+        # 대기 후 최소한의 시도 시간도 남지 않으면 포기
+        if time.monotonic() + delay + 1.0 >= deadline:
+            return None
+        self.retries += 1
+        return delay
+
+    def _attempt_timeout(self, deadline: float) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            self.deadline_exceeded += 1
+            raise DeadlineExceededError("LLM 호출 마감 시간 초과")
+        return min(settings.LLM_ATTEMPT_TIMEOUT_SECONDS, remaining)
+
+    def _record(self, error: BaseException, timeout: float) -> None:
+        # 4xx 등 요청 자체의 오류와 호출부 마감 시간 초과는 업스트림 상태와 무관 → 실패로도 성공으로도 세지 않음
+        # (연속 실패 수/오픈 상태 유지, half-open 시험 슬롯만 반납)
+        # 시도 timeout이 호출부 마감 시간 때문에 LLM_ATTEMPT_TIMEOUT_SECONDS보다 짧았다면 그 타임아웃도 호출부 사정
+        caller_deadline = isinstance(error, DeadlineExceededError) or (
+            isinstance(error, (TimeoutError, openai.APITimeoutError))
+            and timeout < settings.LLM_ATTEMPT_TIMEOUT_SECONDS
+        )
+        if is_retryable(error) and not caller_deadline:
+            self.breaker.record_failure()
+        else:
+            self.breaker.release_trial()
+
+    def call(self, fn: Callable[[float], Any], deadline: Optional[float] = None) -> Any:
+        """동기 호출 - fn(attempt_timeout) 결과 반환"""
+        deadline = self._deadline(deadline)
+        attempt = 0
+        while True:
+            timeout = self._attempt_timeout(deadline)
+            self.breaker.allow()
+            try:
+                result = fn(timeout)
+            except Exception as e:
+                self._record(e, timeout)
+                delay = self._next_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                logger.warning("🔁 LLM 재시도 %d/%d (%s, %.2fs 후)", attempt + 1, settings.LLM_MAX_RETRIES,
+                               type(e).__name__, delay, extra={"breaker": self.breaker.name, "retry_delay": delay})
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def acall(self, fn: Callable[[float], Awaitable[Any]], deadline: Optional[float] = None) -> Any:
+        """비동기 호출 - await fn(attempt_timeout) 결과 반환"""
+        deadline = self._deadline(deadline)
+        attempt = 0
+        while True:
+            timeout = self._attempt_timeout(deadline)
+            self.breaker.allow()
+            try:
+                result = await asyncio.wait_for(fn(timeout), timeout)
+            except Exception as e:
+                self._record(e, timeout)
+                delay = self._next_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                logger.warning("🔁 LLM 재시도 %d/%d (%s, %.2fs 후)", attempt + 1, settings.LLM_MAX_RETRIES,
+                               type(e).__name__, delay, extra={"breaker": self.breaker.name, "retry_delay": delay})
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "deadline_exceeded": self.deadline_exceeded,
+            "circuit_breaker": self.breaker.stats(),
+        }
@@ -0,0 +1,314 @@
+"""
+🗺️ 학습 로드맵 템플릿 라이브러리 - 사전 구성된 단계 골격 + LLM 개인화
+
+- (학습 목표, 포지션 레벨, 기간 구간, 스킬 계열) 조합별 3단계 골격을 기동 시 한 번 구성
+  (단계명/objectives/resources/milestones + 기본 projects/personal_advice)
+- LLM은 단계별 projects와 personal_advice만 생성 → 출력 토큰/지연 감소
+- LLM 실패/생략 시 골격의 기본 projects/personal_advice 그대로 사용 (요청마다 문자열 조립 없음)
+"""
+
+import copy
+import itertools
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from .model_router import is_junior_level
+from .schemas import LearningGoal, PositionLevel
+from .skills import SKILL_FAMILIES, skill_normalizer
+
+# === 조합 키 구성 요소 ===
+
+# 기간 구간 (개월 상한, 구간명) - 구간별로 마일스톤 분량이 달라짐
+DURATION_BANDS: Tuple[Tuple[int, str], ...] = ((3, "short"), (6, "medium"), (24, "long"))
+MILESTONE_COUNTS = {"short": 2, "medium": 3, "long": 4}
+
+GENERAL_FAMILY = "general"
+
+SENIOR_LEVEL_KEYWORDS = ("시니어", "고급", "senior")
+LEAD_LEVEL_KEYWORDS = ("리드", "매니저", "아키텍트", "lead", "principal")
+
+# === 골격 구성 블록 ===
+
+# 목표별 단계 (단계명, objectives)
+GOAL_PHASES: Dict[str, List[Tuple[str, List[str]]]] = {
+    "skill_enhancement": [
+        ("현재 스킬 심화", ["주력 기술 스택의 내부 동작 이해", "성능/품질 지표로 코드 개선", "실전 프로젝트 1개 완성"]),
+        ("인접 역량 확장", ["인접 기술 스택 습득", "팀 프로젝트 또는 오픈소스 협업", "기술 발표 및 지식 공유"]),
+        ("전문성 입증", ["설계 의사결정 근거 문서화", "기술 블로그/발표로 전문성 공개", "포트폴리오 최종 정리"]),
+    ],
+    "career_change": [
+        ("전환 분야 기초 다지기", ["목표 분야 핵심 개념 학습", "기존 경력과 겹치는 역량 정리", "입문 프로젝트 완성"]),
+        ("전환 포트폴리오 구축", ["목표 분야 실무형 프로젝트 구현", "현업자 코드 리뷰 받기", "전환 동기와 강점 정리"]),
+        ("전환 지원 준비", ["목표 직무 채용 공고 분석", "이력서/포트폴리오 전환 관점 재작성", "면접 및 네트워킹"]),
+    ],
+    "promotion": [
+        ("현재 업무 임팩트 확대", ["담당 영역 핵심 지표 정의", "반복 업무 자동화/개선", "개선 성과 수치화"]),
+        ("설계 및 리딩 역량", ["기능 단위 설계 리딩", "코드 리뷰 기준 수립", "주니어 멘토링"]),
+        ("성과 가시화", ["성과 회고 문서 작성", "사내 기술 공유 발표", "다음 레벨 기대 역할 합의"]),
+    ],
+    "interview_prep": [
+        ("기본기 점검", ["CS 기초(자료구조/네트워크/DB) 복습", "주력 기술 핵심 질문 정리", "코딩 테스트 유형별 풀이"]),
+        ("경험 구조화", ["프로젝트 경험을 STAR 형식으로 정리", "기술 선택 근거와 트레이드오프 정리", "포트폴리오 개선"]),
+        ("실전 면접 대비", ["모의 면접으로 답변 다듬기", "지원 회사별 맞춤 준비", "지원 및 결과 회고"]),
+    ],
+    "freelance_prep": [
+        ("상품화 가능한 역량 정리", ["외주 수요가 있는 기술 조합 선정", "재사용 가능한 스타터 킷 구축", "견적 기준 수립"]),
+        ("레퍼런스 확보", ["소규모 유료/무료 프로젝트 수행", "고객 후기와 결과물 정리", "계약/커뮤니케이션 프로세스 정비"]),
+        ("운영 체계 구축", ["영업 채널 확보", "일정/유지보수 운영 방식 정립", "세무/계약 기본기 학습"]),
+    ],
+}
+
+# 레벨별 단계 공통 objective (각 단계 마지막에 추가)
+LEVEL_OBJECTIVES = {
+    "junior": "기본기와 학습 습관 정착",
+    "mid": "독립적으로 기능을 설계하고 완수",
+    "senior": "팀 단위 기술 의사결정 주도",
+    "lead": "조직 차원의 기술 방향 설정과 인재 육성",
+}
+
+# 목표별 마일스톤 풀 (단계별, 기간 구간에 따라 앞에서부터 사용)
+GOAL_MILESTONES: Dict[str, List[List[str]]] = {
+    "skill_enhancement": [
+        ["개인 프로젝트 1개 완성 (GitHub 공개)", "기술 블로그 포스팅 2회", "테스트 커버리지 70% 이상", "성능 개선 전후 비교 문서"],
+        ["협업 프로젝트 PR 머지", "커뮤니티/사내 발표 1회", "신규 기술 적용 사례 1건", "코드 리뷰 10건 이상 참여"],
+        ["설계 문서(ADR) 3건 작성", "포트폴리오 업데이트", "기술 블로그 시리즈 완결", "컨퍼런스 발표 제안서 제출"],
+    ],
+    "career_change": [
+        ["목표 분야 입문 강의 수료", "입문 프로젝트 GitHub 공개", "학습 노트 정리", "현업자 커피챗 1회"],
+        ["실무형 프로젝트 배포", "현업자 코드 리뷰 반영", "전환 스토리 초안", "오픈소스 이슈 1건 해결"],
+        ["전환용 이력서 완성", "지원 10곳 이상", "면접 회고 문서", "네트워킹 행사 2회 참여"],
+    ],
+    "promotion": [
+        ["핵심 지표 대시보드 구축", "개선 과제 1건 완료", "개선 효과 수치 보고", "장애 회고 문서 작성"],
+        ["기능 설계 리딩 1건", "코드 리뷰 가이드 문서화", "주니어 멘토링 정기 진행", "기술 부채 정리 계획 수립"],
+        ["성과 회고 문서 제출", "사내 기술 세미나 발표", "다음 분기 목표 합의", "팀 프로세스 개선 제안 1건"],
+    ],
+    "interview_prep": [
+        ["CS 핵심 질문 50개 답변 정리", "코딩 테스트 문제 40개 풀이", "주력 기술 질문 노트", "약점 유형 재풀이"],
+        ["프로젝트 STAR 답변 5개", "포트폴리오 README 개선", "기술 선택 근거 문서", "깃허브 정리"],
+        ["모의 면접 3회", "지원 회사별 준비 노트", "지원서 제출 완료", "면접 회고 정리"],
+    ],
+    "freelance_prep": [
+        ["서비스 메뉴/가격표 초안", "스타터 킷 저장소 공개", "견적 산정 기준표", "계약서 템플릿 준비"],
+        ["프로젝트 2건 수행", "고객 후기 확보", "결과물 포트폴리오 페이지", "커뮤니케이션 템플릿 정비"],
+        ["영업 채널 2곳 등록 (크몽/위시켓 등)", "유지보수 계약 1건", "월간 운영 회고", "세무 신고 준비"],
+    ],
+}
+
+# 계열별 단계 추천 자료
+FAMILY_RESOURCES: Dict[str, List[List[str]]] = {
+    "backend": [
+        ["Spring/Django 공식 문서 심화", "인프런/패스트캠퍼스 백엔드 심화 강의", "우아한형제들/카카오 기술 블로그"],
+        ["AWS Skill Builder 실습", "대용량 시스템 설계 서적 (가상 면접 사례로 배우는 대규모 시스템 설계)", "OKKY/원티드 개발자 모임"],
+        ["클린 아키텍처/마이크로서비스 패턴 서적", "DEVIEW/우아한테크세미나 발표 영상", "오픈소스 메인테이너 코드 리뷰 사례"],
+    ],
+    "frontend": [
+        ["React/Vue 공식 문서 심화", "인프런 프론트엔드 심화 강의", "토스/카카오 프론트엔드 기술 블로그"],
+        ["웹 성능 최적화 가이드 (web.dev)", "TypeScript 핸드북", "FEConf 발표 영상"],
+        ["디자인 시스템 사례 (토스/당근)", "접근성 가이드 (WAI-ARIA)", "프론트엔드 아키텍처 아티클"],
+    ],
+    "mobile": [
+        ["Android/iOS 공식 문서 심화", "인프런 모바일 아키텍처 강의", "드로이드나이츠/레츠스위프트 발표 영상"],
+        ["앱 성능/배터리 최적화 가이드", "CI 자동 배포 (Fastlane/GitHub Actions) 문서", "모바일 개발자 오픈채팅/커뮤니티"],
+        ["모듈화/멀티모듈 아키텍처 사례", "앱 스토어 운영 지표 가이드", "대형 앱 기술 블로그 (토스/배민)"],
+    ],
+    "data": [
+        ["Spark/Airflow 공식 문서", "패스트캠퍼스 데이터 엔지니어링 강의", "캐글 노트북 분석"],
+        ["데이터 파이프라인 설계 서적 (데이터 중심 애플리케이션 설계)", "dbt/데이터 품질 도구 문서", "데이터 컨퍼런스 영상 (if kakao)"],
+        ["MLOps/데이터 플랫폼 사례 아티클", "사내 데이터 거버넌스 사례", "데이터 분야 기술 블로그 (쏘카/당근)"],
+    ],
+    "devops": [
+        ["AWS/GCP 공식 문서 및 자격증 과정", "Docker/Kubernetes 공식 튜토리얼", "인프런 인프라 강의"],
+        ["Terraform 공식 튜토리얼", "SRE 서적 (구글 SRE 북)", "클라우드 네이티브 커뮤니티 (CNCF 밋업)"],
+        ["관측성 도구 문서 (Prometheus/Grafana)", "장애 회고 공개 사례", "플랫폼 엔지니어링 아티클"],
+    ],
+    GENERAL_FAMILY: [
+        ["기술 공식 문서 및 한국어 튜토리얼", "인프런/패스트캠퍼스/유데미 강의", "국내 기업 기술 블로그"],
+        ["개발자 커뮤니티 (OKKY, 원티드 개발자 모임)", "온라인 멘토링 프로그램", "기술 컨퍼런스 영상 (DEVIEW, 우아한테크세미나)"],
+        ["리더십/커뮤니케이션 도서 (크루셜 대화, 피드백의 기술)", "코드 리뷰 베스트 프랙티스", "오픈소스 기여 가이드"],
+    ],
+}
+
+# 계열별 기본 프로젝트 (LLM 개인화 실패 시 사용)
+FAMILY_PROJECTS: Dict[str, List[List[str]]] = {
+    "backend": [
+        ["주문/결제 REST API 서버 (트랜잭션 + 캐시)", "부하 테스트 기반 성능 개선 리포트"],
+        ["메시지 큐 기반 비동기 알림 서비스", "컨테이너 기반 배포 파이프라인 구축"],
+        ["서비스 분리 설계 문서 + 프로토타입", "사내용 개발 생산성 도구"],
+    ],
+    "frontend": [
+        ["상태 관리가 있는 대시보드 SPA", "Lighthouse 점수 개선 리포트"],
+        ["디자인 시스템 컴포넌트 라이브러리", "SSR 기반 서비스 페이지 구축"],
+        ["마이크로 프론트엔드 프로토타입", "프론트엔드 모니터링 도구 구축"],
+    ],
+    "mobile": [
+        ["오프라인 동기화 지원 할 일 앱", "앱 시작 시간 개선 리포트"],
+        ["모듈화된 커머스 앱 클론", "자동 배포 파이프라인 구축"],
+        ["공통 UI 모듈 라이브러리", "크래시/성능 모니터링 대시보드"],
+    ],
+    "data": [
+        ["공공 데이터 수집 배치 파이프라인", "데이터 품질 검증 리포트"],
+        ["실시간 이벤트 스트리밍 파이프라인", "지표 대시보드 구축"],
+        ["피처 스토어/모델 서빙 프로토타입", "데이터 카탈로그 구축"],
+    ],
+    "devops": [
+        ["IaC로 구성한 3계층 웹 서비스 인프라", "컨테이너 이미지 최적화 리포트"],
+        ["Kubernetes 기반 무중단 배포 파이프라인", "관측성 스택 구축 (메트릭/로그/트레이스)"],
+        ["셀프서비스 배포 플랫폼 프로토타입", "비용 최적화 리포트"],
+    ],
+    GENERAL_FAMILY: [
+        ["주력 기술 기반 웹 애플리케이션", "개인 포트폴리오 사이트"],
+        ["팀 협업 기반 사이드 프로젝트", "오픈소스 기여 활동"],
+        ["팀 생산성 향상 도구 (CI/CD)", "기술 블로그 시리즈"],
+    ],
+}
+
+# 목표별 단계 기본 조언 (LLM 개인화 실패 시 사용)
+GOAL_ADVICE: Dict[str, List[str]] = {
+    "skill_enhancement": [
+        "평일에는 공식 문서로 개념을 다지고 주말에는 프로젝트에 바로 적용해 보세요. 학습한 내용은 벨로그나 GitHub README에 정리해 두시면 포트폴리오가 됩니다.",
+        "인접 기술은 현재 프로젝트에 하나씩 붙여 보는 방식이 가장 빠릅니다. 커뮤니티 스터디나 오픈소스 'good first issue'로 협업 경험도 함께 쌓으세요.",
+        "지금까지의 설계 결정과 개선 결과를 문서로 남기고 발표로 공유해 보세요. 전문성은 결과물과 설명이 함께 있을 때 인정받습니다.",
+    ],
+    "career_change": [
+        "목표 분야의 입문 과정을 빠르게 끝내고, 기존 경력에서 활용할 수 있는 경험을 목록으로 정리해 두세요.",
+        "튜토리얼을 벗어난 실무형 프로젝트를 하나 깊게 완성하고, 현업자에게 코드 리뷰를 받아 개선 과정을 기록하세요.",
+        "채용 공고의 요구사항과 본인 포트폴리오를 대조해 빈 곳을 메우고, 전환 동기를 한 문단으로 설명할 수 있게 준비하세요.",
+    ],
+    "promotion": [
+        "담당 영역의 지표를 먼저 정의하고, 작은 개선이라도 전후 수치를 남겨 두세요. 승진 평가는 근거 있는 성과에서 시작합니다.",
+        "기능 설계 리딩과 코드 리뷰 기준 수립처럼 팀에 영향을 주는 일을 자원해서 맡으세요. 멘토링 기록도 함께 남기시길 권합니다.",
+        "분기 성과를 회고 문서로 정리해 리더와 공유하고, 다음 레벨에서 기대하는 역할을 구체적으로 합의해 보세요.",
+    ],
+    "interview_prep": [
+        "CS 기초와 주력 기술 질문을 매일 정해진 분량씩 답변으로 정리하고, 코딩 테스트는 유형별로 반복해서 풀어 보세요.",
+        "프로젝트 경험을 상황-행동-결과로 정리하고 기술 선택의 이유와 대안을 함께 설명할 수 있게 준비하세요.",
+        "모의 면접을 녹화해 답변 길이와 구조를 점검하고, 지원 회사별로 서비스와 기술 스택을 미리 조사하세요.",
+    ],
+    "freelance_prep": [
+        "외주 수요가 많은 기술 조합을 정하고 반복해서 쓸 수 있는 스타터 킷과 견적 기준을 먼저 만들어 두세요.",
+        "작은 프로젝트라도 끝까지 납품하고 고객 후기와 결과물을 정리해 레퍼런스로 쌓으세요.",
+        "영업 채널과 유지보수 운영 방식을 정해 두고, 계약/세무 기본기를 익혀 안정적으로 운영할 준비를 하세요.",
+    ],
+}
+
+
+class RoadmapKey(NamedTuple):
+    goal: str
+    level: str
+    band: str
+    family: str
+
+
+@dataclass(frozen=True)
+class RoadmapTemplate:
+    """조합 1개의 3단계 골격 (기동 시 구성, 요청마다 복사해서 사용)"""
+    key: RoadmapKey
+    phases: Tuple[Dict[str, Any], ...]
+
+    @property
+    def template_id(self) -> str:
+        return "/".join(self.key)
+
+
+def duration_band(duration_months: int) -> str:
+    for upper, band in DURATION_BANDS:
+        if duration_months <= upper:
+            return band
+    return DURATION_BANDS[-1][1]
+
+
+def level_band(career_level: str) -> str:
+    """분석 결과의 커리어 레벨 문구 → 포지션 레벨 (junior/mid/senior/lead)"""
+    text = (career_level or "").lower()
+    if is_junior_level(text):
+        return PositionLevel.JUNIOR.value
+    if any(keyword in text for keyword in LEAD_LEVEL_KEYWORDS):
+        return PositionLevel.LEAD.value
+    if any(keyword in text for keyword in SENIOR_LEVEL_KEYWORDS):
+        return PositionLevel.SENIOR.value
+    return PositionLevel.MID.value
+
+
+def skill_family(technical_skills: str) -> str:
+    """기술 스택 문자열 → 스킬 계열 (정규화 스킬이 가장 많이 속한 계열, 없으면 general)"""
+    return skill_normalizer.family(skill_normalizer.normalize(technical_skills)) or GENERAL_FAMILY
+
+
+def phase_weeks(duration_months: int) -> Tuple[int, int, int]:
+    """학습 기간을 3단계 주 단위로 분배"""
+    total_weeks = duration_months * 4
+    phase1, phase2 = total_weeks // 3, total_weeks // 2
+    return phase1, phase2, total_weeks - phase1 - phase2
+
+
+def _build_template(key: RoadmapKey) -> RoadmapTemplate:
+    phases = []
+    for index, (name, objectives) in enumerate(GOAL_PHASES[key.goal]):
+        phases.append({
+            "phase": f"{index + 1}단계: {name}",
+            "duration_weeks": 0,
+            "objectives": [*objectives, LEVEL_OBJECTIVES[key.level]],
+            "resources": list(FAMILY_RESOURCES[key.family][index]),
+            "milestones": GOAL_MILESTONES[key.goal][index][:MILESTONE_COUNTS[key.band]],
+            "projects": list(FAMILY_PROJECTS[key.family][index]),
+            "personal_advice": GOAL_ADVICE[key.goal][index],
+        })
+    return RoadmapTemplate(key, tuple(phases))
+
+
+class RoadmapLibrary:
+    """전체 조합의 로드맵 골격 - 기동 시 한 번 구성 후 조회만"""
+
+    def __init__(self):
+        self._templates: Dict[RoadmapKey, RoadmapTemplate] = {}
+
+    def load(self) -> None:
+        if self._templates:
+            return
+        families = [*SKILL_FAMILIES, GENERAL_FAMILY]
+        for goal, level, (_, band), family in itertools.product(
+            [goal.value for goal in LearningGoal], [level.value for level in PositionLevel],
+            DURATION_BANDS, families
+        ):
+            key = RoadmapKey(goal, level, band, family)
+            self._templates[key] = _build_template(key)
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def select(self, target_goal: str, career_level: str, duration_months: int,
+               technical_skills: str) -> RoadmapTemplate:
+        self.load()
+        goal = target_goal if target_goal in GOAL_PHASES else LearningGoal.SKILL_ENHANCEMENT.value
+        key = RoadmapKey(goal, level_band(career_level), duration_band(duration_months),
+                         skill_family(technical_skills))
+        return self._templates[key]
+
+    def phases(self, template: RoadmapTemplate, duration_months: int) -> List[Dict[str, Any]]:
+        """요청별 골격 사본 (단계별 주 수 반영)"""
+        phases = copy.deepcopy(list(template.phases))
+        for phase, weeks in zip(phases, phase_weeks(duration_months)):
+            phase["duration_weeks"] = weeks
+        return phases
+
+
+roadmap_library = RoadmapLibrary()
+
+
+def merge_personalization(phases: List[Dict[str, Any]],
+                          personalized: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    골격 단계 + LLM이 생성한 단계별 projects/personal_advice (인덱스로 대응)
+    - 응답이 모자라도 골격 단계는 모두 유지, 대응하는 개인화 항목이 없는 단계는 골격 기본값
+    """
+    return [{**phase, **personalized[index]} if index < len(personalized) else phase
+            for index, phase in enumerate(phases)]
+
+
+def outline(phases: List[Dict[str, Any]]) -> str:
+    """프롬프트에 넣을 골격 요약 (단계명/기간/목표)"""
+    return "\n".join(
+        f"- {phase['phase']} ({phase['duration_weeks']}주): {', '.join(phase['objectives'])}"
+        for phase in phases
+    )
@@ -5,7 +5,7 @@ Django Ninja에서 사용할 요청/응답 스키마
 
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any, Union
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -119,6 +119,33 @@ class LearningPathCreateRequest(BaseModel):
     )
 
 
+class CoachingBundleCreateRequest(BaseModel):
+    """코칭 번들 (면접 질문 + 학습 경로 동시 생성) 요청"""
+    
+    target_company_type: CompanyType = Field(
+        CompanyType.STARTUP,
+        description="목표 회사 유형 (startup: 스타트업, midsize: 중견기업, large: 대기업, foreign: 외국계)",
+        example="startup"
+    )
+    target_position_level: PositionLevel = Field(
+        PositionLevel.JUNIOR,
+        description="목표 포지션 레벨 (junior: 주니어, mid: 미드레벨, senior: 시니어, lead: 리드)",
+        example="mid"
+    )
+    target_goal: LearningGoal = Field(
+        LearningGoal.SKILL_ENHANCEMENT,
+        description="학습 목표 (skill_enhancement: 기술 향상, career_change: 커리어 전환, promotion: 승진, interview_prep: 면접 준비)",
+        example="skill_enhancement"
+    )
+    preferred_duration_months: Optional[int] = Field(
+        3,
+        ge=1,
+        le=24,
+        description="선호하는 학습 기간(개월) - 1~24개월 범위",
+        example=3
+    )
+
+
 # === 응답 스키마 ===
 
 class ResumeAnalysisResult(BaseModel):
@@ -129,6 +156,8 @@ class ResumeAnalysisResult(BaseModel):
     improvement_areas: List[str] = Field(..., description="개선 필요 영역", example=["프론트엔드 기술 스택 확장", "클라우드 네이티브 아키텍처 심화", "데이터베이스 최적화 전문성"])
     career_pattern: str = Field(..., description="커리어 패턴 분석", example="기술적 깊이와 실무 경험이 균형있게 발전하고 있는 성장형 개발자. 팀워크와 문제해결 능력이 뛰어나며, 지속적인 학습 의지가 강함.")
     market_competitiveness: int = Field(..., ge=1, le=10, description="시장 경쟁력 점수 (1-10)", example=7)
+    personality_traits: List[str] = Field(default_factory=list, description="학습 성향, 문제 해결 스타일, 협업 특성", example=["새로운 기술 습득이 빠른 학습 지향형", "데이터 기반 문제 해결 스타일"])
+    growth_trajectory: str = Field("", description="5년 후 성장 전망", example="현재 궤적을 유지하시면 5년 후 시니어 백엔드 개발자로 성장하실 수 있습니다.")
 
 
 class InterviewQuestion(BaseModel):
@@ -152,6 +181,69 @@ class LearningStep(BaseModel):
     personal_advice: str = Field(..., description="개인 맞춤형 진심어린 조언 (2-3줄)", example="현재 백엔드 실력이 탄탄하시니, 이제는 설계 능력과 성능 최적화에 집중하세요. 특히 Spring Boot의 고급 기능들을 실제 프로젝트에 적용해보면서 경험치를 쌓아가시길 바랍니다. 무엇보다 꾸준한 학습 습관이 중요하니 하루에 1시간씩이라도 투자하시면 3개월 후 확실한 성장을 느끼실 겁니다!")
 
 
+# === LLM 구조화 출력 스키마 (response_format json_schema) ===
+
+class InterviewQuestionSet(BaseModel):
+    """면접 질문 생성 출력"""
+    
+    questions: List[InterviewQuestion] = Field(..., description="맞춤형 면접 질문 5개")
+
+
+class LearningPhasePersonalization(BaseModel):
+    """로드맵 골격 단계 1개에 대한 개인화 항목"""
+    
+    projects: List[str] = Field(..., description="이 지원자의 기술 스택에 맞춘 구체적 프로젝트 제안", example=["결제 API 서버 구축 (Spring Boot + JPA + Redis)"])
+    personal_advice: str = Field(..., description="이 단계를 실행하기 위한 개인 맞춤형 조언 (2-3줄)", example="현재 백엔드 실력이 탄탄하시니 설계와 성능 최적화에 집중하세요.")
+
+
+class LearningPersonalization(BaseModel):
+    """학습 경로 개인화 출력 (골격 단계 순서대로)"""
+    
+    phases: List[LearningPhasePersonalization] = Field(..., description="단계별 개인화 항목")
+
+
+# OpenAI strict 모드에서 지원하지 않는 키워드 (검증은 Pydantic이 담당)
+_UNSUPPORTED_SCHEMA_KEYWORDS = {
+    "title", "default", "example", "examples", "format",
+    "minimum", "maximum", "minLength", "maxLength", "minItems", "maxItems",
+}
+
+
+def _strict_schema_node(node: Any, defs: Dict[str, Any]) -> Any:
+    if isinstance(node, list):
+        return [_strict_schema_node(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if "$ref" in node:
+        return _strict_schema_node(defs[node["$ref"].split("/")[-1]], defs)
+    
+    result = {}
+    for key, value in node.items():
+        if key in _UNSUPPORTED_SCHEMA_KEYWORDS or key == "$defs":
+            continue
+        if key == "properties":
+            result[key] = {name: _strict_schema_node(prop, defs) for name, prop in value.items()}
+        else:
+            result[key] = _strict_schema_node(value, defs)
+    if result.get("type") == "object":
+        result["additionalProperties"] = False
+        result["required"] = list(result.get("properties", {}))
+    return result
+
+
+def openai_response_format(model: type, name: str) -> Dict[str, Any]:
+    """Pydantic 모델 → chat.completions response_format (strict json_schema)"""
+    schema = model.model_json_schema()
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": _strict_schema_node(schema, schema.get("$defs", {})),
+        },
+    }
+
+
 class ResumeProfileResponse(BaseModel):
     """이력서 프로필 응답"""
     
@@ -159,11 +251,21 @@ class ResumeProfileResponse(BaseModel):
     career_summary: str = Field(..., description="경력 요약")
     job_role: str = Field(..., description="현재 또는 희망 직무")
     technical_skills: str = Field(..., description="보유 기술 스킬")
+    skill_ids: List[str] = Field(default_factory=list, description="스킬 사전 기준 정규화 스킬 ID (정렬)", example=["java", "mysql", "spring-boot"])
     experience_years: int = Field(..., description="총 경력 연수")
     created_at: datetime = Field(..., description="프로필 생성 일시")
+    analysis_status: str = Field("completed", description="분석 상태 (pending / processing / completed / failed)")
     analysis_result: Optional[ResumeAnalysisResult] = Field(None, description="AI 분석 결과 (프로필 생성 시 자동 생성)")
 
 
+class ResumeProfileListResponse(BaseModel):
+    """프로필 목록 응답 (키셋 페이지네이션)"""
+    
+    items: List[ResumeProfileResponse] = Field(default_factory=list, description="프로필 (최신순)")
+    skill_ids: List[str] = Field(default_factory=list, description="필터에 사용한 정규화 스킬 ID (모두 보유한 프로필만)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
 class InterviewSessionResponse(BaseModel):
     """면접 세션 응답"""
     
@@ -188,6 +290,131 @@ class LearningPathResponse(BaseModel):
     generation_metadata: Dict[str, Any] = Field(..., description="AI 생성 메타데이터 (모델명, 토큰 사용량 등)")
 
 
+class InterviewSessionListItem(BaseModel):
+    """면접 세션 목록 항목 (질문/메타데이터는 expand 요청 시에만)"""
+    
+    id: str = Field(..., description="면접 세션 고유 ID (UUID 형식)")
+    profile_id: str = Field(..., description="연결된 이력서 프로필 ID")
+    target_company_type: str = Field(..., description="목표 회사 유형 (startup/midsize/large/foreign)")
+    target_position_level: str = Field(..., description="목표 포지션 레벨 (junior/mid/senior/lead)")
+    created_at: datetime = Field(..., description="면접 세션 생성 일시")
+    question_count: Optional[int] = Field(None, description="질문 수 (summary=true)")
+    first_question: Optional[str] = Field(None, description="첫 질문 미리보기 (summary=true)")
+    questions: Optional[List[InterviewQuestion]] = Field(None, description="생성된 면접 질문 (expand=questions)")
+    generation_metadata: Optional[Dict[str, Any]] = Field(None, description="생성 메타데이터 (expand=generation_metadata)")
+
+
+class InterviewSessionListResponse(BaseModel):
+    """면접 세션 목록 응답 (키셋 페이지네이션)"""
+    
+    items: List[InterviewSessionListItem] = Field(default_factory=list, description="면접 세션 (최신순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class LearningPathListItem(BaseModel):
+    """학습 경로 목록 항목 (로드맵/메타데이터는 expand 요청 시에만)"""
+    
+    id: str = Field(..., description="학습 경로 고유 ID (UUID 형식)")
+    profile_id: str = Field(..., description="연결된 이력서 프로필 ID")
+    target_goal: str = Field(..., description="학습 목표 (skill_enhancement/career_change/promotion/interview_prep)")
+    estimated_duration_months: int = Field(..., description="예상 총 학습 기간 (개월)")
+    created_at: datetime = Field(..., description="학습 경로 생성 일시")
+    phase_count: Optional[int] = Field(None, description="단계 수 (summary=true)")
+    first_phase: Optional[str] = Field(None, description="첫 단계 이름 (summary=true)")
+    learning_roadmap: Optional[List[LearningStep]] = Field(None, description="학습 로드맵 (expand=learning_roadmap)")
+    generation_metadata: Optional[Dict[str, Any]] = Field(None, description="생성 메타데이터 (expand=generation_metadata)")
+
+
+class LearningPathListResponse(BaseModel):
+    """학습 경로 목록 응답 (키셋 페이지네이션)"""
+    
+    items: List[LearningPathListItem] = Field(default_factory=list, description="학습 경로 (최신순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class CoachingBundleResponse(BaseModel):
+    """코칭 번들 응답"""
+    
+    profile_id: str = Field(..., description="연결된 이력서 프로필 ID")
+    interview_session: InterviewSessionResponse = Field(..., description="생성된 면접 세션")
+    learning_path: LearningPathResponse = Field(..., description="생성된 학습 경로")
+    generation_time_seconds: float = Field(..., description="번들 전체 소요 시간 (두 생성 작업 병렬 실행)")
+
+
+class AnalysisBatchResponse(BaseModel):
+    """대량 이력서 분석 배치 (Batch API) 상태 응답"""
+    
+    id: str = Field(..., description="배치 ID")
+    status: str = Field(..., description="validating / in_progress / finalizing / completed / failed / expired / cancelled")
+    source_name: str = Field("", description="입력 JSONL 파일명")
+    openai_batch_id: str = Field("", description="OpenAI Batch ID")
+    progress: Dict[str, Any] = Field(..., description="total / completed / failed / pending / progress(0~1)")
+    errors: List[Dict[str, Any]] = Field(default_factory=list, description="실패 상세 (입력 줄 번호 또는 프로필 ID별)")
+    created_at: datetime = Field(..., description="제출 일시")
+    completed_at: Optional[datetime] = Field(None, description="종료 일시")
+
+
+class GenerationJobResponse(BaseModel):
+    """비동기 생성 작업 상태 응답"""
+    
+    id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="profile_analysis / interview_session / learning_path")
+    status: str = Field(..., description="pending / running / completed / failed")
+    profile_id: str = Field(..., description="대상 프로필 ID")
+    status_url: str = Field(..., description="작업 상태 조회 URL")
+    attempts: int = Field(0, description="실행 시도 횟수")
+    error: str = Field("", description="마지막 실패 사유")
+    created_at: datetime = Field(..., description="등록 일시")
+    completed_at: Optional[datetime] = Field(None, description="종료 일시")
+    result: Optional[Dict[str, Any]] = Field(None, description="완료 시 결과 (프로필 / 면접 세션 / 학습 경로 응답과 동일)")
+
+
+# === 사용량/비용 집계 ===
+
+class UsageRollupRow(BaseModel):
+    """집계 행 (group_by에 포함되지 않은 키는 null)"""
+    
+    day: Optional[date] = Field(None, description="집계 일자")
+    stage: Optional[str] = Field(None, description="resume_analysis / interview_questions / learning_path")
+    model: Optional[str] = Field(None, description="모델 (기본 응답으로 대체된 요청은 fallback)")
+    requests: int = Field(0, description="생성 요청 수 (최종 결과를 낸 모델 기준)")
+    calls: int = Field(0, description="LLM 호출 수 (캐스케이드 시도 포함)")
+    prompt_tokens: int = Field(0, description="입력 토큰")
+    completion_tokens: int = Field(0, description="출력 토큰")
+    cached_tokens: int = Field(0, description="프롬프트 캐시 적중 입력 토큰")
+    cost_usd: float = Field(0.0, description="비용 (USD)")
+    cost_per_request_usd: Optional[float] = Field(None, description="요청당 평균 비용 (USD)")
+
+
+class UsageReportResponse(BaseModel):
+    """기간별 사용량/비용 집계 응답"""
+    
+    start: date = Field(..., description="시작 일자 (포함)")
+    end: date = Field(..., description="종료 일자 (포함)")
+    group_by: List[str] = Field(..., description="집계 키")
+    totals: UsageRollupRow = Field(..., description="기간 전체 합계")
+    rows: List[UsageRollupRow] = Field(default_factory=list, description="집계 키별 합계")
+
+
+# === 검색 ===
+
+class SearchHit(BaseModel):
+    """검색 결과 1건"""
+    
+    doc_type: str = Field(..., description="문서 종류 (profile / interview_session / learning_path)")
+    id: str = Field(..., description="문서 ID (프로필 / 면접 세션 / 학습 경로 UUID)")
+    profile_id: str = Field(..., description="연결된 이력서 프로필 ID")
+    score: float = Field(..., description="BM25 관련도 (클수록 관련 높음)")
+    snippet: str = Field(..., description="일치 위치 주변 원문 (일치 구간은 <mark>, HTML 이스케이프)")
+
+
+class SearchResponse(BaseModel):
+    """전문 검색 응답"""
+    
+    query: str = Field(..., description="검색어")
+    hits: List[SearchHit] = Field(default_factory=list, description="관련도 순 결과")
+
+
 # === 에러 응답 ===
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,216 @@
+"""
+🔍 전문 검색 - SQLite FTS5 + 한글 바이그램(n-gram) 색인
+
+- 색인 대상: 프로필 career_summary, 면접 세션 questions, 학습 경로 learning_roadmap (JSON 안의 모든 문자열)
+- 한글/CJK 연속 구간은 2글자 단위로 겹쳐 자른 토큰으로 색인 (형태소 분석기 없이 부분 문자열 검색)
+  · "MSA 전환 경험" → msa 전환 경험 / "마이그레이션" → 마이 이그 그레 레이 이션
+  · 검색어도 같은 방식으로 자른 뒤 구(phrase) 질의 → 연속된 바이그램 = 원문 부분 문자열
+  · 영문/숫자는 단어 단위 (unicode61 토크나이저)
+- 문서 1건 = FTS 행 1개, rowid는 UUID에서 유도 (갱신/삭제가 rowid 조회 1번)
+- 모델 저장/삭제 시그널로 동기화, 시그널이 없는 bulk_create 경로는 index_documents를 직접 호출
+- 색인을 잃거나 토크나이저를 바꾸면 python manage.py rebuild_search_index
+- SQLite 전용 - 다른 DB에서는 색인을 건너뛰고 검색 API는 501
+"""
+
+import html
+import re
+import unicodedata
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import InterviewSession, LearningPath, ResumeProfile
+
+SEARCH_TABLE = "search_documents"
+
+# 마이그레이션 0007이 같은 DDL을 고정해 생성 - 컬럼/토크나이저를 바꾸면 새 마이그레이션 추가 후 rebuild_search_index
+CREATE_TABLE_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+    doc_type UNINDEXED,
+    doc_id UNINDEXED,
+    profile_id UNINDEXED,
+    body UNINDEXED,
+    tokens,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+# 문서 종류 → (모델, 색인 필드)
+DOCUMENT_TYPES = {
+    "profile": (ResumeProfile, "career_summary"),
+    "interview_session": (InterviewSession, "questions"),
+    "learning_path": (LearningPath, "learning_roadmap"),
+}
+
+# 한글 자모/음절, 가나, CJK 한자
+_CJK_CHARS = "\u1100-\u11ff\u3130-\u318f\uac00-\ud7af\u3040-\u30ff\u4e00-\u9fff"
+_RUNS = re.compile(rf"[{_CJK_CHARS}]+|[^\W_{_CJK_CHARS}]+")
+_CJK_RUN = re.compile(rf"[{_CJK_CHARS}]+")
+
+
+def _runs(text: str) -> List[str]:
+    return _RUNS.findall(unicodedata.normalize("NFKC", text or "").lower())
+
+
+def _bigrams(run: str) -> List[str]:
+    if not _CJK_RUN.fullmatch(run) or len(run) < 2:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def ngram_tokens(text: str) -> str:
+    """색인용 토큰 문자열 (한글 구간은 바이그램, 나머지는 단어)"""
+    return " ".join(token for run in _runs(text) for token in _bigrams(run))
+
+
+def match_query(query: str) -> str:
+    """
+    검색어 → FTS5 MATCH 식 (검색어의 모든 단어를 포함하는 문서, AND)
+    - 단어마다 바이그램 구(phrase) 질의, 한 글자 한글은 그 글자로 시작하는 바이그램 접두사 질의
+    - 토큰은 단어 문자만 남으므로 큰따옴표로 감싸면 FTS5 연산자로 해석되지 않음
+    """
+    terms = []
+    for run in dict.fromkeys(_runs(query)):
+        if _CJK_RUN.fullmatch(run) and len(run) == 1:
+            terms.append(f'"{run}"*')
+        else:
+            terms.append('"' + " ".join(_bigrams(run)) + '"')
+    return " ".join(terms)
+
+
+def _flatten_text(value: Any) -> List[str]:
+    """JSON 값 안의 모든 문자열 (순서 유지)"""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in _flatten_text(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _flatten_text(item)]
+    return []
+
+
+def document_body(instance) -> str:
+    if isinstance(instance, ResumeProfile):
+        return instance.career_summary
+    if isinstance(instance, InterviewSession):
+        return "\n".join(_flatten_text(instance.questions))
+    return "\n".join(_flatten_text(instance.learning_roadmap))
+
+
+def _doc_type(instance) -> str:
+    return next(doc_type for doc_type, (model, _) in DOCUMENT_TYPES.items() if isinstance(instance, model))
+
+
+def doc_rowid(pk: uuid.UUID) -> int:
+    """UUID → FTS rowid (상위 63비트, 양의 64비트 정수)"""
+    return uuid.UUID(str(pk)).int >> 65
+
+
+def document_row(instance) -> Tuple:
+    """FTS 행 (rowid, doc_type, doc_id, profile_id, body, tokens)"""
+    body = document_body(instance)
+    profile_id = instance.pk if isinstance(instance, ResumeProfile) else instance.profile_id
+    return (doc_rowid(instance.pk), _doc_type(instance), str(instance.pk), str(profile_id), body, ngram_tokens(body))
+
+
+def search_available() -> bool:
+    return connection.vendor == "sqlite"
+
+
+def index_documents(instances: Iterable, replace: bool = True) -> int:
+    """문서 색인 (replace=True면 이미 있는 행 교체, 빈 색인에 채울 때는 False)"""
+    if not search_available():
+        return 0
+    rows = [document_row(instance) for instance in instances]
+    with connection.cursor() as cursor:
+        if replace:
+            cursor.executemany(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [(row[0],) for row in rows])
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, doc_type, doc_id, profile_id, body, tokens) "
+            f"VALUES (%s, %s, %s, %s, %s, %s)",
+            rows
+        )
+    return len(rows)
+
+
+def remove_documents(pks: Iterable[uuid.UUID]) -> None:
+    if not search_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [(doc_rowid(pk),) for pk in pks])
+
+
+def _highlight(body: str, query: str) -> str:
+    """원문에서 첫 일치 위치 주변만 잘라 일치 구간을 <mark>로 표시 (HTML 이스케이프)"""
+    runs = sorted(dict.fromkeys(_runs(query)), key=len, reverse=True)
+    text = unicodedata.normalize("NFKC", body)
+    pattern = re.compile("|".join(re.escape(run) for run in runs), re.IGNORECASE) if runs else None
+    first = pattern.search(text) if pattern else None
+    radius = settings.SEARCH_SNIPPET_CHARS // 2
+    start = max(first.start() - radius, 0) if first else 0
+    end = min(start + settings.SEARCH_SNIPPET_CHARS, len(text))
+    window = text[start:end]
+
+    parts, position = [], 0
+    for match in (pattern.finditer(window) if pattern else ()):
+        parts.append(html.escape(window[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(window[position:]))
+    snippet = " ".join("".join(parts).split())
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+
+def search_documents(query: str, doc_type: Optional[str] = None, profile_id: Optional[str] = None,
+                     limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    BM25 순위(FTS5 rank) 상위 문서 + 하이라이트 스니펫
+    - doc_type/profile_id는 UNINDEXED 컬럼 필터 (MATCH 결과 안에서만 검사)
+    """
+    expression = match_query(query)
+    if not expression:
+        return []
+    sql = (f"SELECT doc_type, doc_id, profile_id, body, rank "
+           f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s")
+    params: List[Any] = [expression]
+    if doc_type:
+        sql += " AND doc_type = %s"
+        params.append(doc_type)
+    if profile_id:
+        sql += " AND profile_id = %s"
+        params.append(profile_id)
+    sql += " ORDER BY rank LIMIT %s"
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    return [
+        {"doc_type": row[0], "id": row[1], "profile_id": row[2], "score": round(-row[4], 4),
+         "snippet": _highlight(row[3], query)}
+        for row in rows
+    ]
+
+
+# === 모델 시그널 동기화 ===
+
+@receiver(post_save, sender=ResumeProfile)
+@receiver(post_save, sender=InterviewSession)
+@receiver(post_save, sender=LearningPath)
+def _index_on_save(sender, instance, created, update_fields=None, **kwargs):
+    # 분석 결과/상태만 갱신하는 저장(update_fields 지정)은 색인 필드가 바뀌지 않으므로 건너뜀
+    field = DOCUMENT_TYPES[_doc_type(instance)][1]
+    if not created and update_fields is not None and field not in update_fields:
+        return
+    index_documents([instance])
+
+
+@receiver(post_delete, sender=ResumeProfile)
+@receiver(post_delete, sender=InterviewSession)
+@receiver(post_delete, sender=LearningPath)
+def _remove_on_delete(sender, instance, **kwargs):
+    remove_documents([instance.pk])
@@ -0,0 +1,236 @@
+"""
+🛫 Single-flight - 동일 LLM 요청 동시 실행 병합
+
+재시도/더블클릭으로 같은 요청이 동시에 들어오면:
+- 프로세스 내: 첫 요청(leader)의 Future를 나머지가 함께 대기
+  (비동기 요청 경로는 do, 동기 엔진(작업 워커 스레드 등)은 do_sync - 잠금 키는 같아 워커 간에는 서로 병합)
+- 워커 간: 캐시 백엔드(settings.CACHES['llm'])의 add()를 잠금으로 사용,
+  다른 워커는 leader가 남긴 결과를 폴링해서 공유
+  (호출 마감 시간과 잠금 TTL 중 이른 시각까지만 - 넘으면 DeadlineExceededError로 호출부가 기본값 대체)
+- 병합 횟수 통계 제공 (모니터링용)
+- 캐시 백엔드 오류(캐시 테이블 미생성 등) 시 워커 간 병합 없이 직접 실행
+"""
+
+import asyncio
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .resilience import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+
+def request_fingerprint(*parts: Any) -> str:
+    """요청 구성 요소(모델, 메시지, 파라미터 등)로 지문 생성"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """키 단위로 동시 실행을 하나로 합치는 실행기 (비동기/동기)"""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.leaders = 0
+        self.coalesced_local = 0
+        self.coalesced_remote = 0
+        self.backend_errors = 0
+        self.deadline_exceeded = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._inflight_sync: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        return caches[settings.LLM_CACHE_ALIAS]
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]],
+                 deadline: Optional[float] = None) -> Tuple[Any, str]:
+        """
+        fn 실행 결과와 역할(leader/coalesced_local/coalesced_remote) 반환
+        - 같은 key로 진행 중인 호출이 있으면 그 결과를 공유
+        - deadline: 다른 워커의 결과를 기다릴 수 있는 시각 (단조 시계, 없으면 LLM_CALL_DEADLINE_SECONDS 후)
+        """
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            self.coalesced_local += 1
+            return await asyncio.shield(future), "coalesced_local"
+
+        future = loop.create_future()
+        # 대기자가 없을 때 예외 미회수 경고 방지
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result, role = await self._run_across_workers(key, fn, deadline)
+            future.set_result(result)
+            return result, role
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def do_sync(self, key: str, fn: Callable[[], Any], deadline: Optional[float] = None) -> Tuple[Any, str]:
+        """do의 동기 버전 - 같은 프로세스의 다른 스레드는 leader 스레드의 결과를 대기"""
+        with self._lock:
+            future = self._inflight_sync.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight_sync[key] = concurrent.futures.Future()
+            else:
+                self.coalesced_local += 1
+        if not leader:
+            return future.result(), "coalesced_local"
+
+        try:
+            result, role = self._run_across_workers_sync(key, fn, deadline)
+            future.set_result(result)
+            return result, role
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight_sync.pop(key, None)
+
+    def _backend_failed(self, error: Exception) -> None:
+        self.backend_errors += 1
+        logger.warning("⚠️ single-flight 캐시 백엔드 오류 - 워커 간 병합 없이 진행: %s", error,
+                       extra={"single_flight": self.namespace, "error_type": type(error).__name__})
+
+    def _wait_until(self, deadline: Optional[float], lock_ttl: float) -> float:
+        """원격 leader 결과 폴링 종료 시각 - 호출 마감 시간(없으면 LLM_CALL_DEADLINE_SECONDS)과 잠금 TTL 중 이른 쪽"""
+        now = time.monotonic()
+        return min(deadline or now + settings.LLM_CALL_DEADLINE_SECONDS, now + lock_ttl)
+
+    def _wait_expired(self) -> DeadlineExceededError:
+        self.deadline_exceeded += 1
+        logger.warning("⏱️ single-flight 원격 결과 대기 마감 - 호출부 기본값으로 대체",
+                       extra={"single_flight": self.namespace})
+        return DeadlineExceededError(f"single-flight {self.namespace}: 다른 워커의 결과 대기 시간 초과")
+
+    async def _run_across_workers(self, key: str, fn: Callable[[], Awaitable[Any]],
+                                  deadline: Optional[float]) -> Tuple[Any, str]:
+        lock_key = f"singleflight:{self.namespace}:{key}:lock"
+        result_key = f"singleflight:{self.namespace}:{key}:result"
+        lock_ttl = settings.SINGLE_FLIGHT_LOCK_TTL_SECONDS
+
+        try:
+            acquired = await self.backend.aadd(lock_key, os.getpid(), timeout=lock_ttl)
+        except Exception as e:
+            self._backend_failed(e)
+            self.leaders += 1
+            return await fn(), "leader"
+
+        if acquired:
+            self.leaders += 1
+            try:
+                result = await fn()
+                try:
+                    await self.backend.aset(result_key, result, timeout=settings.SINGLE_FLIGHT_RESULT_TTL_SECONDS)
+                except Exception as e:
+                    self._backend_failed(e)
+                return result, "leader"
+            finally:
+                try:
+                    await self.backend.adelete(lock_key)
+                except Exception as e:
+                    self._backend_failed(e)
+
+        # 다른 워커가 leader - 결과가 올라오거나 잠금이 풀릴 때까지 폴링 (마감 시각까지)
+        wait_until = self._wait_until(deadline, lock_ttl)
+        expired = False
+        try:
+            while True:
+                remaining = wait_until - time.monotonic()
+                if remaining <= 0:
+                    expired = True
+                    break
+                await asyncio.sleep(min(settings.SINGLE_FLIGHT_POLL_INTERVAL_SECONDS, remaining))
+                result = await self.backend.aget(result_key)
+                if result is not None:
+                    self.coalesced_remote += 1
+                    return result, "coalesced_remote"
+                if not await self.backend.ahas_key(lock_key):
+                    break
+        except Exception as e:
+            self._backend_failed(e)
+        if expired:
+            raise self._wait_expired()
+
+        # leader 실패/타임아웃 - 직접 실행
+        self.leaders += 1
+        return await fn(), "leader"
+
+    def _run_across_workers_sync(self, key: str, fn: Callable[[], Any],
+                                 deadline: Optional[float]) -> Tuple[Any, str]:
+        """_run_across_workers의 동기 버전"""
+        lock_key = f"singleflight:{self.namespace}:{key}:lock"
+        result_key = f"singleflight:{self.namespace}:{key}:result"
+        lock_ttl = settings.SINGLE_FLIGHT_LOCK_TTL_SECONDS
+
+        try:
+            acquired = self.backend.add(lock_key, os.getpid(), timeout=lock_ttl)
+        except Exception as e:
+            self._backend_failed(e)
+            self.leaders += 1
+            return fn(), "leader"
+
+        if acquired:
+            self.leaders += 1
+            try:
+                result = fn()
+                try:
+                    self.backend.set(result_key, result, timeout=settings.SINGLE_FLIGHT_RESULT_TTL_SECONDS)
+                except Exception as e:
+                    self._backend_failed(e)
+                return result, "leader"
+            finally:
+                try:
+                    self.backend.delete(lock_key)
+                except Exception as e:
+                    self._backend_failed(e)
+
+        wait_until = self._wait_until(deadline, lock_ttl)
+        expired = False
+        try:
+            while True:
+                remaining = wait_until - time.monotonic()
+                if remaining <= 0:
+                    expired = True
+                    break
+                time.sleep(min(settings.SINGLE_FLIGHT_POLL_INTERVAL_SECONDS, remaining))
+                result = self.backend.get(result_key)
+                if result is not None:
+                    self.coalesced_remote += 1
+                    return result, "coalesced_remote"
+                if not self.backend.has_key(lock_key):
+                    break
+        except Exception as e:
+            self._backend_failed(e)
+        if expired:
+            raise self._wait_expired()
+
+        self.leaders += 1
+        return fn(), "leader"
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계 (프로세스 단위)"""
+        return {
+            "leaders": self.leaders,
+            "coalesced_local": self.coalesced_local,
+            "coalesced_remote": self.coalesced_remote,
+            "backend_errors": self.backend_errors,
+            "deadline_exceeded": self.deadline_exceeded,
+            "in_flight": len(self._inflight) + len(self._inflight_sync),
+        }
@@ -0,0 +1,284 @@
+"""
+🧩 스킬 정규화 - 자유 입력 기술 스택 → 정렬된 canonical 스킬 ID
+
+- 스킬 사전(SKILL_DICTIONARY, 한/영 별칭 포함)을 기동 시 Aho-Corasick 오토마톤으로 한 번 구성
+- 입력 1회 순회로 모든 별칭을 찾고, 겹치는 매칭은 왼쪽부터 가장 긴 별칭만 채택
+  · 영문 별칭은 단어 경계 기준 (django 안의 go는 매칭하지 않음)
+  · 한글 별칭은 조사가 붙어도 매칭 (스프링부트를 → spring-boot)
+- 결과 ID는 ResumeProfile.skill_ids에 저장되어 분석 캐시 키, 모델 라우팅, 로드맵 계열 선택, 집계에 사용
+- 같은 ID를 resume_profile_skills(ProfileSkill)에도 연결해 스킬별 프로필 조회는 인덱스로 처리
+"""
+
+import re
+import threading
+import unicodedata
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .models import ProfileSkill, ResumeProfile, Skill
+
+# 로드맵 계열 (동률이면 앞 계열 우선)
+SKILL_FAMILIES = ("backend", "frontend", "mobile", "data", "devops")
+
+# (canonical ID, 표시 이름, 계열, 별칭) - 계열이 None이면 범용 스킬 (로드맵 계열 판별에서 제외)
+SKILL_DICTIONARY: Tuple[Tuple[str, str, Optional[str], Tuple[str, ...]], ...] = (
+    # 언어
+    ("python", "Python", None, ("python", "python3", "파이썬")),
+    ("java", "Java", "backend", ("java", "자바")),
+    ("kotlin", "Kotlin", None, ("kotlin", "코틀린")),
+    ("javascript", "JavaScript", "frontend", ("javascript", "js", "ecmascript", "es6", "자바스크립트")),
+    ("typescript", "TypeScript", "frontend", ("typescript", "ts", "타입스크립트")),
+    ("go", "Go", "backend", ("go", "golang", "고랭")),
+    ("rust", "Rust", "backend", ("rust",)),
+    ("c", "C", None, ("c", "c언어")),
+    ("cpp", "C++", None, ("c++", "cpp", "씨플플")),
+    ("csharp", "C#", "backend", ("c#", "csharp", "c샵")),
+    ("php", "PHP", "backend", ("php",)),
+    ("ruby", "Ruby", "backend", ("ruby", "루비")),
+    ("scala", "Scala", "data", ("scala", "스칼라")),
+    ("swift", "Swift", "mobile", ("swift", "스위프트")),
+    ("dart", "Dart", "mobile", ("dart", "다트")),
+    ("sql", "SQL", "data", ("sql",)),
+    # 백엔드 프레임워크
+    ("spring", "Spring", "backend", ("spring", "spring framework", "스프링")),
+    ("spring-boot", "Spring Boot", "backend", ("spring boot", "springboot", "스프링 부트", "스프링부트")),
+    ("jpa", "JPA", "backend", ("jpa", "hibernate", "spring data jpa", "하이버네이트")),
+    ("django", "Django", "backend", ("django", "장고", "drf", "django rest framework")),
+    ("fastapi", "FastAPI", "backend", ("fastapi", "fast api")),
+    ("flask", "Flask", "backend", ("flask", "플라스크")),
+    ("nodejs", "Node.js", "backend", ("node.js", "nodejs", "node", "노드")),
+    ("nestjs", "NestJS", "backend", ("nestjs", "nest.js", "네스트")),
+    ("express", "Express", "backend", ("express", "express.js")),
+    ("rails", "Ruby on Rails", "backend", ("rails", "ruby on rails", "레일즈")),
+    ("graphql", "GraphQL", "backend", ("graphql",)),
+    ("grpc", "gRPC", "backend", ("grpc",)),
+    ("msa", "MSA", "backend", ("msa", "microservices", "microservice", "마이크로서비스")),
+    # 데이터베이스/메시징
+    ("mysql", "MySQL", "backend", ("mysql", "마이에스큐엘")),
+    ("postgresql", "PostgreSQL", "backend", ("postgresql", "postgres", "포스트그레스")),
+    ("oracle", "Oracle", "backend", ("oracle", "오라클")),
+    ("mongodb", "MongoDB", "backend", ("mongodb", "mongo", "몽고디비")),
+    ("redis", "Redis", "backend", ("redis", "레디스")),
+    ("elasticsearch", "Elasticsearch", "backend", ("elasticsearch", "elastic search", "엘라스틱서치", "엘라스틱 서치")),
+    ("kafka", "Kafka", "data", ("kafka", "카프카")),
+    ("rabbitmq", "RabbitMQ", "backend", ("rabbitmq", "래빗mq")),
+    # 프론트엔드
+    ("react", "React", "frontend", ("react", "react.js", "reactjs", "리액트")),
+    ("nextjs", "Next.js", "frontend", ("next.js", "nextjs", "넥스트")),
+    ("vue", "Vue.js", "frontend", ("vue", "vue.js", "vuejs")),
+    ("angular", "Angular", "frontend", ("angular", "앵귤러")),
+    ("svelte", "Svelte", "frontend", ("svelte",)),
+    ("html", "HTML", "frontend", ("html", "html5")),
+    ("css", "CSS", "frontend", ("css", "css3", "scss", "sass", "tailwind", "tailwindcss")),
+    ("redux", "Redux", "frontend", ("redux", "리덕스")),
+    ("webpack", "Webpack", "frontend", ("webpack", "웹팩")),
+    # 모바일
+    ("android", "Android", "mobile", ("android", "안드로이드")),
+    ("ios", "iOS", "mobile", ("ios",)),
+    ("jetpack-compose", "Jetpack Compose", "mobile", ("jetpack compose", "컴포즈")),
+    ("swiftui", "SwiftUI", "mobile", ("swiftui",)),
+    ("flutter", "Flutter", "mobile", ("flutter", "플러터")),
+    ("react-native", "React Native", "mobile", ("react native", "react-native", "리액트 네이티브", "리액트네이티브")),
+    # 데이터/ML
+    ("spark", "Apache Spark", "data", ("spark", "pyspark", "스파크")),
+    ("airflow", "Apache Airflow", "data", ("airflow", "에어플로우")),
+    ("hadoop", "Hadoop", "data", ("hadoop", "하둡")),
+    ("pandas", "pandas", "data", ("pandas", "판다스")),
+    ("numpy", "NumPy", "data", ("numpy", "넘파이")),
+    ("tensorflow", "TensorFlow", "data", ("tensorflow", "텐서플로우", "텐서플로")),
+    ("pytorch", "PyTorch", "data", ("pytorch", "torch", "파이토치")),
+    ("scikit-learn", "scikit-learn", "data", ("scikit-learn", "sklearn", "사이킷런")),
+    ("machine-learning", "Machine Learning", "data", ("machine learning", "ml", "머신러닝", "기계학습")),
+    ("deep-learning", "Deep Learning", "data", ("deep learning", "dl", "딥러닝")),
+    ("llm", "LLM", "data", ("llm", "openai", "langchain", "랭체인")),
+    ("bigquery", "BigQuery", "data", ("bigquery", "빅쿼리")),
+    # 인프라/DevOps
+    ("aws", "AWS", "devops", ("aws", "amazon web services", "ec2", "aws ec2", "s3", "lambda", "아마존 웹 서비스")),
+    ("gcp", "Google Cloud", "devops", ("gcp", "google cloud", "구글 클라우드")),
+    ("azure", "Azure", "devops", ("azure", "애저")),
+    ("docker", "Docker", "devops", ("docker", "도커")),
+    ("kubernetes", "Kubernetes", "devops", ("kubernetes", "k8s", "쿠버네티스", "eks", "gke")),
+    ("terraform", "Terraform", "devops", ("terraform", "테라폼")),
+    ("jenkins", "Jenkins", "devops", ("jenkins", "젠킨스")),
+    ("github-actions", "GitHub Actions", "devops", ("github actions", "github action", "깃허브 액션")),
+    ("ci-cd", "CI/CD", "devops", ("ci/cd", "cicd", "ci cd")),
+    ("linux", "Linux", "devops", ("linux", "리눅스", "ubuntu", "우분투")),
+    ("nginx", "Nginx", "devops", ("nginx", "엔진엑스")),
+    ("prometheus", "Prometheus", "devops", ("prometheus", "프로메테우스", "grafana", "그라파나")),
+    # 협업/기타
+    ("git", "Git", None, ("git", "깃", "github", "깃허브", "gitlab")),
+    ("jira", "Jira", None, ("jira", "지라")),
+    ("figma", "Figma", "frontend", ("figma", "피그마")),
+)
+
+# 분석 캐시 키의 잔여 입력 토큰 구분자 (사전에 없는 스킬은 원문 그대로 키에 반영)
+_RESIDUAL_SEPARATORS = re.compile(r"[,/\n;|·()\[\]+&]|\s{2,}| 및 | and ")
+
+
+def normalize_skill_text(value: str) -> str:
+    """매칭용 정규화 - NFKC + 소문자 + 공백 하나로"""
+    value = unicodedata.normalize("NFKC", value or "").lower()
+    return re.sub(r"\s+", " ", value).strip()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+class SkillMatch(NamedTuple):
+    start: int
+    end: int
+    skill_id: str
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    skill_id: str
+    name: str
+    family: Optional[str]
+    aliases: Tuple[str, ...]
+
+
+class SkillNormalizer:
+    """스킬 사전 기반 Aho-Corasick 매처 (구성 후 읽기 전용 → 스레드 간 공유)"""
+
+    def __init__(self, dictionary=SKILL_DICTIONARY):
+        self.dictionary = dictionary
+        self.entries: Dict[str, SkillEntry] = {}
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._output: List[Tuple[Tuple[int, str], ...]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._goto)
+
+    def load(self) -> None:
+        """오토마톤 구성 (trie + 실패 링크, 출력은 실패 링크를 따라 미리 병합)"""
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            entries: Dict[str, SkillEntry] = {}
+            goto: List[Dict[str, int]] = [{}]
+            outputs: List[List[Tuple[int, str]]] = [[]]
+            for skill_id, name, family, aliases in self.dictionary:
+                entries[skill_id] = SkillEntry(skill_id, name, family, aliases)
+                for alias in {normalize_skill_text(a) for a in (*aliases, name)}:
+                    # 띄어쓰기/구두점 변형 (spring boot ↔ springboot, node.js ↔ nodejs)
+                    for variant in {alias, re.sub(r"[\s.\-]", "", alias)}:
+                        if not variant:
+                            continue
+                        state = 0
+                        for char in variant:
+                            if char not in goto[state]:
+                                goto[state][char] = len(goto)
+                                goto.append({})
+                                outputs.append([])
+                            state = goto[state][char]
+                        if (len(variant), skill_id) not in outputs[state]:
+                            outputs[state].append((len(variant), skill_id))
+
+            fail = [0] * len(goto)
+            queue = deque(goto[0].values())
+            while queue:
+                state = queue.popleft()
+                for char, child in goto[state].items():
+                    queue.append(child)
+                    fallback = fail[state]
+                    while fallback and char not in goto[fallback]:
+                        fallback = fail[fallback]
+                    fail[child] = goto[fallback].get(char, 0) if goto[fallback].get(char) != child else 0
+                    outputs[child].extend(out for out in outputs[fail[child]] if out not in outputs[child])
+
+            self.entries = entries
+            self._fail = fail
+            self._output = [tuple(out) for out in outputs]
+            self._goto = goto
+
+    def matches(self, text: str) -> List[SkillMatch]:
+        """정규화된 텍스트에서 겹치지 않는 스킬 매칭 (왼쪽 우선, 같은 시작점이면 가장 긴 별칭)"""
+        self.load()
+        goto, fail, output = self._goto, self._fail, self._output
+        found: List[SkillMatch] = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, skill_id in output[state]:
+                start, end = index - length + 1, index + 1
+                # 영문/숫자로 시작·끝나는 별칭은 단어 경계에서만 인정
+                if _is_word_char(text[start]) and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if _is_word_char(text[index]) and end < len(text) and _is_word_char(text[end]):
+                    continue
+                found.append(SkillMatch(start, end, skill_id))
+
+        found.sort(key=lambda match: (match.start, match.start - match.end))
+        selected: List[SkillMatch] = []
+        covered = 0
+        for match in found:
+            if match.start >= covered:
+                selected.append(match)
+                covered = match.end
+        return selected
+
+    def normalize(self, technical_skills: str) -> List[str]:
+        """기술 스택 문자열 → 정렬된 canonical 스킬 ID"""
+        return sorted({match.skill_id for match in self.matches(normalize_skill_text(technical_skills))})
+
+    def fingerprint(self, technical_skills: str) -> str:
+        """
+        캐시 키용 스킬 표현 - canonical ID + 사전에 없는 잔여 토큰
+        (별칭/순서/표기만 다른 입력은 같은 키, 사전 밖 스킬이 다르면 다른 키)
+        """
+        text = normalize_skill_text(technical_skills)
+        matches = self.matches(text)
+        residual, position = [], 0
+        for match in matches:
+            residual.append(text[position:match.start])
+            position = match.end
+        residual.append(text[position:])
+        leftovers = {
+            token.strip(" .-_'\"") for token in _RESIDUAL_SEPARATORS.split(" ".join(residual))
+        }
+        ids = sorted({match.skill_id for match in matches})
+        return ",".join(ids) + "|" + ",".join(sorted(token for token in leftovers if token))
+
+    def family(self, skill_ids: List[str]) -> Optional[str]:
+        """가장 많은 스킬이 속한 계열 (동률이면 SKILL_FAMILIES 순서상 앞 계열, 범용 스킬만 있으면 None)"""
+        self.load()
+        counts = Counter(self.entries[skill_id].family for skill_id in skill_ids
+                         if skill_id in self.entries and self.entries[skill_id].family)
+        if not counts:
+            return None
+        return max(counts, key=lambda family: (counts[family], -SKILL_FAMILIES.index(family)))
+
+
+skill_normalizer = SkillNormalizer()
+
+
+def link_profile_skills(profiles: Iterable[ResumeProfile]) -> int:
+    """프로필의 skill_ids → ProfileSkill 행 (이미 있는 연결은 무시, 사전에 새로 추가된 스킬 행도 함께 생성)"""
+    links = [ProfileSkill(profile_id=profile.id, skill_id=skill_id)
+             for profile in profiles for skill_id in profile.skill_ids]
+    if not links:
+        return 0
+    skill_normalizer.load()
+    entries = [skill_normalizer.entries[skill_id] for skill_id in {link.skill_id for link in links}]
+    Skill.objects.bulk_create(
+        [Skill(id=entry.skill_id, name=entry.name, family=entry.family or "") for entry in entries],
+        ignore_conflicts=True
+    )
+    ProfileSkill.objects.bulk_create(links, ignore_conflicts=True, batch_size=settings.SKILL_LINK_DB_CHUNK)
+    return len(links)
+
+
+alink_profile_skills = sync_to_async(link_profile_skills)
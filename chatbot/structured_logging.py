@@ -0,0 +1,156 @@
+"""
+📝 구조화 로깅 - JSON 레코드 + 요청 스레드 밖에서 I/O
+
+- JsonFormatter: 레코드 1건 = JSON 1줄 (extra 필드, trace_id 포함)
+  · LOG_REDACT_FIELDS(career_summary 등 이력서 원문) 필드는 길이/해시로 대체
+  · 모든 문자열 값의 이메일/전화번호는 마스킹
+- QueueJsonHandler: 요청 스레드에서는 큐에 넣기만 하고 리스너 스레드가 stdout에 기록
+  (큐가 가득 차면 버리고 dropped 증가 - 로그 때문에 요청이 막히지 않도록)
+- log_raw_completion: LLM 원시 응답은 파싱 실패 시 항상, 성공 시 LOG_COMPLETION_SAMPLE_RATE 비율로만 기록
+"""
+
+import atexit
+import copy
+import hashlib
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from .tracing import current_trace_id
+
+completion_logger = logging.getLogger("chatbot.completions")
+
+# LogRecord 기본 속성 - 이 외의 속성은 extra 필드로 출력
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_PHONE = re.compile(r"\b01[016789]-?\d{3,4}-?\d{4}\b|\+\d{1,3}[ -]?\d{1,4}[ -]?\d{3,4}[ -]?\d{4}\b")
+
+
+def redact_text(text: str) -> str:
+    """이메일/전화번호 마스킹 (원시 응답이 이력서 연락처를 되풀이하는 경우 대비)"""
+    return _PHONE.sub("[phone]", _EMAIL.sub("[email]", text))
+
+
+def redact_value(key: str, value: Any) -> Any:
+    """이력서 원문 필드는 길이/해시만 남기고, 그 외 문자열은 연락처만 마스킹"""
+    if isinstance(value, str):
+        if key in settings.LOG_REDACT_FIELDS:
+            digest = hashlib.sha256(value.encode()).hexdigest()[:12]
+            return f"[redacted {len(value)} chars sha256:{digest}]"
+        return redact_text(value)
+    if isinstance(value, dict):
+        return {k: redact_value(k, v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact_value(key, v) for v in value]
+    return value
+
+
+class TraceContextFilter(logging.Filter):
+    """로그를 남긴 요청의 trace id 첨부 (큐에 넣기 전 요청 컨텍스트에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "trace_id"):
+            record.trace_id = current_trace_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 → JSON 1줄 (민감 필드 마스킹)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": redact_text(record.getMessage()),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and value is not None:
+                payload[key] = redact_value(key, value)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = redact_text(record.exc_text)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class QueueJsonHandler(logging.handlers.QueueHandler):
+    """큐에 넣기만 하는 핸들러 - 포맷/기록은 프로세스별 리스너 스레드가 담당"""
+
+    def __init__(self, stream=None, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.target = logging.StreamHandler(stream or sys.stdout)
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self._listener_pid: Optional[int] = None
+        self._listener_lock = threading.Lock()
+        self.dropped = 0
+        atexit.register(self.close)
+
+    def _ensure_listener(self) -> None:
+        if self._listener_pid == os.getpid():
+            return
+        with self._listener_lock:
+            if self._listener_pid != os.getpid():
+                # fork된 워커는 부모의 리스너 스레드를 물려받지 않으므로 프로세스마다 새로 시작
+                self.target.setFormatter(self.formatter or JsonFormatter())
+                self.listener = logging.handlers.QueueListener(self.queue, self.target)
+                self.listener.start()
+                self._listener_pid = os.getpid()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """메시지 인자/예외만 문자열로 확정 (JSON 직렬화는 리스너 스레드에서)"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._ensure_listener()
+        super().emit(record)
+
+    def flush(self) -> None:
+        """리스너를 멈춰 대기 중인 레코드를 모두 기록한 뒤 다시 시작 (테스트/종료 시)"""
+        with self._listener_lock:
+            if self.listener is not None and self._listener_pid == os.getpid():
+                self.listener.stop()
+                self.listener.start()
+        self.target.flush()
+
+    def close(self) -> None:
+        with self._listener_lock:
+            if self.listener is not None and self._listener_pid == os.getpid():
+                self.listener.stop()
+                self._listener_pid = None
+        super().close()
+
+
+def log_raw_completion(stage: str, content: Optional[str], failed: bool, **fields: Any) -> None:
+    """LLM 원시 응답 기록 - 파싱 실패는 항상, 성공은 샘플링"""
+    if not failed and random.random() >= settings.LOG_COMPLETION_SAMPLE_RATE:
+        return
+    completion_logger.log(
+        logging.WARNING if failed else logging.INFO,
+        "🔍 %s 원시 응답", stage,
+        extra={"stage": stage, "parse_failed": failed, "completion": content or "",
+               "completion_chars": len(content or ""), **fields},
+    )
@@ -4,9 +4,92 @@
 Unit tests for the Career Coach Chatbot API
 """
 
-from django.test import TestCase, Client
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import openai
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection, OperationalError
+from django.test import TestCase, SimpleTestCase, Client, AsyncClient, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from .models import ResumeProfile, InterviewSession, LearningPath
+from django.utils import timezone
+from .models import (
+    ResumeProfile, InterviewSession, LearningPath, AnalysisBatch, GenerationJob, UsageRollup, ProfileSkill
+)
+from .ai_service import (
+    analysis_cache, async_career_coach_ai, career_coach_ai, llm_flight, llm_breaker, llm_caller,
+    output_stats, begin_generation, CareerAnalysis
+)
+from .prompts import prompt_registry, LEARNING_PROMPT
+from .token_budget import count_tokens
+from .json_stream import IncrementalArrayParser, parse_array
+from .fake_openai import FakeOpenAIServer, FAIL_MARKER
+from .llm_backends import load_backend
+from .model_router import model_router
+from .jobs import run_pending_jobs
+from .batch_service import poll_analysis_batch, submit_analysis_batch
+from .usage import record_usage_rollup, usage_cost
+from .deadline import Deadline
+from .resilience import DeadlineExceededError
+from .metrics import registry as metrics_registry
+from .tracing import trace, tracer
+from .roadmaps import roadmap_library, merge_personalization
+from .skills import link_profile_skills, skill_normalizer
+from .search import SEARCH_TABLE
+from .structured_logging import QueueJsonHandler, JsonFormatter, TraceContextFilter
+from .schemas import ResumeAnalysisResult
+from .management.commands.benchmark_json_stream import load_recorded_completions
+
+
+def fake_completion(content, usage=None):
+    """OpenAI ChatCompletion 응답 형태의 테스트 더블 (usage: (prompt, completion, cached) 토큰)"""
+    completion = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+    if usage is not None:
+        prompt_tokens, completion_tokens, cached_tokens = usage
+        completion.usage = SimpleNamespace(
+            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens)
+        )
+    return completion
+
+
+def fake_stream(content, chunk_size=7, usage=None):
+    """stream=True 응답 형태의 테스트 더블 (content를 델타 청크로 분할, usage가 있으면 마지막에 사용량 청크)"""
+    async def chunks():
+        for i in range(0, len(content), chunk_size):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + chunk_size]))]
+            )
+        if usage is not None:
+            yield SimpleNamespace(choices=[], usage=fake_completion('', usage=usage).usage)
+    return chunks()
+
+
+SAMPLE_ANALYSIS = {
+    "career_level": "중급",
+    "strength_areas": ["Spring Boot 기반 API 설계"],
+    "improvement_areas": ["클라우드 네이티브 경험"],
+    "career_pattern": "꾸준히 성장 중인 백엔드 개발자입니다.",
+    "market_competitiveness": 7,
+    "personality_traits": ["학습 지향적"],
+    "growth_trajectory": "5년 후 시니어로 성장하실 수 있습니다."
+}
 
 class ResumeProfileTestCase(TestCase):
     """이력서 프로필 모델 테스트"""
@@ -30,10 +113,1376 @@ class APIEndpointTestCase(TestCase):
     
     def setUp(self):
         self.client = Client()
+        analysis_cache.memory.clear()
     
     def test_health_check(self):
         """헬스체크 엔드포인트 테스트"""
         response = self.client.get('/api/health')
         self.assertEqual(response.status_code, 200)
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_create_profile_async(self, mock_create):
+        """비동기 프로필 생성 엔드포인트 테스트 (AsyncOpenAI 모킹)"""
+        mock_create.return_value = fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False))
+        response = self.client.post('/api/profiles', data={
+            'career_summary': '3년차 백엔드 개발자, Spring Boot 기반 커머스 서비스 개발',
+            'job_role': 'Spring Boot 백엔드 개발',
+            'technical_skills': 'Java, Spring Boot, MySQL',
+            'experience_years': 3
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['analysis_result']['career_level'], '중급')
+        mock_create.assert_awaited_once()
+        profile = ResumeProfile.objects.get(id=response.json()['id'])
+        self.assertEqual(profile.analysis_result['market_competitiveness'], 7)
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_create_profile_analysis_cache(self, mock_create):
+        """동일 이력서 재제출 시 LLM 호출 없이 캐시된 분석 결과 반환"""
+        mock_create.return_value = fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False))
+        payload = {
+            'career_summary': '3년차 백엔드 개발자, Spring Boot 기반 커머스 서비스 개발',
+            'job_role': 'Spring Boot 백엔드 개발',
+            'technical_skills': 'Java, Spring Boot, MySQL',
+            'experience_years': 3
+        }
+        first = self.client.post('/api/profiles', data=payload, content_type='application/json')
+        # 공백/스킬 순서만 다른 입력도 같은 캐시 키
+        payload.update(career_summary='3년차 백엔드 개발자,  Spring Boot 기반 커머스 서비스 개발 ',
+                       technical_skills='mysql, Java, Spring Boot')
+        second = self.client.post('/api/profiles', data=payload, content_type='application/json')
         
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(mock_create.await_count, 1)
+        self.assertEqual(first.json()['analysis_result'], second.json()['analysis_result'])
+        metadata = ResumeProfile.objects.get(id=second.json()['id']).analysis_result['analysis_metadata']
+        self.assertEqual(metadata['cache']['status'], 'memory')
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_create_profile_survives_cache_backend_error(self, mock_create):
+        """2차 캐시 테이블이 없어도(createcachetable 미실행) 분석은 캐시 미스 + 워커 간 병합 없이 진행"""
+        mock_create.return_value = fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False))
+        analysis_cache.memory.clear()
+        broken = MagicMock()
+        for method in ('aget', 'aset', 'aadd', 'adelete', 'ahas_key'):
+            setattr(broken, method, AsyncMock(side_effect=OperationalError("no such table: llm_cache")))
+        errors = analysis_cache.persistent_errors
+        with patch.object(type(analysis_cache), 'persistent', new_callable=PropertyMock, return_value=broken), \
+                patch.object(type(llm_flight), 'backend', new_callable=PropertyMock, return_value=broken):
+            response = self.client.post('/api/profiles', data={
+                'career_summary': '5년차 데이터 엔지니어, Spark 기반 파이프라인 운영',
+                'job_role': '데이터 엔지니어',
+                'technical_skills': 'Python, Spark',
+                'experience_years': 5
+            }, content_type='application/json')
+
+        self.assertEqual(response.status_code, 201)
+        metadata = ResumeProfile.objects.get(id=response.json()['id']).analysis_result['analysis_metadata']
+        self.assertEqual(metadata['cache']['status'], 'miss')
+        self.assertEqual(analysis_cache.persistent_errors, errors + 2)
+
     # TODO: OpenAI API 키가 필요한 테스트들은 추후 추가
+
+SAMPLE_QUESTIONS = [{
+    "question": f"질문 {i}",
+    "category": "기술",
+    "difficulty_level": "중급",
+    "suggested_answer_approach": "구조화된 답변"
+} for i in range(5)]
+
+SAMPLE_STEPS = [{
+    "phase": f"{i}단계",
+    "duration_weeks": 4,
+    "objectives": ["목표"],
+    "resources": ["자료"],
+    "milestones": ["마일스톤"],
+    "projects": ["프로젝트"],
+    "personal_advice": "조언"
+} for i in range(1, 4)]
+
+
+class CoachingBundleTestCase(TestCase):
+    """코칭 번들 (병렬 생성) 엔드포인트 테스트"""
+
+    def setUp(self):
+        self.profile = ResumeProfile.objects.create(
+            career_summary='3년차 백엔드 개발자, Spring Boot 기반 커머스 서비스 개발',
+            job_role='Spring Boot 백엔드 개발',
+            technical_skills='Java, Spring Boot, MySQL',
+            experience_years=3,
+            analysis_result=SAMPLE_ANALYSIS
+        )
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_bundle_runs_generations_in_parallel(self, mock_create):
+        """두 생성 호출이 병렬로 실행되고 두 레코드가 모두 저장되는지 확인"""
+        async def completion(**kwargs):
+            await asyncio.sleep(0.2)
+            prompt = kwargs['messages'][0]['content']
+            payload = {"phases": SAMPLE_STEPS} if '로드맵' in prompt else {"questions": SAMPLE_QUESTIONS}
+            return fake_completion(json.dumps(payload, ensure_ascii=False))
+        mock_create.side_effect = completion
+
+        response = self.client.post(
+            f'/api/profiles/{self.profile.id}/coaching-bundle',
+            data={'target_company_type': 'large', 'target_position_level': 'mid',
+                  'target_goal': 'promotion', 'preferred_duration_months': 6},
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual(len(body['interview_session']['questions']), 5)
+        self.assertEqual(len(body['learning_path']['learning_roadmap']), 3)
+        self.assertLess(body['generation_time_seconds'], 0.4)
+        self.assertEqual(self.profile.interview_sessions.count(), 1)
+        self.assertEqual(self.profile.learning_paths.count(), 1)
+
+
+class StreamingEndpointTestCase(TestCase):
+    """SSE 스트리밍 엔드포인트 테스트"""
+
+    def setUp(self):
+        self.profile = ResumeProfile.objects.create(
+            career_summary='3년차 백엔드 개발자, Spring Boot 기반 커머스 서비스 개발',
+            job_role='Spring Boot 백엔드 개발',
+            technical_skills='Java, Spring Boot, MySQL',
+            experience_years=3,
+            analysis_result=SAMPLE_ANALYSIS
+        )
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_interview_session_stream(self, mock_create):
+        """면접 질문이 question 이벤트로 하나씩 전송되고 세션이 저장되는지 확인"""
+        questions = [{
+            "question": f"질문 {i} {{중괄호}} \"인용\"",
+            "category": "기술",
+            "difficulty_level": "중급",
+            "suggested_answer_approach": "구조화된 답변"
+        } for i in range(5)]
+        mock_create.return_value = fake_stream("```json\n" + json.dumps(questions, ensure_ascii=False) + "\n```")
+        
+        response = await AsyncClient().post(
+            '/api/interview-sessions?stream=1',
+            data={'profile_id': str(self.profile.id), 'target_company_type': 'startup',
+                  'target_position_level': 'mid'},
+            content_type='application/json'
+        )
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        
+        self.assertEqual(body.count('event: question'), 5)
+        self.assertIn('질문 4 {중괄호} \\"인용\\"', body)
+        self.assertIn('event: session', body)
+        self.assertEqual(mock_create.await_args.kwargs['stream'], True)
+        self.assertEqual(await InterviewSession.objects.filter(profile=self.profile).acount(), 1)
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_stream_stages_keep_endpoint_label(self, mock_create):
+        """스트림을 소비하는 동안 기록된 단계 메트릭도 요청 엔드포인트 라벨 (background 아님)"""
+        mock_create.return_value = fake_stream(json.dumps(SAMPLE_QUESTIONS, ensure_ascii=False))
+        sample = 'career_coach_stage_duration_seconds_count{endpoint="api/interview-sessions",stage="upstream"} '
+
+        def upstream_count():
+            line = next((line for line in metrics_registry.render().splitlines() if line.startswith(sample)), None)
+            return float(line[len(sample):]) if line else 0
+
+        before = upstream_count()
+        response = await AsyncClient().post(
+            '/api/interview-sessions?stream=1',
+            data={'profile_id': str(self.profile.id), 'target_company_type': 'startup',
+                  'target_position_level': 'mid'},
+            content_type='application/json'
+        )
+        [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(upstream_count() - before, 1)
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_stream_usage_is_rolled_up(self, mock_create):
+        """질문 개수 제한에 도달해도 마지막 사용량 청크까지 읽어 토큰/비용 집계"""
+        mock_create.return_value = fake_stream(json.dumps({"questions": SAMPLE_QUESTIONS}, ensure_ascii=False),
+                                               usage=(1200, 300, 0))
+        response = await AsyncClient().post(
+            '/api/interview-sessions?stream=1',
+            data={'profile_id': str(self.profile.id), 'target_company_type': 'startup',
+                  'target_position_level': 'mid'},
+            content_type='application/json'
+        )
+        [chunk async for chunk in response.streaming_content]
+
+        row = await UsageRollup.objects.aget(stage='interview_questions')
+        self.assertEqual((row.requests, row.calls, row.prompt_tokens, row.completion_tokens), (1, 1, 1200, 300))
+        self.assertGreater(row.cost_usd, 0)
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_stream_skips_invalid_questions(self, mock_create):
+        """스키마에 맞지 않는 질문은 건너뛰고, 남는 질문이 없으면 기본 질문으로 대체"""
+        malformed = [{"question": "카테고리 없음"}] + SAMPLE_QUESTIONS[:4]
+        for questions, expected in ((malformed, "질문 3"), ([{"question": "x"}] * 5, "주요 프로젝트 경험")):
+            mock_create.return_value = fake_stream(json.dumps(questions, ensure_ascii=False))
+            response = await AsyncClient().post(
+                '/api/interview-sessions?stream=1',
+                data={'profile_id': str(self.profile.id), 'target_company_type': 'startup',
+                      'target_position_level': 'mid'},
+                content_type='application/json'
+            )
+            body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+
+            self.assertNotIn('event: error', body)
+            self.assertIn('event: session', body)
+            self.assertIn(expected, body)
+            session = await InterviewSession.objects.alatest('created_at')
+            self.assertNotIn({"question": "x"}, session.questions)
+
+
+class SingleFlightTestCase(TestCase):
+    """동일 LLM 요청 병합 테스트"""
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_concurrent_identical_requests_share_one_call(self, mock_create):
+        """동시에 들어온 동일 면접 질문 요청은 LLM을 한 번만 호출"""
+        questions = [{"question": "질문", "category": "기술", "difficulty_level": "중급",
+                      "suggested_answer_approach": "답변"}] * 5
+
+        async def slow_completion(**kwargs):
+            await asyncio.sleep(0.05)
+            return fake_completion(json.dumps({"questions": questions}, ensure_ascii=False))
+        mock_create.side_effect = slow_completion
+
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        args = (analysis, 'startup', 'mid', '3년차 백엔드 개발자', 'Java, Spring Boot')
+        coalesced_before = llm_flight.coalesced_local
+        results = await asyncio.gather(*[
+            async_career_coach_ai.generate_interview_questions(*args) for _ in range(3)
+        ])
+
+        self.assertEqual(mock_create.await_count, 1)
+        self.assertTrue(all(result == questions for result in results))
+        self.assertEqual(llm_flight.coalesced_local - coalesced_before, 2)
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_concurrent_sync_requests_share_one_call(self, mock_create):
+        """작업 워커 스레드(동기 엔진)의 동일 면접 질문 요청도 LLM을 한 번만 호출"""
+        started = threading.Event()
+
+        def slow_completion(**kwargs):
+            started.set()
+            time.sleep(0.1)
+            return fake_completion(json.dumps({"questions": SAMPLE_QUESTIONS}, ensure_ascii=False))
+        mock_create.side_effect = slow_completion
+
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        args = (analysis, 'startup', 'mid', '3년차 백엔드 개발자', 'Java, Spring Boot')
+        coalesced_before = llm_flight.coalesced_local
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            leader = executor.submit(career_coach_ai.generate_interview_questions, *args)
+            started.wait(5)
+            followers = [executor.submit(career_coach_ai.generate_interview_questions, *args) for _ in range(2)]
+            results = [future.result() for future in [leader, *followers]]
+
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertTrue(all(result == SAMPLE_QUESTIONS for result in results))
+        self.assertEqual(llm_flight.coalesced_local - coalesced_before, 2)
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_remote_wait_is_capped_by_deadline(self, mock_async_create, mock_create):
+        """다른 워커가 잠금을 쥔 채 결과가 없으면 잠금 TTL이 아니라 호출 마감 시간까지만 기다리고 기본값으로 대체"""
+        held = MagicMock()
+        held.add.return_value = False
+        held.get.return_value = None
+        held.has_key.return_value = True
+        held.aadd, held.aget, held.ahas_key = AsyncMock(return_value=False), AsyncMock(return_value=None), \
+            AsyncMock(return_value=True)
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        args = (analysis, 'startup', 'mid', '3년차 백엔드 개발자', 'Java, Spring Boot')
+        exceeded = llm_flight.deadline_exceeded
+        started = time.monotonic()
+        with patch.object(type(llm_flight), 'backend', new_callable=PropertyMock, return_value=held), \
+                override_settings(LLM_CALL_DEADLINE_SECONDS=0.3):
+            begin_generation()
+            questions = asyncio.run(async_career_coach_ai.generate_interview_questions(*args, deadline=Deadline(2.3)))
+            sync_questions = career_coach_ai.generate_interview_questions(*args)
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(questions, career_coach_ai._interview_fallback())
+        self.assertEqual(sync_questions, questions)
+        self.assertEqual(llm_flight.deadline_exceeded - exceeded, 2)
+        mock_async_create.assert_not_awaited()
+        mock_create.assert_not_called()
+
+
+class PromptRegistryTestCase(SimpleTestCase):
+    """프롬프트 레지스트리 테스트"""
+
+    def test_system_prefix_is_static(self):
+        """요청별 데이터가 달라도 system 메시지(prefix)는 동일해야 함"""
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        first = career_coach_ai._interview_request(analysis, 'startup', 'junior', '신입 개발자', 'Python, Django')
+        second = career_coach_ai._interview_request(analysis, 'foreign', 'lead', '10년차 아키텍트', 'Go, Kubernetes')
+        self.assertEqual(first['messages'][0], second['messages'][0])
+        self.assertNotEqual(first['messages'][1], second['messages'][1])
+        self.assertIn('10년차 아키텍트', second['messages'][1]['content'])
+
+    def test_record_usage_reports_cached_share(self):
+        """usage.prompt_tokens_details.cached_tokens 비율 계산"""
+        usage = SimpleNamespace(prompt_tokens=2000, prompt_tokens_details=SimpleNamespace(cached_tokens=1536))
+        stats = prompt_registry.record_usage('learning_path', usage)
+        self.assertEqual(stats['cached_ratio'], 0.768)
+        self.assertEqual(stats['template'], LEARNING_PROMPT.key)
+
+
+class TokenBudgetTestCase(SimpleTestCase):
+    """토큰 예산 테스트"""
+
+    def test_oversized_field_is_truncated(self):
+        """긴 경력 요약은 상한까지 잘리고 잘린 필드가 기록됨"""
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        long_summary = '대규모 트래픽 커머스 플랫폼 개발 경험. ' * 400
+        request = career_coach_ai._interview_request(analysis, 'startup', 'mid', long_summary, 'Java, Spring')
+        user_message = request['messages'][1]['content']
+        self.assertLess(count_tokens(user_message, career_coach_ai.model), 1200)
+        self.assertIn('이하 생략', user_message)
+
+    def test_max_tokens_follows_requested_output(self):
+        """max_tokens는 고정값이 아닌 출력 항목 수 기준으로 산정"""
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        template = roadmap_library.select('promotion', analysis.career_level, 1, 'Java, Spring')
+        request = career_coach_ai._learning_request(analysis, 'promotion', 'Java, Spring', 1,
+                                                    roadmap_library.phases(template, 1))
+        self.assertLess(request['max_tokens'], 2500)
+
+
+class StructuredOutputTestCase(SimpleTestCase):
+    """구조화 출력(json_schema) 검증 테스트"""
+
+    def test_request_uses_strict_json_schema(self):
+        """요청에 Pydantic 모델 기반 strict json_schema가 포함됨"""
+        request = career_coach_ai._interview_request(
+            CareerAnalysis(**SAMPLE_ANALYSIS), 'startup', 'mid', '경력', 'Java, Spring'
+        )
+        schema = request['response_format']['json_schema']
+        self.assertTrue(schema['strict'])
+        item = schema['schema']['properties']['questions']['items']
+        self.assertFalse(item['additionalProperties'])
+        self.assertEqual(set(item['required']), {'question', 'category', 'difficulty_level', 'suggested_answer_approach'})
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_schema_mismatch_falls_back_and_is_counted(self, mock_create):
+        """스키마 불일치 응답은 시도마다 1회 검증에서 걸러지고(캐스케이드 포함) 기본값 대체 횟수가 집계됨"""
+        mock_create.return_value = fake_completion(json.dumps({"questions": [{"question": "필드 누락"}]}))
+        before = output_stats.stats().get('interview_questions', {})
+        questions = career_coach_ai.generate_interview_questions(
+            CareerAnalysis(**SAMPLE_ANALYSIS), 'startup', 'mid', '경력', 'Java, Spring'
+        )
+        after = output_stats.stats()['interview_questions']
+        self.assertEqual(len(questions), 5)
+        self.assertEqual(after['invalid'] - before.get('invalid', 0), mock_create.call_count)
+        self.assertEqual(after['fallback'] - before.get('fallback', 0), 1)
+
+
+class RoadmapTemplateTestCase(SimpleTestCase):
+    """사전 구성 로드맵 골격 + LLM 개인화 테스트"""
+
+    def test_library_covers_every_key_and_selects_by_profile(self):
+        """목표 × 레벨 × 기간 구간 × 스킬 계열 전체 조합이 기동 시 구성되고 입력으로 선택됨"""
+        self.assertEqual(len(roadmap_library), 5 * 4 * 3 * 6)
+        template = roadmap_library.select('career_change', '시니어 백엔드 개발자 (8년차)', 9, 'React, TypeScript, Next.js')
+        self.assertEqual(tuple(template.key), ('career_change', 'senior', 'long', 'frontend'))
+        template = roadmap_library.select('promotion', '주니어 (1년차)', 2, 'Golang, Redis')
+        self.assertEqual(tuple(template.key), ('promotion', 'junior', 'short', 'backend'))
+        self.assertEqual(len(template.phases[0]['milestones']), 2)
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_llm_generates_only_personalized_fields(self, mock_create):
+        """LLM 출력 스키마는 projects/personal_advice만, 나머지 필드는 골격 그대로 병합"""
+        mock_create.return_value = fake_completion(json.dumps({'phases': [
+            {'projects': [f'맞춤 프로젝트 {i}'], 'personal_advice': f'맞춤 조언 {i}'} for i in range(3)
+        ]}, ensure_ascii=False))
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        steps = career_coach_ai.generate_learning_path(analysis, 'interview_prep', '골격 병합 테스트', 'Kotlin, Android', 6)
+
+        schema = mock_create.call_args.kwargs['response_format']['json_schema']['schema']
+        self.assertEqual(set(schema['properties']['phases']['items']['required']), {'projects', 'personal_advice'})
+        skeleton = roadmap_library.select('interview_prep', analysis.career_level, 6, 'Kotlin, Android')
+        self.assertEqual(skeleton.key.family, 'mobile')
+        self.assertEqual([step['phase'] for step in steps], [phase['phase'] for phase in skeleton.phases])
+        self.assertEqual([step['duration_weeks'] for step in steps], [8, 12, 4])
+        self.assertEqual(steps[2]['resources'], skeleton.phases[2]['resources'])
+        self.assertEqual(steps[2]['personal_advice'], '맞춤 조언 2')
+
+    def test_short_personalization_keeps_every_phase(self):
+        """개인화 항목이 골격보다 적어도 모든 단계를 유지하고 없는 단계는 골격 기본값"""
+        skeleton = roadmap_library.select('interview_prep', '주니어 (1년차)', 6, 'Kotlin, Android')
+        phases = roadmap_library.phases(skeleton, 6)
+        steps = merge_personalization(phases, [{'projects': ['맞춤 프로젝트'], 'personal_advice': '맞춤 조언'}])
+
+        self.assertEqual([step['phase'] for step in steps], [phase['phase'] for phase in phases])
+        self.assertEqual(steps[0]['personal_advice'], '맞춤 조언')
+        self.assertEqual(steps[1:], phases[1:])
+
+
+class SkillNormalizerTestCase(TestCase):
+    """스킬 사전 기반 정규화 테스트"""
+
+    def setUp(self):
+        analysis_cache.memory.clear()
+
+    def test_aliases_boundaries_and_longest_match(self):
+        """한/영 별칭·표기 변형은 같은 ID, 단어 내부 부분 일치는 무시, 겹치면 가장 긴 별칭"""
+        self.assertEqual(skill_normalizer.normalize('Java, Spring Boot, MySQL'), ['java', 'mysql', 'spring-boot'])
+        self.assertEqual(skill_normalizer.normalize('자바 / 스프링부트 / mysql'), ['java', 'mysql', 'spring-boot'])
+        self.assertEqual(skill_normalizer.normalize('Django, Node.js'), ['django', 'nodejs'])
+        self.assertEqual(skill_normalizer.normalize('golang, JS'), ['go', 'javascript'])
+        self.assertEqual(
+            skill_normalizer.fingerprint('Java, Spring Boot, 사내 DSL'),
+            skill_normalizer.fingerprint('사내 dsl / springboot / 자바'),
+        )
+        self.assertNotEqual(skill_normalizer.fingerprint('Java, 사내 DSL'), skill_normalizer.fingerprint('Java'))
+        self.assertEqual(skill_normalizer.family(skill_normalizer.normalize('Kotlin, Android')), 'mobile')
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_profile_stores_skill_ids_and_shares_cache_across_aliases(self, mock_create):
+        """프로필 생성 시 skill_ids 저장, 별칭만 다른 재제출은 분석 캐시 적중"""
+        mock_create.return_value = fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False))
+        payload = {
+            'career_summary': '스킬 정규화 테스트 - 결제 시스템 백엔드 4년',
+            'job_role': '백엔드 개발',
+            'technical_skills': 'Java, Spring Boot, MySQL',
+            'experience_years': 4
+        }
+        first = self.client.post('/api/profiles', data=payload, content_type='application/json')
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(first.json()['skill_ids'], ['java', 'mysql', 'spring-boot'])
+        self.assertEqual(ResumeProfile.objects.get(id=first.json()['id']).skill_ids, ['java', 'mysql', 'spring-boot'])
+        self.assertEqual(ProfileSkill.objects.filter(profile_id=first.json()['id']).count(), 3)
+
+        payload['technical_skills'] = 'mysql, 스프링부트, 자바'
+        second = self.client.post('/api/profiles', data=payload, content_type='application/json')
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.json()['skill_ids'], ['java', 'mysql', 'spring-boot'])
+        mock_create.assert_awaited_once()
+
+
+class ProfileSkillIndexTestCase(TestCase):
+    """스킬 연결 테이블 + 스킬별 프로필 목록 테스트"""
+
+    def _profile(self, technical_skills, link=True):
+        profile = ResumeProfile.objects.create(
+            career_summary='스킬 인덱스 테스트 프로필입니다', job_role='플랫폼 엔지니어',
+            technical_skills=technical_skills, skill_ids=skill_normalizer.normalize(technical_skills),
+            analysis_status='completed'
+        )
+        if link:
+            link_profile_skills([profile])
+        return profile
+
+    def test_skill_intersection_with_keyset_pagination(self):
+        """여러 스킬은 교집합, 별칭도 허용, 커서로 중복/누락 없이 최신순 페이지 이동"""
+        both = [self._profile('Go, Kubernetes, Redis') for _ in range(3)]
+        self._profile('Go, Docker')
+        self._profile('k8s, Python')
+
+        pages, cursor = [], None
+        while True:
+            response = self.client.get('/api/profiles', {'skill': ['쿠버네티스', 'golang'], 'limit': 2,
+                                                         **({'cursor': cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['skill_ids'], ['go', 'kubernetes'])
+            pages.append([item['id'] for item in response.json()['items']])
+            cursor = response.json()['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual([len(page) for page in pages], [2, 1])
+        expected = sorted(both, key=lambda p: (p.created_at, p.id), reverse=True)
+        self.assertEqual(sum(pages, []), [str(p.id) for p in expected])
+
+        self.assertEqual(self.client.get('/api/profiles', {'skill': 'cobol-xyz'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/profiles', {'cursor': 'not-a-cursor'}).status_code, 400)
+
+    def test_backfill_command_links_existing_profiles(self):
+        """연결이 없던 기존 프로필을 청크 단위로 채우고, 재실행해도 중복 연결 없음"""
+        profiles = [self._profile('Java, Spring Boot', link=False) for _ in range(5)]
+        stale = self._profile('Docker', link=False)
+        ResumeProfile.objects.filter(id=stale.id).update(technical_skills='Docker, Kubernetes')
+
+        out = StringIO()
+        call_command('backfill_profile_skills', '--chunk-size', '2', stdout=out)
+        call_command('backfill_profile_skills', '--chunk-size', '2', '--renormalize', stdout=out)
+        self.assertEqual(ProfileSkill.objects.filter(profile__in=profiles).count(), 10)
+        self.assertEqual(
+            sorted(ProfileSkill.objects.filter(profile=stale).values_list('skill_id', flat=True)),
+            ['docker', 'kubernetes']
+        )
+        self.assertIn('재정규화 1건', out.getvalue())
+
+
+class SearchTestCase(TestCase):
+    """FTS5 전문 검색 테스트"""
+
+    def setUp(self):
+        self.profile = ResumeProfile.objects.create(
+            career_summary='레거시 모놀리스를 MSA로 전환하고 결제 도메인 마이그레이션을 주도한 백엔드 개발자',
+            job_role='백엔드 개발', technical_skills='Java, Kafka', analysis_status='completed'
+        )
+        self.session = InterviewSession.objects.create(profile=self.profile, questions=[
+            {**SAMPLE_QUESTIONS[0], 'question': 'MSA 전환 과정에서 데이터 정합성을 어떻게 <보장>하셨나요?'},
+            *SAMPLE_QUESTIONS[1:]
+        ])
+        self.path = LearningPath.objects.create(profile=self.profile, learning_roadmap=[
+            {**SAMPLE_STEPS[0], 'objectives': ['쿠버네티스 기반 배포 자동화']}, *SAMPLE_STEPS[1:]
+        ])
+
+    def _search(self, **params):
+        response = self.client.get('/api/search', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['hits']
+
+    def test_signals_keep_index_in_sync_and_return_snippets(self):
+        """저장/삭제가 색인에 반영되고, 한글 부분 문자열로 검색, 일치 구간 하이라이트"""
+        hits = self._search(q='MSA 전환')
+        self.assertEqual({hit['doc_type'] for hit in hits}, {'profile', 'interview_session'})
+        session_hit = next(hit for hit in hits if hit['doc_type'] == 'interview_session')
+        self.assertEqual(session_hit['id'], str(self.session.id))
+        self.assertEqual(session_hit['profile_id'], str(self.profile.id))
+        self.assertIn('<mark>MSA</mark> <mark>전환</mark>', session_hit['snippet'])
+        self.assertIn('&lt;보장&gt;', session_hit['snippet'])
+
+        # 조사가 붙은 원문("마이그레이션을")도 바이그램 구 질의로 일치
+        self.assertEqual([hit['id'] for hit in self._search(q='마이그레이션')], [str(self.profile.id)])
+        self.assertEqual([hit['id'] for hit in self._search(q='쿠버네티스', type='learning_path')], [str(self.path.id)])
+        self.assertEqual(self._search(q='MSA 쿠버네티스'), [])
+
+        self.session.delete()
+        self.assertEqual({hit['doc_type'] for hit in self._search(q='MSA 전환')}, {'profile'})
+        self.assertEqual(self.client.get('/api/search', {'q': 'MSA', 'type': 'resume'}).status_code, 400)
+
+    def test_rebuild_command_restores_index(self):
+        """색인을 잃어도 rebuild_search_index로 전체 재구성"""
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        self.assertEqual(self._search(q='데이터 정합성'), [])
+
+        out = StringIO()
+        call_command('rebuild_search_index', '--chunk-size', '1', stdout=out)
+        self.assertIn('interview_session: 1건 색인', out.getvalue())
+        self.assertEqual([hit['id'] for hit in self._search(q='데이터 정합성')], [str(self.session.id)])
+
+
+class ProfileHistoryListingTestCase(TestCase):
+    """프로필별 면접 세션/학습 경로 목록 테스트"""
+
+    def setUp(self):
+        self.profile = ResumeProfile.objects.create(
+            career_summary='목록 조회 테스트 프로필입니다', job_role='백엔드 개발',
+            technical_skills='Python', analysis_status='completed'
+        )
+        self.sessions = [
+            InterviewSession.objects.create(profile=self.profile, questions=SAMPLE_QUESTIONS,
+                                            generation_metadata={'model': 'gpt-4o-mini'})
+            for _ in range(5)
+        ]
+        self.paths = [LearningPath.objects.create(profile=self.profile, learning_roadmap=SAMPLE_STEPS)]
+        # 다른 프로필의 세션은 목록에 섞이지 않아야 함
+        other = ResumeProfile.objects.create(career_summary='다른 프로필입니다 (목록 제외)', job_role='-', technical_skills='-')
+        InterviewSession.objects.create(profile=other, questions=SAMPLE_QUESTIONS)
+
+    def test_sessions_keyset_pages_without_heavy_fields(self):
+        """기본 목록은 질문 JSON을 조회하지 않고, 커서로 전체 세션을 최신순으로 순회"""
+        url = f'/api/profiles/{self.profile.id}/interview-sessions'
+        seen, cursor = [], None
+        while True:
+            with self.assertNumQueries(2):
+                response = self.client.get(url, {'limit': 2, **({'cursor': cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            for item in response.json()['items']:
+                self.assertIsNone(item['questions'])
+                self.assertIsNone(item['question_count'])
+            seen.extend(item['id'] for item in response.json()['items'])
+            cursor = response.json()['next_cursor']
+            if cursor is None:
+                break
+        expected = sorted(self.sessions, key=lambda s: (s.created_at, s.id), reverse=True)
+        self.assertEqual(seen, [str(s.id) for s in expected])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url, {'limit': 2})
+        self.assertNotIn('"questions"', queries.captured_queries[-1]['sql'])
+
+        self.assertEqual(self.client.get(url, {'expand': 'answers'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/profiles/not-a-uuid/interview-sessions').status_code, 404)
+
+    def test_expand_and_summary_projection(self):
+        """expand로 대용량 필드 포함, summary는 개수/첫 항목을 SQL로 계산"""
+        response = self.client.get(f'/api/profiles/{self.profile.id}/interview-sessions',
+                                   {'limit': 1, 'expand': 'questions,generation_metadata', 'summary': 'true'})
+        item = response.json()['items'][0]
+        self.assertEqual(len(item['questions']), 5)
+        self.assertEqual(item['generation_metadata'], {'model': 'gpt-4o-mini'})
+        self.assertEqual((item['question_count'], item['first_question']), (5, '질문 0'))
+
+        response = self.client.get(f'/api/profiles/{self.profile.id}/learning-paths', {'summary': 'true'})
+        self.assertEqual(response.status_code, 200)
+        item = response.json()['items'][0]
+        self.assertEqual((item['phase_count'], item['first_phase'], item['learning_roadmap']), (3, '1단계', None))
+        self.assertIsNone(response.json()['next_cursor'])
+
+
+class QueryPlanTestCase(TestCase):
+    """
+    핫 쿼리 실행 계획 회귀 테스트
+    - 엔드포인트 요청 중 실행된 SELECT마다 EXPLAIN QUERY PLAN 실행
+    - 테이블 전체 스캔(SCAN <table>, 인덱스 없이)이나 정렬용 임시 B-tree가 나오면 실패
+    """
+
+    def setUp(self):
+        self.profile = ResumeProfile.objects.create(
+            career_summary='실행 계획 테스트 - MSA 전환 경험', job_role='플랫폼 개발',
+            technical_skills='Go, Kubernetes', skill_ids=['go', 'kubernetes'], analysis_status='completed'
+        )
+        ResumeProfile.objects.create(career_summary='실행 계획 테스트 - 두 번째 프로필', job_role='플랫폼 개발',
+                                     technical_skills='Go', skill_ids=['go'])
+        link_profile_skills(ResumeProfile.objects.all())
+        for _ in range(2):
+            InterviewSession.objects.create(profile=self.profile, questions=SAMPLE_QUESTIONS)
+            LearningPath.objects.create(profile=self.profile, learning_roadmap=SAMPLE_STEPS)
+        self.job = GenerationJob.objects.create(kind='profile_analysis', profile=self.profile, run_after=timezone.now())
+        self.batch = AnalysisBatch.objects.create(source_name='plan.jsonl')
+
+    def _query_plans(self, path, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params or {})
+        self.assertEqual(response.status_code, 200, path)
+        plans = []
+        for query in queries.captured_queries:
+            if not query['sql'].lstrip().upper().startswith('SELECT'):
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute('EXPLAIN QUERY PLAN ' + query['sql'])
+                plans.append((query['sql'], [row[3] for row in cursor.fetchall()]))
+        return response.json(), plans
+
+    def assertIndexedPlans(self, path, params=None, allow_sort=False):
+        """요청의 모든 SELECT가 인덱스를 사용하는지 확인, 다음 페이지가 있으면 커서 조회도 검사"""
+        data, plans = self._query_plans(path, params)
+        self.assertTrue(plans, path)
+        for sql, plan in plans:
+            for line in plan:
+                full_scan = line.startswith('SCAN ') and 'USING' not in line and 'VIRTUAL TABLE' not in line
+                self.assertFalse(full_scan, f"{path}: 전체 스캔 {line}\n{sql}")
+                if not allow_sort:
+                    self.assertNotIn('TEMP B-TREE', line, f"{path}: 정렬용 임시 B-tree\n{sql}")
+        cursor = data.get('next_cursor') if isinstance(data, dict) else None
+        if cursor:
+            self.assertIndexedPlans(path, {**(params or {}), 'cursor': cursor}, allow_sort)
+
+    def test_listing_endpoints_use_keyset_indexes(self):
+        """목록 API는 (…, created_at, id) 인덱스 순서대로 읽음 (정렬/스캔 없음)"""
+        profile_url = f'/api/profiles/{self.profile.id}'
+        self.assertIndexedPlans('/api/profiles', {'limit': 1})
+        self.assertIndexedPlans('/api/profiles', {'job_role': '플랫폼 개발', 'limit': 1})
+        self.assertIndexedPlans(f'{profile_url}/interview-sessions', {'limit': 1})
+        self.assertIndexedPlans(f'{profile_url}/interview-sessions', {'limit': 1, 'summary': 'true', 'expand': 'questions'})
+        self.assertIndexedPlans(f'{profile_url}/learning-paths', {'limit': 1})
+        # 스킬 교집합은 연결 테이블 인덱스로 후보를 찾은 뒤 후보만 정렬
+        self.assertIndexedPlans('/api/profiles', {'skill': ['go', 'kubernetes'], 'limit': 1}, allow_sort=True)
+
+    def test_lookup_endpoints_use_indexes(self):
+        """단건 조회/검색/집계 API"""
+        self.assertIndexedPlans(f'/api/profiles/{self.profile.id}')
+        self.assertIndexedPlans(f'/api/jobs/{self.job.id}')
+        self.assertIndexedPlans(f'/api/profile-batches/{self.batch.id}')
+        self.assertIndexedPlans('/api/usage')
+        self.assertIndexedPlans('/api/search', {'q': 'MSA 전환', 'profile_id': str(self.profile.id)}, allow_sort=True)
+
+
+class JsonStreamTestCase(SimpleTestCase):
+    """증분 JSON 파서 테스트 (녹화된 완성 응답 기반)"""
+
+    def test_fuzz_random_chunking_and_truncation(self):
+        """임의 청크 분할/임의 지점 절단에도 완성된 원소만, 순서대로 반환"""
+        rng = random.Random(20241017)
+        for record in load_recorded_completions():
+            content, key = record['content'], record['key']
+            expected, closed = parse_array(content, key)
+            self.assertEqual(closed, record['finish_reason'] != 'length', record['name'])
+
+            for _ in range(50):
+                cut = rng.randint(0, len(content))
+                parser, items, pos = IncrementalArrayParser(key), [], 0
+                while pos < cut:
+                    step = rng.randint(1, 40)
+                    items.extend(parser.feed(content[pos:min(pos + step, cut)]))
+                    pos += step
+                # 잘린 응답 = 항상 전체 결과의 접두사, 파싱 오류 없음
+                self.assertEqual(items, expected[:len(items)], record['name'])
+                self.assertEqual(parser.errors, 0)
+                if cut == len(content):
+                    self.assertEqual(items, expected)
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_truncated_completion_keeps_finished_elements(self, mock_create):
+        """finish_reason == length 응답은 미완성 단계만 버리고 기본값 대체 없이 반환"""
+        record = next(r for r in load_recorded_completions() if r['finish_reason'] == 'length')
+        response = fake_completion(record['content'])
+        response.choices[0].finish_reason = 'length'
+        mock_create.return_value = response
+
+        steps = career_coach_ai.generate_learning_path(
+            CareerAnalysis(**SAMPLE_ANALYSIS), 'skill_enhancement', '경력', 'Java, Spring', 3
+        )
+        recorded, _ = parse_array(record['content'], record['key'])
+        skeleton = roadmap_library.select('skill_enhancement', SAMPLE_ANALYSIS['career_level'], 3, 'Java, Spring')
+        # 잘리기 전에 완성된 단계만 개인화, 나머지 단계는 골격 기본값
+        self.assertEqual([step['projects'] for step in steps],
+                         [recorded[0]['projects'], recorded[1]['projects'], skeleton.phases[2]['projects']])
+        self.assertGreaterEqual(output_stats.stats()['learning_path']['repaired'], 1)
+
+
+
+class ModelRoutingTestCase(TestCase):
+    """모델 라우팅/캐스케이드 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+        self.tiers = dict(settings.LLM_MODEL_TIERS)
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_short_junior_profile_starts_light_and_escalates_on_invalid_output(self, mock_create):
+        """짧은 주니어 입력은 light 모델로 시작, 스키마 불일치 시에만 standard로 재시도"""
+        mock_create.side_effect = [
+            fake_completion('{"career_level": "신입"}'),
+            fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False)),
+        ]
+        begin_generation()
+        analysis = career_coach_ai.analyze_resume_profile('부트캠프 수료, 팀 프로젝트 2회', '백엔드 개발', 'Python', 1)
+        metadata = career_coach_ai.get_generation_metadata('resume_analysis', 0)
+
+        self.assertEqual(analysis.career_level, SAMPLE_ANALYSIS['career_level'])
+        self.assertEqual([c.kwargs['model'] for c in mock_create.call_args_list],
+                         [self.tiers['light'], self.tiers['standard']])
+        self.assertEqual(metadata['model_used'], self.tiers['standard'])
+        self.assertEqual([(r['tier'], r['outcome']) for r in metadata['routing']],
+                         [('light', 'invalid_output'), ('standard', 'ok')])
+        self.assertEqual(metadata['routing'][1]['reason'], 'cascade:invalid_output')
+        self.assertFalse(metadata['degraded'])
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_cache_hit_reports_producing_model(self, mock_create):
+        """분석 캐시 적중 시 기본 모델이 아니라 캐시된 결과를 만든 모델을 보고"""
+        mock_create.return_value = fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False))
+        args = ('부트캠프 수료, 캐시 모델 보고 테스트', '백엔드 개발', 'Python', 1)
+        for _ in range(2):
+            begin_generation()
+            career_coach_ai.analyze_resume_profile(*args)
+            metadata = career_coach_ai.get_analysis_metadata(0)
+            self.assertEqual(metadata['model_used'], self.tiers['light'])
+
+        self.assertEqual(mock_create.call_count, 1)
+        self.assertEqual(metadata['cache']['status'], 'memory')
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_failed_escalation_keeps_validated_result(self, mock_create):
+        """품질 미달 결과는 상위 모델로 재시도하되, 재시도가 실패하면 앞선 결과와 그 모델을 보고"""
+        few = fake_completion(json.dumps({"questions": SAMPLE_QUESTIONS[:3]}, ensure_ascii=False))
+        mock_create.side_effect = [few, openai.BadRequestError(
+            "bad request", response=SimpleNamespace(status_code=400, headers={}, request=None), body=None
+        )]
+        begin_generation()
+        questions = career_coach_ai.generate_interview_questions(
+            CareerAnalysis(**SAMPLE_ANALYSIS), 'startup', 'mid', '경력', 'Java, Spring'
+        )
+        metadata = career_coach_ai.get_generation_metadata('interview_questions', 0)
+
+        self.assertEqual(questions, SAMPLE_QUESTIONS[:3])
+        self.assertEqual(metadata['model_used'], self.tiers['standard'])
+        self.assertEqual([(r['tier'], r['outcome']) for r in metadata['routing']],
+                         [('standard', 'too_few_items'), ('strong', 'error')])
+        self.assertGreaterEqual(model_router.stats()['escalations']['interview_questions'], 1)
+
+class UsageTestCase(TestCase):
+    """토큰 사용량/비용 메타데이터 + 일자별 집계 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+        self.tiers = dict(settings.LLM_MODEL_TIERS)
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_cascade_attempts_are_costed_and_rolled_up(self, mock_create):
+        """실패한 light 시도까지 비용에 포함, 집계 행은 증분 갱신되고 /usage에서 합산"""
+        mock_create.side_effect = [
+            fake_completion('{"career_level": "신입"}', usage=(1000, 100, 0)),
+            fake_completion(json.dumps(SAMPLE_ANALYSIS, ensure_ascii=False), usage=(2000, 300, 1024)),
+        ] * 2
+        for projects in (2, 3):
+            begin_generation()
+            career_coach_ai.analyze_resume_profile(f'국비 과정 수료, 사이드 프로젝트 {projects}개', '백엔드 개발', 'Python', 1)
+            metadata = career_coach_ai.get_analysis_metadata(0)
+            record_usage_rollup('resume_analysis', [metadata])
+
+        light, standard = (settings.LLM_MODEL_PRICES[self.tiers[t]] for t in ('light', 'standard'))
+        light_cost = (1000 * light['input'] + 100 * light['output']) / 1e6
+        standard_cost = (976 * standard['input'] + 1024 * standard['cached_input'] + 300 * standard['output']) / 1e6
+        usage = metadata['usage']
+        self.assertEqual((usage['calls'], usage['prompt_tokens'], usage['cached_tokens']), (2, 3000, 1024))
+        self.assertAlmostEqual(usage['cost_usd'], light_cost + standard_cost, places=8)
+        self.assertAlmostEqual(metadata['routing'][0]['cost_usd'], light_cost, places=8)
+
+        rows = {row.model: row for row in UsageRollup.objects.filter(stage='resume_analysis')}
+        self.assertEqual((rows[self.tiers['light']].requests, rows[self.tiers['light']].calls), (0, 2))
+        self.assertEqual((rows[self.tiers['standard']].requests, rows[self.tiers['standard']].calls), (2, 2))
+
+        report = self.client.get('/api/usage', {'group_by': 'stage'}).json()
+        self.assertEqual(report['rows'], [{**report['totals'], 'day': None, 'stage': 'resume_analysis', 'model': None}])
+        self.assertEqual((report['totals']['requests'], report['totals']['calls']), (2, 4))
+        self.assertAlmostEqual(report['totals']['cost_per_request_usd'], light_cost + standard_cost, places=7)
+
+    def test_batch_price_and_snapshot_model_names(self):
+        """스냅샷 이름은 가장 긴 접두사 단가로, Batch API는 할인 단가로 계산"""
+        tokens = {'prompt_tokens': 1_000_000, 'completion_tokens': 0, 'cached_tokens': 0}
+        mini = settings.LLM_MODEL_PRICES['gpt-4o-mini']['input']
+        self.assertAlmostEqual(usage_cost('gpt-4o-mini-2024-07-18', tokens), mini)
+        self.assertAlmostEqual(usage_cost('gpt-4o-mini', tokens, batch=True), mini * settings.LLM_BATCH_PRICE_RATIO)
+        self.assertIsNone(usage_cost('unknown-model', tokens))
+        self.assertEqual(self.client.get('/api/usage', {'group_by': 'tier'}).status_code, 400)
+
+
+class MetricsTestCase(TestCase):
+    """Prometheus 메트릭 (/api/metrics) 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+        analysis_cache.memory.clear()
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_endpoint_stages_and_upstream_status_are_exposed(self, mock_create):
+        """엔드포인트 × 단계 히스토그램, 업스트림 상태 코드, 기본값 대체가 노출"""
+        mock_create.side_effect = upstream_error(400)
+        response = self.client.post('/api/profiles', data={
+            'career_summary': '메트릭 테스트용 6년차 데이터 엔지니어',
+            'job_role': '데이터 파이프라인 개발',
+            'technical_skills': 'Spark, Airflow',
+            'experience_years': 6
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+
+        body = self.client.get('/api/metrics').content.decode()
+        for stage in ('db', 'prompt_render', 'upstream', 'llm', 'serialize'):
+            self.assertIn(f'career_coach_stage_duration_seconds_count{{endpoint="api/profiles",stage="{stage}"}}', body)
+        self.assertIn(f'career_coach_llm_requests_total{{model="{career_coach_ai.model}",status="400"}}', body)
+        self.assertIn('career_coach_llm_fallbacks_total{stage="resume_analysis",reason="upstream_error"}', body)
+        self.assertIn('career_coach_http_requests_total{endpoint="api/profiles",method="POST",status="201"}', body)
+
+    def test_snapshots_from_other_processes_are_summed(self):
+        """다른 워커의 카운터는 합산, 종료된 워커의 게이지는 제외"""
+        exited = subprocess.Popen(['true'])
+        exited.wait()
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_MULTIPROC_DIR=directory):
+            before = metrics_registry.collect()['career_coach_llm_fallbacks_total'].get(('learning_path', 'test'), 0)
+            for pid in (os.getppid(), exited.pid):
+                with open(os.path.join(directory, f'{pid}.json'), 'w') as f:
+                    json.dump({'pid': pid, 'metrics': {
+                        'career_coach_llm_fallbacks_total': [[['learning_path', 'test'], 2.0]],
+                        'career_coach_llm_inflight_requests': [[['gpt-test'], 3.0]],
+                    }}, f)
+            merged = metrics_registry.collect()
+
+        self.assertEqual(merged['career_coach_llm_fallbacks_total'][('learning_path', 'test')], before + 4)
+        self.assertEqual(merged['career_coach_llm_inflight_requests'][('gpt-test',)], 3.0)
+
+
+class TracingTestCase(TestCase):
+    """요청 트레이싱 (X-Trace-Id, span 트리) 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+        analysis_cache.memory.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'traces.jsonl')
+        exporters = {'file': {'BACKEND': 'chatbot.tracing.FileSpanExporter', 'OPTIONS': {'path': self.path}}}
+        overrides = override_settings(TRACING_EXPORTER='file', TRACING_EXPORTERS=exporters, TRACING_SAMPLE_RATE=1.0)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+    def spans(self, trace_id):
+        tracer.flush()
+        with open(self.path, encoding='utf-8') as f:
+            return [span for span in map(json.loads, f) if span['trace_id'] == trace_id]
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    def test_request_spans_form_a_tree_under_the_trace_id(self, mock_create):
+        """루트 span 아래에 db/prompt_render/upstream(llm_attempt)/serialize 단계 span이 기록"""
+        mock_create.side_effect = upstream_error(400)
+        response = self.client.post('/api/profiles', data={
+            'career_summary': '트레이싱 테스트용 3년차 안드로이드 개발자',
+            'job_role': '모바일 앱 개발',
+            'technical_skills': 'Kotlin, Jetpack Compose',
+            'experience_years': 3
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        trace_id = response['X-Trace-Id']
+        profile = ResumeProfile.objects.get(id=response.json()['id'])
+        self.assertEqual(profile.analysis_result['analysis_metadata']['trace_id'], trace_id)
+
+        spans = self.spans(trace_id)
+        by_id = {span['span_id']: span for span in spans}
+        root = next(span for span in spans if span['parent_span_id'] is None)
+        self.assertEqual(root['name'], 'POST api/profiles')
+        self.assertEqual(root['attributes']['http.status_code'], 201)
+        names = {span['name'] for span in spans}
+        self.assertTrue({'db', 'llm', 'prompt_render', 'upstream', 'llm_attempt', 'serialize'} <= names)
+        attempt = next(span for span in spans if span['name'] == 'llm_attempt')
+        self.assertEqual(attempt['attributes']['llm.status'], '400')
+        self.assertEqual(by_id[attempt['parent_span_id']]['name'], 'upstream')
+        for span in spans:
+            if span is not root:
+                self.assertIn(span['parent_span_id'], by_id)
+
+    def test_incoming_traceparent_is_continued(self):
+        """traceparent 헤더의 trace id/부모 span을 이어서 기록"""
+        trace_id, parent_id = 'ab' * 16, 'cd' * 8
+        response = self.client.get('/api/health', HTTP_TRACEPARENT=f'00-{trace_id}-{parent_id}-01')
+        self.assertEqual(response['X-Trace-Id'], trace_id)
+        [root] = self.spans(trace_id)
+        self.assertEqual(root['parent_span_id'], parent_id)
+
+
+class StructuredLoggingTestCase(SimpleTestCase):
+    """구조화 로깅 (원시 응답 샘플링, 마스킹, 큐 핸들러) 테스트"""
+
+    @override_settings(LOG_COMPLETION_SAMPLE_RATE=0.0)
+    def test_raw_completion_logged_only_on_parse_failure_when_not_sampled(self):
+        """샘플링 비율 0이어도 파싱 실패 응답은 기록, 성공 응답은 생략"""
+        valid = json.dumps({
+            'career_level': '주니어', 'strength_areas': ['Python'], 'improvement_areas': ['설계'],
+            'career_pattern': '성장형', 'market_competitiveness': 6,
+            'personality_traits': ['꼼꼼함'], 'growth_trajectory': '백엔드 리드'
+        }, ensure_ascii=False)
+        with self.assertLogs('chatbot.completions', level='INFO') as logs:
+            career_coach_ai._validate_output('resume_analysis', ResumeAnalysisResult, SimpleNamespace(content=valid))
+            with self.assertRaises(Exception):
+                career_coach_ai._validate_output('resume_analysis', ResumeAnalysisResult,
+                                                 SimpleNamespace(content='{"career_level": "주니어"'))
+
+        [record] = logs.records
+        self.assertTrue(record.parse_failed)
+        self.assertEqual(record.completion, '{"career_level": "주니어"')
+        self.assertEqual(record.levelname, 'WARNING')
+
+    def test_queue_handler_writes_redacted_json_with_trace_id(self):
+        """이력서 원문 필드/연락처는 마스킹되어 JSON 1줄로 기록되고 trace id가 첨부"""
+        stream = StringIO()
+        handler = QueueJsonHandler(stream=stream)
+        handler.setFormatter(JsonFormatter())
+        handler.addFilter(TraceContextFilter())
+        logger = logging.getLogger('chatbot.tests.structured')
+        logger.addHandler(handler)
+        self.addCleanup(handler.close)
+        self.addCleanup(logger.removeHandler, handler)
+
+        summary = '5년차 백엔드 개발자, 결제 시스템 담당'
+        with override_settings(TRACING_EXPORTER=''), trace('test') as root:
+            logger.warning('연락처 dev@example.com / 010-1234-5678', extra={
+                'career_summary': summary, 'stage': 'resume_analysis'
+            })
+        handler.flush()
+
+        [line] = stream.getvalue().splitlines()
+        record = json.loads(line)
+        self.assertEqual(record['message'], '연락처 [email] / [phone]')
+        self.assertTrue(record['career_summary'].startswith(f'[redacted {len(summary)} chars sha256:'))
+        self.assertNotIn('결제', line)
+        self.assertEqual(record['stage'], 'resume_analysis')
+        self.assertEqual(record['trace_id'], root.trace_id)
+
+
+def upstream_error(status_code):
+    """OpenAI SDK가 던지는 HTTP 상태 오류 (429/5xx 등)"""
+    response = SimpleNamespace(status_code=status_code, headers={}, request=None)
+    return openai.APIStatusError(f"status {status_code}", response=response, body=None)
+
+
+@override_settings(LLM_RETRY_BASE_DELAY_SECONDS=0, LLM_RETRY_MAX_DELAY_SECONDS=0)
+class ResilienceTestCase(TestCase):
+    """재시도/서킷 브레이커/degraded 표시 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+
+    def tearDown(self):
+        llm_breaker.reset()
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_retries_transient_errors_with_per_call_timeout(self, mock_create):
+        """429/503은 재시도 후 성공, 각 시도에 timeout 전달"""
+        mock_create.side_effect = [
+            upstream_error(429), upstream_error(503),
+            fake_completion(json.dumps({"questions": SAMPLE_QUESTIONS}, ensure_ascii=False))
+        ]
+        begin_generation()
+        questions = await async_career_coach_ai.generate_interview_questions(
+            CareerAnalysis(**SAMPLE_ANALYSIS), 'startup', 'mid', '재시도 테스트', 'Java'
+        )
+        metadata = async_career_coach_ai.get_generation_metadata('interview_questions', 0)
+
+        self.assertEqual(questions, SAMPLE_QUESTIONS)
+        self.assertEqual(mock_create.await_count, 3)
+        self.assertLessEqual(mock_create.await_args.kwargs['timeout'], 15)
+        self.assertFalse(metadata['degraded'])
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_open_circuit_serves_fallback_without_calling_upstream(self, mock_create):
+        """연속 실패로 서킷이 열리면 LLM 호출 없이 기본값 + degraded 표시"""
+        mock_create.side_effect = upstream_error(500)
+        analysis = CareerAnalysis(**SAMPLE_ANALYSIS)
+        with patch.object(llm_breaker, 'failure_threshold', 3):
+            career_coach_ai.generate_learning_path(analysis, 'promotion', '서킷 테스트', 'Go', 3)
+            self.assertEqual(llm_breaker.state, 'open')
+            calls = mock_create.call_count
+
+            begin_generation()
+            steps = career_coach_ai.generate_learning_path(analysis, 'promotion', '서킷 테스트', 'Go', 3)
+            metadata = career_coach_ai.get_generation_metadata('learning_path', 0)
+
+        self.assertEqual(mock_create.call_count, calls)
+        self.assertEqual(len(steps), 3)
+        self.assertTrue(metadata['degraded'])
+        self.assertEqual(metadata['degraded_stages'], {'learning_path': 'circuit_open'})
+        self.assertGreaterEqual(llm_caller.stats()['circuit_breaker']['short_circuited'], 1)
+
+    @override_settings(LLM_MAX_RETRIES=0)
+    def test_client_error_leaves_breaker_state_untouched(self):
+        """4xx는 연속 실패 수를 지우지 않고, half-open 시험 호출이면 슬롯만 반납 (서킷을 닫지 않음)"""
+        def fail(status_code):
+            def call(timeout):
+                raise upstream_error(status_code)
+            return call
+
+        with patch.object(llm_breaker, 'failure_threshold', 2), patch.object(llm_breaker, 'reset_seconds', 0):
+            with self.assertRaises(openai.APIStatusError):
+                llm_caller.call(fail(500))
+            with self.assertRaises(openai.APIStatusError):
+                llm_caller.call(fail(400))
+            self.assertEqual((llm_breaker.state, llm_breaker.failures), ('closed', 1))
+
+            with self.assertRaises(openai.APIStatusError):
+                llm_caller.call(fail(503))
+            self.assertEqual(llm_breaker.state, 'half_open')
+            with self.assertRaises(openai.APIStatusError):
+                llm_caller.call(fail(400))
+            self.assertEqual((llm_breaker.state, llm_breaker.failures), ('half_open', 2))
+            # 반납된 슬롯으로 다음 시험 호출 가능
+            self.assertEqual(llm_caller.call(lambda timeout: 'ok'), 'ok')
+            self.assertEqual((llm_breaker.state, llm_breaker.failures), ('closed', 0))
+
+    @override_settings(LLM_MAX_RETRIES=0)
+    def test_caller_deadline_is_not_a_breaker_failure(self):
+        """호출부 마감 시간 초과는 브레이커 실패가 아니고, 업스트림/SDK 타임아웃만 실패로 집계"""
+        def fail(error):
+            def call(timeout):
+                raise error
+            return call
+
+        with self.assertRaises(DeadlineExceededError):
+            llm_caller.call(fail(DeadlineExceededError("마감")))
+        with self.assertRaises(TimeoutError):
+            llm_caller.call(fail(TimeoutError()), deadline=time.monotonic() + 0.5)
+        self.assertEqual(llm_breaker.failures, 0)
+
+        with self.assertRaises(TimeoutError):
+            llm_caller.call(fail(TimeoutError()))
+        self.assertEqual(llm_breaker.failures, 1)
+
+
+class DeadlineTestCase(TestCase):
+    """요청 마감 시간 전달 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+        self.profile = ResumeProfile.objects.create(
+            career_summary='3년차 백엔드 개발자, Spring Boot 기반 커머스 서비스 개발',
+            job_role='Spring Boot 백엔드 개발',
+            technical_skills='Java, Spring Boot, MySQL',
+            experience_years=3,
+            analysis_result=SAMPLE_ANALYSIS
+        )
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_header_budget_caps_upstream_timeout_and_max_tokens(self, mock_create):
+        """X-Request-Timeout에 맞춰 업스트림 timeout/max_tokens가 줄어듦"""
+        mock_create.return_value = fake_completion(json.dumps({"questions": SAMPLE_QUESTIONS}, ensure_ascii=False))
+        response = await AsyncClient().post(
+            '/api/interview-sessions',
+            data={'profile_id': str(self.profile.id), 'target_company_type': 'startup',
+                  'target_position_level': 'mid'},
+            content_type='application/json',
+            headers={'X-Request-Timeout': '15'}
+        )
+        self.assertEqual(response.status_code, 201)
+        kwargs = mock_create.await_args.kwargs
+        self.assertLessEqual(kwargs['timeout'], 13)
+        self.assertLess(kwargs['max_tokens'], 700)
+        metadata = response.json()['generation_metadata']
+        self.assertEqual(metadata['deadline']['budget_seconds'], 15)
+        self.assertFalse(metadata['degraded'])
+
+    @patch('chatbot.ai_service.async_client.chat.completions.create', new_callable=AsyncMock)
+    async def test_exhausted_budget_skips_llm_and_returns_degraded(self, mock_create):
+        """예산이 부족하면 LLM을 호출하지 않고 기본 로드맵 + degraded로 응답 (500/타임아웃 없음)"""
+        response = await AsyncClient().post(
+            '/api/learning-paths',
+            data={'profile_id': str(self.profile.id), 'target_goal': 'promotion'},
+            content_type='application/json',
+            headers={'X-Request-Timeout': '2'}
+        )
+        self.assertEqual(response.status_code, 201)
+        mock_create.assert_not_awaited()
+        metadata = response.json()['generation_metadata']
+        self.assertTrue(metadata['degraded'])
+        self.assertEqual(metadata['degraded_stages'], {'learning_path': 'deadline_exceeded'})
+        self.assertEqual(len(response.json()['learning_roadmap']), 3)
+
+
+class AnalysisBatchTestCase(TestCase):
+    """Batch API 대량 등록 테스트 (로컬 스탠드인 서버)"""
+
+    def setUp(self):
+        self.server = FakeOpenAIServer().start()
+        self.addCleanup(self.server.stop)
+        patcher = patch('chatbot.batch_service.batch_client',
+                        openai.OpenAI(api_key='sk-test', base_url=self.server.base_url, max_retries=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _jsonl(self, *summaries):
+        return "\n".join(json.dumps({
+            'career_summary': summary,
+            'job_role': 'Django 백엔드 개발',
+            'technical_skills': 'Python, Django, PostgreSQL',
+            'experience_years': 2
+        }, ensure_ascii=False) for summary in summaries)
+
+    def test_upload_poll_and_failure_accounting(self):
+        """업로드 → 폴링 → 결과 일괄 저장, 입력 오류/요청 실패는 배치별로 집계"""
+        content = "\n".join([
+            self._jsonl('부트캠프 수료, 팀 프로젝트 3회', '2년차 백엔드 개발자, 결제 API 개발'),
+            '{"career_summary": "짧음"}',
+            self._jsonl(f'{FAIL_MARKER} 요청 실패를 유도하는 이력서 요약'),
+        ])
+        response = Client().post('/api/profile-batches', {
+            'file': SimpleUploadedFile('cohort.jsonl', content.encode(), content_type='application/jsonl')
+        })
+        self.assertEqual(response.status_code, 202)
+        batch_id = response.json()['id']
+        self.assertEqual(response.json()['progress']['failed'], 1)
+        self.assertEqual(response.json()['errors'][0]['line'], 3)
+
+        statuses = [Client().get(f'/api/profile-batches/{batch_id}?refresh=true').json() for _ in range(2)]
+        self.assertEqual([s['status'] for s in statuses], ['in_progress', 'completed'])
+        self.assertEqual(statuses[-1]['progress'], {
+            'total': 4, 'completed': 2, 'failed': 2, 'pending': 0, 'progress': 1.0
+        })
+        analysed = ResumeProfile.objects.filter(batch_id=batch_id, analysis_result__isnull=False)
+        self.assertEqual(analysed.count(), 2)
+        self.assertEqual(analysed.first().analysis_result['analysis_metadata']['source'], 'batch_api')
+
+    def test_submit_command_waits_for_completion(self):
+        """관리 명령 --wait: 종료될 때까지 폴링 후 결과 저장"""
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', encoding='utf-8') as f:
+            f.write(self._jsonl('신입 개발자, 사이드 프로젝트 2개', '5년차 데이터 엔지니어, Spark 운영'))
+            f.flush()
+            out = StringIO()
+            call_command('submit_analysis_batch', f.name, '--wait', '--poll-interval', '0', stdout=out)
+
+        batch = AnalysisBatch.objects.get()
+        self.assertEqual(batch.status, 'completed')
+        self.assertEqual((batch.completed_count, batch.failed_count), (2, 0))
+        self.assertIn('completed', out.getvalue())
+
+    def test_poll_command_wait_stops_at_terminal_status(self):
+        """poll_analysis_batches --wait: 배치가 종료되면 반복을 멈추고 최신 상태 출력"""
+        batch = submit_analysis_batch(self._jsonl('6년차 게임 서버 개발자, C++').splitlines())
+        out = StringIO()
+        call_command('poll_analysis_batches', str(batch.id), '--wait', '--poll-interval', '0', stdout=out)
+
+        self.assertEqual(out.getvalue().splitlines()[-1].split()[1], 'completed:')
+        self.assertEqual(AnalysisBatch.objects.get(id=batch.id).completed_count, 1)
+
+    def test_stale_poller_does_not_ingest_twice(self):
+        """동시에 읽은 배치 인스턴스로 두 번 폴링해도 결과/집계는 한 번만 반영"""
+        batch = submit_analysis_batch(self._jsonl('3년차 iOS 개발자, Swift', '1년차 QA 엔지니어, 테스트 자동화').splitlines())
+        poll_analysis_batch(batch)  # in_progress
+        stale = AnalysisBatch.objects.get(id=batch.id)
+        poll_analysis_batch(AnalysisBatch.objects.get(id=batch.id))  # completed
+        self.assertEqual(poll_analysis_batch(stale).status, 'completed')
+
+        batch.refresh_from_db()
+        self.assertEqual((batch.completed_count, batch.failed_count), (2, 0))
+        self.assertEqual(batch.errors, [])
+
+    @override_settings(ANALYSIS_BATCH_DB_CHUNK=1)
+    def test_ingest_commits_chunks_and_resumes_after_crash(self):
+        """결과는 청크마다 커밋 - 수집 중 폴러가 죽으면 임대 만료 후 다른 폴러가 나머지만 이어서 반영"""
+        batch = submit_analysis_batch(self._jsonl('2년차 백엔드, Kotlin', '3년차 프론트엔드, Vue').splitlines())
+        poll_analysis_batch(batch)  # in_progress
+        parse = career_coach_ai._parse_analysis_response
+        calls = []
+
+        def crash_on_second(message):
+            calls.append(message)
+            if len(calls) == 2:
+                raise RuntimeError('poller killed')
+            return parse(message)
+
+        with patch('chatbot.batch_service.career_coach_ai._parse_analysis_response', side_effect=crash_on_second):
+            with self.assertRaises(RuntimeError):
+                poll_analysis_batch(batch)
+        partial = AnalysisBatch.objects.get(id=batch.id)
+        self.assertEqual((partial.status, partial.completed_count), ('in_progress', 1))
+        # 다른 폴러가 점유 중(임대 유효)이면 반영하지 않음
+        self.assertEqual(poll_analysis_batch(partial).completed_count, 1)
+
+        with override_settings(ANALYSIS_BATCH_INGEST_LEASE_SECONDS=0):
+            finished = poll_analysis_batch(partial)
+        self.assertEqual(finished.status, 'completed')
+        self.assertEqual((finished.completed_count, finished.failed_count), (2, 0))
+
+    def test_submit_failure_marks_profiles_failed(self):
+        """업로드/제출 실패 시 배치와 함께 프로필 분석 상태도 failed"""
+        with patch('chatbot.batch_service.batch_client.files.create', side_effect=openai.APIConnectionError(request=None)):
+            with self.assertRaises(openai.APIConnectionError):
+                submit_analysis_batch(self._jsonl('2년차 안드로이드 개발자, Kotlin').splitlines())
+
+        batch = AnalysisBatch.objects.get()
+        self.assertEqual((batch.status, batch.failed_count), ('failed', 1))
+        self.assertEqual(list(batch.profiles.values_list('analysis_status', flat=True)), ['failed'])
+
+
+@override_settings(LLM_RETRY_BASE_DELAY_SECONDS=0, LLM_RETRY_MAX_DELAY_SECONDS=0)
+class FakeBackendTestCase(TestCase):
+    """fake 백엔드(로컬 스탠드인 서버)로 실제 SDK/HTTP 경로 실행"""
+
+    def use_fake_backend(self, **options):
+        llm_breaker.reset()
+        self.addCleanup(llm_breaker.reset)
+        fake = {'BACKEND': 'chatbot.llm_backends.FakeServerBackend', 'OPTIONS': options}
+        with override_settings(LLM_BACKENDS={'fake': fake}):
+            backend = load_backend('fake')
+        self.addCleanup(backend.server.stop)
+        for name in ('client', 'async_client'):
+            patcher = patch(f'chatbot.ai_service.{name}', getattr(backend, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return backend
+
+    async def test_profile_and_streamed_questions_through_fake_server(self):
+        """프로필 분석(구조화 출력) + 면접 질문 스트리밍이 스탠드인 서버 응답으로 완료"""
+        backend = self.use_fake_backend(latency_ms=5, completion_tokens=400, cached_tokens=128)
+        response = await AsyncClient().post('/api/profiles', data={
+            'career_summary': '4년차 백엔드 개발자, 주문/정산 시스템 MSA 전환 주도',
+            'job_role': 'Kotlin 백엔드 개발',
+            'technical_skills': 'Kotlin, Spring Boot, Kafka',
+            'experience_years': 4
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        self.assertIn(response.json()['analysis_result']['career_level'], ['주니어', '중급', '시니어'])
+        profile = await ResumeProfile.objects.aget(id=response.json()['id'])
+        self.assertFalse(profile.analysis_result['analysis_metadata']['degraded'])
+
+        questions = [q async for q in async_career_coach_ai.stream_interview_questions(
+            CareerAnalysis(**SAMPLE_ANALYSIS), 'startup', 'mid', '스트리밍 테스트', 'Kotlin'
+        )]
+        self.assertEqual(len(questions), 5)
+        self.assertEqual(backend.server.state.requests, 2)
+
+    def test_injected_errors_degrade_to_fallback(self):
+        """error_rate=1이면 재시도 후 기본 로드맵 + degraded(upstream_error)"""
+        backend = self.use_fake_backend(error_rate=1.0)
+        begin_generation()
+        with override_settings(LLM_MAX_RETRIES=1):
+            steps = career_coach_ai.generate_learning_path(
+                CareerAnalysis(**SAMPLE_ANALYSIS), 'promotion', '오류 주입 테스트', 'Go', 3
+            )
+        metadata = career_coach_ai.get_generation_metadata('learning_path', 0)
+
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(metadata['degraded_stages'], {'learning_path': 'upstream_error'})
+        self.assertEqual(backend.server.state.requests, 2)
+
+
+@override_settings(GENERATION_JOB_RETRY_DELAY_SECONDS=0)
+class GenerationJobTestCase(TestCase):
+    """비동기 작업 모드 (202 + DB 작업 큐 + 워커) 테스트"""
+
+    def setUp(self):
+        llm_breaker.reset()
+        analysis_cache.memory.clear()
+
+    @patch('chatbot.ai_service.client.chat.completions.create')
+    def test_async_profile_and_chained_interview_job(self, mock_create):
+        """202로 즉시 응답 → 워커가 분석 후 면접 질문 작업까지 처리, 작업 URL로 결과 조회"""
+        def completion(**kwargs):
+            schema = kwargs['response_format']['json_schema']['name']
+            payload = SAMPLE_ANALYSIS if schema == 'resume_analysis' else {"questions": SAMPLE_QUESTIONS}
+            return fake_completion(json.dumps(payload, ensure_ascii=False))
+        mock_create.side_effect = completion
+
+        created = self.client.post('/api/profiles?async=1', data={
+            'career_summary': '3년차 백엔드 개발자, Spring Boot 기반 커머스 서비스 개발',
+            'job_role': 'Spring Boot 백엔드 개발',
+            'technical_skills': 'Java, Spring Boot, MySQL',
+            'experience_years': 3
+        }, content_type='application/json')
+        self.assertEqual(created.status_code, 202)
+        profile_id = created.json()['profile_id']
+        self.assertEqual(self.client.get(f'/api/profiles/{profile_id}').json()['analysis_status'], 'pending')
+
+        # 분석이 끝나기 전에 등록한 면접 질문 작업은 분석 완료 후 실행
+        queued = self.client.post('/api/interview-sessions', data={
+            'profile_id': profile_id, 'target_company_type': 'startup', 'target_position_level': 'mid'
+        }, content_type='application/json', headers={'Prefer': 'respond-async'})
+        self.assertEqual(queued.status_code, 202)
+        mock_create.assert_not_called()
+
+        self.assertEqual(run_pending_jobs(), 2)
+        profile = self.client.get(f'/api/profiles/{profile_id}').json()
+        self.assertEqual(profile['analysis_status'], 'completed')
+        self.assertEqual(profile['analysis_result']['career_level'], '중급')
+
+        job = self.client.get(queued.json()['status_url']).json()
+        self.assertEqual((job['status'], job['attempts']), ('completed', 1))
+        self.assertEqual(len(job['result']['questions']), 5)
+        self.assertEqual(job['result']['generation_metadata']['job']['id'], job['id'])
+
+    @override_settings(GENERATION_JOB_MAX_ATTEMPTS=2)
+    def test_failing_job_retries_then_fails(self):
+        """예외가 나면 재시도 후 failed, 프로필 분석 상태도 failed"""
+        profile = ResumeProfile.objects.create(
+            career_summary='2년차 프론트엔드 개발자, React 기반 어드민 개발',
+            job_role='프론트엔드 개발', technical_skills='React, TypeScript', experience_years=2
+        )
+        job = GenerationJob.objects.create(kind='profile_analysis', profile=profile, run_after=timezone.now())
+        with patch('chatbot.jobs.career_coach_ai.analyze_resume_profile', side_effect=RuntimeError('db down')):
+            self.assertEqual(run_pending_jobs(), 2)
+
+        job.refresh_from_db()
+        profile.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.error), ('failed', 2, 'db down'))
+        self.assertEqual(profile.analysis_status, 'failed')
+
+    @override_settings(GENERATION_JOB_MAX_ATTEMPTS=1)
+    def test_dependent_job_fails_when_no_analysis_in_flight(self):
+        """분석할 작업/배치 없이 pending에 남은 프로필(요청 경로 분석 실패 등)은 무한 대기하지 않음"""
+        profile = ResumeProfile.objects.create(
+            career_summary='4년차 백엔드 개발자, Go 기반 결제 서버 개발',
+            job_role='백엔드 개발', technical_skills='Go, PostgreSQL', experience_years=4
+        )
+        job = GenerationJob.objects.create(kind='learning_path', profile=profile, run_after=timezone.now(),
+                                           payload={'target_goal': '시니어 백엔드'})
+        self.assertEqual(run_pending_jobs(), 1)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 1))
+        self.assertIn('진행 중인 프로필 분석이 없습니다', job.error)
@@ -0,0 +1,146 @@
+"""
+🧮 토큰 예산 관리 - 입력 길이 제한 + 출력 크기 기반 max_tokens
+
+- LLM 호출 전 프롬프트 토큰 수 계산 (tiktoken, 미설치/로드 실패 시 보수적 근사치)
+- 과도하게 긴 입력 필드는 우선순위에 따라 잘라냄
+- 요청된 출력량(질문 수, 단계 수)으로 max_tokens 산정 → 짧은 완성, 낮은 지연
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import tiktoken
+except ImportError:  # 선택적 의존성
+    tiktoken = None
+
+
+# 메시지 1개당 role/구분자 오버헤드 (OpenAI chat 포맷 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 잘린 필드 끝에 붙는 표시
+TRUNCATION_MARKER = " …(이하 생략)"
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """모델별 토크나이저 (로드 실패 시 None → 근사치 사용)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """토크나이저 없이 보수적으로 추정 (한글 등 비ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰)"""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + math.ceil((len(text) - non_ascii) / 4)
+
+
+def count_tokens(text: str, model: str) -> int:
+    """텍스트 토큰 수"""
+    encoding = _encoding(model)
+    if encoding is None:
+        return _estimate_tokens(text)
+    return len(encoding.encode(text))
+
+
+@lru_cache(maxsize=32)
+def _count_static_tokens(text: str, model: str) -> int:
+    """정적 system 프롬프트 토큰 수 (요청마다 재계산하지 않음)"""
+    return count_tokens(text, model)
+
+
+def count_message_tokens(messages: Sequence[Dict[str, str]], model: str) -> int:
+    """chat 메시지 목록의 프롬프트 토큰 수"""
+    total = 3  # assistant 응답 프라이밍
+    for message in messages:
+        counter = _count_static_tokens if message["role"] == "system" else count_tokens
+        total += MESSAGE_OVERHEAD_TOKENS + counter(message["content"], model)
+    return total
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """max_tokens 이내로 자르기 (가능하면 문장/항목 경계에서)"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    budget = max(max_tokens - count_tokens(TRUNCATION_MARKER, model), 1)
+    encoding = _encoding(model)
+    if encoding is not None:
+        cut = encoding.decode(encoding.encode(text)[:budget])
+    else:
+        cut = text
+        while cut and _estimate_tokens(cut) > budget:
+            cut = cut[:int(len(cut) * budget / _estimate_tokens(cut)) or len(cut) - 1]
+
+    # 문장/쉼표 경계가 뒤쪽 절반 안에 있으면 거기서 끊기
+    boundary = max((m.end() for m in re.finditer(r"[.!?。,]\s", cut)), default=-1)
+    if boundary > len(cut) // 2:
+        cut = cut[:boundary]
+    return cut.rstrip(" ,") + TRUNCATION_MARKER
+
+
+@dataclass(frozen=True)
+class FieldBudget:
+    """입력 필드별 토큰 상한 (priority가 낮을수록 먼저 줄임)"""
+    name: str
+    max_tokens: int
+    priority: int
+
+
+def fit_fields(fields: Dict[str, str], budgets: Sequence[FieldBudget], total_tokens: int,
+               model: str) -> Tuple[Dict[str, str], List[str]]:
+    """
+    필드별 상한 적용 후, 합계가 total_tokens를 넘으면 우선순위 낮은 필드부터 추가로 줄임
+    반환: (조정된 필드, 잘린 필드 이름 목록)
+    """
+    fitted = dict(fields)
+    truncated: List[str] = []
+
+    for budget in budgets:
+        value = fitted[budget.name]
+        cut = truncate_to_tokens(value, budget.max_tokens, model)
+        if cut != value:
+            fitted[budget.name] = cut
+            truncated.append(budget.name)
+
+    sizes = {budget.name: count_tokens(fitted[budget.name], model) for budget in budgets}
+    overflow = sum(sizes.values()) - total_tokens
+    for budget in sorted(budgets, key=lambda b: b.priority):
+        if overflow <= 0:
+            break
+        target = max(sizes[budget.name] - overflow, budget.max_tokens // 4)
+        if target < sizes[budget.name]:
+            fitted[budget.name] = truncate_to_tokens(fitted[budget.name], target, model)
+            overflow -= sizes[budget.name] - count_tokens(fitted[budget.name], model)
+            if budget.name not in truncated:
+                truncated.append(budget.name)
+
+    return fitted, truncated
+
+
+def completion_budget(items: int, tokens_per_item: int, overhead: int = 100,
+                      margin: float = 1.15, ceiling: Optional[int] = None) -> int:
+    """출력 항목 수 기반 max_tokens 산정"""
+    budget = int(items * tokens_per_item * margin) + overhead
+    return min(budget, ceiling) if ceiling else budget
+
+
+def budget_report(messages: Sequence[Dict[str, str]], max_tokens: int, model: str,
+                  truncated: List[str]) -> Dict[str, Any]:
+    """generation_metadata용 예산 요약"""
+    return {
+        "estimated_prompt_tokens": count_message_tokens(messages, model),
+        "max_tokens": max_tokens,
+        "truncated_fields": truncated,
+        "tokenizer": "tiktoken" if _encoding(model) is not None else "estimate",
+    }
@@ -0,0 +1,408 @@
+"""
+🧭 요청 트레이싱 - 요청/ORM/LLM 계층 span 기록
+
+- TracingMiddleware가 요청마다 루트 span을 열고 응답 헤더(X-Trace-Id)로 trace id 반환
+  (W3C traceparent 헤더가 있으면 그 trace를 이어서 기록)
+- 처리 단계(stage_timer: db, restore_analysis, prompt_render, upstream, parse, llm, serialize)와
+  LLM 시도(llm_attempt)가 자식 span으로 기록됨, 스트리밍 응답은 첫 토큰 시각(first_token 이벤트) 포함
+- 루트 span이 끝나면 trace 전체를 큐에 넣고 백그라운드 스레드가 내보냄 (요청 스레드에서 I/O 없음)
+  · TRACING_EXPORTER=file: JSON Lines 파일 (span 1개 = 1줄)
+  · TRACING_EXPORTER=otlp: OTLP/HTTP JSON (Jaeger, Tempo, OpenTelemetry Collector 등)
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import Resolver404, resolve
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """트레이스 구간 1개 (OpenTelemetry span과 같은 필드)"""
+    trace: "Trace"
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": attributes})
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.trace.finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "start_time_ns": self.start_ns,
+            "end_time_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "events": self.events,
+            "error": self.error,
+        }
+
+
+class Trace:
+    """요청 1건의 span 모음 - 루트 span 종료 시 내보내기"""
+
+    def __init__(self, trace_id: str, sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.root: Optional[Span] = None
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def finish(self, span: Span) -> None:
+        if not self.sampled:
+            return
+        with self._lock:
+            self.spans.append(span)
+        if span is self.root:
+            tracer.export(self.spans)
+
+
+class _NoopSpan:
+    """샘플링되지 않은 요청/트레이스 밖에서 쓰는 span (기록하지 않음)"""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+def _parse_traceparent(value: str) -> Optional[tuple]:
+    """W3C traceparent (00-<trace_id>-<parent_id>-<flags>) → (trace_id, parent_id, sampled)"""
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2], parts[3] == "01"
+
+
+# === 내보내기 ===
+
+class SpanExporter:
+    """trace 단위로 span 목록을 받아 외부로 기록"""
+
+    def __init__(self, **options: Any):
+        self.options = options
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+
+class FileSpanExporter(SpanExporter):
+    """JSON Lines 파일 (span 1개 = 1줄)"""
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        path = Path(self.options["path"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span, ensure_ascii=False, default=str) + "\n")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class OTLPHttpExporter(SpanExporter):
+    """OTLP/HTTP JSON (POST {endpoint}, 기본 http://localhost:4318/v1/traces)"""
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        body = {"resourceSpans": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": settings.TRACING_SERVICE_NAME})},
+            "scopeSpans": [{
+                "scope": {"name": "chatbot.tracing"},
+                "spans": [{
+                    "traceId": span["trace_id"],
+                    "spanId": span["span_id"],
+                    "parentSpanId": span["parent_span_id"] or "",
+                    "name": span["name"],
+                    "kind": 2 if span["parent_span_id"] is None else 1,  # SERVER / INTERNAL
+                    "startTimeUnixNano": str(span["start_time_ns"]),
+                    "endTimeUnixNano": str(span["end_time_ns"]),
+                    "attributes": _otlp_attributes(span["attributes"]),
+                    "events": [{
+                        "name": event["name"],
+                        "timeUnixNano": str(event["time_ns"]),
+                        "attributes": _otlp_attributes(event["attributes"]),
+                    } for event in span["events"]],
+                    "status": {"code": 2, "message": span["error"]} if span["error"] else {"code": 1},
+                } for span in spans],
+            }],
+        }]}
+        request = urllib.request.Request(
+            self.options["endpoint"], data=json.dumps(body).encode(), method="POST",
+            headers={"Content-Type": "application/json", **self.options.get("headers", {})}
+        )
+        with urllib.request.urlopen(request, timeout=self.options.get("timeout", 5)):
+            pass
+
+
+class Tracer:
+    """span 생성 + 백그라운드 내보내기 스레드"""
+
+    def __init__(self):
+        self._queue: "queue.Queue[List[Dict[str, Any]]]" = queue.Queue(maxsize=1000)
+        self._exporters: Dict[str, SpanExporter] = {}
+        self._worker_pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.TRACING_EXPORTER)
+
+    def exporter(self) -> SpanExporter:
+        alias = settings.TRACING_EXPORTER
+        if alias not in self._exporters:
+            config = settings.TRACING_EXPORTERS[alias]
+            self._exporters[alias] = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+        return self._exporters[alias]
+
+    def start_trace(self, name: str, traceparent: str = "", **attributes: Any) -> Span:
+        """루트 span 시작 (traceparent가 있으면 상위 trace를 이어서)"""
+        parent = _parse_traceparent(traceparent) if traceparent else None
+        if parent:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = _new_id(16), None
+            sampled = self.enabled and random.random() < settings.TRACING_SAMPLE_RATE
+        trace = Trace(trace_id, sampled and self.enabled)
+        trace.root = Span(trace, name, _new_id(8), parent_id, time.time_ns(), attributes=attributes)
+        return trace.root
+
+    def start_span(self, name: str, **attributes: Any) -> Any:
+        """현재 span의 자식 span 시작 (활성화하지 않음 - 호출부가 end())"""
+        parent = _current_span.get()
+        if parent is None or not parent.trace.sampled:
+            return NOOP_SPAN
+        return Span(parent.trace, name, _new_id(8), parent.span_id, time.time_ns(), attributes=attributes)
+
+    def export(self, spans: List[Span]) -> None:
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait([span.to_dict() for span in spans if span.end_ns is not None])
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_worker(self) -> None:
+        if self._worker_pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker_pid != os.getpid():
+                self._worker_pid = os.getpid()
+                threading.Thread(target=self._export_loop, name="trace-exporter", daemon=True).start()
+
+    def _export_loop(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                self.exporter().export(spans)
+            except Exception as e:  # 수집기 장애가 요청 처리에 영향을 주지 않도록
+                self.dropped += 1
+                logger.warning("⚠️ 트레이스 내보내기 실패: %s", e)
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """대기 중인 trace 내보내기 완료까지 대기 (테스트/종료 시)"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+tracer = Tracer()
+
+
+@receiver(setting_changed)
+def _reset_exporters(setting, **kwargs) -> None:
+    if setting in ("TRACING_EXPORTER", "TRACING_EXPORTERS"):
+        tracer._exporters.clear()
+
+
+def endpoint_route(path: str) -> str:
+    """URL 패턴 (api/profiles/<profile_id>) - span 이름/메트릭 라벨용"""
+    try:
+        return resolve(path).route or "unmatched"
+    except Resolver404:
+        return "unmatched"
+
+
+def current_span() -> Any:
+    return _current_span.get() or NOOP_SPAN
+
+
+def current_trace_id() -> Optional[str]:
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """현재 span의 자식 span을 열고 with 블록 동안 활성화"""
+    child = tracer.start_span(name, **attributes)
+    if child is NOOP_SPAN:
+        yield child
+        return
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+@contextmanager
+def trace(name: str, traceparent: str = "", **attributes: Any) -> Iterator[Span]:
+    """루트 span을 열고 with 블록 동안 활성화 (요청 밖 - 생성 작업 워커 등)"""
+    root = tracer.start_trace(name, traceparent, **attributes)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        root.end()
+
+
+class TracingMiddleware:
+    """요청별 루트 span + 응답 헤더로 trace id 반환 (SSE 응답은 스트림 종료 시 span 종료)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _begin(self, request) -> Span:
+        return tracer.start_trace(
+            f"{request.method} {endpoint_route(request.path_info)}",
+            request.headers.get("traceparent", ""),
+            **{"http.method": request.method, "http.target": request.path_info},
+        )
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        root = self._begin(request)
+        token = _current_span.set(root)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_span.reset(token)
+        return self._finish(root, response)
+
+    async def __acall__(self, request):
+        root = self._begin(request)
+        token = _current_span.set(root)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_span.reset(token)
+        return self._finish(root, response)
+
+    def _finish(self, root: Span, response):
+        root.set_attribute("http.status_code", response.status_code)
+        response[settings.TRACING_RESPONSE_HEADER] = root.trace_id
+        if not response.streaming:
+            root.end()
+            return response
+        # SSE: 스트림을 소비하는 쪽 컨텍스트에서 루트 span을 다시 활성화하고 스트림 종료 시 종료
+        if response.is_async:
+            response.streaming_content = self._aiter_with_span(root, response.streaming_content)
+        else:
+            response.streaming_content = self._iter_with_span(root, response.streaming_content)
+        return response
+
+    @staticmethod
+    async def _aiter_with_span(root: Span, content):
+        token = _current_span.set(root)
+        try:
+            async for chunk in content:
+                yield chunk
+        finally:
+            _reset_span(token)
+            root.end()
+
+    @staticmethod
+    def _iter_with_span(root: Span, content):
+        token = _current_span.set(root)
+        try:
+            yield from content
+        finally:
+            _reset_span(token)
+            root.end()
+
+
+def _reset_span(token) -> None:
+    """스트림을 다른 컨텍스트에서 닫는 경우(GC 등)에는 되돌릴 값이 없으므로 무시"""
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        pass
@@ -0,0 +1,154 @@
+"""
+💰 LLM 토큰 사용량/비용 - 생성 메타데이터 + 일자별 집계
+
+- 호출마다 response.usage(입력/출력/캐시 적중 토큰)와 단가표(LLM_MODEL_PRICES)로 비용 계산
+  (Batch API 결과는 LLM_BATCH_PRICE_RATIO 적용)
+- 요청 단위 합계는 generation_metadata.usage / analysis_metadata.usage (스테이지 × 모델별 내역 포함)
+- 결과 저장 시 UsageRollup 행(일자 × 스테이지 × 모델)에 증분 반영 → GET /usage는 집계 행만 조회
+"""
+
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import UsageRollup
+
+logger = logging.getLogger(__name__)
+
+# 기본 응답으로 대체되어 최종 모델이 없는 요청의 집계 키
+FALLBACK_MODEL = "fallback"
+USAGE_GROUP_FIELDS = ("day", "stage", "model")
+TOKEN_FIELDS = ("prompt_tokens", "completion_tokens", "cached_tokens")
+
+
+def usage_tokens(usage: Any) -> Dict[str, int]:
+    """SDK usage 객체 → 입력/출력/캐시 적중 토큰"""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
+    }
+
+
+def model_price(model: str) -> Optional[Dict[str, float]]:
+    """단가표 조회 - 스냅샷 이름(gpt-4o-mini-2024-07-18)은 가장 긴 접두사로 매칭"""
+    prices = settings.LLM_MODEL_PRICES
+    matches = [name for name in prices if model == name or model.startswith(f"{name}-")]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def usage_cost(model: str, tokens: Dict[str, int], batch: bool = False) -> Optional[float]:
+    """호출 1건 비용 (USD) - 단가표에 없는 모델이면 None"""
+    price = model_price(model)
+    if price is None:
+        return None
+    cached = min(tokens["cached_tokens"], tokens["prompt_tokens"])
+    cost = ((tokens["prompt_tokens"] - cached) * price["input"]
+            + cached * price["cached_input"]
+            + tokens["completion_tokens"] * price["output"]) / 1_000_000
+    if batch:
+        cost *= settings.LLM_BATCH_PRICE_RATIO
+    return round(cost, 8)
+
+
+def empty_usage() -> Dict[str, Any]:
+    return {"calls": 0, **{field: 0 for field in TOKEN_FIELDS}, "cost_usd": 0.0, "unpriced_calls": 0, "by_model": []}
+
+
+def add_usage(summary: Optional[Dict[str, Any]], stage: str, model: str,
+              tokens: Dict[str, int], cost: Optional[float]) -> Dict[str, Any]:
+    """요청 단위 사용량 합계에 호출 1건 반영 (새 dict 반환)"""
+    summary = {**(summary or empty_usage())}
+    by_model = [dict(entry) for entry in summary["by_model"]]
+    entry = next((e for e in by_model if e["stage"] == stage and e["model"] == model), None)
+    if entry is None:
+        entry = {"stage": stage, "model": model, "calls": 0, **{field: 0 for field in TOKEN_FIELDS}, "cost_usd": 0.0}
+        by_model.append(entry)
+
+    for target in (summary, entry):
+        target["calls"] += 1
+        for field in TOKEN_FIELDS:
+            target[field] += tokens[field]
+        target["cost_usd"] = round(target["cost_usd"] + (cost or 0.0), 8)
+    if cost is None:
+        summary["unpriced_calls"] += 1
+    summary["by_model"] = by_model
+    return summary
+
+
+# === 일자 × 스테이지 × 모델 집계 ===
+
+def _increment(day: date, stage: str, model: str, values: Dict[str, Any]) -> None:
+    """집계 행 증분 (없으면 생성, 동시 생성 경합 시 상대가 만든 행에 증분)"""
+    rows = UsageRollup.objects.filter(day=day, stage=stage, model=model)
+    increments = {name: F(name) + value for name, value in values.items()}
+    if rows.update(updated_at=timezone.now(), **increments):
+        return
+    try:
+        with transaction.atomic():
+            UsageRollup.objects.create(day=day, stage=stage, model=model, **values)
+    except IntegrityError:
+        rows.update(updated_at=timezone.now(), **increments)
+
+
+def record_usage_rollup(stage: str, metadatas: Iterable[Dict[str, Any]], day: Optional[date] = None) -> None:
+    """
+    저장된 생성 결과들의 사용량을 집계 행에 반영
+    - requests는 최종 결과를 낸 모델(model_used, 기본 응답이면 fallback) 행에만 +1
+    - 호출/토큰/비용은 usage.by_model의 시도별 모델 행에 반영
+    """
+    day = day or timezone.localdate()
+    totals: Dict[str, Dict[str, Any]] = {}
+
+    def row(model: str) -> Dict[str, Any]:
+        return totals.setdefault(model, {"requests": 0, "calls": 0, **{f: 0 for f in TOKEN_FIELDS},
+                                         "cost_usd": Decimal(0)})
+
+    for metadata in metadatas:
+        row(metadata.get("model_used") or FALLBACK_MODEL)["requests"] += 1
+        for entry in (metadata.get("usage") or {}).get("by_model", []):
+            if entry["stage"] != stage:
+                continue
+            values = row(entry["model"])
+            values["calls"] += entry["calls"]
+            for field in TOKEN_FIELDS:
+                values[field] += entry[field]
+            values["cost_usd"] += Decimal(str(entry["cost_usd"]))
+
+    try:
+        for model, values in totals.items():
+            _increment(day, stage, model, values)
+    except Exception as e:  # 집계 실패가 이미 저장된 생성 결과 응답을 막지 않도록
+        logger.warning("⚠️ 사용량 집계 실패 (%s): %s", stage, e, extra={"stage": stage})
+
+
+arecord_usage_rollup = sync_to_async(record_usage_rollup)
+
+
+def usage_report(start: date, end: date, group_by: Sequence[str] = USAGE_GROUP_FIELDS) -> Dict[str, Any]:
+    """기간 내 집계 행 합산 - group_by(day/stage/model 조합)별 행 + 전체 합계"""
+    rows = UsageRollup.objects.filter(day__gte=start, day__lte=end)
+    sums = {f"total_{name}": Sum(name) for name in ("requests", "calls", *TOKEN_FIELDS, "cost_usd")}
+
+    def shape(values: Dict[str, Any]) -> Dict[str, Any]:
+        shaped = {name[len("total_"):]: values[name] or 0 for name in sums}
+        shaped["cost_usd"] = float(shaped["cost_usd"])
+        shaped["cost_per_request_usd"] = (
+            round(shaped["cost_usd"] / shaped["requests"], 8) if shaped["requests"] else None
+        )
+        return shaped
+
+    grouped: List[Dict[str, Any]] = [
+        {**{field: values[field] for field in group_by}, **shape(values)}
+        for values in rows.values(*group_by).annotate(**sums).order_by(*group_by)
+    ] if group_by else []
+    return {"start": start, "end": end, "group_by": list(group_by),
+            "totals": shape(rows.aggregate(**sums)), "rows": grouped}